@@ -9,6 +9,8 @@ from collections.abc import Iterable
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
+from improver import instrumentation
+
 try:
     __version__ = version("improver")
 except PackageNotFoundError:
@@ -23,7 +25,8 @@ class BasePlugin(ABC):
     """
 
     def __call__(self, *args, **kwargs) -> Any:
-        """Makes subclasses callable to use process
+        """Makes subclasses callable to use process. If instrumentation is
+        enabled, the resources used by the call are recorded.
         Args:
             *args:
                 Positional arguments.
@@ -32,6 +35,14 @@ class BasePlugin(ABC):
         Returns:
             Output of self.process()
         """
+        if instrumentation.ENABLED:
+            plugin = type(self)
+            return instrumentation.record_call(
+                f"{plugin.__module__}.{plugin.__qualname__}",
+                self.process,
+                *args,
+                **kwargs,
+            )
         return self.process(*args, **kwargs)
 
     @abstractmethod
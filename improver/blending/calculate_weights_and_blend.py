@@ -51,6 +51,7 @@ class WeightAndBlend(PostProcessingPlugin):
         ynval: Optional[float] = None,
         cval: Optional[float] = None,
         inverse_ordering: bool = False,
+        max_workers: int = 1,
     ) -> None:
         """
         Initialise central parameters
@@ -90,10 +91,15 @@ class WeightAndBlend(PostProcessingPlugin):
                 Option to invert weighting order for non-linear weights plugin
                 so that higher blend coordinate values get higher weights (eg
                 if cycle blending over forecast reference time).
+            max_workers:
+                Maximum number of chunks of grid points to blend concurrently
+                when blending percentiles, using a pool of threads. The
+                default of 1 blends chunks serially.
         """
         self.blend_coord = blend_coord
         self.wts_calc_method = wts_calc_method
         self.weighting_coord = None
+        self.max_workers = max_workers
 
         if self.wts_calc_method == "dict":
             self.weighting_coord = weighting_coord
@@ -313,7 +319,9 @@ class WeightAndBlend(PostProcessingPlugin):
                 )
 
             # Blend across specified dimension
-            BlendingPlugin = WeightedBlendAcrossWholeDimension(self.blend_coord)
+            BlendingPlugin = WeightedBlendAcrossWholeDimension(
+                self.blend_coord, max_workers=self.max_workers
+            )
             result = BlendingPlugin(cube, weights=weights)
 
         if record_run_attr is not None:
@@ -6,6 +6,7 @@
 whole dimension."""
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import iris
@@ -242,14 +243,25 @@ class PercentileBlendingAggregator:
            linear interpolation, resulting in blended values at each of the
            original percentiles.
 
+    These steps are carried out for chunks of grid points at once, giving
+    exactly the same results as blending each point with blend_percentiles.
+
     References:
      :download:`Combining Probabilities by Caroline Jones, 2017
      <../files/Combining_Probabilities.pdf>`
     """
 
+    # Number of grid points blended at once, limiting the memory used by the
+    # intermediate arrays.
+    POINTS_PER_CHUNK = 2**14
+
     @staticmethod
     def aggregate(
-        data: ndarray, axis: int, percentiles: ndarray, arr_weights: ndarray
+        data: ndarray,
+        axis: int,
+        percentiles: ndarray,
+        arr_weights: ndarray,
+        max_workers: int = 1,
     ) -> ndarray:
         """
         Function to blend percentile data over a given dimension.
@@ -270,6 +282,9 @@ class PercentileBlendingAggregator:
             arr_weights:
                 Array of weights, same shape as data, but without the percentile
                 dimension (weights do not vary with percentile).
+            max_workers:
+                Maximum number of chunks of grid points to blend concurrently,
+                using a pool of threads. The default of 1 blends chunks serially.
 
         Note "weights" has special meaning in Aggregator, hence
         using a different name for this variable.
@@ -297,17 +312,152 @@ class PercentileBlendingAggregator:
         weights_shape = [data.shape[0], grid_points]
         arr_weights = arr_weights.reshape(weights_shape)
 
-        # Find the blended percentile values at each point in the flattened data
+        # Find the blended percentile values at each point in the flattened
+        # data, blending chunks of points at once.
         result = np.zeros(flattened_shape[1:], dtype=FLOAT_DTYPE)
-        for i in range(data.shape[-1]):
-            result[:, i] = PercentileBlendingAggregator.blend_percentiles(
-                data[:, :, i], percentiles, arr_weights[:, i]
+
+        def _blend_chunk(start):
+            points = slice(start, start + PercentileBlendingAggregator.POINTS_PER_CHUNK)
+            result[:, points] = PercentileBlendingAggregator._blend_points(
+                data[:, :, points], percentiles, arr_weights[:, points]
+            )
+
+        starts = range(0, grid_points, PercentileBlendingAggregator.POINTS_PER_CHUNK)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(_blend_chunk, starts)
+                if max_workers > 1
+                else map(_blend_chunk, starts)
             )
         # Reshape the data with a leading percentile dimension
         shape = percentiles.shape + grid_shape
         result = result.reshape(shape)
         return result
 
+    @staticmethod
+    def _blend_points(
+        perc_values: ndarray, percentiles: ndarray, weights: ndarray
+    ) -> ndarray:
+        """Blend percentiles at many grid points at once, giving exactly the
+        same result as blend_percentiles at each point. Points with values
+        that are masked, not finite or not in ascending order, for which the
+        result of blend_percentiles depends on details of np.interp and
+        np.sort, are blended individually with blend_percentiles.
+
+        Args:
+            perc_values:
+                Array containing the percentile values to blend, with
+                shape: (length of coord to blend, num of percentiles,
+                num of points)
+            percentiles:
+                Array of percentile values e.g [0, 20.0, 50.0, 70.0, 100.0],
+                same size as the percentile dimension of data.
+            weights:
+                Array of weights, with shape: (length of coord to blend,
+                num of points)
+
+        Returns:
+            Array containing the weighted percentile blend data, with shape:
+            (num of percentiles, num of points)
+        """
+        individual = (
+            np.ma.getmaskarray(perc_values).any(axis=(0, 1))
+            | ~np.isfinite(perc_values).all(axis=(0, 1))
+            | ~np.isfinite(weights).all(axis=0)
+            | (np.diff(perc_values, axis=1) < 0).any(axis=(0, 1))
+        )
+        result = np.zeros(perc_values.shape[1:], dtype=FLOAT_DTYPE)
+        for i in np.flatnonzero(individual):
+            result[:, i] = PercentileBlendingAggregator.blend_percentiles(
+                perc_values[:, :, i], percentiles, weights[:, i]
+            )
+        if individual.all():
+            return result
+
+        # Order the arrays with points first.
+        perc_values = np.ma.getdata(perc_values)[..., ~individual].transpose(2, 0, 1)
+        weights = weights[:, ~individual].T
+        n_points, inputs_to_blend, n_percentiles = perc_values.shape
+        all_perc_values = perc_values.reshape(n_points, -1)
+
+        # Loop over the axis we are blending over finding the values for the
+        # probability at each threshold in the cdf, for each of the other
+        # points in the axis we are blending over.
+        # Then add the probabilities multiplied by the correct weight to the
+        # running total.
+        combined_cdf = np.zeros(all_perc_values.shape, dtype=FLOAT_DTYPE)
+        for i in range(inputs_to_blend):
+            interp_values = PercentileBlendingAggregator._interp(
+                all_perc_values, perc_values[:, i], percentiles
+            ).reshape(perc_values.shape)
+            interp_values[:, i] = percentiles
+            combined_cdf += (interp_values * weights[:, i, None, None]).reshape(
+                n_points, -1
+            )
+
+        # Combine and sort the threshold values and blended probability values
+        # for all the points we are blending.
+        combined_perc_thres_data = np.sort(all_perc_values, axis=-1)
+        combined_perc_values = np.sort(combined_cdf, axis=-1)
+
+        # Find the percentile values from this combined data by interpolating
+        # back from probability values to the original percentiles.
+        new_combined_perc = PercentileBlendingAggregator._interp(
+            np.broadcast_to(percentiles, (n_points, n_percentiles)),
+            combined_perc_values,
+            combined_perc_thres_data,
+        )
+        result[:, ~individual] = new_combined_perc.T
+        return result
+
+    @staticmethod
+    def _interp(x: ndarray, xp: ndarray, fp: ndarray) -> ndarray:
+        """Linearly interpolate each row of x from the corresponding rows of
+        xp and fp, with the same arithmetic as np.interp so that the results
+        are identical. For each x, np.interp uses the last point of xp that is
+        not greater than x; x below the range of xp takes the first value of fp
+        and x at or above the end of the range of xp takes the last value.
+
+        Args:
+            x:
+                Array of shape (num of points, n) of the values at which to
+                interpolate.
+            xp:
+                Array of shape (num of points, m) of finite x coordinates, in
+                ascending order along each row.
+            fp:
+                Array of the y coordinates, of the same shape as xp or of
+                shape (m,) to use the same values for every point.
+
+        Returns:
+            Array of shape (num of points, n) of interpolated values.
+        """
+        x = x.astype(np.float64)
+        xp = xp.astype(np.float64)
+        fp = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(fp, dtype=np.float64), xp.shape)
+        )
+
+        # Count the points of xp after the first that are not greater than x,
+        # giving the index of the last point of xp not greater than x.
+        index = np.zeros(x.shape, dtype=np.min_scalar_type(xp.shape[-1]))
+        not_greater = np.empty(x.shape, dtype=bool)
+        for j in range(1, xp.shape[-1]):
+            np.less_equal(xp[:, j, None], x, out=not_greater)
+            index += not_greater
+        flat_index = index + xp.shape[-1] * np.arange(len(xp))[:, None]
+        next_flat_index = flat_index + (index < xp.shape[-1] - 1)
+        x_lower = xp.ravel()[flat_index]
+        x_upper = xp.ravel()[next_flat_index]
+        y_lower = fp.ravel()[flat_index]
+        y_upper = fp.ravel()[next_flat_index]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (y_upper - y_lower) / (x_upper - x_lower)
+            result = slope * (x - x_lower) + y_lower
+        result = np.where((index == xp.shape[-1] - 1) | (x_lower == x), y_lower, result)
+        return np.where(x < xp[:, :1], fp[:, :1], result)
+
     @staticmethod
     def blend_percentiles(
         perc_values: ndarray, percentiles: ndarray, weights: ndarray
@@ -366,7 +516,9 @@ class WeightedBlendAcrossWholeDimension(PostProcessingPlugin):
     dimension. Uses one of two methods, either weighted average, or
     the maximum of the weighted probabilities."""
 
-    def __init__(self, blend_coord: str, timeblending: bool = False) -> None:
+    def __init__(
+        self, blend_coord: str, timeblending: bool = False, max_workers: int = 1
+    ) -> None:
         """Set up for a Weighted Blending plugin
 
         Args:
@@ -379,6 +531,10 @@ class WeightedBlendAcrossWholeDimension(PostProcessingPlugin):
                 all have the same validity time. Setting this to True will
                 bypass this test, as is necessary for triangular time
                 blending.
+            max_workers:
+                Maximum number of chunks of grid points to blend concurrently
+                when blending percentiles. The default of 1 blends chunks
+                serially.
 
         Raises:
             ValueError: If the blend coordinate is "threshold".
@@ -388,6 +544,7 @@ class WeightedBlendAcrossWholeDimension(PostProcessingPlugin):
             raise ValueError(msg)
         self.blend_coord = blend_coord
         self.timeblending = timeblending
+        self.max_workers = max_workers
         self.cycletime = None
         self.crds_to_remove = None
 
@@ -609,6 +766,7 @@ class WeightedBlendAcrossWholeDimension(PostProcessingPlugin):
             PERCENTILE_BLEND,
             percentiles=cube.coord(PERC_COORD).points,
             arr_weights=weights_array,
+            max_workers=self.max_workers,
         )
 
         return cube_new
@@ -54,6 +54,52 @@ from improver.metadata.utilities import (
 from improver.utilities.cube_manipulation import collapsed, enforce_coordinate_ordering
 
 
+def _spatial_point_dims(cubes: Sequence[Cube], reference: Cube) -> Optional[int]:
+    """Check whether the spatial coordinates of each cube match those of the
+    reference cube and occupy the trailing dimensions of each cube, such that
+    the data for each point can be indexed directly, rather than extracted by
+    matching coordinate values.
+
+    Args:
+        cubes:
+            Cubes to be checked.
+        reference:
+            Cube providing the spatial coordinates to be matched.
+
+    Returns:
+        The number of spatial dimensions, either one for sites, where the y
+        and x coordinates share a dimension, or two for gridded data. None
+        is returned if the spatial coordinates of any cube do not match.
+    """
+    y_ref, x_ref = reference.coord(axis="y"), reference.coord(axis="x")
+    n_spatial = 1 if reference.coord_dims(y_ref) == reference.coord_dims(x_ref) else 2
+    for cube in cubes:
+        y_coord, x_coord = cube.coord(axis="y"), cube.coord(axis="x")
+        expected_dims = (cube.ndim - n_spatial, cube.ndim - 1)
+        if cube.coord_dims(y_coord) + cube.coord_dims(x_coord) != expected_dims:
+            return None
+        for coord, ref in ((y_coord, y_ref), (x_coord, x_ref)):
+            if coord.shape != ref.shape or not np.allclose(coord.points, ref.points):
+                return None
+    return n_spatial
+
+
+def _flatten_spatial_dims(data: ndarray, n_spatial: int) -> ndarray:
+    """Flatten the trailing spatial dimensions of an array into a single
+    dimension of points.
+
+    Args:
+        data:
+            Array with trailing spatial dimensions.
+        n_spatial:
+            Number of trailing spatial dimensions.
+
+    Returns:
+        Array with the spatial dimensions flattened into the final dimension.
+    """
+    return data.reshape(data.shape[: data.ndim - n_spatial] + (-1,))
+
+
 class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
     """
     Minimise the Continuous Ranked Probability Score (CRPS)
@@ -85,6 +131,7 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         tolerance: float = 0.02,
         max_iterations: int = 1000,
         point_by_point: bool = False,
+        max_workers: int = 1,
     ) -> None:
         """
         Initialise class for performing minimisation of the Continuous
@@ -117,6 +164,10 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 If True, coefficients are calculated independently for each
                 point within the input cube by minimising each point
                 independently.
+            max_workers:
+                The maximum number of processes used to minimise the points
+                concurrently, if point_by_point is True. The default of 1
+                minimises the points serially within the current process.
 
         """
         # Dictionary containing the functions that will be minimised,
@@ -131,6 +182,10 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         # Maximum iterations for minimisation using Nelder-Mead.
         self.max_iterations = max_iterations
         self.point_by_point = point_by_point
+        self.max_workers = max_workers
+        # Summary of the convergence of the most recent point by point
+        # minimisation.
+        self.convergence_statistics = None
 
     def _normal_crps_preparation(
         self,
@@ -369,6 +424,24 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             forecast_predictors:
                 The forecast predictors to be reshaped.
 
+        Returns:
+            Reshaped array with a first dimension representing the flattened
+            spatiotemporal dimensions and an optional second dimension for
+            flattened non-spatiotemporal dimensions (e.g. realizations).
+        """
+        return self._flatten_forecasts(
+            broadcast_data_to_time_coord(forecast_predictors)
+        )
+
+    def _flatten_forecasts(self, forecast_predictors: List[ndarray]) -> ndarray:
+        """Flatten the spatiotemporal dimensions of the forecast predictor
+        arrays, which have already been broadcast along the time dimension,
+        and stack the predictors.
+
+        Args:
+            forecast_predictors:
+                The forecast predictor arrays to be reshaped.
+
         Returns:
             Reshaped array with a first dimension representing the flattened
             spatiotemporal dimensions and an optional second dimension for
@@ -376,7 +449,6 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         """
         preserve_leading_dimension = self.predictor == "realizations"
 
-        forecast_predictors = broadcast_data_to_time_coord(forecast_predictors)
         flattened_forecast_predictors = []
         for fp_data in forecast_predictors:
             flattened_forecast_predictors.append(
@@ -391,6 +463,113 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             (forecast_predictor_data,) = flattened_forecast_predictors
         return forecast_predictor_data
 
+    def _extract_points(
+        self, forecast_predictors: CubeList, truth: Cube, forecast_var: Cube
+    ) -> List[Tuple[ndarray, ndarray, ndarray]]:
+        """Extract the forecast predictor, truth and forecast variance data
+        for each point along the spatial dimensions, in the order in which
+        the points occur within the truth cube. If the spatial coordinates of
+        all inputs match, the data are reshaped once so that each point can be
+        indexed directly. Otherwise, the forecast predictors are extracted
+        for each point by matching coordinate values.
+
+        Args:
+            forecast_predictors
+            truth
+            forecast_var
+
+        Returns:
+            List containing a tuple for each point of the forecast predictor
+            data, prepared for minimisation, and the truth and forecast
+            variance data.
+        """
+        n_spatial = _spatial_point_dims(
+            list(forecast_predictors) + [truth, forecast_var], truth
+        )
+        if n_spatial:
+            predictor_data = [
+                _flatten_spatial_dims(data, n_spatial)
+                for data in broadcast_data_to_time_coord(forecast_predictors)
+            ]
+            truth_data = _flatten_spatial_dims(truth.data, n_spatial)
+            forecast_var_data = _flatten_spatial_dims(forecast_var.data, n_spatial)
+            return [
+                (
+                    self._flatten_forecasts(
+                        [data[..., index] for data in predictor_data]
+                    ),
+                    truth_data[..., index],
+                    forecast_var_data[..., index],
+                )
+                for index in range(truth_data.shape[-1])
+            ]
+
+        fp_template = forecast_predictors[0]
+        sindex = [fp_template.coord(axis="y"), fp_template.coord(axis="x")]
+
+        y_name = truth.coord(axis="y").name()
+        x_name = truth.coord(axis="x").name()
+
+        points = []
+        for truth_slice, fv_slice in zip(
+            truth.slices_over(sindex), forecast_var.slices_over(sindex)
+        ):
+            # Extract forecast predictor cubelist to match truth and variance cubes
+            constr = iris.Constraint(
+                coord_values={
+                    y_name: lambda cell: any(
+                        np.isclose(cell.point, truth_slice.coord(axis="y").points)
+                    ),
+                    x_name: lambda cell: any(
+                        np.isclose(cell.point, truth_slice.coord(axis="x").points)
+                    ),
+                }
+            )
+            forecast_predictors_slice = forecast_predictors.extract(constr)
+            points.append(
+                (
+                    self._prepare_forecasts(forecast_predictors_slice),
+                    truth_slice.data,
+                    fv_slice.data,
+                )
+            )
+        return points
+
+    def _minimise_point(
+        self,
+        minimisation_function: Callable,
+        initial_guess: ndarray,
+        forecast_predictor_data: ndarray,
+        truth_data: ndarray,
+        forecast_var_data: ndarray,
+        sqrt_pi: float,
+    ) -> Tuple[ndarray, bool, int]:
+        """Minimise a single point. Only the optimised coefficients and the
+        convergence information are returned, to limit the data returned
+        from worker processes.
+
+        Args:
+            minimisation_function
+            initial_guess
+            forecast_predictor_data
+            truth_data
+            forecast_var_data
+            sqrt_pi
+
+        Returns:
+            The optimised coefficients, whether the minimisation converged
+            and the number of iterations performed.
+        """
+        result = self._minimise_caller(
+            minimisation_function,
+            initial_guess,
+            forecast_predictor_data,
+            truth_data,
+            forecast_var_data,
+            sqrt_pi,
+        )
+        return result.x.astype(np.float32), bool(result.success), int(result.nit)
+
     def _process_points_independently(
         self,
         minimisation_function: Callable,
@@ -403,7 +582,10 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         """Minimise each point along the spatial dimensions independently to
         create a set of coefficients for each point. The coefficients returned
         can be either gridded (i.e. separate dimensions for x and y) or for a
-        list of sites where x and y share a common dimension.
+        list of sites where x and y share a common dimension. Points are
+        minimised within a pool of processes if max_workers is greater
+        than one. A summary of the convergence of the minimisations is stored
+        in the convergence_statistics attribute.
 
         Args:
             minimisation_function:
@@ -421,47 +603,62 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             Multiple beta values can be provided if either realizations
             are provided as the predictor, or if additional predictors
             are provided.
-        """
-        fp_template = forecast_predictors[0]
-        sindex = [fp_template.coord(axis="y"), fp_template.coord(axis="x")]
 
-        y_name = truth.coord(axis="y").name()
-        x_name = truth.coord(axis="x").name()
-
-        optimised_coeffs = []
-        for index, (truth_slice, fv_slice) in enumerate(
-            zip(truth.slices_over(sindex), forecast_var.slices_over(sindex))
-        ):
-            # Extract forecast predictor cubelist to match truth and variance cubes
-            constr = iris.Constraint(
-                coord_values={
-                    y_name: lambda cell: any(
-                        np.isclose(cell.point, truth_slice.coord(axis="y").points)
-                    ),
-                    x_name: lambda cell: any(
-                        np.isclose(cell.point, truth_slice.coord(axis="x").points)
-                    ),
-                }
+        Warns:
+            Warning: If the minimisation did not converge at any point.
+        """
+        points = self._extract_points(forecast_predictors, truth, forecast_var)
+
+        # Points without any valid truths retain the initial guess.
+        optimised_coeffs = [
+            np.array(initial_guess[index], dtype=np.float32)
+            for index in range(len(points))
+        ]
+        to_minimise = [
+            index
+            for index, (_, truth_data, _) in enumerate(points)
+            if not all(np.isnan(truth_data))
+        ]
+        tasks = [
+            (
+                minimisation_function,
+                initial_guess[index],
+                points[index][0].T,
+                points[index][1],
+                points[index][2],
+                sqrt_pi,
             )
-            forecast_predictors_slice = forecast_predictors.extract(constr)
-            forecast_predictor_data = self._prepare_forecasts(forecast_predictors_slice)
+            for index in to_minimise
+        ]
+        if self.max_workers > 1:
+            from joblib import Parallel, delayed
 
-            if all(np.isnan(truth_slice.data)):
-                optimised_coeffs.append(
-                    np.array(initial_guess[index], dtype=np.float32)
-                )
-            else:
-                optimised_coeffs.append(
-                    self._minimise_caller(
-                        minimisation_function,
-                        initial_guess[index],
-                        forecast_predictor_data.T,
-                        truth_slice.data,
-                        fv_slice.data,
-                        sqrt_pi,
-                    ).x.astype(np.float32)
-                )
+            results = Parallel(n_jobs=self.max_workers)(
+                delayed(self._minimise_point)(*task) for task in tasks
+            )
+        else:
+            results = [self._minimise_point(*task) for task in tasks]
+
+        iterations = []
+        for index, (coeffs, _, nit) in zip(to_minimise, results):
+            optimised_coeffs[index] = coeffs
+            iterations.append(nit)
+        n_converged = sum(success for _, success, _ in results)
+        self.convergence_statistics = {
+            "points": len(points),
+            "minimised_points": len(to_minimise),
+            "converged_points": n_converged,
+            "mean_iterations": float(np.mean(iterations)) if iterations else 0.0,
+            "max_iterations": max(iterations, default=0),
+        }
+        if n_converged < len(to_minimise):
+            warnings.warn(
+                f"Minimisation did not result in convergence at "
+                f"{len(to_minimise) - n_converged} of {len(to_minimise)} points "
+                f"within {self.max_iterations} iterations."
+            )
 
+        fp_template = forecast_predictors[0]
         y_coord = fp_template.coord(axis="y")
         x_coord = fp_template.coord(axis="x")
         if fp_template.coord_dims(y_coord) == fp_template.coord_dims(x_coord):
@@ -591,6 +788,7 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             )
             raise KeyError(msg)
 
+        self.convergence_statistics = None
         if self.predictor == "realizations":
             for forecast_predictor in forecast_predictors:
                 enforce_coordinate_ordering(forecast_predictor, "realization")
@@ -645,6 +843,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         tolerance: float = 0.02,
         max_iterations: int = 1000,
         proportion_of_nans: float = 0.5,
+        max_workers: int = 1,
     ) -> None:
         """
         Create an ensemble calibration plugin that, for Nonhomogeneous Gaussian
@@ -701,6 +900,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             proportion_of_nans:
                 The proportion of the matching historic forecast-truth pairs that
                 are allowed to be NaN.
+            max_workers:
+                The maximum number of processes used to minimise the points
+                concurrently, if point_by_point is True.
         """
         self.distribution = distribution
         self.point_by_point = point_by_point
@@ -717,6 +919,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             tolerance=self.tolerance,
             max_iterations=self.max_iterations,
             point_by_point=self.point_by_point,
+            max_workers=max_workers,
         )
 
         # Setting default values for coeff_names.
@@ -1115,6 +1318,66 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         else:
             cube.data = np.ma.masked_invalid(cube.data)
 
+    def _initial_guess_from_coefficients(
+        self, previous_coefficients: CubeList, truths: Cube, n_coefficients: int
+    ) -> Optional[ndarray]:
+        """Construct the initial guess from previously estimated coefficients,
+        so that the minimisation starts close to the expected solution. When
+        estimating coefficients point by point, the previous coefficients
+        must be for the same points as the truths, matched using the wmo_id
+        coordinate for sites, if present, and the y and x coordinates.
+
+        Args:
+            previous_coefficients:
+                CubeList containing a cube for each EMOS coefficient.
+            truths:
+                Truths from the training dataset, providing the points at
+                which coefficients are expected.
+            n_coefficients:
+                The number of coefficients expected, including each of the
+                beta coefficients.
+
+        Returns:
+            Initial guess with a leading dimension of the number of points,
+            which is one, unless the coefficients are calculated point by
+            point. Order of coefficients is [alpha, beta, gamma, delta].
+            None is returned if the previous coefficients do not match the
+            number of coefficients or the points expected.
+        """
+        cubes = [
+            previous_coefficients.extract(f"emos_coefficient_{name}")
+            for name in self.coeff_names
+        ]
+        if any(len(cube) != 1 for cube in cubes):
+            return None
+        cubes = [cube for (cube,) in cubes]
+
+        n_points = 1
+        if self.point_by_point:
+            if _spatial_point_dims(cubes, truths) is None:
+                return None
+            if truths.coords("wmo_id") and not all(
+                cube.coords("wmo_id")
+                and np.array_equal(
+                    cube.coord("wmo_id").points, truths.coord("wmo_id").points
+                )
+                for cube in cubes
+            ):
+                return None
+            y_coord, x_coord = truths.coord(axis="y"), truths.coord(axis="x")
+            n_points = len(y_coord.points)
+            if truths.coord_dims(y_coord) != truths.coord_dims(x_coord):
+                n_points *= len(x_coord.points)
+
+        if any(cube.data.size % n_points for cube in cubes):
+            return None
+        initial_guess = np.concatenate(
+            [np.reshape(cube.data, (-1, n_points)) for cube in cubes]
+        ).T
+        if initial_guess.shape != (n_points, n_coefficients):
+            return None
+        return initial_guess.astype(np.float32)
+
     def guess_and_minimise(
         self,
         truths: Cube,
@@ -1122,6 +1385,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         forecast_predictors: CubeList,
         forecast_var: Cube,
         number_of_realizations: Optional[int],
+        previous_coefficients: Optional[CubeList] = None,
     ) -> CubeList:
         """Function to consolidate calls to compute the initial guess, compute
         the optimised coefficients using minimisation and store the resulting
@@ -1142,15 +1406,64 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             number_of_realizations:
                 Number of realizations within the forecast predictor. If no
                 realizations are present, this option is None.
+            previous_coefficients:
+                Coefficients previously estimated for the same points, e.g.
+                for the previous cycle, to be used as the initial guess in
+                place of the computed or default initial guess. If they do
+                not match the coefficients or points expected, a warning is
+                raised and they are not used.
 
         Returns:
             CubeList constructed using the coefficients provided and using
             metadata from the historic_forecasts cube. Each cube within the
             cubelist is for a separate EMOS coefficient e.g. alpha, beta,
-            gamma, delta.
+            gamma, delta. If point_by_point is True, a summary of the
+            convergence of the minimisation at each point is recorded in the
+            emos_convergence_statistics attribute.
 
         """
-        if self.point_by_point and not self.use_default_initial_guess:
+        n_spatial = _spatial_point_dims(list(forecast_predictors) + [truths], truths)
+        initial_guess = None
+        if previous_coefficients:
+            n_coefficients = 3 + (
+                number_of_realizations
+                if self.predictor == "realizations"
+                else len(forecast_predictors)
+            )
+            initial_guess = self._initial_guess_from_coefficients(
+                previous_coefficients, truths, n_coefficients
+            )
+            if initial_guess is None:
+                warnings.warn(
+                    "The previous coefficients do not match the coefficients "
+                    "or points expected, so will not be used as the initial "
+                    "guess."
+                )
+
+        if initial_guess is not None:
+            if not self.point_by_point:
+                initial_guess = initial_guess[0]
+        elif self.point_by_point and not self.use_default_initial_guess and n_spatial:
+            truth_data = _flatten_spatial_dims(truths.data, n_spatial)
+            if self.predictor == "realizations":
+                forecast_predictors_data = forecast_predictors[0].data
+            else:
+                forecast_predictors_data = np.ma.stack(
+                    broadcast_data_to_time_coord(forecast_predictors)
+                )
+            forecast_predictors_data = _flatten_spatial_dims(
+                forecast_predictors_data, n_spatial
+            )
+            initial_guess = [
+                self.compute_initial_guess(
+                    truth_data[..., index],
+                    forecast_predictors_data[..., index],
+                    self.predictor,
+                    number_of_realizations,
+                )
+                for index in range(truth_data.shape[-1])
+            ]
+        elif self.point_by_point and not self.use_default_initial_guess:
             y_name = truths.coord(axis="y").name()
             x_name = truths.coord(axis="x").name()
 
@@ -1223,6 +1536,14 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             optimised_coeffs, historic_forecasts, forecast_predictors
         )
 
+        # Record a summary of the convergence of the point by point
+        # minimisation on the coefficients.
+        statistics = self.minimiser.convergence_statistics
+        if statistics is not None:
+            summary = ", ".join(f"{key}: {value}" for key, value in statistics.items())
+            for cube in coefficients_cubelist:
+                cube.attributes["emos_convergence_statistics"] = summary
+
         return coefficients_cubelist
 
     def process(
@@ -1231,6 +1552,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         truths: Cube,
         additional_fields: Optional[CubeList] = None,
         landsea_mask: Optional[Cube] = None,
+        previous_coefficients: Optional[CubeList] = None,
     ) -> CubeList:
         """
         Using Nonhomogeneous Gaussian Regression/Ensemble Model Output
@@ -1251,7 +1573,8 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
            and predictor from the historic forecasts.
         6. Calculate initial guess at coefficient values by performing a
            linear regression, if requested, otherwise default values are
-           used.
+           used. If previous coefficients are provided, these are used as
+           the initial guess instead.
         7. Perform minimisation.
 
         Args:
@@ -1266,12 +1589,19 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
                 land points are used to calculate the coefficients. Within the
                 land-sea mask cube land points should be specified as ones,
                 and sea points as zeros.
+            previous_coefficients:
+                The optional coefficients estimated for the same points and
+                predictors, e.g. for the previous cycle. If provided, these
+                are used as the initial guess for the minimisation, which
+                typically reduces the number of iterations required.
 
         Returns:
             CubeList constructed using the coefficients provided and using
             metadata from the historic_forecasts cube. Each cube within the
             cubelist is for a separate EMOS coefficient e.g. alpha, beta,
-            gamma, delta.
+            gamma, delta. If point_by_point is True, a summary of the
+            convergence of the minimisation at each point is recorded in the
+            emos_convergence_statistics attribute.
 
         Raises:
             ValueError: If either the historic_forecasts or truths cubes were not
@@ -1361,6 +1691,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             forecast_predictors,
             forecast_var,
             number_of_realizations,
+            previous_coefficients=previous_coefficients,
         )
         return coefficients_cubelist
 
@@ -14,6 +14,7 @@ import os
 import typing
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -77,6 +78,7 @@ class ApplyRainForestsCalibration(PostProcessingPlugin):
         model_config_dict: dict[str, dict[str, dict[str, str]]],
         threads: int | None = None,
         bin_data: bool = False,
+        max_workers: int = 1,
     ):
         """Initialise class object based on package and model file availability.
 
@@ -92,6 +94,9 @@ class ApplyRainForestsCalibration(PostProcessingPlugin):
                 if there are many data points which fall into the same bins for all threshold
                 models. Limits the calculation of common feature values by only calculating
                 them once. Defaults to False.
+            max_workers:
+                Maximum number of threshold models to evaluate concurrently, using
+                a pool of threads. The default of 1 evaluates the models serially.
 
         Dictionary is of format::
 
@@ -302,6 +307,7 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
         model_config_dict: dict[str, dict[str, dict[str, str]]],
         threads: int | None = None,
         bin_data: bool = False,
+        max_workers: int = 1,
     ):
         """Check all model files are available before initialising."""
         ApplyRainForestsCalibration.check_filenames("lightgbm_model", model_config_dict)
@@ -312,6 +318,7 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
         model_config_dict: dict[str, dict[str, dict[str, str]]],
         threads: int | None = None,
         bin_data: bool = False,
+        max_workers: int = 1,
     ):
         """Initialise the tree model variables used in the application of RainForests
         Calibration. LightGBM Boosters are used for tree model predictors.
@@ -328,6 +335,9 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
                 if there are many data points which fall into the same bins for all threshold
                 models. Limits the calculation of common feature values by only calculating
                 them once.
+            max_workers:
+                Maximum number of threshold models to evaluate concurrently, using
+                a pool of threads. The default of 1 evaluates the models serially.
 
         Dictionary is of format::
 
@@ -386,6 +396,7 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
         self.bin_data = bin_data
         if self.bin_data:
             self.combined_feature_splits = self._get_feature_splits(model_config_dict)
+        self.max_workers = max_workers
 
     def _get_num_features(self) -> int:
         return next(iter(self.tree_models.values())).num_feature()
@@ -569,6 +580,84 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
         )
         return 0.5 * (upper + lower)
 
+    def _predict_thresholds(
+        self,
+        model_lead_time: np.float32,
+        data_for_prediction: ndarray,
+        output_data: ndarray,
+    ) -> None:
+        """Evaluate probability that forecast exceeds each threshold using the models
+        for a lead time. The models for each threshold are evaluated concurrently if
+        max_workers is greater than 1.
+
+        Args:
+            model_lead_time:
+                lead time of the models to evaluate
+            data_for_prediction:
+                2-d array of data for the feature variables of the model
+            output_data:
+                array to populate with output, with threshold as the leading
+                dimension; will be modified in place
+        """
+        dataset_for_prediction = self.model_input_converter(data_for_prediction)
+
+        def _predict_threshold(threshold_index):
+            threshold = self.model_thresholds[threshold_index]
+            model = self.tree_models[model_lead_time, threshold]
+            prediction = model.predict(dataset_for_prediction)
+            prediction = np.clip(prediction, 0, 1)
+            if type(self) is ApplyRainForestsCalibrationTreelite:
+                # treelite 4.x.x changed output dimensions, so must flatten here
+                # See https://treelite.readthedocs.io/en/latest/treelite-gtil-api.html#treelite.gtil.predict
+                prediction = prediction.flatten()
+            output_data[threshold_index] = np.reshape(prediction, output_data.shape[1:])
+
+        threshold_indices = range(len(self.model_thresholds))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(
+                executor.map(_predict_threshold, threshold_indices)
+                if self.max_workers > 1
+                else map(_predict_threshold, threshold_indices)
+            )
+
+    def _predict_binned_thresholds(
+        self, model_lead_time: np.float32, input_data: ndarray, output_data: ndarray
+    ) -> None:
+        """Evaluate probability that forecast exceeds each threshold, predicting only
+        once for each combination of bins of the feature splits used in the models.
+        Rows of input_data within the same bins for all features have the same
+        predictions for all threshold models.
+
+        Args:
+            model_lead_time:
+                lead time of the models to evaluate
+            input_data:
+                2-d array of data for the feature variables of the model
+            output_data:
+                array to populate with output, with threshold as the leading
+                dimension; will be modified in place
+        """
+        # bin by feature splits
+        feature_splits = self.combined_feature_splits[model_lead_time]
+        binned_data = np.empty(input_data.shape, dtype=np.int32)
+        for i, splits in enumerate(feature_splits):
+            binned_data[:, i] = np.digitize(input_data[:, i], bins=splits)
+        # sort so rows in the same bins are grouped, and find the first row and
+        # the group of each row
+        sort_ind = np.lexsort(binned_data.T)
+        sorted_data = binned_data[sort_ind]
+        group_starts = np.ones(len(sorted_data), dtype=bool)
+        group_starts[1:] = np.any(sorted_data[1:] != sorted_data[:-1], axis=1)
+        first_rows = sort_ind[group_starts]
+        binned_inverse = np.empty(len(sort_ind), dtype=np.intp)
+        binned_inverse[sort_ind] = np.cumsum(group_starts) - 1
+
+        predictions = np.empty(
+            (len(self.model_thresholds), len(first_rows)), dtype=output_data.dtype
+        )
+        self._predict_thresholds(model_lead_time, input_data[first_rows], predictions)
+        output_data[:] = np.reshape(predictions[:, binned_inverse], output_data.shape)
+
     def _evaluate_probabilities(
         self, input_data: ndarray, lead_time_hours: int, output_data: ndarray
     ) -> None:
@@ -591,57 +680,9 @@ class ApplyRainForestsCalibrationLightGBM(ApplyRainForestsCalibration):
             model_lead_time = self.lead_times[best_ind]
 
         if self.bin_data:
-            # bin by feature splits
-            feature_splits = self.combined_feature_splits[model_lead_time]
-            binned_data = np.empty(input_data.shape, dtype=np.int32)
-            n_features = len(feature_splits)
-            for i in range(n_features):
-                binned_data[:, i] = np.digitize(
-                    input_data[:, i], bins=feature_splits[i]
-                )
-            # sort so rows in the same bins are grouped
-            sort_ind = np.lexsort(tuple([binned_data[:, i] for i in range(n_features)]))
-            sorted_data = binned_data[sort_ind]
-            reverse_sort_ind = np.argsort(sort_ind)
-            # we only need to predict for rows which are different from the previous row
-            diff = np.any(np.diff(sorted_data, axis=0) != 0, axis=1)
-            predict_rows = np.concatenate([[0], np.nonzero(diff)[0] + 1])
-            data_for_prediction = input_data[sort_ind][predict_rows]
-            full_prediction = np.empty((input_data.shape[0],))
-            # forward fill code inspired by this: https://stackoverflow.com/a/41191127
-            fill_inds = np.zeros(len(full_prediction), dtype=np.int32)
-            fill_inds[predict_rows] = predict_rows
-            fill_inds = np.maximum.accumulate(fill_inds)
-            dataset_for_prediction = self.model_input_converter(data_for_prediction)
-
-            for threshold_index, threshold in enumerate(self.model_thresholds):
-                model = self.tree_models[model_lead_time, threshold]
-                prediction = model.predict(dataset_for_prediction)
-                prediction = np.clip(prediction, 0, 1)
-                if type(self) is ApplyRainForestsCalibrationTreelite:
-                    # treelite 4.x.x changed output dimensions, so must flatten here
-                    # See https://treelite.readthedocs.io/en/latest/treelite-gtil-api.html#treelite.gtil.predict
-                    prediction = prediction.flatten()
-                full_prediction[predict_rows] = prediction
-                full_prediction = full_prediction[fill_inds]
-                # restore original order
-                full_prediction = full_prediction[reverse_sort_ind]
-                output_data[threshold_index, :] = np.reshape(
-                    full_prediction, output_data.shape[1:]
-                )
+            self._predict_binned_thresholds(model_lead_time, input_data, output_data)
         else:
-            dataset_for_prediction = self.model_input_converter(input_data)
-            for threshold_index, threshold in enumerate(self.model_thresholds):
-                model = self.tree_models[model_lead_time, threshold]
-                prediction = model.predict(dataset_for_prediction)
-                prediction = np.clip(prediction, 0, 1)
-                if type(self) is ApplyRainForestsCalibrationTreelite:
-                    # treelite 4.x.x changed output dimensions, so must flatten here
-                    # See https://treelite.readthedocs.io/en/latest/treelite-gtil-api.html#treelite.gtil.predict
-                    prediction = prediction.flatten()
-                output_data[threshold_index, :] = np.reshape(
-                    prediction, output_data.shape[1:]
-                )
+            self._predict_thresholds(model_lead_time, input_data, output_data)
 
     def _calculate_threshold_probabilities(
         self, forecast_cube: Cube, feature_cubes: CubeList
@@ -850,6 +891,7 @@ class ApplyRainForestsCalibrationTreelite(ApplyRainForestsCalibrationLightGBM):
         model_config_dict: dict[str, dict[str, dict[str, str]]],
         threads: int | None = None,
         bin_data: bool = False,
+        max_workers: int = 1,
     ):
         """Check required dependencies and all model files are available
         before initialising."""
@@ -866,6 +908,7 @@ class ApplyRainForestsCalibrationTreelite(ApplyRainForestsCalibrationLightGBM):
         model_config_dict: dict[str, dict[str, dict[str, str]]],
         threads: int | None = None,
         bin_data: bool = False,
+        max_workers: int = 1,
     ):
         """Initialise the tree model variables used in the application of RainForests
         Calibration. Treelite Predictors are used for tree model predictors.
@@ -881,6 +924,9 @@ class ApplyRainForestsCalibrationTreelite(ApplyRainForestsCalibrationLightGBM):
                 if there are many data points which fall into the same bins for all threshold
                 models. Limits the calculation of common feature values by only calculating
                 them once.
+            max_workers:
+                Maximum number of threshold models to evaluate concurrently, using
+                a pool of threads. The default of 1 evaluates the models serially.
 
         Dictionary is of format::
 
@@ -934,6 +980,7 @@ class ApplyRainForestsCalibrationTreelite(ApplyRainForestsCalibrationLightGBM):
         self.bin_data = bin_data
         if self.bin_data:
             self.combined_feature_splits = self._get_feature_splits(model_config_dict)
+        self.max_workers = max_workers
 
     def _get_num_features(self) -> int:
         return next(iter(self.tree_models.values())).num_feature
@@ -244,7 +244,9 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
 
         forecast_slice = next(forecast.slices_over(["time", threshold_coord]))
         expected_shape = self.expected_table_shape + forecast_slice.shape
-        dummy_data = np.zeros((expected_shape))
+        # The data is replaced when the table is populated, so need not be
+        # allocated.
+        dummy_data = np.broadcast_to(np.float32(0), expected_shape)
 
         diagnostic = find_threshold_coordinate(forecast).name()
         attributes = self._define_metadata(forecast)
@@ -289,14 +291,28 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
 
         return reliability_cube
 
-    def _populate_reliability_bins(
-        self, forecast: Union[MaskedArray, ndarray], truth: Union[MaskedArray, ndarray]
-    ) -> MaskedArray:
+    def _accumulate_reliability_bins(
+        self,
+        reliability_table: ndarray,
+        forecast: Union[MaskedArray, ndarray],
+        truth: Union[MaskedArray, ndarray],
+    ) -> ndarray:
         """
-        For a spatial slice at a single validity time and threshold, populate
-        a reliability table using the provided truth.
+        For a spatial slice at a single validity time and threshold, add the
+        contributions of each forecast and truth pair to the reliability
+        table in place. Each point contributes to a single probability bin,
+        so the contributions are scattered directly into the table, without
+        creating an array of the size of the table for each slice. Forecasts
+        that are masked, nan or outside the probability bins, and forecasts
+        for which the truth is masked, are not counted.
 
         Args:
+            reliability_table:
+                A C-contiguous float32 array containing the reliability table
+                data to be added to. The leading dimension corresponds to the rows of a
+                calibration table, the second dimension to the number of
+                probability bins, and the trailing dimension(s) are the
+                spatial dimension(s) of the forecast and truth.
             forecast:
                 An array containing data over a spatial slice for a single validity
                 time and threshold.
@@ -305,63 +321,43 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
                 equivalent validity time to the forecast array.
 
         Returns:
-            An array containing reliability table data for a single time
-            and threshold. The leading dimension corresponds to the rows
-            of a calibration table, the second dimension to the number of
-            probability bins, and the trailing dimension(s) are the spatial
-            dimension(s) of the forecast and truth cubes (which are
-            equivalent).
+            A flattened boolean array that is True at the points where
+            neither the forecast nor the truth are masked.
         """
-
         bin_edges = np.concatenate(
             [
                 np.array(self.probability_bins[:, 0]),
                 np.array([self.probability_bins[-1, 1] + self.single_value_tolerance]),
             ]
         ).astype(self.probability_bins.dtype)
+        unmasked = ~(np.ma.getmaskarray(forecast) | np.ma.getmaskarray(truth)).ravel()
+        forecast = np.ma.getdata(forecast).ravel()
+        # nan values and values outside the bins have an index less than zero
+        # or greater than the index of the last bin.
         bin_index = np.searchsorted(bin_edges, forecast, side="right") - 1
-        # nan values have index len(bin_edges) - 1, which is one more than the number of bins.
-        # Therefore, to make put_along_axis work, we also make the first dimension of the new shape
-        # one more than the number of bins, and discard the last slice of the first dimension later.
-        new_shape = (len(bin_edges),) + forecast.shape
-        forecast_mask = np.broadcast_to(
-            np.expand_dims(np.ma.getmask(forecast), 0), new_shape
-        )
-        forecast_probabilities = np.zeros(new_shape, dtype=forecast.dtype)
-        np.put_along_axis(
-            forecast_probabilities, np.expand_dims(bin_index, 0), forecast, axis=0
-        )
-        forecast_probabilities = np.ma.array(
-            forecast_probabilities, mask=forecast_mask, copy=False
-        )
-        forecast_counts = np.zeros_like(forecast_probabilities)
-        np.put_along_axis(forecast_counts, np.expand_dims(bin_index, 0), 1, axis=0)
-        forecast_counts = np.ma.array(forecast_counts, mask=forecast_mask, copy=False)
-        observation_counts = (
-            np.expand_dims(np.isclose(truth, 1), 0) & forecast_counts.astype(bool)
-        ).astype(int)
-
-        # discard last index in first dimension because it contains data from forecast nans
-        reliability_table = np.ma.stack(
-            [
-                observation_counts[:-1, :],
-                forecast_probabilities[:-1, :],
-                forecast_counts[:-1, :],
-            ]
+        points = np.flatnonzero(
+            unmasked & (bin_index >= 0) & (bin_index < len(self.probability_bins))
         )
+        bin_index = bin_index[points]
 
-        return reliability_table.astype(np.float32)
+        table = reliability_table.reshape(reliability_table.shape[:2] + (-1,))
+        table[0, bin_index, points] += np.isclose(
+            np.ma.getdata(truth).ravel()[points], 1
+        )
+        table[1, bin_index, points] += forecast[points].astype(np.float32)
+        table[2, bin_index, points] += 1
+        return unmasked
 
-    def _populate_masked_reliability_bins(
-        self, forecast: ndarray, truth: MaskedArray
+    def _populate_reliability_bins(
+        self, forecast: Union[MaskedArray, ndarray], truth: Union[MaskedArray, ndarray]
     ) -> MaskedArray:
         """
-        Support populating the reliability table bins with a masked truth. If a
-        masked truth is provided, a masked reliability table is returned.
+        For a spatial slice at a single validity time and threshold, populate
+        a reliability table using the provided truth.
 
         Args:
             forecast:
-                An array containing data over an xy slice for a single validity
+                An array containing data over a spatial slice for a single validity
                 time and threshold.
             truth:
                 An array containing a thresholded gridded truth at an
@@ -371,22 +367,23 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
             An array containing reliability table data for a single time
             and threshold. The leading dimension corresponds to the rows
             of a calibration table, the second dimension to the number of
-            probability bins, and the trailing dimensions are the spatial
-            dimensions of the forecast and truth cubes (which are
-            equivalent).
+            probability bins, and the trailing dimension(s) are the spatial
+            dimension(s) of the forecast and truth cubes (which are
+            equivalent). Points at which the forecast is masked are masked.
         """
-        forecast = np.ma.masked_where(np.ma.getmask(truth), forecast)
-        table = self._populate_reliability_bins(forecast, truth)
-        # Zero data underneath mask to support bitwise addition of masks.
-        table.data[table.mask] = 0
-        return table
+        reliability_table = np.zeros(
+            self.expected_table_shape + forecast.shape, dtype=np.float32
+        )
+        self._accumulate_reliability_bins(reliability_table, forecast, truth)
+        mask = np.broadcast_to(np.ma.getmaskarray(forecast), reliability_table.shape)
+        return np.ma.array(reliability_table, mask=mask)
 
-    def _add_reliability_tables(
-        self, forecast: Cube, truth: Cube, threshold_reliability: MaskedArray
-    ) -> Union[MaskedArray, ndarray]:
+    def _populate_masked_reliability_bins(
+        self, forecast: ndarray, truth: MaskedArray
+    ) -> MaskedArray:
         """
-        Add reliability tables. The presence of a masked truth is handled
-        separately to ensure support for a mask that changes with validity time.
+        Support populating the reliability table bins with a masked truth. If a
+        masked truth is provided, a masked reliability table is returned.
 
         Args:
             forecast:
@@ -395,8 +392,6 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
             truth:
                 An array containing a thresholded gridded truth at an
                 equivalent validity time to the forecast array.
-            threshold_reliability:
-                The current reliability table that will be added to.
 
         Returns:
             An array containing reliability table data for a single time
@@ -406,29 +401,18 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
             dimensions of the forecast and truth cubes (which are
             equivalent).
         """
-        if np.ma.is_masked(truth.data):
-            table = self._populate_masked_reliability_bins(forecast.data, truth.data)
-            # Bitwise addition of masks. This ensures that only points that are
-            # masked in both the existing and new reliability tables are kept
-            # as being masked within the resulting reliability table.
-            mask = threshold_reliability.mask & table.mask
-            threshold_reliability = np.ma.array(
-                threshold_reliability.data + table.data, mask=mask, dtype=np.float32
-            )
-        else:
-            np.add(
-                threshold_reliability,
-                self._populate_reliability_bins(forecast.data, truth.data),
-                out=threshold_reliability,
-                dtype=np.float32,
-            )
-        return threshold_reliability
+        forecast = np.ma.masked_where(np.ma.getmask(truth), forecast)
+        table = self._populate_reliability_bins(forecast, truth)
+        # Zero data underneath mask to support bitwise addition of masks.
+        table.data[table.mask] = 0
+        return table
 
     def process(
         self,
         historic_forecasts: Cube,
         truths: Cube,
         aggregate_coords: Optional[List[str]] = None,
+        reliability_table: Optional[Cube] = None,
     ) -> Cube:
         """
         Slice data over threshold and time coordinates to construct reliability
@@ -439,7 +423,12 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
         any point that is unmasked for at least one timestep will have
         unmasked values within the reliability table. Therefore historic
         forecast points will only be used if they have a corresponding valid
-        truth point for each timestep.
+        truth point for each timestep. Points at which the historic forecast
+        is masked at any timestep are masked within the reliability table.
+
+        The contributions of each validity time are added directly to the
+        tables in turn, so if the historic forecasts and truths are loaded
+        lazily only a single validity time of each is held in memory at once.
 
         .. See the documentation for an example of the resulting reliability
            table cube.
@@ -466,6 +455,13 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
                 :class:`improver.calibration.reliability_calibration.AggregateReliabilityCalibrationTables`
                 but with reduced memory usage due to avoiding large intermediate
                 data.
+            reliability_table:
+                An existing reliability table, constructed from earlier
+                historic forecasts and truths with the same thresholds and
+                aggregate_coords, to which the contributions of the provided
+                historic forecasts and truths are added. This allows a table
+                to be updated as new forecasts and truths become available,
+                without reconstructing it from all the historic data.
 
         Returns:
             A cubelist of reliability table cubes, one for each threshold
@@ -492,28 +488,39 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
             historic_forecasts, threshold_coord
         )
 
-        populate_bins_func = self._populate_reliability_bins
-        if np.ma.is_masked(truths.data):
-            populate_bins_func = self._populate_masked_reliability_bins
-
         reliability_tables = iris.cube.CubeList()
         threshold_slices = zip(
             historic_forecasts.slices_over(threshold_coord),
             truths.slices_over(threshold_coord),
         )
         for forecast_slice, truth_slice in threshold_slices:
+            # Add the contributions of each validity time to the table in
+            # turn, so that only one time of the forecasts and truths need be
+            # loaded at once.
+            table_data = np.zeros(reliability_cube.shape, dtype=np.float32)
+            mask = None
             time_slices = zip(
                 forecast_slice.slices_over(time_coord),
                 truth_slice.slices_over(time_coord),
             )
-            forecast, truth = next(time_slices)
-            threshold_reliability = populate_bins_func(forecast.data, truth.data)
-
             for forecast, truth in time_slices:
-                threshold_reliability = self._add_reliability_tables(
-                    forecast, truth, threshold_reliability
+                truth_data = truth.data
+                point_mask = ~self._accumulate_reliability_bins(
+                    table_data, forecast.data, truth_data
                 )
+                if mask is None:
+                    mask = point_mask
+                elif np.ma.is_masked(truth_data):
+                    # Points with a masked truth are only masked in the table
+                    # if they are masked at every time.
+                    mask &= point_mask
+                else:
+                    # Points with a masked forecast are masked in the table if
+                    # they are masked at any time.
+                    mask |= point_mask
 
+            mask = np.broadcast_to(mask.reshape(table_data.shape[2:]), table_data.shape)
+            threshold_reliability = np.ma.array(table_data, mask=mask)
             reliability_entry = reliability_cube.copy(data=threshold_reliability)
             reliability_entry.replace_coord(forecast_slice.coord(threshold_coord))
             if aggregate_coords:
@@ -522,7 +529,12 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
                 )
             reliability_tables.append(reliability_entry)
 
-        return MergeCubes()(reliability_tables, copy=False)
+        result = MergeCubes()(reliability_tables, copy=False)
+        if reliability_table is not None:
+            result = AggregateReliabilityCalibrationTables().process(
+                [reliability_table, result]
+            )
+        return result
 
 
 class AggregateReliabilityCalibrationTables(BasePlugin):
@@ -6,7 +6,7 @@
 
 import copy
 import operator
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import iris
 import numpy as np
@@ -65,6 +65,23 @@ def _define_invertible_conditions() -> Dict[str, str]:
 INVERTIBLE_CONDITIONS = _define_invertible_conditions()
 
 
+def _expression_key(expression: Union[Constraint, List]) -> Hashable:
+    """Construct a hashable key identifying an extract expression, such that
+    repeated expressions built from the same constraints share a key.
+
+    Args:
+        expression:
+            An iris.Constraint, or a list of constraints, operators, numbers
+            and nested lists of these.
+
+    Returns:
+        The constraint itself, or a nested tuple of the expression items.
+    """
+    if isinstance(expression, list):
+        return tuple(_expression_key(item) for item in expression)
+    return expression
+
+
 class ApplyDecisionTree(BasePlugin):
     """
     Definition and implementation of a categorical decision tree. This
@@ -134,6 +151,9 @@ class ApplyDecisionTree(BasePlugin):
         # flag to indicate whether to expect "threshold" as a coordinate name
         # (defaults to False, checked on reading input cubes)
         self.coord_named_threshold = False
+        # constraints keyed by diagnostic name and threshold, so that each
+        # diagnostic threshold is extracted from the inputs only once
+        self._constraints = {}
 
     def __repr__(self) -> str:
         """Represent the configured plugin instance as a string."""
@@ -405,7 +425,7 @@ class ApplyDecisionTree(BasePlugin):
                         # Add a constraint from the variable name and threshold value
                         d_threshold_index += 1
                         if test_conditions.get("deterministic"):
-                            extract_constraint.append(iris.Constraint(item))
+                            extract_constraint.append(self._name_constraint(item))
                         else:
                             extract_constraint.append(
                                 self.construct_extract_constraint(
@@ -424,16 +444,35 @@ class ApplyDecisionTree(BasePlugin):
                         diagnostic, d_threshold, self.coord_named_threshold
                     )
                 else:
-                    extract_constraint = iris.Constraint(diagnostic)
+                    extract_constraint = self._name_constraint(diagnostic)
             conditions.append([extract_constraint, comp, p_threshold])
         condition_chain = [conditions, test_conditions["condition_combination"]]
         return condition_chain
 
+    def _name_constraint(self, diagnostic: str) -> Constraint:
+        """
+        Construct an iris constraint on the diagnostic name alone, reusing
+        the constraint for repeated diagnostics.
+
+        Args:
+            diagnostic:
+                The name of the diagnostic to be extracted from the CubeList.
+
+        Returns:
+            A constraint
+        """
+        key = (diagnostic, None, None)
+        if key not in self._constraints:
+            self._constraints[key] = iris.Constraint(diagnostic)
+        return self._constraints[key]
+
     def construct_extract_constraint(
         self, diagnostic: str, threshold: AuxCoord, coord_named_threshold: bool
     ) -> Constraint:
         """
-        Construct an iris constraint.
+        Construct an iris constraint. The same constraint is returned for
+        repeated requests for a diagnostic threshold, so that the extracted
+        data can be shared between the nodes that use it.
 
         Args:
             diagnostic:
@@ -459,6 +498,10 @@ class ApplyDecisionTree(BasePlugin):
             )
 
         threshold_val = threshold.points.item()
+        key = (diagnostic, threshold_val, threshold_coord_name)
+        if key in self._constraints:
+            return self._constraints[key]
+
         if abs(threshold_val) < self.float_abs_tolerance:
             cell_constraint = lambda cell: np.isclose(
                 cell.point,
@@ -476,6 +519,7 @@ class ApplyDecisionTree(BasePlugin):
 
         kw_dict = {"{}".format(threshold_coord_name): cell_constraint}
         constraint = iris.Constraint(name=diagnostic, **kw_dict)
+        self._constraints[key] = constraint
         return constraint
 
     def remove_optional_missing(self, optional_node_data_missing: List[str]):
@@ -682,7 +726,10 @@ class ApplyDecisionTree(BasePlugin):
         return result
 
     def evaluate_extract_expression(
-        self, cubes: CubeList, expression: Union[Constraint, List]
+        self,
+        cubes: CubeList,
+        expression: Union[Constraint, List],
+        cache: Optional[Dict[Hashable, Any]] = None,
     ) -> ndarray:
         """Evaluate a single condition.
 
@@ -697,59 +744,97 @@ class ApplyDecisionTree(BasePlugin):
                 is a valid expression.
                 A list consisting of valid expressions, strings (representing
                 operators) and floats is a valid expression.
+            cache:
+                Results of the constraints and expressions already evaluated
+                against these cubes, which is updated with the results of
+                this expression and its sub-expressions. Sharing a cache
+                between calls avoids repeated extraction and evaluation.
 
         Returns:
             An array or masked array of booleans
         """
+        if cache is None:
+            cache = {}
+        key = _expression_key(expression)
+        if key not in cache:
+            if isinstance(expression, iris.Constraint):
+                cache[key] = cubes.extract(expression)[0].data
+            else:
+                cache[key] = self._evaluate_operators(cubes, expression, cache)
+        return cache[key]
+
+    def _evaluate_operators(
+        self, cubes: CubeList, expression: List, cache: Dict[Hashable, Any]
+    ) -> ndarray:
+        """Evaluate an expression list, first evaluating any sub-expressions
+        and then applying the operators in order of precedence.
+
+        Args:
+            cubes:
+                A cubelist containing the diagnostics required for the
+                decision tree, these at co-incident times.
+            expression:
+                A list of constraints, operators, numbers and sub-expressions.
+            cache:
+                Results of the constraints and expressions already evaluated
+                against these cubes.
+
+        Returns:
+            The result of the expression.
+        """
         operator_map = {
             "+": operator.add,
             "-": operator.sub,
             "*": operator.mul,
             "/": operator.truediv,
         }
-        if isinstance(expression, iris.Constraint):
-            return cubes.extract(expression)[0].data
-        else:
-            curr_expression = copy.deepcopy(expression)
-            # evaluate sub-expressions first
-            for idx, item in enumerate(expression):
-                if isinstance(item, list):
-                    curr_expression = (
-                        curr_expression[:idx]
-                        + [self.evaluate_extract_expression(cubes, item)]
-                        + curr_expression[idx + 1 :]
-                    )
-            # evaluate operators in order of precedence
-            for op_str in [["/", "*"], ["+", "-"]]:
-                while len(curr_expression) > 1:
-                    for idx, item in enumerate(curr_expression):
-                        if isinstance(item, str) and (item in op_str):
-                            left_arg = curr_expression[idx - 1]
-                            right_arg = curr_expression[idx + 1]
-                            if isinstance(left_arg, iris.Constraint):
-                                left_eval = cubes.extract(left_arg)[0].data
-                            else:
-                                left_eval = left_arg
-                            if isinstance(right_arg, iris.Constraint):
-                                right_eval = cubes.extract(right_arg)[0].data
-                            else:
-                                right_eval = right_arg
-                            op = operator_map[item]
-                            res = op(left_eval, right_eval)
-                            curr_expression = (
-                                curr_expression[: idx - 1]
-                                + [res]
-                                + curr_expression[idx + 2 :]
+        curr_expression = list(expression)
+        # evaluate sub-expressions first
+        for idx, item in enumerate(expression):
+            if isinstance(item, list):
+                curr_expression = (
+                    curr_expression[:idx]
+                    + [self.evaluate_extract_expression(cubes, item, cache)]
+                    + curr_expression[idx + 1 :]
+                )
+        # evaluate operators in order of precedence
+        for op_str in [["/", "*"], ["+", "-"]]:
+            while len(curr_expression) > 1:
+                for idx, item in enumerate(curr_expression):
+                    if isinstance(item, str) and (item in op_str):
+                        left_arg = curr_expression[idx - 1]
+                        right_arg = curr_expression[idx + 1]
+                        if isinstance(left_arg, iris.Constraint):
+                            left_eval = self.evaluate_extract_expression(
+                                cubes, left_arg, cache
                             )
-                            break
-                    else:
+                        else:
+                            left_eval = left_arg
+                        if isinstance(right_arg, iris.Constraint):
+                            right_eval = self.evaluate_extract_expression(
+                                cubes, right_arg, cache
+                            )
+                        else:
+                            right_eval = right_arg
+                        op = operator_map[item]
+                        res = op(left_eval, right_eval)
+                        curr_expression = (
+                            curr_expression[: idx - 1]
+                            + [res]
+                            + curr_expression[idx + 2 :]
+                        )
                         break
-            if isinstance(curr_expression[0], iris.Constraint):
-                res = cubes.extract(curr_expression[0])[0].data
-            return res
+                else:
+                    break
+        if isinstance(curr_expression[0], iris.Constraint):
+            res = self.evaluate_extract_expression(cubes, curr_expression[0], cache)
+        return res
 
     def evaluate_condition_chain(
-        self, cubes: CubeList, condition_chain: List
+        self,
+        cubes: CubeList,
+        condition_chain: List,
+        cache: Optional[Dict[Hashable, Any]] = None,
     ) -> ndarray:
         """Recursively evaluate the list of conditions.
 
@@ -768,10 +853,15 @@ class ApplyDecisionTree(BasePlugin):
                 (2) If a1, ..., an are each valid conditions chain, and b is
                 either "AND" or "OR", then [[a1, ..., an], b] is a valid
                 condition chain.
+            cache:
+                Results of the constraints and expressions already evaluated
+                against these cubes, shared with evaluate_extract_expression.
 
         Returns:
             An array of masked array of booleans
         """
+        if cache is None:
+            cache = {}
 
         def is_chain(item):
             return (
@@ -783,21 +873,21 @@ class ApplyDecisionTree(BasePlugin):
         items_list, comb = condition_chain
         item = items_list[0]
         if is_chain(item):
-            res = self.evaluate_condition_chain(cubes, item)
+            res = self.evaluate_condition_chain(cubes, item, cache)
         else:
             condition, comparator, threshold = item
             res = self.compare_array_to_threshold(
-                self.evaluate_extract_expression(cubes, condition),
+                self.evaluate_extract_expression(cubes, condition, cache),
                 comparator,
                 threshold,
             )
         for item in items_list[1:]:
             if is_chain(item):
-                new_res = self.evaluate_condition_chain(cubes, item)
+                new_res = self.evaluate_condition_chain(cubes, item, cache)
             else:
                 condition, comparator, threshold = item
                 new_res = self.compare_array_to_threshold(
-                    self.evaluate_extract_expression(cubes, condition),
+                    self.evaluate_extract_expression(cubes, condition, cache),
                     comparator,
                     threshold,
                 )
@@ -815,24 +905,66 @@ class ApplyDecisionTree(BasePlugin):
                 raise RuntimeError(msg)
         return res
 
-    def process(self, *cubes: Union[Cube, CubeList]) -> Cube:
-        """Apply the decision tree to the input cubes to produce categorical output.
+    def branch_condition_chain(self, node: str, next_node: str) -> Optional[List]:
+        """Construct the condition chain satisfied by locations that pass from
+        a node of the decision tree to the next node on a route through it.
 
         Args:
-            cubes:
-                Diagnostics required for the decision tree, these at co-incident times.
+            node:
+                Name of the current node.
+            next_node:
+                Name of the node, or the category code, that follows the
+                current node on the route.
 
         Returns:
-            A cube of categorical data.
+            A condition chain as defined in create_condition_chain, or None
+            if the current node is a leaf.
         """
-        # Check input cubes contain required data and return only those that
-        # are needed to speed up later cube extractions.
-        cubes, optional_node_data_missing = self.prepare_input_cubes(*cubes)
+        current = copy.copy(self.queries[node])
+
+        if current.get("if_false") == next_node:
+            (
+                current["threshold_condition"],
+                current["condition_combination"],
+            ) = self.invert_condition(current)
+        if current.get("if_masked") == next_node and current.get("if_masked") not in [
+            current.get("if_false"),
+            current.get("if_true"),
+        ]:
+            # if if_masked is not the same as if_false or if_true, then
+            # it is a separate branch of the tree and we need to replace
+            # the condition.
+            current["diagnostic_fields"] = current["diagnostic_fields"]
+            current["threshold_condition"] = "is_masked"
+            current["condition_combination"] = ""
+        elif current.get("if_masked") == next_node:
+            # if masked is the same as if_false or if_true, then we need
+            # to add the masked condition to the existing condition.
+            current["diagnostic_fields"] = current["diagnostic_fields"] * 2
+            current["threshold_condition"] = [
+                current["threshold_condition"],
+                "is_masked",
+            ]
+            current["condition_combination"] = "OR"
+            current["thresholds"] = current["thresholds"] * 2
+        if "leaf" in current.keys():
+            return None
+        return self.create_condition_chain(current)
 
-        # Reroute the decision tree around missing optional nodes
-        if optional_node_data_missing is not None:
-            self.remove_optional_missing(optional_node_data_missing)
+    def compile_evaluation_plan(
+        self,
+    ) -> Tuple[List[Tuple[int, List[List[Tuple]]]], Dict[Tuple, List]]:
+        """Compile the decision tree into a flat evaluation plan. All routes
+        from the start node to each category are traced, and the condition
+        chain for each branch between two nodes is constructed once, however
+        many routes share that branch.
 
+        Returns:
+            - The category codes, in the order in which they are assigned,
+              each paired with its routes through the tree. Each route is
+              a list of the branches taken, as (node, next node) tuples.
+            - The condition chain for each branch, keyed by branch.
+        """
         # Construct graph nodes dictionary
         graph = {
             key: [self.queries[key]["leaf"]]
@@ -850,56 +982,64 @@ class ApplyDecisionTree(BasePlugin):
             for value in item.values():
                 if isinstance(value, int):
                     defined_categories.append(value)
-        # Create categorical cube
-        categories = self.create_categorical_cube(cubes)
-        # Loop over possible categories
 
+        plan = []
+        branch_chains = {}
         for category_code in defined_categories:
-            routes = self.find_all_routes(
-                graph,
-                self.start_node,
-                category_code,
-            )
+            routes = []
             # Loop over possible routes from root to leaf
-            for route in routes:
-                conditions = []
-                for i_node in range(len(route) - 1):
-                    current_node = route[i_node]
-                    current = copy.copy(self.queries[current_node])
-                    next_node = route[i_node + 1]
-
-                    if current.get("if_false") == next_node:
-                        (
-                            current["threshold_condition"],
-                            current["condition_combination"],
-                        ) = self.invert_condition(current)
-                    if current.get("if_masked") == next_node and current.get(
-                        "if_masked"
-                    ) not in [current.get("if_false"), current.get("if_true")]:
-                        # if if_masked is not the same as if_false or if_true, then
-                        # it is a separate branch of the tree and we need to replace
-                        # the condition.
-                        current["diagnostic_fields"] = current["diagnostic_fields"]
-                        current["threshold_condition"] = "is_masked"
-                        current["condition_combination"] = ""
-                    elif current.get("if_masked") == next_node:
-                        # if masked is the same as if_false or if_true, then we need
-                        # to add the masked condition to the existing condition.
-                        current["diagnostic_fields"] = current["diagnostic_fields"] * 2
-                        current["threshold_condition"] = [
-                            current["threshold_condition"],
-                            "is_masked",
-                        ]
-                        current["condition_combination"] = "OR"
-                        current["thresholds"] = current["thresholds"] * 2
-                    if "leaf" not in current.keys():
-                        conditions.append(self.create_condition_chain(current))
-                test_chain = [conditions, "AND"]
+            for route in self.find_all_routes(graph, self.start_node, category_code):
+                branches = []
+                for branch in zip(route[:-1], route[1:]):
+                    if branch not in branch_chains:
+                        branch_chains[branch] = self.branch_condition_chain(*branch)
+                    if branch_chains[branch] is not None:
+                        branches.append(branch)
+                routes.append(branches)
+            plan.append((category_code, routes))
+        branch_chains = {
+            branch: chain
+            for branch, chain in branch_chains.items()
+            if chain is not None
+        }
+        return plan, branch_chains
+
+    def process(self, *cubes: Union[Cube, CubeList]) -> Cube:
+        """Apply the decision tree to the input cubes to produce categorical output.
 
+        Args:
+            cubes:
+                Diagnostics required for the decision tree, these at co-incident times.
+
+        Returns:
+            A cube of categorical data.
+        """
+        # Check input cubes contain required data and return only those that
+        # are needed to speed up later cube extractions.
+        cubes, optional_node_data_missing = self.prepare_input_cubes(*cubes)
+
+        # Reroute the decision tree around missing optional nodes
+        if optional_node_data_missing is not None:
+            self.remove_optional_missing(optional_node_data_missing)
+
+        plan, branch_chains = self.compile_evaluation_plan()
+        # Create categorical cube
+        categories = self.create_categorical_cube(cubes)
+
+        # Evaluate the condition for each branch once, sharing the extracted
+        # diagnostics and evaluated expressions between branches.
+        cache = {}
+        branch_masks = {
+            branch: self.evaluate_condition_chain(cubes, chain, cache)
+            for branch, chain in branch_chains.items()
+        }
+        for category_code, routes in plan:
+            for route in routes:
+                mask = branch_masks[route[0]]
+                for branch in route[1:]:
+                    mask = mask & branch_masks[branch]
                 # Set grid locations to suitable category
-                categories.data[
-                    np.ma.where(self.evaluate_condition_chain(cubes, test_chain))
-                ] = category_code
+                categories.data[np.ma.where(mask)] = category_code
 
         # Update categories for day or night where appropriate.
         categories = update_daynight(categories, day_night_map(self.queries))
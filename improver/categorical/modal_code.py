@@ -4,14 +4,15 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module containing a plugin to calculate the modal category in a period."""
 
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
 
 import iris
 import numpy as np
 from iris.analysis import Aggregator
 from iris.cube import Cube, CubeList
 from numpy import ndarray
-from scipy import stats
 
 from improver import BasePlugin
 from improver.blending import RECORD_COORD
@@ -29,10 +30,11 @@ from .utilities import day_night_map, dry_map
 class BaseModalCategory(BasePlugin):
     """Base plugin for modal weather symbol plugins."""
 
-    def __init__(
-        self,
-        decision_tree: Dict,
-    ):
+    # Number of points for which categories are counted at once, limiting the
+    # memory used to count the categories at every point.
+    POINTS_PER_CHUNK = 2**16
+
+    def __init__(self, decision_tree: Dict, max_workers: int = 1):
         """
         Set up base plugin.
 
@@ -40,9 +42,13 @@ class BaseModalCategory(BasePlugin):
             decision_tree:
                 The decision tree used to generate the categories and which contains the
                 mapping of day and night categories and of category groupings.
+            max_workers:
+                Maximum number of chunks of points to process concurrently, using
+                a pool of threads. The default of 1 processes chunks serially.
         """
         self.decision_tree = decision_tree
         self.day_night_map = day_night_map(self.decision_tree)
+        self.max_workers = max_workers
 
     def _unify_day_and_night(self, cube: Cube):
         """Remove distinction between day and night codes so they can each
@@ -56,6 +62,86 @@ class BaseModalCategory(BasePlugin):
         for day, night in self.day_night_map.items():
             cube.data[cube.data == night] = day
 
+    @staticmethod
+    def counts_per_category(
+        data: ndarray, bin_max: int, weights: Optional[ndarray] = None
+    ) -> ndarray:
+        """Implemented following https://stackoverflow.com/questions/46256279/bin-elements-per-row-vectorized-2d-bincount-for-numpy/46256361#46256361  # noqa: E501
+        Use np.bincount to count the number of occurrences within each category, so that
+        the most common occurrence can then be found. The categories at every point
+        are counted in a single pass over the data.
+
+        Args:
+            data: Array of shape (n_points, n_times) where occurrences of each possible
+                integer value between 0 and bin_max will be counted. Masked values
+                are not counted.
+            bin_max: Integer defining the number of categories expected.
+            weights: Optional integer weight for each time, by which the occurrences
+                at that time are multiplied.
+
+        Returns:
+            An array of counts for the occurrence of each category within each row.
+
+        Raises:
+            ValueError: If the data contains values outside the range of the
+                categories.
+        """
+        if data.min() < 0 or data.max() > bin_max:
+            raise ValueError(
+                f"Categories must be integers between 0 and {bin_max} to be counted."
+            )
+        n_cat = bin_max + 1
+        a_offs = data + np.arange(data.shape[0])[:, None] * n_cat
+        if weights is None:
+            weights = np.ones(data.shape[1], dtype=int)
+        counts = np.zeros(data.shape[0] * n_cat, dtype=int)
+        for weight in np.unique(weights):
+            # Use compressed() to avoid counting masked values.
+            counts += weight * np.bincount(
+                np.ma.compressed(a_offs[:, weights == weight]),
+                minlength=data.shape[0] * n_cat,
+            )
+        return counts.reshape(-1, n_cat)
+
+    @staticmethod
+    def _most_common(counts: ndarray) -> ndarray:
+        """Find the most common category at each point from the counts of each
+        category. In the event of a tie, the last of the tied categories is
+        returned, as the significance of categories generally increases with
+        their value.
+
+        Args:
+            counts: Array of shape (n_points, n_categories) of category counts.
+
+        Returns:
+            Index of the most common category at each point.
+        """
+        return counts.shape[1] - 1 - np.argmax(counts[:, ::-1], axis=1)
+
+    def _map_chunks(self, function: Callable, data: ndarray) -> ndarray:
+        """Apply a function to chunks of points of the data, concurrently if
+        max_workers is greater than 1, and join the results.
+
+        Args:
+            function: Function taking an array of shape (n_points, n_times) and
+                returning an array with a leading dimension of n_points.
+            data: Array of shape (n_points, n_times).
+
+        Returns:
+            Results of the function for every point.
+        """
+        chunks = [
+            data[start : start + self.POINTS_PER_CHUNK]
+            for start in range(0, data.shape[0], self.POINTS_PER_CHUNK)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = (
+                executor.map(function, chunks)
+                if self.max_workers > 1
+                else map(function, chunks)
+            )
+            return np.concatenate(list(results))
+
     def _prepare_input_cubes(
         self,
         cubes: CubeList,
@@ -144,12 +230,10 @@ class BaseModalCategory(BasePlugin):
 
 class ModalCategory(BaseModalCategory):
     """Plugin that returns the modal category over the period spanned by the
-    input data. In cases of a tie in the mode values, scipy returns the smaller
-    value. The opposite is desirable in this case as the significance /
-    importance of the weather code categories generally increases with the value. To
-    achieve this the categories are subtracted from an arbitrarily larger
-    number prior to calculating the mode, and this operation is reversed before the
-    final output is returned.
+    input data. The occurrences of each category at each point are counted in a
+    single pass over the data, from which the mode is found. In cases of a tie in
+    the mode values, the larger value is returned, as the significance /
+    importance of the weather code categories generally increases with the value.
 
     If there are many different categories for a single point over the time
     spanned by the input cubes it may be that the returned mode is not robust.
@@ -173,6 +257,7 @@ class ModalCategory(BaseModalCategory):
         decision_tree: Dict,
         model_id_attr: Optional[str] = None,
         record_run_attr: Optional[str] = None,
+        max_workers: int = 1,
     ):
         """
         Set up plugin and create an aggregator instance for reuse
@@ -188,8 +273,11 @@ class ModalCategory(BaseModalCategory):
             record_run_attr:
                 Name of attribute used to record models and cycles used in
                 constructing the categories.
+            max_workers:
+                Maximum number of chunks of points to process concurrently, using
+                a pool of threads. The default of 1 processes chunks serially.
         """
-        super().__init__(decision_tree)
+        super().__init__(decision_tree, max_workers=max_workers)
         self.aggregator_instance = Aggregator("mode", self.mode_aggregator)
         self.model_id_attr = model_id_attr
         self.record_run_attr = record_run_attr
@@ -200,11 +288,6 @@ class ModalCategory(BaseModalCategory):
             if "leaf" in node.keys()
         ]
         self.code_max = max(codes) + 1
-        self.unset_code_indicator = min(codes) - 100
-        self.min_dtype = np.result_type(
-            np.min_scalar_type(self.unset_code_indicator),
-            np.min_scalar_type(self.code_max),
-        )
         self.code_groups = self._code_groups()
 
     def _code_groups(self) -> Dict:
@@ -216,43 +299,58 @@ class ModalCategory(BaseModalCategory):
             groups[node["group"]] = groups.get(node["group"], []) + [node["leaf"]]
         return groups
 
-    def _group_codes(self, modal: Cube, cube: Cube):
+    def _group_codes(self, counts: ndarray) -> ndarray:
         """In instances where the mode returned is not significant, i.e. the
         category chosen occurs infrequently in the period, the codes can be
         grouped to yield a more definitive period code. Given the uncertainty,
         the least significant category (lowest number in a group that is
         found in the data) is used to replace the other data values that belong
-        to that group prior to recalculating the modal code.
+        to that group prior to recalculating the modal code. This is done by
+        moving the counts of all the codes in each group to that code.
 
-        The modal cube is modified in place.
+        Args:
+            counts:
+                Array of shape (n_points, n_categories) of the counts of each
+                code at the points at which the mode is not significant.
+
+        Returns:
+            The counts of each code after grouping.
+        """
+        counts = counts.copy()
+        points = np.arange(counts.shape[0])
+        for codes in self.code_groups.values():
+            codes = np.unique(codes)
+            group_counts = counts[:, codes]
+            default_code = codes[np.argmax(group_counts > 0, axis=1)]
+            counts[:, codes] = 0
+            counts[points, default_code] = group_counts.sum(axis=1)
+        return counts
+
+    def _modal_codes(self, data: ndarray) -> ndarray:
+        """Calculate the modal code at each point. If the modal code comprises
+        less than 30% of the data at a point, the codes are grouped and the
+        modal code of the grouped codes is returned instead.
 
         Args:
-            modal:
-                The modal categorical cube which contains UNSET_CODE_INDICATOR
-                values that need to be replaced with a more definitive period
-                code.
-            cube:
-                The original input data. Data relating to unset points will be
-                grouped and the mode recalculated."""
-
-        undecided_points = np.argwhere(modal.data == self.unset_code_indicator)
-
-        for point in undecided_points:
-            data = cube.data[(..., *point)].copy()
-
-            for _, codes in self.code_groups.items():
-                default_code = sorted([code for code in data if code in codes])
-                if default_code:
-                    data[np.isin(data, codes)] = default_code[0]
-            mode_result, counts = stats.mode(self.code_max - data)
-            modal.data[tuple(point)] = self.code_max - mode_result
+            data:
+                Array of shape (n_points, n_times) of codes.
+
+        Returns:
+            The modal code at each point.
+        """
+        counts = self.counts_per_category(data, max(self.code_max - 1, data.max()))
+        modal = self._most_common(counts)
+        minimum_significant_count = 0.3 * data.shape[1]
+        undecided = counts.max(axis=1) < minimum_significant_count
+        if undecided.any():
+            modal[undecided] = self._most_common(self._group_codes(counts[undecided]))
+        return modal
 
     def mode_aggregator(self, data: ndarray, axis: int) -> ndarray:
         """An aggregator for use with iris to calculate the mode along the
         specified axis. If the modal value selected comprises less than 30%
-        of data along the dimension being collapsed, the value is set to the
-        UNSET_CODE_INDICATOR to indicate that the uncertainty was too high to
-        return a mode.
+        of data along the dimension being collapsed, the codes are grouped to
+        find a more definitive mode, as described in _group_codes.
 
         Args:
             data:
@@ -266,16 +364,11 @@ class ModalCategory(BaseModalCategory):
         # Iris aggregators support indexing from the end of the array.
         if axis < 0:
             axis += data.ndim
-        # Aggregation coordinate is moved to the -1 position in initialisation;
-        # move this back to the leading coordinate
-        data = np.moveaxis(data, [axis], [0])
-        data = data.astype(self.min_dtype)
-        minimum_significant_count = 0.3 * data.shape[0]
-        mode_result, counts = stats.mode(self.code_max - data, axis=0)
-        mode_result[counts < minimum_significant_count] = (
-            self.code_max - self.unset_code_indicator
-        )
-        return (self.code_max - np.squeeze(mode_result)).astype(data.dtype)
+        # Aggregation coordinate is moved to the -1 position in initialisation,
+        # so the data at each point are contiguous.
+        data = np.moveaxis(data, [axis], [-1])
+        modal = self._map_chunks(self._modal_codes, data.reshape(-1, data.shape[-1]))
+        return modal.reshape(data.shape[:-1]).astype(data.dtype)
 
     @staticmethod
     def _set_blended_times(cube: Cube) -> None:
@@ -317,12 +410,6 @@ class ModalCategory(BaseModalCategory):
         cube = self._prepare_input_cubes(
             cubes, self.record_run_attr, self.model_id_attr
         )
-        # dtype may be escalated in modal calculation to accommodate the
-        # unset_code_indicator and code_max. The modes must exist within
-        # the range of the original data type, so we keep this to reset
-        # the data type at the end of the process.
-        original_dtype = cube.data.dtype
-
         self._unify_day_and_night(cube)
 
         # Handle case in which a single time is provided.
@@ -335,12 +422,6 @@ class ModalCategory(BaseModalCategory):
         result = self._prepare_result_cube(
             cube, cubes, result, self.record_run_attr, self.model_id_attr
         )
-
-        # Handle any unset points where it was hard to determine a suitable mode
-        if (result.data == self.unset_code_indicator).any():
-            self._group_codes(result, cube)
-
-        result.data = result.data.astype(original_dtype)
         return result
 
 
@@ -392,6 +473,7 @@ class ModalFromGroupings(BaseModalCategory):
         wet_bias: int = 1,
         model_id_attr: Optional[str] = None,
         record_run_attr: Optional[str] = None,
+        max_workers: int = 1,
     ):
         """
         Set up plugin.
@@ -435,8 +517,11 @@ class ModalFromGroupings(BaseModalCategory):
             record_run_attr:
                 Name of attribute used to record models and cycles used in
                 constructing the categories.
+            max_workers:
+                Maximum number of chunks of points to process concurrently, using
+                a pool of threads. The default of 1 processes chunks serially.
         """
-        super().__init__(decision_tree)
+        super().__init__(decision_tree, max_workers=max_workers)
         self.dry_map = dry_map(self.decision_tree)
 
         self.broad_categories = broad_categories
@@ -449,16 +534,26 @@ class ModalFromGroupings(BaseModalCategory):
         self.model_id_attr = model_id_attr
         self.record_run_attr = record_run_attr
 
-    def _consolidate_intensity_categories(self, cube: Cube) -> Cube:
+        self.dry_codes = np.unique(self.broad_categories["dry"])
+        self.wet_codes = np.unique(self.broad_categories["wet"])
+        codes = [*self.dry_map.keys(), *self.dry_map.values()]
+        for categories in (self.broad_categories, self.wet_categories):
+            codes.extend(code for values in categories.values() for code in values)
+        if self.intensity_categories:
+            codes.extend(
+                code for values in self.intensity_categories.values() for code in values
+            )
+        self.bin_max = max(codes)
+
+    def _consolidate_intensity_categories(self, counts: ndarray) -> None:
         """Consolidate weather codes representing different intensities of
         precipitation. This can help with computing a representative weather code.
+        The counts of the secondary codes of each intensity category are moved to
+        the primary code, if intensity categories are provided.
 
         Args:
-            cube: Weather codes cube.
-
-        Returns:
-            Weather codes cube with intensity categories consolidated,
-            if intensity categories are provided.
+            counts: Array of shape (n_points, n_categories) of weather code
+                counts, which is modified in place.
         """
         if self.intensity_categories:
             # Ignore intensities, so that weather codes representing different
@@ -466,81 +561,42 @@ class ModalFromGroupings(BaseModalCategory):
             for values in self.intensity_categories.values():
                 primary_value = values[0]
                 for secondary_value in values[1:]:
-                    cube.data[cube.data == secondary_value] = primary_value
-        return cube
-
-    @staticmethod
-    def _promote_time_coords(cube: Cube, template_cube: Cube) -> Cube:
-        """Promote the time coordinate, so that cubes can be concatenated along the
-        time coordinate. Concatenation, rather than merging, helps to ensure
-        consistent output, as merging can lead to other coordinates e.g.
-        forecast_reference_time and forecast_period being made the dimension coordinate.
-
-        Args:
-            cube: Cube with time coordinates.
-            template_cube: Cube to provide coordinates associated with the time
-                coordinate that will be added to the output cube.
-
-        Returns:
-            A cube with a time dimension coordinate and other time-related coordinates
-            are associated with the time dimension coordinate.
-        """
-        cube = iris.util.new_axis(cube, "time")
-        time_dim = cube.coord_dims("time")
+                    if secondary_value != primary_value:
+                        counts[:, primary_value] += counts[:, secondary_value]
+                        counts[:, secondary_value] = 0
 
-        associated_coords = [
-            c.name() for c in template_cube.coords(dimensions=time_dim)
-        ]
-
-        for coord in associated_coords:
-            if cube.coords(coord):
-                coord = cube.coord(coord).copy()
-                # The blend_record coordinate needs to be set to a consistent dtype
-                # to facilitate concatenation later.
-                coord.points = coord.points.astype(template_cube.coord(coord).dtype)
-                cube.remove_coord(coord)
-                cube.add_aux_coord(coord, data_dims=time_dim)
-        iris.util.promote_aux_coord_to_dim_coord(cube, "time")
-        return cube
-
-    def _emphasise_day_period(self, cube: Cube) -> Cube:
+    def _day_weights(self, cube: Cube) -> ndarray:
         """A day weighting can be set which biases the forecasts towards the hours of
         e.g. 6am-6pm. This is achieved by counting the number of input times available
         e.g. hourly and taking those that are 18 times from the end up to those
-        that are 6 from the end and duplicating these symbols by the integer weighting.
-        This approach is taken to accommodate different timezones without the need for
-        any timezone awareness. Inputs are always provided from midnight to midnight, or
-        ending at midnight if a partial day is provided. The middle of the set of input
-        times therefore corresponds to the local middle of the day. The count back
-        from the end of the period is done to accommodate partial periods (same day
-        updates). The index counted backwards is clipped to 0, meaning if there are
-        only 12 files being passed in (because we're around midday when we perform
-        the update), the first index will be 0, rather than -6, and only symbols from
-        6 periods will be multiplied up by the day_weighting.
+        that are 6 from the end and weighting these symbols by the integer weighting,
+        which is equivalent to duplicating them. This approach is taken to accommodate
+        different timezones without the need for any timezone awareness. Inputs are
+        always provided from midnight to midnight, or ending at midnight if a partial
+        day is provided. The middle of the set of input times therefore corresponds to
+        the local middle of the day. The count back from the end of the period is done
+        to accommodate partial periods (same day updates). The index counted backwards
+        is clipped to 0, meaning if there are only 12 files being passed in (because
+        we're around midday when we perform the update), the first index will be 0,
+        rather than -6, and only symbols from 6 periods will be multiplied up by the
+        day_weighting.
 
         Metadata is not used to select the day period as the times recorded
         within the cubes are all UTC, rather than local time, so the local day period
-        can not be identified. The time and forecast_period coordinates are
-        incremented by the the minimum arbitrary amount (1 second) to ensure
-        non-duplicate coordinates.
+        can not be identified.
 
         Args:
             cube: Weather codes cube.
 
         Returns:
-            Cube with more times during the daytime period, so that daytime hours
-            are emphasised, depending upon the day_weighting chosen.
+            Integer weight for each time, so that daytime hours are emphasised,
+            depending upon the day_weighting chosen.
         """
-        day_cubes = iris.cube.CubeList()
-        for cube_slice in cube.slices_over("time"):
-            cube_slice = self._promote_time_coords(cube_slice, cube)
-            day_cubes.append(cube_slice)
-
         time_coord = cube.coord("time").copy()
         time_coord.convert_units("hours since 1970-01-01 00:00:00")
         interval = time_coord.bounds[0][1] - time_coord.bounds[0][0]
 
-        n_times = len(day_cubes)
+        n_times = len(time_coord.points)
         start_file = np.clip(
             (n_times - int((self.DAY_LENGTH - self.day_start) / interval)), 0, None
         )
@@ -548,129 +604,31 @@ class ModalFromGroupings(BaseModalCategory):
             (n_times - int((self.DAY_LENGTH - self.day_end) / interval)), 0, None
         )
 
-        for increment in range(1, self.day_weighting):
-            for day_slice in day_cubes[start_file:end_file]:
-                day_slice = day_slice.copy()
-                for coord in ["time", "forecast_period"]:
-                    if len(cube.coord_dims(coord)) > 0:
-                        day_slice.coord(coord).points = (
-                            day_slice.coord(coord).points + increment
-                        )
-                        bounds = day_slice.coord(coord).bounds.copy()
-                        bounds[0] = bounds[0] + increment
-                        day_slice.coord(coord).bounds = bounds
-                day_cubes.append(day_slice)
-        return day_cubes.concatenate_cube()
-
-    def _find_wet_indices(self, cube: Cube, time_axis: int) -> np.ndarray:
-        """Identify the points at which a wet weather code should be selected.
-        This can include a wet bias if supplied.
+        weights = np.ones(n_times, dtype=int)
+        weights[start_file:end_file] = max(self.day_weighting, 1)
+        return weights
 
-        Args:
-            cube: Weather codes cube.
-            time_axis: The time coordinate dimension.
-
-        Returns:
-            Boolean array that is true if the weather codes are wet or False otherwise.
+    def _get_dry_equivalents(self, counts: ndarray) -> None:
         """
-        # Find indices corresponding to dry weather codes inclusive of a wet bias.
-        dry_counts = np.sum(
-            np.isin(cube.data, self.broad_categories["dry"]), axis=time_axis
-        )
-        wet_counts = np.sum(
-            np.isin(cube.data, self.broad_categories["wet"]), axis=time_axis
-        )
-        return (self.wet_bias * wet_counts) >= dry_counts
-
-    @staticmethod
-    def counts_per_category(data: np.ndarray, bin_max: int) -> np.ndarray:
-        """Implemented following https://stackoverflow.com/questions/46256279/bin-elements-per-row-vectorized-2d-bincount-for-numpy/46256361#46256361  # noqa: E501
-        Use np.bincount to count the number of occurrences within each category, so that
-        the most common occurrence can then be found.
-
-        Args:
-            data: Array where occurrences of each possible integer value between 0
-                and data.max() will be counted.
-            bin_max: Integer defining the number of categories expected.
-
-        Returns:
-            An array of counts for the occurrence of each category within each row.
-        """
-        n_cat = bin_max + 1
-        a_offs = data + np.arange(data.shape[0])[:, None] * n_cat
-        # Use compressed() to avoid counting masked values.
-        return np.bincount(
-            a_offs.ravel().compressed(), minlength=data.shape[0] * n_cat
-        ).reshape(-1, n_cat)
-
-    def _find_most_significant_dry_code(
-        self, cube: Cube, result: Cube, dry_indices: np.ndarray
-    ) -> Cube:
-        """Find the most significant dry weather code at each point.
-
-        Args:
-            cube: Weather code cube.
-            result: Cube into which to put the result.
-            dry_indices: Boolean, which is true if the weather codes at that point,
-                are dry.
-
-        Returns:
-            Cube where points that are dry are filled with the most common dry
-            code present at that point. If there is a tie, the most significant dry
-            weather code is used, assuming higher values for the weather code indicates
-            more significant weather.
-        """
-        data = cube.data.copy()
-        data = np.ma.masked_where(
-            ~np.isin(cube.data.copy(), self.broad_categories["dry"]), data
-        )
-
-        # If required, reshape a 3D dataset e.g. a gridded dataset to 2D.
-        # 2D datasets e.g. site datasets will be unchanged.
-        reshaped_data = data.T.reshape(-1, len(cube.coord("time").points), order="F")
-        bins = [i for v in self.broad_categories.values() for i in v]
-        bin_max = np.amax(bins)
-
-        counts = self.counts_per_category(reshaped_data, bin_max=bin_max)
-
-        # Flip counts with the aim that the counts for the higher index weather codes
-        # are on the left, and will therefore be selected by argmax.
-        counts = np.fliplr(counts)
-
-        # Reshape the 2D counts back to a 3D dataset, if required. If the input
-        # data is 2D, this reshape will have no impact.
-        reshaped_counts = counts.reshape(*data.shape[1:], -1)
-
-        result.data[dry_indices] = (bin_max - np.argmax(reshaped_counts, axis=-1))[
-            dry_indices
-        ]
-        return result
-
-    def _find_intensity_indices(self, cube: Cube) -> np.ndarray:
-        """Find which points / sites include any weather code predictions that fall
-        within the intensity categories.
+        Replace the counts of wet codes with counts of their nearest dry cloud
+        equivalent. For example a shower code is replaced with a partly cloudy code,
+        a light rain code is replaced with a cloud code, and a heavy rain code is
+        replaced with an overcast cloud code.
 
         Args:
-            cube: Weather code cube.
-
-        Returns:
-            Boolean that is True if any weather code from the intensity categories
-            are found at a given point, otherwise False.
+            counts: Array of shape (n_points, n_categories) of weather code
+                counts at the points that will receive a dry summary weather code,
+                which is modified in place.
         """
-        values = np.isin(
-            cube.data, [x for v in self.intensity_categories.values() for x in v]
-        )
-        return values.astype(bool)
+        original = counts.copy()
+        for value, target in self.dry_map.items():
+            counts[:, value] -= original[:, value]
+            counts[:, target] += original[:, value]
 
+    @staticmethod
     def _get_most_likely_following_grouping(
-        self,
-        cube: Cube,
-        result: Cube,
-        categories: Dict,
-        required_indices: np.ndarray,
-        time_axis: int,
-        categorise_using_modal: bool,
-    ):
+        counts: ndarray, categories: Dict[str, List[int]]
+    ) -> ndarray:
         """Determine the most common category and subcategory using a dictionary
         defining the categorisation. The category could be a group of weather codes
         representing frozen precipitation, where the subcategory would be the individual
@@ -682,49 +640,80 @@ class ModalFromGroupings(BaseModalCategory):
         is chosen in the event of a tie.
 
         Args:
-            cube: Weather codes cube.
-            result: Cube in which to put the result.
+            counts: Array of shape (n_points, n_categories) of weather code counts.
             categories: Dictionary defining the categories (keys) and
-                subcategories (values). The most likely category and then the most
-                likely value for the subcategory is put into the result cube.
-            required_indices: Boolean indicating which indices within the result cube
-                to fill.
-            time_axis: The time coordinate dimension.
-            categorise_using_modal: Boolean defining whether the top level
-                categorisation should use the input cube or the processed result time.
-                The input cube will have a time dimension, whereas the result cube
-                will not have a time dimension.
+                subcategories (values).
 
         Returns:
-            A result cube containing the most appropriate weather code following
-            categorisation.
+            The most likely weather code from the most likely category at each point.
         """
-        # Identify the most likely weather code within each of the subcategory.
-        category_counter = []
-        most_likely_subcategory = {}
-        for key in categories.keys():
-            if categorise_using_modal:
-                category_counter.append(np.isin(result.data, categories[key]))
-            else:
-                category_counter.append(
-                    np.sum(np.isin(cube.data, categories[key]), axis=time_axis)
-                )
-
-            subcategory_counter = []
-            for value in categories[key]:
-                subcategory_counter.append(np.sum(cube.data == value, axis=time_axis))
-            most_likely_subcategory[key] = np.array(categories[key])[
-                np.argmax(subcategory_counter, axis=time_axis)
-            ]
-
-        # Identify which category is most likely.
-        most_likely_category = np.argmax(category_counter, axis=time_axis)
-        # Use the most likely subcategory from the most likely category.
-        for index, key in enumerate(categories.keys()):
-            category_index = np.logical_and(
-                required_indices, most_likely_category == index
+        category_counts = []
+        most_likely_subcategory = []
+        for codes in categories.values():
+            category_counts.append(counts[:, np.unique(codes)].sum(axis=1))
+            most_likely_subcategory.append(
+                np.array(codes)[np.argmax(counts[:, codes], axis=1)]
             )
-            result.data[category_index] = most_likely_subcategory[key][category_index]
+        most_likely_category = np.argmax(category_counts, axis=0)
+        return np.array(most_likely_subcategory)[
+            most_likely_category, np.arange(counts.shape[0])
+        ]
+
+    def _modal_codes(self, data: ndarray, weights: ndarray) -> ndarray:
+        """Calculate the representative weather code at each point from the
+        weighted counts of each weather code, which are found in a single pass
+        over the data.
+
+        Firstly, points are identified as wet if the number of wet codes, multiplied
+        by the wet bias, is at least the number of dry codes. For dry points, wet
+        codes are converted to their dry equivalents and the most common dry code is
+        selected, with the most significant dry code selected in the event of a tie.
+        For wet points, the most likely wet code following the wet categories is
+        selected. If intensity categories are provided, codes of different
+        intensities are considered together when finding the most common code and,
+        where the code selected is within an intensity category, it is replaced by
+        the most common code of that intensity category.
+
+        Args:
+            data: Array of shape (n_points, n_times) of weather codes.
+            weights: Integer weight of the weather codes at each time.
+
+        Returns:
+            The representative weather code at each point.
+        """
+        counts = self.counts_per_category(
+            data, max(self.bin_max, data.max()), weights=weights
+        )
+        wet_indices = self.wet_bias * counts[:, self.wet_codes].sum(axis=1) >= counts[
+            :, self.dry_codes
+        ].sum(axis=1)
+        dry_indices = ~wet_indices
+
+        # For dry locations convert the wet codes to their equivalent dry
+        # codes for use in determining the summary symbol.
+        dry_counts = counts[dry_indices]
+        self._get_dry_equivalents(dry_counts)
+        counts[dry_indices] = dry_counts
+
+        original_counts = counts.copy()
+        self._consolidate_intensity_categories(counts)
+
+        result = np.empty(data.shape[0], dtype=data.dtype)
+        result[dry_indices] = self.dry_codes[
+            self._most_common(counts[dry_indices][:, self.dry_codes])
+        ]
+        result[wet_indices] = self._get_most_likely_following_grouping(
+            counts[wet_indices], self.wet_categories
+        )
+
+        if self.intensity_categories:
+            unassigned = np.ones(data.shape[0], dtype=bool)
+            for codes in self.intensity_categories.values():
+                category_indices = unassigned & np.isin(result, codes)
+                result[category_indices] = self._get_most_likely_following_grouping(
+                    original_counts[category_indices], {"intensity": codes}
+                )
+                unassigned &= ~category_indices
         return result
 
     @staticmethod
@@ -763,38 +752,6 @@ class ModalFromGroupings(BaseModalCategory):
             )
             result.replace_coord(new_coord)
 
-    def _get_dry_equivalents(
-        self, cube: Cube, dry_indices: np.ndarray, time_axis: int
-    ) -> Cube:
-        """
-        Returns a cube with only dry codes in which all wet codes have
-        been replaced by their nearest dry cloud equivalent. For example a
-        shower code is replaced with a partly cloudy code, a light rain code
-        is replaced with a cloud code, and a heavy rain code is replaced with
-        an overcast cloud code.
-
-        Args:
-            cube: Weather code cube.
-            dry_indices: An array of bools which are true for locations where
-                         the summary weather code will be dry.
-            time_axis: The time coordinate dimension.
-
-        Returns:
-            cube: Wet codes converted to their dry equivalent for those points
-                  that will receive a dry summary weather code.
-        """
-        dry_cube = cube.copy()
-        for value, target in self.dry_map.items():
-            dry_cube.data = np.where(cube.data == value, target, dry_cube.data)
-
-        # Note that np.rollaxis returns a new view of the input data. As such
-        # changes to `original` here are also changes to cube.data.
-        original = np.rollaxis(cube.data, time_axis)
-        dried = np.rollaxis(dry_cube.data, time_axis)
-        original[..., dry_indices] = dried[..., dry_indices]
-
-        return cube
-
     def process(self, cubes: CubeList) -> Cube:
         """Calculate the modal categorical code by grouping weather codes.
 
@@ -818,40 +775,16 @@ class ModalFromGroupings(BaseModalCategory):
         if len(cube.coord("time").points) == 1:
             result = cube
         else:
-            cube = self._emphasise_day_period(cube)
-
-            result = cube[0].copy()
             (time_axis,) = cube.coord_dims("time")
-
-            wet_indices = self._find_wet_indices(cube, time_axis)
-
-            # For dry locations convert the wet codes to their equivalent dry
-            # codes for use in determining the summary symbol.
-            cube = self._get_dry_equivalents(cube, ~wet_indices, time_axis)
-
-            original_cube = cube.copy()
-            cube = self._consolidate_intensity_categories(cube)
-            result = self._find_most_significant_dry_code(cube, result, ~wet_indices)
-
-            result = self._get_most_likely_following_grouping(
-                cube,
-                result,
-                self.wet_categories,
-                wet_indices,
-                time_axis,
-                categorise_using_modal=False,
+            result = next(cube.slices_over("time")).copy()
+            # Move the time dimension last, so the data at each point are
+            # contiguous.
+            data = np.moveaxis(cube.data, time_axis, -1)
+            modal = self._map_chunks(
+                partial(self._modal_codes, weights=self._day_weights(cube)),
+                data.reshape(-1, data.shape[-1]),
             )
-
-            if self.intensity_categories:
-                intensity_indices = self._find_intensity_indices(result)
-                result = self._get_most_likely_following_grouping(
-                    original_cube,
-                    result,
-                    self.intensity_categories,
-                    intensity_indices,
-                    time_axis,
-                    categorise_using_modal=True,
-                )
+            result.data = modal.reshape(data.shape[:-1])
 
         self._set_blended_times(cube, result)
 
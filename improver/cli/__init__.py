@@ -113,10 +113,19 @@ class ObjectAsStr(str):
         return "<%s.%s@%i>" % (cls.__module__, cls.__name__, obj_id)
 
 
+# Cache of inputs loaded from file, set by long-running processes
+# (see improver.server.InputCache).
+INPUT_CACHE = None
+
+
 def maybe_coerce_with(converter, obj, **kwargs):
     """Apply converter if str, pass through otherwise."""
     obj = getattr(obj, "original_object", obj)
-    return converter(obj, **kwargs) if isinstance(obj, str) else obj
+    if not isinstance(obj, str):
+        return obj
+    if INPUT_CACHE is not None:
+        return INPUT_CACHE.load(converter, obj, **kwargs)
+    return converter(obj, **kwargs)
 
 
 @value_converter
@@ -155,6 +164,55 @@ def inputcube_nolazy(to_convert):
     return maybe_coerce_with(load_cube, to_convert, no_lazy_load=True)
 
 
+@value_converter
+def inputcube_filechunks(to_convert):
+    """Loads cube from file or returns passed object.
+    Where a load is performed, lazy data is chunked spatially as in the file,
+    so that extracting spot data reads only the file chunks containing sites.
+    Args:
+        to_convert (string or iris.cube.Cube):
+            File name or Cube object.
+    Returns:
+        Loaded cube or passed object.
+    """
+    from improver.utilities.load import load_cube
+
+    return maybe_coerce_with(load_cube, to_convert, file_chunks=True)
+
+
+@value_converter
+def inputcube_deferred(to_convert):
+    """Returns file name or passed object, deferring the load of a file so
+    that the inputs of a command can be loaded together by load_inputcubes.
+    Args:
+        to_convert (string or iris.cube.Cube):
+            File name or Cube object.
+    Returns:
+        File name or passed object.
+    """
+    return getattr(to_convert, "original_object", to_convert)
+
+
+def load_inputcubes(inputs):
+    """Loads cubes from file names, passing through other objects.
+    The files are loaded together, concurrently if the
+    IMPROVER_LOAD_MAX_WORKERS environment variable is greater than 1.
+    Args:
+        inputs (list of string or iris.cube.Cube):
+            File names or Cube objects, as returned by inputcube_deferred.
+    Returns:
+        list of iris.cube.Cube:
+            Loaded cubes or passed objects, in the order of the inputs.
+    """
+    from improver.utilities.load import load_cube, load_cubes
+
+    filepaths = [obj for obj in inputs if isinstance(obj, str)]
+    if INPUT_CACHE is not None or len(filepaths) < 2:
+        return [maybe_coerce_with(load_cube, obj) for obj in inputs]
+    loaded = iter(load_cubes(filepaths))
+    return [next(loaded) if isinstance(obj, str) else obj for obj in inputs]
+
+
 @value_converter
 def inputcubelist(to_convert):
     """Loads a cubelist from file or returns passed object.
@@ -216,6 +274,22 @@ def comma_separated_list_of_float(to_convert):
     )
 
 
+@value_converter
+def comma_separated_list_of_int(to_convert):
+    """Converts comma separated string to list of integers or returns passed object.
+
+    Args:
+        to_convert (string or list)
+            comma separated string or list
+
+    Returns:
+       list
+    """
+    return maybe_coerce_with(
+        lambda string: [int(s) for s in string.split(",")], to_convert
+    )
+
+
 @value_converter
 def inputpath(to_convert):
     """Converts string paths to pathlib Path objects
@@ -312,18 +386,21 @@ def with_output(
     pass_through_output=False,
     compression_level=1,
     least_significant_digit: int = None,
+    chunk_sizes: comma_separated_list_of_int = None,
     **kwargs,
 ):
     """Add `output` keyword only argument.
     Add `compression_level` option.
     Add `least_significant_digit` option.
+    Add `chunk_sizes` option.
 
-    This is used to add extra `output`, `compression_level` and `least_significant_digit` CLI
-    options. If `output` is provided, it saves the result of calling `wrapped` to file and returns
-    None, otherwise it returns the result. If `compression_level` is provided, it compresses the
-    data with the provided compression level (or not, if `compression_level` 0). If
-    `least_significant_digit` provided, it will quantize the data to a certain number of
-    significant figures.
+    This is used to add extra `output`, `compression_level`, `least_significant_digit` and
+    `chunk_sizes` CLI options. If `output` is provided, it saves the result of calling `wrapped`
+    to file and returns None, otherwise it returns the result. If `compression_level` is
+    provided, it compresses the data with the provided compression level (or not, if
+    `compression_level` 0). If `least_significant_digit` provided, it will quantize the data to
+    a certain number of significant figures. If `chunk_sizes` provided, the data are written in
+    chunks of these lengths along the trailing dimensions.
 
     Args:
         wrapped (obj):
@@ -343,6 +420,9 @@ def with_output(
             http://www.esrl.noaa.gov/psd/data/gridded/conventions/cdc_netcdf_standard.shtml
             for details. When used with `compression level`, this will result in lossy
             compression.
+        chunk_sizes (list of int):
+            If specified, the chunk lengths of the trailing dimensions of the saved data,
+            e.g. 256,256 to write spatial tiles. By default each x-y slice is a single chunk.
     Returns:
         Result of calling `wrapped` or None if `output` is given.
     """
@@ -363,7 +443,13 @@ def with_output(
             or all([isinstance(x, Cube) for x in result])
         )
     ):
-        save_netcdf(result, output, compression_level, least_significant_digit)
+        save_netcdf(
+            result,
+            output,
+            compression_level,
+            least_significant_digit,
+            chunksizes=chunk_sizes,
+        )
         if pass_through_output:
             return ObjectAsStr(result, output)
         return
@@ -533,6 +619,7 @@ def main(
     *args,
     profile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
     memprofile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
+    instrument: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
     verbose=False,
     dry_run=False,
 ):
@@ -561,6 +648,12 @@ def main(
             of your program (suffixed with _SNAPSHOT)
             and a track of the maximum memory used by your program
             over time (suffixed with _MAX_TRACKER).
+        instrument (str):
+            If given, will write the wall time, CPU time, bytes read and
+            written and peak memory increase of each plugin to the file
+            given, in the Prometheus text format if the file name ends in
+            .prom and as JSON otherwise. The overhead is small enough for
+            use in operations. To write to stderr, use a hyphen (-)
         verbose (bool):
             Print executed commands
         dry_run (bool):
@@ -579,6 +672,10 @@ def main(
         from improver.memprofile import memory_profile_decorator
 
         exec_cmd = memory_profile_decorator(exec_cmd, memprofile)
+    if instrument is not None:
+        from improver.instrumentation import instrumentation_hook_enable
+
+        instrumentation_hook_enable(instrument)
     result = exec_cmd(
         SUBCOMMANDS_DISPATCHER,
         prog_name,
@@ -20,6 +20,7 @@ def process(
     threshold_units: str = None,
     threads: int = None,
     bin_data: bool = False,
+    max_workers: int = 1,
 ):
     """
     Calibrate a forecast cube using the Rainforests method.
@@ -68,6 +69,9 @@ def process(
             Bin data according to splits used in models. This speeds up prediction
             if there are many data points which fall into the same bins for all threshold models.
             Limits the calculation of common feature values by only calculating them once.
+        max_workers (int):
+            Maximum number of threshold models to evaluate concurrently, using a pool
+            of threads. The default of 1 evaluates the models serially.
 
     Returns:
         iris.cube.Cube:
@@ -95,7 +99,10 @@ def process(
     else:
         thresholds = [float(x) for x in output_thresholds]
     return ApplyRainForestsCalibration(
-        model_config_dict=model_config, threads=threads, bin_data=bin_data
+        model_config_dict=model_config,
+        threads=threads,
+        bin_data=bin_data,
+        max_workers=max_workers,
     ).process(
         forecast,
         CubeList(features),
@@ -12,7 +12,7 @@ from improver import cli
 
 @cli.clizefy
 @cli.with_output
-def process(*cubes: cli.inputcube, cycletime: str = None):
+def process(*cubes: cli.inputcube_deferred, cycletime: str = None):
     """Runs equal-weighted blending for a specific scenario.
 
     Calculates an equal-weighted blend of input cube data across the realization and
@@ -37,7 +37,7 @@ def process(*cubes: cli.inputcube, cycletime: str = None):
     from improver.utilities.cube_manipulation import collapse_realizations
 
     cubelist = CubeList()
-    for cube in cubes:
+    for cube in cli.load_inputcubes(cubes):
         cubelist.append(collapse_realizations(cube))
 
     plugin = WeightAndBlend("forecast_reference_time", "linear", y0val=0.5, ynval=0.5)
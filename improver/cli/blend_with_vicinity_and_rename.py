@@ -12,7 +12,7 @@ from improver import cli
 @cli.clizefy
 @cli.with_output
 def process(
-    *cubes: cli.inputcube,
+    *cubes: cli.inputcube_deferred,
     coordinate,
     new_name: str = None,
     vicinity_radius: float = None,
@@ -28,6 +28,7 @@ def process(
     record_run_attr: str = None,
     spatial_weights_from_mask=False,
     fuzzy_length=20000.0,
+    max_workers: int = 1,
 ):
     """Runs weighted blending, with additional options to handle mismatched in_vicinity coords
     and to apply a new name to the output cube.
@@ -104,6 +105,10 @@ def process(
             integer. Assumes the grid spacing is the same in the x and y
             directions and raises an error if this is not true. See
             SpatiallyVaryingWeightsFromMask for more details.
+        max_workers (int):
+            Maximum number of chunks of grid points to blend concurrently
+            when blending percentiles, using a pool of threads. The default
+            of 1 blends chunks serially.
 
     Returns:
         iris.cube.Cube:
@@ -141,6 +146,7 @@ def process(
         record_run_attr=record_run_attr,
         spatial_weights_from_mask=spatial_weights_from_mask,
         fuzzy_length=fuzzy_length,
+        max_workers=max_workers,
     )
     update_name_and_vicinity_coord(result_cube, new_name, vicinity_radius)
     return result_cube
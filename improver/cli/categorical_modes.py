@@ -15,6 +15,7 @@ def process(
     decision_tree: cli.inputjson = None,
     model_id_attr: str = None,
     record_run_attr: str = None,
+    max_workers: int = 1,
 ):
     """Generates a modal category for the period covered by the input
     categorical cubes. Where there are different categories available
@@ -35,6 +36,9 @@ def process(
         record_run_attr:
             Name of attribute used to record models and cycles used in
             constructing the categorical data.
+        max_workers (int):
+            Maximum number of chunks of points to process concurrently, using
+            a pool of threads. The default of 1 processes chunks serially.
 
     Returns:
         iris.cube.Cube:
@@ -46,5 +50,8 @@ def process(
         raise RuntimeError("Not enough input arguments. See help for more information.")
 
     return ModalCategory(
-        decision_tree, model_id_attr=model_id_attr, record_run_attr=record_run_attr
+        decision_tree,
+        model_id_attr=model_id_attr,
+        record_run_attr=record_run_attr,
+        max_workers=max_workers,
     )(cubes)
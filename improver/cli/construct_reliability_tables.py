@@ -17,6 +17,7 @@ def process(
     single_value_lower_limit: bool = False,
     single_value_upper_limit: bool = False,
     aggregate_coordinates: cli.comma_separated_list = None,
+    reliability_table: cli.inputcube = None,
 ):
     """Populate reliability tables for use in reliability calibration.
 
@@ -51,6 +52,11 @@ def process(
             calibration table using summation. This is equivalent to constructing
             then using aggregate-reliability-tables but with reduced memory
             usage due to avoiding large intermediate data.
+        reliability_table (iris.cube.Cube):
+            An optional existing reliability table, constructed from earlier
+            forecasts and truths with the same thresholds and aggregate
+            coordinates, to be updated with the contributions of the provided
+            forecasts and truths.
 
     Returns:
         iris.cube.Cube:
@@ -68,4 +74,4 @@ def process(
         n_probability_bins=n_probability_bins,
         single_value_lower_limit=single_value_lower_limit,
         single_value_upper_limit=single_value_upper_limit,
-    )(forecast, truth, aggregate_coordinates)
+    )(forecast, truth, aggregate_coordinates, reliability_table)
@@ -22,6 +22,8 @@ def process(
     predictor="mean",
     tolerance: float = 0.02,
     max_iterations: int = 1000,
+    previous_coefficients: cli.inputcubelist = None,
+    max_workers: int = 1,
 ):
     """Estimate coefficients for Ensemble Model Output Statistics.
 
@@ -81,6 +83,13 @@ def process(
             is raised. If the predictor is "realizations", then the number of
             iterations may require increasing, as there will be more
             coefficients to solve.
+        previous_coefficients (iris.cube.CubeList):
+            Optional coefficients previously estimated for the same points and
+            predictors, e.g. for the previous cycle, to be used as the initial
+            guess for the minimisation.
+        max_workers (int):
+            The maximum number of processes used to minimise the points
+            concurrently when point_by_point is True.
 
     Returns:
         iris.cube.CubeList:
@@ -103,5 +112,11 @@ def process(
         predictor=predictor,
         tolerance=tolerance,
         max_iterations=max_iterations,
+        max_workers=max_workers,
+    )
+    return plugin(
+        forecast,
+        truth,
+        landsea_mask=land_sea_mask,
+        previous_coefficients=previous_coefficients,
     )
-    return plugin(forecast, truth, landsea_mask=land_sea_mask)
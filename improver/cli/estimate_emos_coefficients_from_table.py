@@ -30,6 +30,8 @@ def process(
     max_iterations: int = 1000,
     percentiles: cli.comma_separated_list = None,
     experiment: str = None,
+    previous_coefficients: cli.inputcubelist = None,
+    max_workers: int = 1,
 ):
     """Estimate coefficients for Ensemble Model Output Statistics.
 
@@ -109,6 +111,13 @@ def process(
         experiment (str):
             A value within the experiment column to select from the forecast
             table.
+        previous_coefficients (iris.cube.CubeList):
+            Optional coefficients previously estimated for the same sites and
+            predictors, e.g. for the previous cycle, to be used as the initial
+            guess for the minimisation.
+        max_workers (int):
+            The maximum number of processes used to minimise the points
+            concurrently when point_by_point is True.
 
     Returns:
         iris.cube.CubeList:
@@ -148,5 +157,11 @@ def process(
         predictor=predictor,
         tolerance=tolerance,
         max_iterations=max_iterations,
+        max_workers=max_workers,
+    )
+    return plugin(
+        forecast_cube,
+        truth_cube,
+        additional_fields=additional_predictors,
+        previous_coefficients=previous_coefficients,
     )
-    return plugin(forecast_cube, truth_cube, additional_fields=additional_predictors)
@@ -16,6 +16,8 @@ def process(
     realizations_count: int = None,
     random_seed: int = None,
     tie_break: str = "random",
+    tile_size: int = None,
+    max_workers: int = 1,
     ignore_ecc_bounds_exceedance: bool = False,
     skip_ecc_bounds: bool = False,
 ):
@@ -42,6 +44,15 @@ def process(
             The available methods are "random", to tie-break randomly, and
             "realization", to tie-break by assigning values to the highest numbered
             realizations first.
+        tile_size (int):
+            Option to reorder percentiles in tiles of this many points, bounding
+            the memory required for ensembles on large grids. For a given
+            random seed the result does not depend on the tile size, but differs
+            from the result without tiling.
+        max_workers (int):
+            Maximum number of tiles to reorder concurrently, using a pool of
+            threads. Only used if tile_size is set. The default of 1 reorders
+            tiles serially.
         ignore_ecc_bounds_exceedance (bool):
             If True where percentiles (calculated as an intermediate output
             before realization) exceed the ECC bounds range, raises a
@@ -95,7 +106,12 @@ def process(
 
     if raw_cube:
         result = EnsembleReordering()(
-            percentiles, raw_cube, random_seed=random_seed, tie_break=tie_break
+            percentiles,
+            raw_cube,
+            random_seed=random_seed,
+            tie_break=tie_break,
+            tile_size=tile_size,
+            max_workers=max_workers,
         )
     else:
         result = RebadgePercentilesAsRealizations()(percentiles)
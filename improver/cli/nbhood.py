@@ -24,6 +24,8 @@ def process(
     area_sum=False,
     percentiles: cli.comma_separated_list = DEFAULT_PERCENTILES,
     halo_radius: float = None,
+    max_workers: int = 1,
+    correlation_method="auto",
 ):
     """Runs neighbourhood processing.
 
@@ -82,6 +84,17 @@ def process(
             where a larger grid was defined than the standard grid and we want
             to clip the grid back to the standard grid. Otherwise no clipping
             is applied.
+        max_workers (int):
+            Maximum number of x-y slices to process concurrently, using a
+            pool of threads. The default of 1 processes slices serially.
+            Only used for "probabilities" output.
+        correlation_method (str):
+            Method used to sum over circular neighbourhoods. Options:
+            "direct" for direct correlation with the kernel, "fft" for
+            correlation using fast Fourier transforms, which is faster for
+            large kernels, or "auto" to use "fft" for large kernels and
+            "direct" otherwise. Only used for "probabilities" output.
+            Default: "auto".
 
     Returns:
         iris.cube.Cube:
@@ -108,5 +121,7 @@ def process(
         area_sum=area_sum,
         percentiles=percentiles,
         halo_radius=halo_radius,
+        max_workers=max_workers,
+        correlation_method=correlation_method,
     )
     return plugin(cube, mask=mask)
@@ -25,6 +25,8 @@ def process(
     site_x_coordinate=None,
     site_y_coordinate=None,
     unique_site_id_key=None,
+    previous_neighbours: cli.inputcube = None,
+    max_workers: int = 1,
 ):
     """Create neighbour cubes for extracting spot data.
 
@@ -95,6 +97,14 @@ def process(
             as the name for an additional coordinate on the returned neighbour
             cube. Values in this coordinate will be recorded as strings, with
             all numbers padded to 8-digits, e.g. "00012345".
+        previous_neighbours (iris.cube.Cube):
+            Neighbour cube previously created by this CLI with the same
+            options, orography and land mask. The neighbours of sites that
+            are unchanged are taken from this cube, and only added or moved
+            sites are searched for.
+        max_workers (int):
+            Number of threads with which to search for the neighbours of the
+            sites. The default of 1 searches serially.
 
     Returns:
         iris.cube.Cube:
@@ -165,8 +175,9 @@ def process(
         "node_limit": node_limit,
         "site_y_coordinate": site_y_coordinate,
         "unique_site_id_key": unique_site_id_key,
+        "max_workers": max_workers,
     }
-    fargs = (site_list, orography, land_sea_mask)
+    fargs = (site_list, orography, land_sea_mask, previous_neighbours)
     kwargs = {k: v for (k, v) in args.items() if v is not None}
 
     # Deal with coordinate systems for sites other than PlateCarree.
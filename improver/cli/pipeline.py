@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run a pipeline of IMPROVER commands within a single process."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(config: cli.inputjson, *, verbose=False, dry_run=False):
+    """Run a pipeline of IMPROVER commands within a single process.
+
+    The commands are described as a directed acyclic graph of named steps.
+    Results are passed from one step to the next in memory, avoiding the
+    interpreter start up, saving and loading costs of running each command
+    separately. Only the outputs declared in the pipeline are written to file.
+
+    Args:
+        config (dict):
+            Pipeline configuration containing a "steps" dictionary keyed by
+            step name. Each step defines the "command" to run, a list of
+            command line "args" and optionally an "output" file name. An
+            argument of the form "@<step name>" is replaced with the result
+            of that step, e.g.:
+            {"steps": {"probabilities": {"command": "threshold",
+            "args": ["temperature.nc", "--threshold-values", "280"]},
+            "neighbourhood": {"command": "nbhood", "args": ["@probabilities",
+            "--neighbourhood-output", "probabilities", "--radii", "20000"],
+            "output": "output.nc"}}}
+        verbose (bool):
+            Print executed commands.
+        dry_run (bool):
+            Print commands to be executed, without running them.
+    """
+    from improver.utilities.pipeline import run_pipeline
+
+    run_pipeline(config, verbose=verbose, dry_run=dry_run)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run a long-lived worker process for IMPROVER commands."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(
+    socket_path: cli.inputpath,
+    *,
+    cache_size: int = 16,
+    cache_patterns: cli.comma_separated_list = None,
+):
+    """Run IMPROVER commands received over a Unix domain socket.
+
+    The plugin modules are imported once on start up, avoiding the import
+    cost on each command. Inputs loaded by the commands from files matching
+    the cache patterns, such as land-sea masks and neighbour cubes, are
+    retained in memory between jobs. The socket is only accessible to the
+    user running the server.
+    Commands are submitted using "improver submit". The server runs until
+    a shutdown request is submitted.
+
+    Args:
+        socket_path (pathlib.Path):
+            Path of the Unix domain socket to listen on.
+        cache_size (int):
+            Maximum number of loaded inputs to retain between jobs. When
+            exceeded, the least recently used input is evicted. Zero
+            disables caching.
+        cache_patterns (list of str):
+            Glob patterns of the input file paths to retain between jobs,
+            e.g. matching the directory containing ancillary files.
+            Inputs are only retained if they match one of these patterns,
+            so by default none are.
+    """
+    from improver.server import serve
+
+    serve(str(socket_path), cache_size=cache_size, cache_patterns=cache_patterns or ())
@@ -11,7 +11,7 @@ from improver import cli
 @cli.clizefy
 @cli.with_output
 def process(
-    *cubes: cli.inputcube,
+    *cubes: cli.inputcube_filechunks,
     apply_lapse_rate_correction: bool = False,
     fixed_lapse_rate: float = None,
     land_constraint: bool = False,
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to submit a command to a running IMPROVER server."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(
+    socket_path: cli.inputpath,
+    command: cli.LAST_OPTION = None,
+    *args,
+    shutdown=False,
+):
+    """Submit a command to a server started with "improver serve".
+
+    The command is run by the server and the output of the command,
+    including any warnings, is printed once it completes.
+
+    Args:
+        socket_path (pathlib.Path):
+            Path of the Unix domain socket the server is listening on.
+        command (str):
+            Command to run, followed by its arguments.
+        args (tuple):
+            Command arguments.
+        shutdown (bool):
+            Stop the server instead of running a command.
+
+    Returns:
+        str:
+            Representation of the object returned by the command, if any.
+
+    Raises:
+        RuntimeError: If the command failed.
+    """
+    import sys
+
+    from improver.server import submit
+
+    argv = [command, *args] if command else []
+    response = submit(socket_path, argv, shutdown=shutdown)
+    if response.get("stdout"):
+        print(response["stdout"], end="")
+    if response.get("stderr"):
+        print(response["stderr"], end="", file=sys.stderr)
+    if response["returncode"]:
+        raise RuntimeError(f"Command failed on server:\n{response['error']}")
+    return response.get("result")
@@ -10,7 +10,7 @@ from improver import cli
 
 @cli.clizefy
 @cli.with_output
-def process(*cubes: cli.inputcube):
+def process(*cubes: cli.inputcube_deferred):
     """Module to time-lag ensembles.
 
     Combines the realization from different forecast cycles into one cube.
@@ -30,4 +30,4 @@ def process(*cubes: cli.inputcube):
     """
     from improver.utilities.time_lagging import GenerateTimeLaggedEnsemble
 
-    return GenerateTimeLaggedEnsemble()(cubes)
+    return GenerateTimeLaggedEnsemble()(cli.load_inputcubes(cubes))
@@ -21,6 +21,7 @@ def process(
     wet_bias: int = 1,
     model_id_attr: str = None,
     record_run_attr: str = None,
+    max_workers: int = 1,
 ):
     """Generates a modal weather code for the period covered by the input
     categorical cubes. Where there are different categories available
@@ -69,6 +70,9 @@ def process(
         record_run_attr:
             Name of attribute used to record models and cycles used in
             constructing the categorical data.
+        max_workers (int):
+            Maximum number of chunks of points to process concurrently, using
+            a pool of threads. The default of 1 processes chunks serially.
 
     Returns:
         iris.cube.Cube:
@@ -90,4 +94,5 @@ def process(
         wet_bias,
         model_id_attr=model_id_attr,
         record_run_attr=record_run_attr,
+        max_workers=max_workers,
     )(cubes)
@@ -12,7 +12,7 @@ from improver import cli
 @cli.clizefy
 @cli.with_output
 def process(
-    *cubes: cli.inputcube,
+    *cubes: cli.inputcube_deferred,
     coordinate,
     weighting_method="linear",
     weighting_coord="forecast_period",
@@ -26,6 +26,7 @@ def process(
     record_run_attr: str = None,
     spatial_weights_from_mask=False,
     fuzzy_length=20000.0,
+    max_workers: int = 1,
 ):
     """Runs weighted blending.
 
@@ -96,6 +97,10 @@ def process(
             integer. Assumes the grid spacing is the same in the x and y
             directions and raises an error if this is not true. See
             SpatiallyVaryingWeightsFromMask for more details.
+        max_workers (int):
+            Maximum number of chunks of grid points to blend concurrently
+            when blending percentiles, using a pool of threads. The default
+            of 1 blends chunks serially.
 
     Returns:
         iris.cube.Cube:
@@ -111,6 +116,8 @@ def process(
     """
     from improver.blending.calculate_weights_and_blend import WeightAndBlend
 
+    cubes = cli.load_inputcubes(cubes)
+
     # make the data nonlazy
     if spatial_weights_from_mask:
         for _ in map(lambda cube: getattr(cube, "data"), cubes):
@@ -135,6 +142,7 @@ def process(
         y0val=y0val,
         ynval=ynval,
         cval=cval,
+        max_workers=max_workers,
     )
 
     return plugin(
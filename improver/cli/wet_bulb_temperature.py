@@ -12,7 +12,10 @@ from improver import cli
 @cli.clizefy
 @cli.with_output
 def process(
-    *cubes: cli.inputcube, convergence_condition=0.05, model_id_attr: str = None
+    *cubes: cli.inputcube,
+    convergence_condition=0.05,
+    model_id_attr: str = None,
+    use_lookup_table=False,
 ):
     """Module to generate wet-bulb temperatures.
 
@@ -37,6 +40,11 @@ def process(
             before returning wet-bulb temperatures.
         model_id_attr (str):
             Name of the attribute used to identify the source model for blending.
+        use_lookup_table (bool):
+            If True, interpolate wet-bulb temperatures from a precomputed
+            lookup table over temperature, relative humidity and pressure,
+            using the Newton iterator only for inputs outside its range.
+            This requires a convergence_condition of at least 0.01 K.
 
     Returns:
         iris.cube.Cube:
@@ -48,5 +56,7 @@ def process(
     )
 
     return WetBulbTemperature(
-        precision=convergence_condition, model_id_attr=model_id_attr
+        precision=convergence_condition,
+        model_id_attr=model_id_attr,
+        use_lookup_table=use_lookup_table,
     )(*cubes)
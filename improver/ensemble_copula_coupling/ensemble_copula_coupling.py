@@ -8,7 +8,8 @@ This module defines the plugins required for Ensemble Copula Coupling.
 """
 
 import warnings
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
 
 import iris
 import numpy as np
@@ -1351,6 +1352,127 @@ class EnsembleReordering(BasePlugin):
             )
         return raw_forecast_realizations
 
+    @staticmethod
+    def _tile_random_values(
+        key: Union[int, ndarray], time_index: int, start: int, stop: int, n_members: int
+    ) -> ndarray:
+        """
+        Generate random values for a tile of points. The values are taken
+        from a counter-based random number stream specific to the key and
+        time index, in which the values for each point are at a fixed
+        position. The values for each point are therefore independent of how
+        the points are divided into tiles.
+
+        Args:
+            key:
+                Key of the Philox random number generator.
+            time_index:
+                Index of the time slice being processed.
+            start:
+                Index of the first point of the tile, within the flattened
+                dimensions other than realization.
+            stop:
+                Index following the last point of the tile.
+            n_members:
+                Length of the realization dimension.
+
+        Returns:
+            Random values with shape (n_members, stop - start).
+        """
+        first = start * n_members
+        offset = first % 4
+        # Each step of the Philox counter generates four random values.
+        bit_generator = np.random.Philox(
+            key=key, counter=[first // 4, 0, time_index, 0]
+        )
+        values = np.random.Generator(bit_generator).random(
+            offset + (stop - start) * n_members
+        )
+        return values[offset:].reshape(stop - start, n_members).T
+
+    @staticmethod
+    def _rank_ecc_tiled(
+        raw_data: ndarray,
+        post_processed_data: ndarray,
+        realizations: ndarray,
+        random_ordering: bool,
+        key: Union[int, ndarray],
+        time_index: int,
+        tie_break: str,
+        tile_size: int,
+        max_workers: int,
+    ) -> ndarray:
+        """
+        Reorder the post-processed data for a single time using the ranking
+        of the raw data, processing tiles of points in turn so that the
+        arrays used to calculate the ranking are bounded in size.
+
+        Args:
+            raw_data:
+                Raw forecast data with the realization dimension leading.
+            post_processed_data:
+                Post-processed percentile data with the percentile dimension
+                leading.
+            realizations:
+                Realization numbers of the raw forecast, used if tie_break is
+                "realization".
+            random_ordering:
+                If True, the post-processed data are reordered randomly.
+            key:
+                Key of the random number generator.
+            time_index:
+                Index of the time slice being processed.
+            tie_break:
+                The method of tie breaking, either "random" or "realization".
+            tile_size:
+                Number of points to process in each tile.
+            max_workers:
+                Maximum number of tiles to process concurrently, using a pool
+                of threads.
+
+        Returns:
+            Reordered post-processed data, without any mask.
+        """
+        n_members = raw_data.shape[0]
+        raw_data = raw_data.reshape(n_members, -1)
+        post_processed_data = np.ma.getdata(post_processed_data)
+        result = np.empty_like(post_processed_data)
+        post_processed_data = post_processed_data.reshape(n_members, -1)
+        flat_result = result.reshape(n_members, -1)
+        n_points = raw_data.shape[1]
+
+        def _reorder_tile(start):
+            stop = min(start + tile_size, n_points)
+            if random_ordering or tie_break == "random":
+                random_data = EnsembleReordering._tile_random_values(
+                    key, time_index, start, stop, n_members
+                )
+            if random_ordering:
+                ranking = np.argsort(random_data, axis=0)
+            else:
+                if tie_break == "random":
+                    tie_break_data = random_data
+                else:
+                    tie_break_data = np.broadcast_to(
+                        realizations[:, np.newaxis], (n_members, stop - start)
+                    )
+                sorting_index = np.lexsort(
+                    (tie_break_data, raw_data[:, start:stop]), axis=0
+                )
+                ranking = np.argsort(sorting_index, axis=0)
+            flat_result[:, start:stop] = choose(
+                ranking, post_processed_data[:, start:stop]
+            )
+
+        starts = range(0, n_points, tile_size)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_reorder_tile, starts))
+        else:
+            for start in starts:
+                _reorder_tile(start)
+        return result
+
     @staticmethod
     def rank_ecc(
         post_processed_forecast_percentiles: Cube,
@@ -1358,6 +1480,8 @@ class EnsembleReordering(BasePlugin):
         random_ordering: bool = False,
         random_seed: Optional[int] = None,
         tie_break: Optional[str] = "random",
+        tile_size: Optional[int] = None,
+        max_workers: int = 1,
     ) -> Cube:
         """
         Function to apply Ensemble Copula Coupling. This ranks the
@@ -1386,6 +1510,16 @@ class EnsembleReordering(BasePlugin):
                 contains ties. The available methods are "random", to tie-break
                 randomly, and "realization", to tie-break by assigning values to the
                 highest numbered realizations first.
+            tile_size:
+                If set, the points at each time are reordered in tiles of
+                this many points, bounding the memory required for the
+                random values and sorting indices. The random values are
+                generated such that, for a given random_seed, the result is
+                identical for any tile_size, although it differs from the
+                result without tiling.
+            max_workers:
+                Maximum number of tiles to process concurrently, using a pool
+                of threads. Only used if tile_size is set.
 
         Returns:
             Cube for post-processed realizations where at a particular grid
@@ -1395,52 +1529,74 @@ class EnsembleReordering(BasePlugin):
         Raises:
             ValueError: tie_break is not either 'random' or 'realization'
         """
+        if not random_ordering and tie_break not in ["random", "realization"]:
+            msg = (
+                'Input tie_break must be either "random", or "realization",'
+                f' not "{tie_break}".'
+            )
+            raise ValueError(msg)
+
         if random_seed is not None:
             random_seed = int(random_seed)
+        if tile_size is not None:
+            key = random_seed
+            if key is None:
+                key = np.random.SeedSequence().generate_state(2, np.uint64)
         random_seed = np.random.RandomState(random_seed)
 
+        realizations = raw_forecast_realizations.coord("realization").points
         results = iris.cube.CubeList([])
-        for rawfc, calfc in zip(
-            raw_forecast_realizations.slices_over("time"),
-            post_processed_forecast_percentiles.slices_over("time"),
+        for time_index, (rawfc, calfc) in enumerate(
+            zip(
+                raw_forecast_realizations.slices_over("time"),
+                post_processed_forecast_percentiles.slices_over("time"),
+            )
         ):
-            if random_ordering:
-                random_data = random_seed.rand(*rawfc.data.shape)
-                # Returns the indices that would sort the array.
-                # As these indices are from a random dataset, only an argsort
-                # is used.
-                ranking = np.argsort(random_data, axis=0)
+            mask = np.ma.getmask(calfc.data)
+            if tile_size is not None:
+                calfc.data = EnsembleReordering._rank_ecc_tiled(
+                    rawfc.data,
+                    calfc.data,
+                    realizations,
+                    random_ordering,
+                    key,
+                    time_index,
+                    tie_break,
+                    tile_size,
+                    max_workers,
+                )
             else:
-                if tie_break == "random":
-                    tie_break_data = random_seed.rand(*rawfc.data.shape)
-                elif tie_break == "realization":
-                    realizations = raw_forecast_realizations.coord("realization").points
-                    target_shape = rawfc.data.shape
-                    realizations = np.expand_dims(
-                        realizations, axis=list(range(1, len(target_shape[1:]) + 1))
-                    )
-                    tie_break_data = np.broadcast_to(realizations, target_shape)
+                if random_ordering:
+                    random_data = random_seed.rand(*rawfc.data.shape)
+                    # Returns the indices that would sort the array.
+                    # As these indices are from a random dataset, only an argsort
+                    # is used.
+                    ranking = np.argsort(random_data, axis=0)
                 else:
-                    msg = (
-                        'Input tie_break must be either "random", or "realization",'
-                        f' not "{tie_break}".'
-                    )
-                    raise ValueError(msg)
-                # Lexsort returns the indices sorted firstly by the
-                # primary key, the raw forecast data (unless random_ordering
-                # is enabled), and secondly by the secondary key, the contents of which
-                # is determined by the tie_break input, in order to split tied values.
-                sorting_index = np.lexsort((tie_break_data, rawfc.data), axis=0)
-                # Returns the indices that would sort the array.
-                ranking = np.argsort(sorting_index, axis=0)
-            # Index the post-processed forecast data using the ranking array.
-            # The following uses a custom choose function that reproduces the
-            # required elements of the np.choose method without the limitation
-            # of having < 32 arrays or a leading dimension < 32 in the
-            # input data array. This function allows indexing of a 3d array
-            # using a 3d array.
-            mask = np.ma.getmask(calfc.data)
-            calfc.data = choose(ranking, calfc.data)
+                    if tie_break == "random":
+                        tie_break_data = random_seed.rand(*rawfc.data.shape)
+                    else:
+                        target_shape = rawfc.data.shape
+                        tie_break_data = np.expand_dims(
+                            realizations,
+                            axis=list(range(1, len(target_shape[1:]) + 1)),
+                        )
+                        tie_break_data = np.broadcast_to(tie_break_data, target_shape)
+                    # Lexsort returns the indices sorted firstly by the
+                    # primary key, the raw forecast data (unless random_ordering
+                    # is enabled), and secondly by the secondary key, the contents
+                    # of which is determined by the tie_break input, in order to
+                    # split tied values.
+                    sorting_index = np.lexsort((tie_break_data, rawfc.data), axis=0)
+                    # Returns the indices that would sort the array.
+                    ranking = np.argsort(sorting_index, axis=0)
+                # Index the post-processed forecast data using the ranking array.
+                # The following uses a custom choose function that reproduces the
+                # required elements of the np.choose method without the limitation
+                # of having < 32 arrays or a leading dimension < 32 in the
+                # input data array. This function allows indexing of a 3d array
+                # using a 3d array.
+                calfc.data = choose(ranking, calfc.data)
             if mask is not np.ma.nomask:
                 calfc.data = np.ma.MaskedArray(calfc.data, mask, dtype=np.float32)
             results.append(calfc)
@@ -1514,6 +1670,8 @@ class EnsembleReordering(BasePlugin):
         random_ordering: bool = False,
         random_seed: Optional[int] = None,
         tie_break: Optional[str] = "random",
+        tile_size: Optional[int] = None,
+        max_workers: int = 1,
     ) -> Cube:
         """
         Reorder post-processed forecast using the ordering of the
@@ -1540,6 +1698,13 @@ class EnsembleReordering(BasePlugin):
                 contains ties. The available methods are "random", to tie-break
                 randomly, and "realization", to tie-break by assigning values to the
                 highest numbered realizations first.
+            tile_size:
+                If set, the points at each time are reordered in tiles of
+                this many points, bounding the memory required. For a given
+                random_seed, the result is identical for any tile_size.
+            max_workers:
+                Maximum number of tiles to process concurrently, using a pool
+                of threads. Only used if tile_size is set.
 
         Returns:
             Cube containing the new ensemble realizations where all points
@@ -1565,6 +1730,8 @@ class EnsembleReordering(BasePlugin):
             random_ordering=random_ordering,
             random_seed=random_seed,
             tie_break=tie_break,
+            tile_size=tile_size,
+            max_workers=max_workers,
         )
         plugin = RebadgePercentilesAsRealizations()
         post_processed_forecast_realizations = plugin(
@@ -0,0 +1,226 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Module containing lightweight instrumentation of plugin calls.
+
+When enabled, every call of a plugin records the wall time, CPU time, bytes
+read and written and the increase in the peak resident set size (RSS) of the
+process, which are accumulated for each plugin. Only a few system calls are
+made for each plugin call, so the overhead is small enough for the
+instrumentation to remain enabled in operational use.
+
+Nested plugin calls are included in the resources recorded for the calling
+plugin. CPU time, bytes read and written and peak RSS are measured for the
+whole process, so are also attributed to any other plugins running
+concurrently in other threads.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from resource import RUSAGE_SELF, getrusage
+from typing import Any, Callable, Dict, Tuple
+
+from improver.utilities.atomic_write import atomic_write
+
+#: Whether plugin calls are recorded
+ENABLED = False
+
+#: Names, Prometheus metric types and descriptions of the recorded metrics
+METRICS = {
+    "calls": ("counter", "Number of calls of the plugin."),
+    "wall_seconds": ("counter", "Wall time spent in the plugin."),
+    "cpu_seconds": ("counter", "CPU time of the process spent in the plugin."),
+    "read_bytes": ("counter", "Bytes read by the process in the plugin."),
+    "written_bytes": ("counter", "Bytes written by the process in the plugin."),
+    "peak_rss_increase_bytes": (
+        "gauge",
+        "Largest increase in the peak RSS of the process in a call of the plugin.",
+    ),
+}
+
+_RECORDS: Dict[str, Dict[str, float]] = {}
+_LOCK = threading.Lock()
+
+# Process for which /proc/self/io is open, its file descriptor, and the
+# number of bytes read from it
+_PROC_IO_PID = None
+_PROC_IO_FD = None
+_PROC_IO_READ = 0
+
+# Linux reports the maximum RSS in KiB rather than bytes
+_MAX_RSS_SCALE = 1024 if sys.platform == "linux" else 1
+
+
+def _io_bytes() -> Tuple[int, int]:
+    """Return the bytes read and written by the process so far, as reported
+    by /proc/self/io. This includes reads and writes satisfied from the page
+    cache, but not access to memory-mapped files. The file is kept open, as
+    reopening it would cost more than reading it, and the bytes read from it
+    are excluded from the total.
+
+    Returns:
+        - Bytes read, or zero if not available on this platform.
+        - Bytes written, or zero if not available on this platform.
+    """
+    global _PROC_IO_PID, _PROC_IO_FD, _PROC_IO_READ
+    try:
+        if _PROC_IO_PID != os.getpid():
+            # the file describes the process that opened it, so is reopened
+            # in forked processes
+            _PROC_IO_FD = os.open("/proc/self/io", os.O_RDONLY)
+            _PROC_IO_PID = os.getpid()
+            _PROC_IO_READ = 0
+        contents = os.pread(_PROC_IO_FD, 4096, 0)
+        lines = contents.split(b"\n", 2)
+        read, written = int(lines[0].split()[1]), int(lines[1].split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0, 0
+    # the total reported does not include the current read of the file
+    read -= _PROC_IO_READ
+    _PROC_IO_READ += len(contents)
+    return read, written
+
+
+def record_call(name: str, function: Callable, *args, **kwargs) -> Any:
+    """Call a function, recording the resources used under the given name.
+    The call is recorded even if the function raises an exception.
+
+    Args:
+        name:
+            Name under which to record the call.
+        function:
+            Function to call.
+        *args:
+            Positional arguments for the function.
+        **kwargs:
+            Keyword arguments for the function.
+
+    Returns:
+        Output of the function.
+    """
+    start_read, start_written = _io_bytes()
+    start_max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    start_cpu = time.process_time()
+    start_wall = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+        read, written = _io_bytes()
+        with _LOCK:
+            record = _RECORDS.setdefault(name, dict.fromkeys(METRICS, 0))
+            record["calls"] += 1
+            record["wall_seconds"] += wall
+            record["cpu_seconds"] += cpu
+            record["read_bytes"] += read - start_read
+            record["written_bytes"] += written - start_written
+            record["peak_rss_increase_bytes"] = max(
+                record["peak_rss_increase_bytes"],
+                (max_rss - start_max_rss) * _MAX_RSS_SCALE,
+            )
+
+
+def instrumentation_enable() -> None:
+    """Start recording plugin calls."""
+    global ENABLED
+    ENABLED = True
+
+
+def instrumentation_disable() -> None:
+    """Stop recording plugin calls. Existing records are kept."""
+    global ENABLED
+    ENABLED = False
+
+
+def instrumentation_reset() -> None:
+    """Discard all records of plugin calls."""
+    with _LOCK:
+        _RECORDS.clear()
+
+
+def instrumentation_records() -> Dict[str, Dict[str, float]]:
+    """Return the resources recorded for each plugin.
+
+    Returns:
+        Dictionary of the metrics recorded for each plugin, keyed by the
+        plugin's module and class name.
+    """
+    with _LOCK:
+        return {name: dict(record) for name, record in sorted(_RECORDS.items())}
+
+
+def format_json(records: Dict[str, Dict[str, float]]) -> str:
+    """Format records of plugin calls as JSON.
+
+    Args:
+        records:
+            Metrics recorded for each plugin.
+
+    Returns:
+        JSON document of the metrics of each plugin.
+    """
+    return json.dumps({"plugins": records}, indent=2) + "\n"
+
+
+def format_prometheus(records: Dict[str, Dict[str, float]]) -> str:
+    """Format records of plugin calls in the Prometheus text exposition
+    format, as read by the textfile collector of the node exporter.
+
+    Args:
+        records:
+            Metrics recorded for each plugin.
+
+    Returns:
+        Text of the metrics, labelled by plugin.
+    """
+    lines = []
+    for metric, (metric_type, description) in METRICS.items():
+        name = f"improver_plugin_{metric}"
+        if metric_type == "counter":
+            name += "_total"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for plugin, record in records.items():
+            lines.append(f'{name}{{plugin="{plugin}"}} {record[metric]}')
+    return "\n".join(lines) + "\n"
+
+
+def instrumentation_dump(dump_filename: str) -> None:
+    """Write the records of plugin calls to file, in the Prometheus text
+    format if the file name ends in ".prom" and as JSON otherwise. The file
+    is replaced atomically, so that readers never see a partial file.
+
+    Args:
+        dump_filename:
+            File path to write the records to. To write JSON to stderr,
+            use a hyphen (-).
+    """
+    records = instrumentation_records()
+    if dump_filename == "-":
+        sys.stderr.write(format_json(records))
+        return
+    if dump_filename.endswith(".prom"):
+        text = format_prometheus(records)
+    else:
+        text = format_json(records)
+    with atomic_write(dump_filename) as output:
+        output.write(text)
+
+
+def instrumentation_hook_enable(dump_filename: str) -> None:
+    """Start recording plugin calls and register a hook to write the records
+    to file at exit.
+
+    Args:
+        dump_filename:
+            File path to write the records to at exit.
+    """
+    instrumentation_enable()
+    atexit.register(instrumentation_dump, dump_filename)
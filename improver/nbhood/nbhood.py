@@ -4,11 +4,12 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module containing neighbourhood processing utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import iris
 import numpy as np
-from iris.cube import Cube, CubeList
+from iris.cube import Cube
 from numpy import ndarray
 from scipy.ndimage.filters import correlate
 
@@ -22,12 +23,20 @@ from improver.utilities.cube_checker import (
     check_cube_coordinates,
     find_dimension_coordinate_mismatch,
 )
-from improver.utilities.neighbourhood_tools import boxsum, pad_and_roll
+from improver.utilities.neighbourhood_tools import (
+    boxsum,
+    fft_correlate,
+    pad_and_roll,
+)
 from improver.utilities.spatial import (
     check_if_grid_is_equal_area,
     distance_to_number_of_grid_cells,
 )
 
+# Width in grid cells of the smallest circular kernel for which correlation
+# using fast Fourier transforms is faster than direct correlation.
+FFT_MIN_KERNEL_WIDTH = 11
+
 
 def check_radius_against_distance(cube: Cube, radius: float) -> None:
     """Check required distance isn't greater than the size of the domain.
@@ -48,7 +57,7 @@ def check_radius_against_distance(cube: Cube, radius: float) -> None:
     max_allowed = np.sqrt(axes[0] ** 2 + axes[1] ** 2) * 0.5
     if radius > max_allowed:
         raise ValueError(
-            f"Distance of {radius}m exceeds max domain " f"distance of {max_allowed}m"
+            f"Distance of {radius}m exceeds max domain distance of {max_allowed}m"
         )
 
 
@@ -187,6 +196,8 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         weighted_mode: bool = False,
         sum_only: bool = False,
         re_mask: bool = True,
+        max_workers: int = 1,
+        correlation_method: str = "auto",
     ) -> None:
         """
         Initialise class.
@@ -217,12 +228,25 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 mask is not applied. Therefore, the neighbourhood processing
                 may result in values being present in areas that were
                 originally masked.
+            max_workers:
+                Maximum number of x-y slices to process concurrently, using a
+                pool of threads. The default of 1 processes slices serially.
+            correlation_method:
+                Method used to sum over circular neighbourhoods. Options:
+                'direct' for direct correlation with the kernel, 'fft' for
+                correlation using fast Fourier transforms, which is faster
+                for large kernels and matches direct correlation to within
+                floating point precision, or 'auto' (default) to use 'fft'
+                for kernels at least FFT_MIN_KERNEL_WIDTH grid cells wide
+                and 'direct' otherwise.
 
         Raises:
             ValueError: If the neighbourhood_method is not either
                         "square" or "circular".
             ValueError: If the weighted_mode is used with a
                         neighbourhood_method that is not "circular".
+            ValueError: If the correlation_method is not one of "auto",
+                        "direct" or "fft".
         """
         super().__init__(radii, lead_times=lead_times)
         if neighbourhood_method in ["square", "circular"]:
@@ -240,9 +264,37 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         self.weighted_mode = weighted_mode
         self.sum_only = sum_only
         self.re_mask = re_mask
+        self.max_workers = max_workers
+        if correlation_method not in ["auto", "direct", "fft"]:
+            msg = "{} is not a valid correlation_method.".format(correlation_method)
+            raise ValueError(msg)
+        self.correlation_method = correlation_method
+
+    def _valid_data_area_sum(self, data_mask: ndarray, shape: tuple) -> ndarray:
+        """
+        Calculate the number of valid data points (or their total weight, for
+        a weighted circular kernel) within the neighbourhood of each point.
+
+        Args:
+            data_mask:
+                Mask that is True for invalid data points. This may be a
+                scalar False if all data points are valid.
+            shape:
+                Shape of the x-y data array.
+
+        Returns:
+            Array containing the neighbourhood sum of valid data points.
+        """
+        if self.neighbourhood_method == "circular":
+            mask_type = np.float32
+        else:
+            mask_type = np.int64
+        valid_data_mask = np.ones(shape, dtype=mask_type)
+        valid_data_mask[data_mask] = 0
+        return self._do_nbhood_sum(valid_data_mask)
 
     def _calculate_neighbourhood(
-        self, data: ndarray, mask: ndarray = None
+        self, data: ndarray, mask: ndarray = None, area_sum: Optional[ndarray] = None
     ) -> Union[ndarray, np.ma.MaskedArray]:
         """
         Apply neighbourhood processing. Ensures that masked data does not
@@ -255,6 +307,10 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 Input data array.
             mask:
                 Mask of valid input data elements.
+            area_sum:
+                Neighbourhood sum of valid data points, as calculated by
+                _valid_data_area_sum. This may be supplied where it is shared
+                by many x-y slices; if not supplied it is calculated.
 
         Returns:
             Array containing the smoothed field after the
@@ -286,18 +342,13 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
 
         # Replace invalid elements with zeros so they don't count towards
         # neighbourhood sum
-        if self.neighbourhood_method == "circular":
-            mask_type = np.float32
-        else:
-            mask_type = np.int64
-        valid_data_mask = np.ones(data.shape, dtype=mask_type)
-        valid_data_mask[data_mask] = 0
         data[data_mask] = 0
 
         if self.sum_only:
             max_extreme_data = None
         else:
-            area_sum = self._do_nbhood_sum(valid_data_mask)
+            if area_sum is None:
+                area_sum = self._valid_data_area_sum(data_mask, data.shape)
             max_extreme_data = area_sum.astype(loc_data_dtype)
         # Where data are all ones in nbhood, result will be same as area_sum
         data = self._do_nbhood_sum(data, max_extreme=max_extreme_data)
@@ -398,7 +449,14 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                     data, self.nb_size, mode="constant", constant_values=extreme
                 )
             elif self.neighbourhood_method == "circular":
-                data = correlate(data, self.kernel, mode="nearest")
+                use_fft = self.correlation_method == "fft" or (
+                    self.correlation_method == "auto"
+                    and max(self.kernel.shape) >= FFT_MIN_KERNEL_WIDTH
+                )
+                if use_fft:
+                    data = fft_correlate(data, self.kernel)
+                else:
+                    data = correlate(data, self.kernel, mode="nearest")
         else:
             data = untrimmed
 
@@ -413,6 +471,12 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         Call the methods required to apply a neighbourhood processing to a cube.
 
         Applies neighbourhood processing to each 2D x-y-slice of the input cube.
+        Where the input data are not masked, the neighbourhood sum of valid
+        points is shared by all slices and so is calculated only once. The
+        slices are processed concurrently if max_workers is greater than 1.
+        As for slicing and merging the cube, the x-y dimensions of the
+        returned cube are last and any other dimensions of length 1 are
+        demoted to scalar coordinates.
 
         If the input cube is masked the neighbourhood sum is calculated from
         the total of the unmasked data in the neighbourhood around each grid
@@ -454,13 +518,53 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         except AttributeError:
             mask_cube_data = None
 
-        result_slices = CubeList()
-        for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            cube_slice.data = self._calculate_neighbourhood(
-                cube_slice.data, mask_cube_data
+        # Demote leading dimensions of length 1 to scalar coordinates and
+        # order the dimensions with x-y last.
+        yx_dims = [cube.coord_dims(cube.coord(axis=axis))[0] for axis in "yx"]
+        leading_dims = [dim for dim in range(cube.ndim) if dim not in yx_dims]
+        if any(cube.shape[dim] == 1 for dim in leading_dims):
+            cube = cube[
+                tuple(
+                    0 if dim in leading_dims and cube.shape[dim] == 1 else slice(None)
+                    for dim in range(cube.ndim)
+                )
+            ]
+            yx_dims = [cube.coord_dims(cube.coord(axis=axis))[0] for axis in "yx"]
+            leading_dims = [dim for dim in range(cube.ndim) if dim not in yx_dims]
+        dim_order = leading_dims + yx_dims
+        data = cube.data.transpose(dim_order)
+        stacked_data = data.reshape((-1,) + data.shape[-2:])
+
+        area_sum = None
+        if not self.sum_only and not np.ma.is_masked(stacked_data):
+            area_sum = self._valid_data_area_sum(
+                mask_cube_data == 0, stacked_data.shape[-2:]
+            )
+
+        def _calculate_slice(slice_data):
+            return self._calculate_neighbourhood(slice_data, mask_cube_data, area_sum)
+
+        result_data = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = (
+                executor.map(_calculate_slice, stacked_data)
+                if self.max_workers > 1
+                else map(_calculate_slice, stacked_data)
             )
-            result_slices.append(cube_slice)
-        neighbourhood_averaged_cube = result_slices.merge_cube()
+            for index, slice_result in enumerate(results):
+                if result_data is None:
+                    result_data = np.empty(stacked_data.shape, slice_result.dtype)
+                    if self.re_mask:
+                        result_data = np.ma.masked_array(
+                            result_data, mask=np.zeros(stacked_data.shape, dtype=bool)
+                        )
+                result_data[index] = slice_result
+
+        neighbourhood_averaged_cube = cube.copy(
+            data=result_data.reshape(data.shape).transpose(np.argsort(dim_order))
+        )
+        if dim_order != list(range(cube.ndim)):
+            neighbourhood_averaged_cube.transpose(dim_order)
 
         return neighbourhood_averaged_cube
 
@@ -774,6 +878,8 @@ class MetaNeighbourhood(BasePlugin):
         area_sum: bool = False,
         percentiles: Union[float, List[float]] = DEFAULT_PERCENTILES,
         halo_radius: Optional[float] = None,
+        max_workers: int = 1,
+        correlation_method: str = "auto",
     ) -> None:
         """
         Initialise the MetaNeighbourhood class.
@@ -824,6 +930,14 @@ class MetaNeighbourhood(BasePlugin):
                 where a larger grid was defined than the standard grid and we want
                 to clip the grid back to the standard grid. Otherwise no clipping
                 is applied.
+            max_workers:
+                Maximum number of x-y slices to process concurrently, using a
+                pool of threads. The default of 1 processes slices serially.
+                Only used for "probabilities" output.
+            correlation_method:
+                Method used to sum over circular neighbourhoods. Options:
+                "direct", "fft" or "auto" (default). See NeighbourhoodProcessing.
+                Only used for "probabilities" output.
         """
         self._neighbourhood_output = neighbourhood_output
         self._neighbourhood_shape = neighbourhood_shape
@@ -833,6 +947,8 @@ class MetaNeighbourhood(BasePlugin):
         self._area_sum = area_sum
         self._percentiles = percentiles
         self._halo_radius = halo_radius
+        self._max_workers = max_workers
+        self._correlation_method = correlation_method
 
         if neighbourhood_output == "percentiles":
             if weighted_mode:
@@ -876,6 +992,8 @@ class MetaNeighbourhood(BasePlugin):
                 weighted_mode=self._weighted_mode,
                 sum_only=self._area_sum,
                 re_mask=True,
+                max_workers=self._max_workers,
+                correlation_method=self._correlation_method,
             )(cube, mask_cube=mask)
         elif self._neighbourhood_output == "percentiles":
             result = GeneratePercentilesFromANeighbourhood(
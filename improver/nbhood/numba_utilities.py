@@ -0,0 +1,69 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for neighbourhood processing
+plugins.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit(parallel=True, nogil=True)
+def fast_recursive_filter(
+    grid: np.ndarray, coeffs_x: np.ndarray, coeffs_y: np.ndarray, iterations: int
+) -> np.ndarray:
+    """Apply the recursive filter in place to each slice of a stack of
+    float32 grids, equivalent to repeated calls to the forward and backward
+    sweeps of RecursiveFilter along x and then y. Slices are processed in
+    parallel.
+
+    Args:
+        grid: 3-D float32 array of shape (slices, y, x), modified in place.
+        coeffs_x: 3-D float32 array of shape (1 or slices, y, x - 1) of the
+            smoothing coefficients along x.
+        coeffs_y: 3-D float32 array of shape (1 or slices, y - 1, x) of the
+            smoothing coefficients along y.
+        iterations: The number of iterations of the recursive filter.
+    Returns:
+        The filtered grid.
+    """
+    if coeffs_x.shape[0] != coeffs_y.shape[0]:
+        raise ValueError("coeffs_x and coeffs_y must have the same leading dimension.")
+    if coeffs_x.shape[0] != 1 and coeffs_x.shape[0] != grid.shape[0]:
+        raise ValueError("Coefficients must be provided once, or for every slice.")
+    one = np.float32(1.0)
+    n_y, n_x = grid.shape[1], grid.shape[2]
+    # coefficients index stride across slices, zero if the coefficients are shared
+    stride = 1 if coeffs_x.shape[0] > 1 else 0
+    for s in prange(grid.shape[0]):
+        c = s * stride
+        for _ in range(iterations):
+            for j in range(n_y):
+                for i in range(1, n_x):
+                    grid[s, j, i] = (one - coeffs_x[c, j, i - 1]) * grid[
+                        s, j, i
+                    ] + coeffs_x[c, j, i - 1] * grid[s, j, i - 1]
+                for i in range(n_x - 2, -1, -1):
+                    grid[s, j, i] = (one - coeffs_x[c, j, i]) * grid[
+                        s, j, i
+                    ] + coeffs_x[c, j, i] * grid[s, j, i + 1]
+            for j in range(1, n_y):
+                for i in range(n_x):
+                    grid[s, j, i] = (one - coeffs_y[c, j - 1, i]) * grid[
+                        s, j, i
+                    ] + coeffs_y[c, j - 1, i] * grid[s, j - 1, i]
+            for j in range(n_y - 2, -1, -1):
+                for i in range(n_x):
+                    grid[s, j, i] = (one - coeffs_y[c, j, i]) * grid[
+                        s, j, i
+                    ] + coeffs_y[c, j, i] * grid[s, j + 1, i]
+    return grid
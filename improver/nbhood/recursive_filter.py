@@ -4,6 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module to apply a recursive filter to neighbourhooded data."""
 
+import warnings
 from typing import List, Optional, Tuple
 
 import iris
@@ -16,7 +17,7 @@ from improver.generate_ancillaries.generate_orographic_smoothing_coefficients im
     OrographicSmoothingCoefficients,
 )
 from improver.utilities.cube_checker import check_cube_coordinates
-from improver.utilities.pad_spatial import pad_cube_with_halo, remove_halo_from_cube
+from improver.utilities.pad_spatial import pad_cube_with_halo
 
 
 class RecursiveFilter(PostProcessingPlugin):
@@ -74,30 +75,30 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid:
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied, with the spatial dimensions last.
+                Any leading dimensions (e.g. a stack of slices) are filtered
+                together.
             smoothing_coefficients:
-                Matching 2D array of smoothing_coefficient values that will be
+                Matching array of smoothing_coefficient values that will be
                 used when applying the recursive filter along the specified
-                axis.
+                axis, broadcastable against the grid.
             axis:
                 Index of the spatial axis (0 or 1) over which to recurse.
 
         Returns:
-            2D array containing the smoothed field after the recursive
+            Array containing the smoothed field after the recursive
             filter method has been applied to the input array in the
             forward direction along the specified axis.
         """
-        lim = grid.shape[axis]
-        for i in range(1, lim):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i - 1, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i - 1, :] * grid[i - 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i - 1]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i - 1] * grid[:, i - 1]
+        grid_view = np.moveaxis(grid, grid.ndim - 2 + axis, 0)
+        coeffs_view = np.moveaxis(
+            smoothing_coefficients, smoothing_coefficients.ndim - 2 + axis, 0
+        )
+        for i in range(1, grid_view.shape[0]):
+            grid_view[i] = (1.0 - coeffs_view[i - 1]) * grid_view[i] + coeffs_view[
+                i - 1
+            ] * grid_view[i - 1]
         return grid
 
     @staticmethod
@@ -123,30 +124,30 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid:
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied, with the spatial dimensions last.
+                Any leading dimensions (e.g. a stack of slices) are filtered
+                together.
             smoothing_coefficients:
-                Matching 2D array of smoothing_coefficient values that will be
+                Matching array of smoothing_coefficient values that will be
                 used when applying the recursive filter along the specified
-                axis.
+                axis, broadcastable against the grid.
             axis:
                 Index of the spatial axis (0 or 1) over which to recurse.
 
         Returns:
-            2D array containing the smoothed field after the recursive
+            Array containing the smoothed field after the recursive
             filter method has been applied to the input array in the
             backwards direction along the specified axis.
         """
-        lim = grid.shape[axis]
-        for i in range(lim - 2, -1, -1):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i, :] * grid[i + 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i] * grid[:, i + 1]
+        grid_view = np.moveaxis(grid, grid.ndim - 2 + axis, 0)
+        coeffs_view = np.moveaxis(
+            smoothing_coefficients, smoothing_coefficients.ndim - 2 + axis, 0
+        )
+        for i in range(grid_view.shape[0] - 2, -1, -1):
+            grid_view[i] = (1.0 - coeffs_view[i]) * grid_view[i] + coeffs_view[
+                i
+            ] * grid_view[i + 1]
         return grid
 
     @staticmethod
@@ -198,6 +199,65 @@ class RecursiveFilter(PostProcessingPlugin):
             cube.data = output
         return cube
 
+    @staticmethod
+    def _run_recursion_on_stack(
+        grid: ndarray,
+        smoothing_coefficients_x: ndarray,
+        smoothing_coefficients_y: ndarray,
+        iterations: int,
+    ) -> ndarray:
+        """
+        Method to run the recursive filter on a stack of 2D slices at once.
+        A compiled implementation, which processes the slices in parallel, is
+        used where numba is available and the inputs are float32. Otherwise
+        each sweep of the filter is applied to all slices together using
+        numpy. Both give results identical to filtering each slice in turn.
+
+        Args:
+            grid:
+                3D array of shape (slices, y, x) containing the input data to
+                which the recursive filter will be applied. This is modified
+                in place.
+            smoothing_coefficients_x:
+                3D array of smoothing_coefficient values along the x-axis,
+                with a leading dimension of either one, if the coefficients
+                are shared by all slices, or the number of slices.
+            smoothing_coefficients_y:
+                3D array of smoothing_coefficient values along the y-axis,
+                with the same leading dimension as smoothing_coefficients_x.
+            iterations:
+                The number of iterations of the recursive filter.
+
+        Returns:
+            Array containing the smoothed slices.
+        """
+        if all(
+            arr.dtype == np.float32
+            for arr in [grid, smoothing_coefficients_x, smoothing_coefficients_y]
+        ):
+            try:
+                import numba  # noqa: F401
+
+                from improver.nbhood.numba_utilities import fast_recursive_filter
+            except ImportError:
+                warnings.warn(
+                    "Module numba unavailable. RecursiveFilter will be slower."
+                )
+            else:
+                return fast_recursive_filter(
+                    grid,
+                    np.ascontiguousarray(smoothing_coefficients_x),
+                    np.ascontiguousarray(smoothing_coefficients_y),
+                    iterations,
+                )
+
+        for _ in range(iterations):
+            grid = RecursiveFilter._recurse_forward(grid, smoothing_coefficients_x, 1)
+            grid = RecursiveFilter._recurse_backward(grid, smoothing_coefficients_x, 1)
+            grid = RecursiveFilter._recurse_forward(grid, smoothing_coefficients_y, 0)
+            grid = RecursiveFilter._recurse_backward(grid, smoothing_coefficients_y, 0)
+        return grid
+
     def _validate_coefficients(
         self, cube: Cube, smoothing_coefficients: CubeList
     ) -> List[Cube]:
@@ -330,9 +390,10 @@ class RecursiveFilter(PostProcessingPlugin):
         2. Construct an array of filter parameters (smoothing_coefficients_x
            and smoothing_coefficients_y) for each cube slice that are used to
            weight the recursive filter in the x- and y-directions.
-        3. Pad each cube slice with a square-neighbourhood halo and apply
-           the recursive filter for the required number of iterations.
-        4. Remove the halo from the cube slice and append the recursed cube
+        3. Stack the cube slices, pad each with a square-neighbourhood halo
+           and apply the recursive filter to all slices together for the
+           required number of iterations.
+        4. Remove the halo from each slice and append the recursed cube
            slice to a 'recursed cube'.
         5. Merge all the cube slices in the 'recursed cube' into a 'new cube'.
         6. Modify the 'new cube' so that its scalar dimension co-ordinates are
@@ -403,42 +464,48 @@ class RecursiveFilter(PostProcessingPlugin):
         if mask_zeros:
             cube.data = np.ma.masked_where(cube.data == 0.0, cube.data, copy=False)
 
-        recursed_cube = iris.cube.CubeList()
-        for cslice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            padded_cube = pad_cube_with_halo(
-                cslice, 2 * self.edge_width, 2 * self.edge_width, pad_method="symmetric"
-            )
-
-            slice_coeffs_x = coeffs_x.copy()
-            slice_coeffs_y = coeffs_y.copy()
-
+        # Stack all slices so that the filter is applied to them together.
+        # Slices share the smoothing coefficients, unless they are masked, in
+        # which case the coefficients at the masked points are zeroed.
+        slices = list(cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]))
+        shared_coefficients = self._pad_coefficients(coeffs_x, coeffs_y)
+        slice_masks = []
+        slice_coefficients = []
+        for cslice in slices:
             mask_cube = None
+            padded_coefficients = shared_coefficients
             if np.ma.is_masked(cslice.data):
                 mask_cube = cslice.copy(data=cslice.data.mask)
-                slice_coeffs_x, slice_coeffs_y = self._update_coefficients_from_mask(
-                    slice_coeffs_x,
-                    slice_coeffs_y,
-                    mask_cube,
+                padded_coefficients = self._pad_coefficients(
+                    *self._update_coefficients_from_mask(
+                        coeffs_x.copy(), coeffs_y.copy(), mask_cube
+                    )
                 )
+            slice_masks.append(mask_cube)
+            slice_coefficients.append(padded_coefficients)
+        if all(mask_cube is None for mask_cube in slice_masks):
+            slice_coefficients = [shared_coefficients]
+
+        width = 2 * self.edge_width
+        padded_data = np.pad(
+            np.stack([np.ma.getdata(cslice.data) for cslice in slices]),
+            ((0, 0), (width, width), (width, width)),
+            mode="symmetric",
+        )
+        recursed_data = self._run_recursion_on_stack(
+            padded_data,
+            np.stack([coeff_x.data for coeff_x, _ in slice_coefficients]),
+            np.stack([coeff_y.data for _, coeff_y in slice_coefficients]),
+            self.iterations,
+        )
+        n_y, n_x = slices[0].shape
+        recursed_data = recursed_data[:, width : width + n_y, width : width + n_x]
 
-            padded_coefficients_x, padded_coefficients_y = self._pad_coefficients(
-                slice_coeffs_x, slice_coeffs_y
-            )
-
-            new_cube = self._run_recursion(
-                padded_cube,
-                padded_coefficients_x,
-                padded_coefficients_y,
-                self.iterations,
-            )
-            new_cube = remove_halo_from_cube(
-                new_cube, 2 * self.edge_width, 2 * self.edge_width
-            )
-
+        recursed_cube = iris.cube.CubeList()
+        for cslice, mask_cube, data in zip(slices, slice_masks, recursed_data):
             if mask_cube is not None:
-                new_cube.data = np.ma.MaskedArray(new_cube.data, mask=mask_cube.data)
-
-            recursed_cube.append(new_cube)
+                data = np.ma.MaskedArray(data, mask=mask_cube.data)
+            recursed_cube.append(cslice.copy(data=data))
 
         new_cube = recursed_cube.merge_cube()
         if mask_zeros:
@@ -10,8 +10,9 @@ This module defines plugins used to create nowcast extrapolation forecasts.
 
 import datetime
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import iris
 import numpy as np
@@ -92,68 +93,17 @@ class AdvectField(BasePlugin):
         return result
 
     @staticmethod
-    def _increment_output_array(
-        indata: ndarray,
-        outdata: ndarray,
-        cond: ndarray,
-        xdest_grid: ndarray,
-        ydest_grid: ndarray,
-        xsrc_grid: ndarray,
-        ysrc_grid: ndarray,
-        x_weight: ndarray,
-        y_weight: ndarray,
-    ) -> None:
-        """
-        Calculate and add contribution to the advected array from one source
-        grid point, for all points where boolean condition "cond" is valid.
-
-        Args:
-            indata:
-                2D numpy array of source data to be advected
-            outdata:
-                2D numpy array for advected output, modified in place by
-                this method (is both input and output).
-            cond:
-                2D boolean mask of points to be processed
-            xdest_grid:
-                Integer x-coordinates of all points on destination grid
-            ydest_grid:
-                Integer y-coordinates of all points on destination grid
-            xsrc_grid:
-                Integer x-coordinates of all points on source grid
-            ysrc_grid:
-                Integer y-coordinates of all points on source grid
-            x_weight:
-                Fractional contribution to destination grid of source data
-                advected along the x-axis.  Positive definite.
-            y_weight:
-                Fractional contribution to destination grid of source data
-                advected along the y-axis.  Positive definite.
+    def _advection_stencil(
+        grid_vel_x: ndarray, grid_vel_y: ndarray, timestep: int
+    ) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
         """
-        xdest = xdest_grid[cond]
-        ydest = ydest_grid[cond]
-        xsrc = xsrc_grid[cond]
-        ysrc = ysrc_grid[cond]
-        outdata[ydest, xdest] += (
-            indata[ysrc, xsrc] * x_weight[ydest, xdest] * y_weight[ydest, xdest]
-        )
-
-    def _advect_field(
-        self,
-        data: Union[ndarray, MaskedArray],
-        grid_vel_x: ndarray,
-        grid_vel_y: ndarray,
-        timestep: int,
-    ) -> MaskedArray:
-        """
-        Performs a dimensionless grid-based extrapolation of spatial data
-        using advection velocities via a backwards method.  Points where data
-        cannot be extrapolated (ie the source is out of bounds) are given a
-        fill value of np.nan and masked.
+        Calculate the source points and weights from which each point on the
+        output grid is interpolated, for a dimensionless grid-based
+        extrapolation of spatial data via a backwards method.  The stencil
+        depends only on the advection velocities and time step, so may be
+        applied to any number of fields on the same grid.
 
         Args:
-            data:
-                2D numpy data array to be advected
             grid_vel_x:
                 Velocity in the x direction (in grid points per second)
             grid_vel_y:
@@ -162,18 +112,19 @@ class AdvectField(BasePlugin):
                 Advection time step in seconds
 
         Returns:
-            2D float array of advected data values with masked "no data"
-            regions
+            - 2D boolean array which is True where the source location of an
+              output point lies within the bounds of the field.
+            - 3D integer array of the flattened indices of the four source
+              points surrounding the source location of each output point.
+              Source points outside the bounds of the field have an index one
+              beyond the end of the flattened field.
+            - 3D float array of the fractional contribution to each output
+              point of the four source points along the x-axis.
+            - 3D float array of the fractional contribution to each output
+              point of the four source points along the y-axis.
         """
-        # Cater for special case where timestep (int) is 0
-        if timestep == 0:
-            return data
-
-        # Initialise advected field with np.nan
-        adv_field = np.full(data.shape, np.nan, dtype=np.float32)
-
         # Set up grids of data coordinates (meshgrid inverts coordinate order)
-        ydim, xdim = data.shape
+        ydim, xdim = grid_vel_x.shape
         (xgrid, ygrid) = np.meshgrid(np.arange(xdim), np.arange(ydim))
 
         # For each grid point on the output field, trace its (x,y) "source"
@@ -184,14 +135,13 @@ class AdvectField(BasePlugin):
         xsrc_point_frac = -grid_vel_x * timestep + xgrid.astype(np.float32)
         ysrc_point_frac = -grid_vel_y * timestep + ygrid.astype(np.float32)
 
-        # For all the points where fractional source coordinates are within
-        # the bounds of the field, set the output field to 0
+        # Find the points where fractional source coordinates are within
+        # the bounds of the field
         def point_in_bounds(x, y, nx, ny):
             """Check point (y, x) lies within defined bounds"""
             return (x >= 0.0) & (x < nx) & (y >= 0.0) & (y < ny)
 
         cond_pt = point_in_bounds(xsrc_point_frac, ysrc_point_frac, xdim, ydim)
-        adv_field[cond_pt] = 0
 
         # Find the integer points surrounding the fractional source coordinates
         xsrc_point_lower = xsrc_point_frac.astype(int)
@@ -206,25 +156,107 @@ class AdvectField(BasePlugin):
         x_weights = np.array([1.0 - x_weight_upper, x_weight_upper], dtype=np.float32)
         y_weights = np.array([1.0 - y_weight_upper, y_weight_upper], dtype=np.float32)
 
+        # Index each of the four source points in the flattened field, or
+        # beyond its end where the source point cannot contribute
+        indices, stencil_x_weights, stencil_y_weights = [], [], []
+        for xpt, xwt in zip(x_points, x_weights):
+            for ypt, ywt in zip(y_points, y_weights):
+                cond = point_in_bounds(xpt, ypt, xdim, ydim) & cond_pt
+                indices.append(np.where(cond, ypt * xdim + xpt, ydim * xdim))
+                stencil_x_weights.append(xwt)
+                stencil_y_weights.append(ywt)
+
+        return (
+            cond_pt,
+            np.array(indices),
+            np.array(stencil_x_weights),
+            np.array(stencil_y_weights),
+        )
+
+    @staticmethod
+    def _apply_stencil(
+        data: Union[ndarray, MaskedArray],
+        stencil: Tuple[ndarray, ndarray, ndarray, ndarray],
+    ) -> MaskedArray:
+        """
+        Advect one or more fields using an advection stencil, gathering the
+        contributions from each of the four surrounding source points for all
+        fields at once.  Points where data cannot be extrapolated (ie the
+        source is out of bounds) are given a fill value of np.nan and masked.
+
+        Args:
+            data:
+                Numpy data array to be advected, with the two spatial
+                dimensions last and any number of leading dimensions
+            stencil:
+                Advection stencil, as returned by self._advection_stencil
+
+        Returns:
+            Float array of advected data values with masked "no data"
+            regions, with the same shape as the input data
+        """
+        cond_pt, indices, x_weights, y_weights = stencil
+
         # Check whether the input data is masked - if so substitute NaNs for
         # the masked data.  Note there is an implicit type conversion here: if
         # data is of integer type this unmasking will convert it to float.
         if isinstance(data, np.ma.MaskedArray):
             data = np.where(data.mask, np.nan, data.data)
 
+        # Flatten the spatial dimensions, appending a zero from which source
+        # points outside the bounds of the field are gathered
+        flat_data = data.reshape(data.shape[:-2] + (-1,))
+        flat_data = np.concatenate(
+            [flat_data, np.zeros(data.shape[:-2] + (1,), dtype=data.dtype)], axis=-1
+        )
+
         # Advect data from each of the four source points onto the output grid
-        for xpt, xwt in zip(x_points, x_weights):
-            for ypt, ywt in zip(y_points, y_weights):
-                cond = point_in_bounds(xpt, ypt, xdim, ydim) & cond_pt
-                self._increment_output_array(
-                    data, adv_field, cond, xgrid, ygrid, xpt, ypt, xwt, ywt
-                )
+        adv_field = np.zeros(data.shape, dtype=np.float32)
+        for index, x_weight, y_weight in zip(indices, x_weights, y_weights):
+            adv_field += flat_data[..., index] * x_weight * y_weight
+
+        # Points with source locations out of bounds have no data
+        adv_field[..., ~cond_pt] = np.nan
 
         # Replace NaNs with a mask
         adv_field = np.ma.masked_where(~np.isfinite(adv_field), adv_field)
 
         return adv_field
 
+    def _advect_field(
+        self,
+        data: Union[ndarray, MaskedArray],
+        grid_vel_x: ndarray,
+        grid_vel_y: ndarray,
+        timestep: int,
+    ) -> MaskedArray:
+        """
+        Performs a dimensionless grid-based extrapolation of spatial data
+        using advection velocities via a backwards method.  Points where data
+        cannot be extrapolated (ie the source is out of bounds) are given a
+        fill value of np.nan and masked.
+
+        Args:
+            data:
+                2D numpy data array to be advected
+            grid_vel_x:
+                Velocity in the x direction (in grid points per second)
+            grid_vel_y:
+                Velocity in the y direction (in grid points per second)
+            timestep:
+                Advection time step in seconds
+
+        Returns:
+            2D float array of advected data values with masked "no data"
+            regions
+        """
+        # Cater for special case where timestep (int) is 0
+        if timestep == 0:
+            return data
+
+        stencil = self._advection_stencil(grid_vel_x, grid_vel_y, timestep)
+        return self._apply_stencil(data, stencil)
+
     @staticmethod
     def _update_time(
         input_time: Coord, advected_cube: Cube, timestep: timedelta
@@ -312,6 +344,73 @@ class AdvectField(BasePlugin):
 
         return advected_cube
 
+    def advect_cubes(self, cubes: List[Cube], timestep: timedelta) -> CubeList:
+        """
+        Extrapolates the data in each of a list of input cubes and updates
+        validity times.  The advection stencil is calculated once and applied
+        to all of the cubes together, so this is faster than processing each
+        cube separately.  The requirements for each input cube are as for
+        self.process.  Where the cubes have data of different types, they
+        are advected at a common precision.
+
+        Args:
+            cubes:
+                The 2D cubes containing data to be advected
+            timestep:
+                Advection time step
+
+        Returns:
+            New cubes with updated time and extrapolated data, as returned by
+            self.process for each input cube in turn.
+        """
+        for cube in cubes:
+            # check that the input cube has precisely two non-scalar dimension
+            # coordinates (spatial x/y) and a scalar time coordinate
+            check_input_coords(cube, require_time=True)
+
+            # check spatial coordinates match those of plugin velocities
+            if (
+                cube.coord(axis="x") != self.x_coord
+                or cube.coord(axis="y") != self.y_coord
+            ):
+                raise InvalidCubeError(
+                    "Input data grid does not match advection velocities"
+                )
+
+            # raise a warning if data contains unmasked NaNs
+            nan_count = np.count_nonzero(~np.isfinite(cube.data))
+            if nan_count > 0:
+                warnings.warn("input data contains unmasked NaNs")
+
+        # derive velocities in "grid squares per second"
+        def grid_spacing(coord: Coord) -> float:
+            """Calculate grid spacing along a given spatial axis"""
+            new_coord = coord.copy()
+            new_coord.convert_units("m")
+            return np.float32(np.diff((new_coord).points)[0])
+
+        grid_vel_x = self.vel_x.data / grid_spacing(self.x_coord)
+        grid_vel_y = self.vel_y.data / grid_spacing(self.y_coord)
+
+        # perform advection of all cubes at once and create output cubes
+        seconds = round(timestep.total_seconds())
+        if seconds == 0:
+            advected_data = [cube.data for cube in cubes]
+        else:
+            stack = (
+                np.ma.stack
+                if any(np.ma.isMaskedArray(cube.data) for cube in cubes)
+                else np.stack
+            )
+            stencil = self._advection_stencil(grid_vel_x, grid_vel_y, seconds)
+            advected_data = self._apply_stencil(
+                stack([cube.data for cube in cubes]), stencil
+            )
+        return CubeList(
+            self._create_output_cube(cube, data, timestep)
+            for cube, data in zip(cubes, advected_data)
+        )
+
     def process(self, cube: Cube, timestep: timedelta) -> Cube:
         """
         Extrapolates input cube data and updates validity time.  The input
@@ -332,36 +431,7 @@ class AdvectField(BasePlugin):
             out of bounds (ie where data could not be advected from outside
             the cube domain).
         """
-        # check that the input cube has precisely two non-scalar dimension
-        # coordinates (spatial x/y) and a scalar time coordinate
-        check_input_coords(cube, require_time=True)
-
-        # check spatial coordinates match those of plugin velocities
-        if cube.coord(axis="x") != self.x_coord or cube.coord(axis="y") != self.y_coord:
-            raise InvalidCubeError(
-                "Input data grid does not match advection velocities"
-            )
-
-        # derive velocities in "grid squares per second"
-        def grid_spacing(coord: Coord) -> float:
-            """Calculate grid spacing along a given spatial axis"""
-            new_coord = coord.copy()
-            new_coord.convert_units("m")
-            return np.float32(np.diff((new_coord).points)[0])
-
-        grid_vel_x = self.vel_x.data / grid_spacing(cube.coord(axis="x"))
-        grid_vel_y = self.vel_y.data / grid_spacing(cube.coord(axis="y"))
-
-        # raise a warning if data contains unmasked NaNs
-        nan_count = np.count_nonzero(~np.isfinite(cube.data))
-        if nan_count > 0:
-            warnings.warn("input data contains unmasked NaNs")
-
-        # perform advection and create output cube
-        advected_data = self._advect_field(
-            cube.data, grid_vel_x, grid_vel_y, round(timestep.total_seconds())
-        )
-        advected_cube = self._create_output_cube(cube, advected_data, timestep)
+        (advected_cube,) = self.advect_cubes([cube], timestep)
         return advected_cube
 
 
@@ -378,6 +448,7 @@ class CreateExtrapolationForecast(BasePlugin):
         vel_y: Cube,
         orographic_enhancement_cube: Optional[Cube] = None,
         attributes_dict: Optional[Dict] = None,
+        max_workers: int = 1,
     ) -> None:
         """
         Initialises the object.
@@ -404,6 +475,10 @@ class CreateExtrapolationForecast(BasePlugin):
             attributes_dict:
                 Dictionary containing information for amending the attributes
                 of the output cube.
+            max_workers:
+                Maximum number of lead times to extrapolate concurrently,
+                using a pool of threads. The default of 1 extrapolates lead
+                times serially.
         """
         if not (vel_x and vel_y):
             raise TypeError("Neither x velocity or y velocity can be None")
@@ -423,6 +498,7 @@ class CreateExtrapolationForecast(BasePlugin):
             )
             raise ValueError(msg)
         self.input_cube = input_cube
+        self.max_workers = max_workers
         self.advection_plugin = AdvectField(
             vel_x, vel_y, attributes_dict=attributes_dict
         )
@@ -485,7 +561,11 @@ class CreateExtrapolationForecast(BasePlugin):
             List of forecast cubes at the required lead times
         """
         lead_times = np.arange(0, max_lead_time + 1, interval)
-        forecast_cubes = iris.cube.CubeList()
-        for lead_time in lead_times:
-            forecast_cubes.append(self.extrapolate(lead_time))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            forecasts = (
+                executor.map(self.extrapolate, lead_times)
+                if self.max_workers > 1
+                else map(self.extrapolate, lead_times)
+            )
+            forecast_cubes = iris.cube.CubeList(forecasts)
         return forecast_cubes
@@ -31,6 +31,11 @@ from improver.utilities.spatial import (
     check_if_grid_is_equal_area,
 )
 
+# kernel for neighbour weighting in "smart smoothing"
+NEIGHBOUR_KERNEL = (
+    np.array([[0.5, 1, 0.5], [1.0, 0, 1.0], [0.5, 1, 0.5]]) / 6.0
+).astype(np.float32)
+
 
 def generate_optical_flow_components(
     cube_list: CubeList, ofc_box_size: int, smart_smoothing_iterations: int
@@ -420,43 +425,51 @@ class OpticalFlow(BasePlugin):
         smoothed_diffs[1:-1, 1:-1] = self.interp_to_midpoint(tdiff)
         return self.interp_to_midpoint(smoothed_diffs)
 
-    def _make_subboxes(self, field: ndarray) -> Tuple[List[ndarray], ndarray]:
+    def _box_sum(self, field: ndarray) -> ndarray:
+        """
+        Sum a field over non-overlapping "boxes" of size self.boxsize**2
+        using a single block reduction.  The field is zero-padded up to a
+        whole number of boxes, so that the final boxes along each axis sum
+        over the smaller remainder of the field if its size is not an exact
+        multiple of "boxsize".
+
+        Args:
+            field:
+                2D input field (dimensions M x N)
+
+        Returns:
+            2D array of box sums, with one value per box (dimensions
+            ceil(M / boxsize) x ceil(N / boxsize))
+        """
+        n_boxes = [-(-size // self.boxsize) for size in field.shape]
+        padding = [
+            (0, n * self.boxsize - size) for n, size in zip(n_boxes, field.shape)
+        ]
+        blocks = np.pad(field, padding).reshape(
+            n_boxes[0], self.boxsize, n_boxes[1], self.boxsize
+        )
+        return blocks.sum(axis=(1, 3))
+
+    def _box_weights(self) -> ndarray:
         """
-        Generate a list of non-overlapping "boxes" of size self.boxsize**2
-        from the input field, along with weights based on data values at times
-        1 and 2.  The final boxes in the list will be smaller if the size of
-        the data field is not an exact multiple of "boxsize".
+        Calculate the weight of each non-overlapping "box" of size
+        self.boxsize**2 based on data values at times 1 and 2.
 
         Note that the weights calculated below are valid for precipitation
         rates in mm/hr. This is a result of the constant 0.8 that is used,
         noting that in the source paper a value of 0.75 is used; see equation
         8. in Bowler et al. 2004.
 
-        Args:
-            field:
-                Input field (partial derivative)
-
         Returns:
-            - List of numpy.ndarrays of size boxsize*boxsize containing
-              slices of data from input field.
-            - 1D numpy array containing weights values associated with
-              each listed box.
+            2D array of weights with one value per box, as for self._box_sum
         """
-        boxes = []
-        weights = []
         weighting_factor = 0.5 / self.boxsize**2.0
-        for i in range(0, field.shape[0], self.boxsize):
-            for j in range(0, field.shape[1], self.boxsize):
-                boxes.append(field[i : i + self.boxsize, j : j + self.boxsize])
-                weight = weighting_factor * (
-                    (self.data1[i : i + self.boxsize, j : j + self.boxsize]).sum()
-                    + (self.data2[i : i + self.boxsize, j : j + self.boxsize]).sum()
-                )
-                weight = 1.0 - np.exp(-1.0 * weight / 0.8)
-                weights.append(weight)
-        weights = np.array(weights, dtype=np.float32)
+        weights = weighting_factor * (
+            self._box_sum(self.data1) + self._box_sum(self.data2)
+        )
+        weights = (1.0 - np.exp(-1.0 * weights / 0.8)).astype(np.float32)
         weights[weights < 0.01] = 0
-        return boxes, weights
+        return weights
 
     def _box_to_grid(self, box_data: ndarray) -> ndarray:
         """
@@ -545,8 +558,27 @@ class OpticalFlow(BasePlugin):
         smoothed_field = smoothed_field.astype(field.dtype)
         return smoothed_field
 
+    @staticmethod
+    def _smooth_weights(weights: ndarray) -> ndarray:
+        """
+        Smooth the weights used for "smart smoothing" with the kernel used
+        to weight each point's neighbours.
+
+        Args:
+            weights:
+                Weight of each grid point for averaging
+
+        Returns:
+            Weights of the neighbours of each grid point
+        """
+        return ndimage.convolve(weights, NEIGHBOUR_KERNEL)
+
     def _smart_smooth(
-        self, vel_point: ndarray, vel_iter: ndarray, weights: ndarray
+        self,
+        vel_point: ndarray,
+        vel_iter: ndarray,
+        weights: ndarray,
+        neighbour_weights: Optional[ndarray] = None,
     ) -> ndarray:
         """
         Performs a single iteration of "smart smoothing" over a point and its
@@ -562,21 +594,21 @@ class OpticalFlow(BasePlugin):
                 Latest iteration of smart-smoothed displacement
             weights:
                 Weight of each grid point for averaging
+            neighbour_weights:
+                Optional kernel-smoothed weights, as returned by
+                self._smooth_weights.  These are the same on every iteration,
+                so may be calculated once and reused.
 
         Returns:
             Next iteration of smart-smoothed displacement
         """
-        # define kernel for neighbour weighting
-        neighbour_kernel = (
-            np.array([[0.5, 1, 0.5], [1.0, 0, 1.0], [0.5, 1, 0.5]]) / 6.0
-        ).astype(np.float32)
-
         # smooth input data and weights fields
-        vel_neighbour = ndimage.convolve(weights * vel_iter, neighbour_kernel)
-        neighbour_weights = ndimage.convolve(weights, neighbour_kernel)
+        vel_neighbour = ndimage.convolve(weights * vel_iter, NEIGHBOUR_KERNEL)
+        if neighbour_weights is None:
+            neighbour_weights = self._smooth_weights(weights)
 
         # initialise output data from latest iteration
-        vel = ndimage.convolve(vel_iter, neighbour_kernel)
+        vel = ndimage.convolve(vel_iter, NEIGHBOUR_KERNEL)
 
         # create "point" and "neighbour" validity masks using original and
         # kernel-smoothed weights
@@ -617,10 +649,13 @@ class OpticalFlow(BasePlugin):
             Smoothed displacement vectors on input data grid
         """
         v_orig = np.copy(box_data)
+        neighbour_weights = self._smooth_weights(weights)
 
         # iteratively smooth umat and vmat
         for _ in range(self.iterations):
-            box_data = self._smart_smooth(v_orig, box_data, weights)
+            box_data = self._smart_smooth(
+                v_orig, box_data, weights, neighbour_weights=neighbour_weights
+            )
 
         # reshape smoothed box velocity arrays to match input data grid
         grid_data = self._box_to_grid(box_data)
@@ -650,17 +685,66 @@ class OpticalFlow(BasePlugin):
         Returns:
             2-column matrix (u, v) containing scalar displacement values
         """
-        deriv_t = deriv_t.reshape([deriv_t.size, 1])
-        m_to_invert = (deriv_xy.transpose()).dot(deriv_xy)
-        try:
-            m_inverted = np.linalg.inv(m_to_invert)
-        except np.linalg.LinAlgError:
-            # if matrix is not invertible, set velocities to zero
-            velocity = np.array([0, 0])
-        else:
-            scale = (deriv_xy.transpose()).dot(deriv_t)
-            velocity = -m_inverted.dot(scale)[:, 0]
-        return velocity
+        deriv_xy = np.asarray(deriv_xy, dtype=np.float64)
+        deriv_t = np.asarray(deriv_t, dtype=np.float64).flatten()
+        deriv_x, deriv_y = deriv_xy[:, 0], deriv_xy[:, 1]
+        velocity = OpticalFlow.solve_for_uv_boxes(
+            *[
+                np.array([np.dot(first, second)])
+                for first, second in [
+                    (deriv_x, deriv_x),
+                    (deriv_x, deriv_y),
+                    (deriv_y, deriv_y),
+                    (deriv_x, deriv_t),
+                    (deriv_y, deriv_t),
+                ]
+            ]
+        )
+        return np.array([velocity[0][0], velocity[1][0]])
+
+    @staticmethod
+    def solve_for_uv_boxes(
+        sum_xx: ndarray,
+        sum_xy: ndarray,
+        sum_yy: ndarray,
+        sum_xt: ndarray,
+        sum_yt: ndarray,
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Solve the 2x2 systems of linear simultaneous equations for u and v in
+        every box at once, as in solve_for_uv, from the sums over each box of
+        the products of the partial field derivatives.  The inverse of each
+        2x2 matrix is written explicitly in terms of its determinant.  Boxes
+        for which the matrix is singular (determinant zero to within rounding
+        error), eg in the presence of too many zeroes, are given displacements
+        of 0.
+
+        Args:
+            sum_xx:
+                Array of box sums of (d/dx)**2
+            sum_xy:
+                Array of box sums of (d/dx)(d/dy)
+            sum_yy:
+                Array of box sums of (d/dy)**2
+            sum_xt:
+                Array of box sums of (d/dx)(d/dt)
+            sum_yt:
+                Array of box sums of (d/dy)(d/dt)
+
+        Returns:
+            - Array of displacements in the x direction, one per box
+            - Array of displacements in the y direction, one per box
+        """
+        determinant = sum_xx * sum_yy - sum_xy * sum_xy
+        # sum_xx * sum_yy bounds the determinant, so treat it as zero where it
+        # is no larger than the rounding error in its calculation
+        singular = ~(
+            np.abs(determinant) > np.finfo(np.float64).eps * sum_xx * sum_yy
+        ) | ~np.isfinite(determinant)
+        determinant = np.where(singular, 1.0, determinant)
+        u = np.where(singular, 0.0, (sum_xy * sum_yt - sum_yy * sum_xt) / determinant)
+        v = np.where(singular, 0.0, (sum_xy * sum_xt - sum_xx * sum_yt) / determinant)
+        return u, v
 
     @staticmethod
     def extreme_value_check(umat: ndarray, vmat: ndarray, weights: ndarray) -> None:
@@ -702,41 +786,34 @@ class OpticalFlow(BasePlugin):
             - 2D array of displacements in the y-direction
         """
 
-        # (a) Generate lists of subboxes over which velocity is constant
-        dx_boxed, box_weights = self._make_subboxes(partial_dx)
-        dy_boxed, _ = self._make_subboxes(partial_dy)
-        dt_boxed, _ = self._make_subboxes(partial_dt)
-
-        # (b) Solve optical flow displacement calculation on each subbox
-        velocity = ([], [])
-        for deriv_x, deriv_y, deriv_t in zip(dx_boxed, dy_boxed, dt_boxed):
-            # Flatten arrays to create the system of linear simultaneous
-            # equations to solve for this subbox
-            deriv_x = deriv_x.flatten()
-            deriv_y = deriv_y.flatten()
-            deriv_t = deriv_t.flatten()
-            # deriv_xy must be float64 in order to work OK.
-            deriv_xy = (np.array([deriv_x, deriv_y], dtype=np.float64)).transpose()
-
-            # Solve equations for u and v through matrix inversion
-            u, v = self.solve_for_uv(deriv_xy, deriv_t)
-            velocity[0].append(u)
-            velocity[1].append(v)
-
-        # (c) Reshape displacement arrays to match array of subbox points
-        newshape = [
-            int((self.shape[0] - 1) / self.boxsize) + 1,
-            int((self.shape[1] - 1) / self.boxsize) + 1,
+        # (a) Sum products of the partial derivatives over each subbox, over
+        #     which velocity is constant.  These must be float64 in order to
+        #     work OK.
+        partial_dx = partial_dx.astype(np.float64)
+        partial_dy = partial_dy.astype(np.float64)
+        partial_dt = partial_dt.astype(np.float64)
+        box_sums = [
+            self._box_sum(first * second)
+            for first, second in [
+                (partial_dx, partial_dx),
+                (partial_dx, partial_dy),
+                (partial_dy, partial_dy),
+                (partial_dx, partial_dt),
+                (partial_dy, partial_dt),
+            ]
         ]
-        umat = np.array(velocity[0], dtype=np.float32).reshape(newshape)
-        vmat = np.array(velocity[1], dtype=np.float32).reshape(newshape)
-        weights = box_weights.reshape(newshape)
+        weights = self._box_weights()
+
+        # (b) Solve optical flow displacement calculation on all subboxes
+        umat, vmat = self.solve_for_uv_boxes(*box_sums)
+        umat = umat.astype(np.float32)
+        vmat = vmat.astype(np.float32)
 
-        # (d) Check for extreme advection displacements (over a significant
+        # (c) Check for extreme advection displacements (over a significant
         #     proportion of the domain size) and set to zero
         self.extreme_value_check(umat, vmat, weights)
 
-        # (e) smooth and reshape displacement arrays to match input data grid
+        # (d) smooth and reshape displacement arrays to match input data grid
         umat = self._smooth_advection_fields(umat, weights)
         vmat = self._smooth_advection_fields(vmat, weights)
 
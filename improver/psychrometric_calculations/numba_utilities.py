@@ -0,0 +1,141 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for psychrometric
+calculations.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+from improver import constants as consts
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit(nogil=True)
+def _saturated_humidity(
+    temperature: np.float32,
+    pressure: np.float32,
+    svp_table: np.ndarray,
+    svp_t_min: np.float32,
+    svp_t_max: np.float32,
+    svp_t_increment: np.float32,
+) -> np.float32:
+    """Calculate the saturated specific humidity at a single point, as
+    improver.psychrometric_calculations.psychrometric_calculations.
+    saturated_humidity does for float32 arrays.
+
+    Args:
+        temperature: Air temperature (K).
+        pressure: Air pressure (Pa).
+        svp_table: Saturated vapour pressure lookup table (Pa).
+        svp_t_min: Temperature of the first entry in the table (K).
+        svp_t_max: Maximum temperature from which to interpolate (K).
+        svp_t_increment: Temperature increment of the table (K).
+    Returns:
+        Specific humidity (kg kg-1) of saturated air.
+    """
+    t_clipped = min(max(temperature, svp_t_min), svp_t_max)
+    table_position = (t_clipped - svp_t_min) / svp_t_increment
+    table_index = np.int64(table_position)
+    interpolation_factor = np.float64(table_position) - np.float64(table_index)
+    svp = (1.0 - interpolation_factor) * svp_table[
+        table_index
+    ] + interpolation_factor * svp_table[table_index + 1]
+    temp_c = temperature + np.float32(consts.ABSOLUTE_ZERO)
+    correction = np.float32(1.0) + np.float32(1.0e-8) * pressure * (
+        np.float32(4.5) + np.float32(6.0e-4) * temp_c * temp_c
+    )
+    svp = svp * np.float64(correction)
+    numerator = consts.EARTH_REPSILON * svp
+    denominator = max(svp, np.float64(pressure)) - ((1.0 - consts.EARTH_REPSILON) * svp)
+    return np.float32(numerator / denominator)
+
+
+@njit(parallel=True, nogil=True)
+def fast_wet_bulb_temperature(
+    temperature: np.ndarray,
+    relative_humidity: np.ndarray,
+    pressure: np.ndarray,
+    svp_table: np.ndarray,
+    svp_t_min: float,
+    svp_t_max: float,
+    svp_t_increment: float,
+    precision: float,
+    maximum_iterations: int,
+) -> np.ndarray:
+    """Calculate wet bulb temperatures from 1-D float32 arrays using a Newton
+    iterator at each point, equivalent to
+    WetBulbTemperature._calculate_wet_bulb_temperature. Points are processed
+    in parallel, each iterating only until it has converged.
+
+    Args:
+        temperature: 1-D float32 array of air temperature (K).
+        relative_humidity: 1-D float32 array of relative humidity (1).
+        pressure: 1-D float32 array of air pressure (Pa).
+        svp_table: Saturated vapour pressure lookup table (Pa).
+        svp_t_min: Temperature of the first entry in the table (K).
+        svp_t_max: Maximum temperature from which to interpolate (K).
+        svp_t_increment: Temperature increment of the table (K).
+        precision: The precision to which the Newton iterator must converge.
+        maximum_iterations: The maximum number of Newton iterations.
+    Returns:
+        1-D float32 array of wet bulb temperature (K).
+    """
+    if relative_humidity.shape != temperature.shape:
+        raise ValueError("relative_humidity must have the same shape as temperature.")
+    if pressure.shape != temperature.shape:
+        raise ValueError("pressure must have the same shape as temperature.")
+    one = np.float32(1.0)
+    cp_dry_air = np.float32(consts.CP_DRY_AIR)
+    cp_water_vapour = np.float32(consts.CP_WATER_VAPOUR)
+    r_water_vapour = np.float32(consts.R_WATER_VAPOUR)
+    latent_heat_t_dependence = np.float32(consts.LATENT_HEAT_T_DEPENDENCE)
+    lh_condensation_water = np.float32(consts.LH_CONDENSATION_WATER)
+    absolute_zero = np.float32(consts.ABSOLUTE_ZERO)
+    t_min = np.float32(svp_t_min)
+    t_max = np.float32(svp_t_max)
+    t_increment = np.float32(svp_t_increment)
+    threshold = np.float32(precision)
+
+    result = np.empty_like(temperature)
+    for i in prange(temperature.shape[0]):
+        wbt = temperature[i]
+        if np.isnan(wbt):
+            # no valid index into the lookup table
+            result[i] = wbt
+            continue
+        point_pressure = pressure[i]
+        latent_heat = (
+            np.float32(-1.0) * latent_heat_t_dependence * (wbt + absolute_zero)
+            + lh_condensation_water
+        )
+        mixing_ratio = relative_humidity[i] * _saturated_humidity(
+            wbt, point_pressure, svp_table, t_min, t_max, t_increment
+        )
+        specific_heat = (
+            np.float32(-1.0) * mixing_ratio + one
+        ) * cp_dry_air + mixing_ratio * cp_water_vapour
+        enthalpy = latent_heat * mixing_ratio + specific_heat * wbt
+
+        for _ in range(maximum_iterations):
+            saturation_mixing_ratio = _saturated_humidity(
+                wbt, point_pressure, svp_table, t_min, t_max, t_increment
+            )
+            enthalpy_new = latent_heat * saturation_mixing_ratio + specific_heat * wbt
+            enthalpy_gradient = (
+                saturation_mixing_ratio * latent_heat * latent_heat
+            ) / (r_water_vapour * wbt * wbt) + specific_heat
+            delta_wbt = (enthalpy - enthalpy_new) / enthalpy_gradient
+            if not abs(delta_wbt) > threshold:
+                break
+            wbt += delta_wbt
+        result[i] = wbt
+    return result
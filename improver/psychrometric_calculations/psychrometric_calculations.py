@@ -4,7 +4,6 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module to contain Psychrometric Calculations."""
 
-import functools
 from typing import List, Optional, Tuple, Union
 
 import iris._constraints
@@ -33,6 +32,7 @@ from improver.utilities.cube_manipulation import (
     sort_coord_in_cube,
 )
 from improver.utilities.interpolation import interpolate_missing_data
+from improver.utilities.lookup_tables import interpolate_from_table, lookup_table
 from improver.utilities.mathematical_operations import fast_linear_fit
 from improver.utilities.spatial import OccurrenceWithinVicinity
 
@@ -41,12 +41,14 @@ SVP_T_MAX = 338.25
 SVP_T_INCREMENT = 0.1
 
 
-@functools.lru_cache()
+@lookup_table("svp")
 def _svp_table(phase: Optional[str] = None) -> ndarray:
     """
     Calculate a saturated vapour pressure (SVP) lookup table.
-    The lru_cache decorator caches this table on first call to this function,
-    so that the table does not need to be re-calculated if used multiple times.
+    The lookup_table decorator caches this table on first call to this
+    function, in memory and optionally on disk to share between processes (see
+    improver.utilities.lookup_tables), so that the table does not need to be
+    re-calculated if used multiple times.
 
     A value of SVP for any temperature between T_MIN and T_MAX (inclusive) can be
     obtained by interpolating through the table, as is done in the _svp_from_lookup
@@ -78,12 +80,14 @@ def _svp_table(phase: Optional[str] = None) -> ndarray:
     return svp.process().data
 
 
-@functools.lru_cache()
+@lookup_table("svp_derivative")
 def _svp_derivative_table() -> ndarray:
     """
     Calculate a saturated vapour pressure (SVP) derivative lookup table.
-    The lru_cache decorator caches this table on first call to this function,
-    so that the table does not need to be re-calculated if used multiple times.
+    The lookup_table decorator caches this table on first call to this
+    function, in memory and optionally on disk to share between processes (see
+    improver.utilities.lookup_tables), so that the table does not need to be
+    re-calculated if used multiple times.
 
     A value of SVP derivative for any temperature between T_MIN and T_MAX (inclusive) can be
     obtained by interpolating through the table, as is done in the _svp_derivative_from_lookup
@@ -116,16 +120,13 @@ def _svp_from_lookup(temperature: ndarray, phase: Optional[str] = None) -> ndarr
     """
     # where temperatures are outside the SVP table range, clip data to
     # within the available range
-    t_clipped = np.clip(temperature, SVP_T_MIN, SVP_T_MAX - SVP_T_INCREMENT)
-
-    # interpolate between bracketing values
-    table_position = (t_clipped - SVP_T_MIN) / SVP_T_INCREMENT
-    table_index = table_position.astype(int)
-    interpolation_factor = table_position - table_index
-    svp_table_data = _svp_table(phase)
-    return (1.0 - interpolation_factor) * svp_table_data[
-        table_index
-    ] + interpolation_factor * svp_table_data[table_index + 1]
+    return interpolate_from_table(
+        temperature,
+        _svp_table(phase),
+        SVP_T_MIN,
+        SVP_T_MAX - SVP_T_INCREMENT,
+        SVP_T_INCREMENT,
+    )
 
 
 def _svp_derivative_from_lookup(temperature: ndarray) -> ndarray:
@@ -143,16 +144,13 @@ def _svp_derivative_from_lookup(temperature: ndarray) -> ndarray:
     """
     # where temperatures are outside the SVP derivative table range, clip data to
     # within the available range
-    t_clipped = np.clip(temperature, SVP_T_MIN, SVP_T_MAX - SVP_T_INCREMENT)
-
-    # interpolate between bracketing values
-    table_position = (t_clipped - SVP_T_MIN) / SVP_T_INCREMENT
-    table_index = table_position.astype(int)
-    interpolation_factor = table_position - table_index
-    svp_derivative_table_data = _svp_derivative_table()
-    return (1.0 - interpolation_factor) * svp_derivative_table_data[
-        table_index
-    ] + interpolation_factor * svp_derivative_table_data[table_index + 1]
+    return interpolate_from_table(
+        temperature,
+        _svp_derivative_table(),
+        SVP_T_MIN,
+        SVP_T_MAX - SVP_T_INCREMENT,
+        SVP_T_INCREMENT,
+    )
 
 
 def calculate_svp_in_air(
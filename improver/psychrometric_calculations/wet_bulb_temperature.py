@@ -4,7 +4,8 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module to contain wet-bulb temperature plugins."""
 
-from typing import List, Union
+import warnings
+from typing import List, Tuple, Union
 
 import iris
 import numpy as np
@@ -19,13 +20,112 @@ from improver.metadata.utilities import (
     generate_mandatory_attributes,
 )
 from improver.psychrometric_calculations.psychrometric_calculations import (
+    SVP_T_INCREMENT,
+    SVP_T_MAX,
+    SVP_T_MIN,
     _calculate_latent_heat,
+    _svp_table,
     saturated_humidity,
 )
 from improver.utilities.common_input_handle import as_cube, as_cubelist
 from improver.utilities.cube_checker import check_cube_coordinates
+from improver.utilities.lookup_tables import lookup_table
 from improver.utilities.mathematical_operations import Integration
 
+# Ranges (minimum, maximum, increment) of air temperature (K), relative
+# humidity (1) and pressure (Pa) covered by the wet bulb temperature lookup
+# table
+WBT_TABLE_T = (183.15, 338.15, 0.5)
+WBT_TABLE_RH = (0.0, 1.1, 0.005)
+WBT_TABLE_P = (10000.0, 110000.0, 2000.0)
+# Precision (K) to which wet bulb temperatures are interpolated from the table
+WBT_TABLE_PRECISION = 0.01
+
+
+def _table_axis(axis_range: Tuple[float, float, float]) -> ndarray:
+    """Return the points along one axis of the wet bulb temperature table."""
+    minimum, maximum, increment = axis_range
+    return np.linspace(minimum, maximum, round((maximum - minimum) / increment) + 1)
+
+
+@lookup_table("wet_bulb_temperature")
+def _wet_bulb_temperature_table() -> ndarray:
+    """
+    Calculate a wet bulb temperature lookup table over air temperature,
+    relative humidity and pressure, with the ranges given by WBT_TABLE_T,
+    WBT_TABLE_RH and WBT_TABLE_P.  The lookup_table decorator caches this
+    table on first call to this function, in memory and optionally on disk to
+    share between processes (see improver.utilities.lookup_tables), so that
+    the table does not need to be re-calculated if used multiple times.
+
+    Returns:
+        3D array of wet bulb temperatures (K).
+    """
+    temperature, relative_humidity, pressure = (
+        grid.astype(np.float32)
+        for grid in np.meshgrid(
+            *(_table_axis(axis) for axis in (WBT_TABLE_T, WBT_TABLE_RH, WBT_TABLE_P)),
+            indexing="ij",
+        )
+    )
+    return WetBulbTemperature(precision=1.0e-4)._iterate_wet_bulb_temperature(
+        pressure, relative_humidity, temperature
+    )
+
+
+def _wet_bulb_temperature_from_lookup(
+    pressure: ndarray, relative_humidity: ndarray, temperature: ndarray
+) -> Tuple[ndarray, ndarray]:
+    """
+    Gets values of wet bulb temperature from a pre-calculated lookup table,
+    interpolating linearly between points in the table along each axis.
+
+    Args:
+        pressure:
+            Array of air pressure (Pa).
+        relative_humidity:
+            Array of relative humidities (1).
+        temperature:
+            Array of air temperature (K).
+
+    Returns:
+        - Array of wet bulb temperatures (K).
+        - Boolean array which is True where the inputs are within the range
+          of the table.  Wet bulb temperatures are not valid elsewhere.
+    """
+    table = _wet_bulb_temperature_table()
+    strides = [table.shape[1] * table.shape[2], table.shape[2], 1]
+
+    # find the flattened table index of the lower corner of the table cell
+    # containing each input, and the fractional position within the cell
+    in_table = np.ones(temperature.shape, dtype=bool)
+    flat_index = np.zeros(temperature.shape, dtype=int)
+    factors = []
+    for values, (minimum, maximum, increment), size, stride in zip(
+        (temperature, relative_humidity, pressure),
+        (WBT_TABLE_T, WBT_TABLE_RH, WBT_TABLE_P),
+        table.shape,
+        strides,
+    ):
+        in_table &= (values >= minimum) & (values <= maximum)
+        table_position = np.clip(
+            np.nan_to_num((values - minimum) / increment), 0, size - 1
+        )
+        table_index = np.minimum(table_position.astype(int), size - 2)
+        flat_index += stride * table_index
+        factors.append((table_position - table_index).astype(np.float32))
+
+    # interpolate between the eight corners of each cell along the last axis,
+    # then the second axis, then the first axis
+    offsets = np.add.outer(np.add.outer([0, strides[0]], [0, strides[1]]), [0, 1])
+    corners = [table.ravel()[flat_index + offset] for offset in offsets.ravel()]
+    for factor in reversed(factors):
+        corners = [
+            lower + factor * (upper - lower)
+            for lower, upper in zip(corners[::2], corners[1::2])
+        ]
+    return corners[0], in_table
+
 
 class WetBulbTemperature(BasePlugin):
     """
@@ -39,12 +139,23 @@ class WetBulbTemperature(BasePlugin):
     The import also brings in attributes that describe the range of
     temperatures covered by the table and the increments in the table.
 
+    Where numba is available, the Newton iterator is run for each point in
+    turn by a compiled solver, giving identical results.  Optionally, wet
+    bulb temperatures may instead be interpolated from a lookup table over
+    air temperature, relative humidity and pressure, which is faster but
+    limited to a precision of WBT_TABLE_PRECISION.
+
     References:
         Met Office UM Documentation Paper 080, UM Version 10.8,
         last updated 2014-12-05.
     """
 
-    def __init__(self, precision: float = 0.005, model_id_attr: str = None) -> None:
+    def __init__(
+        self,
+        precision: float = 0.005,
+        model_id_attr: str = None,
+        use_lookup_table: bool = False,
+    ) -> None:
         """
         Initialise class.
 
@@ -54,11 +165,24 @@ class WetBulbTemperature(BasePlugin):
                 returning wet bulb temperatures.
             model_id_attr (str):
                 Name of the attribute used to identify the source model for blending.
-
+            use_lookup_table:
+                If True, interpolate wet bulb temperatures from a lookup table
+                where the inputs are within its range, using the Newton
+                iterator only for other points.
+
+        Raises:
+            ValueError: If use_lookup_table is True and the precision is
+                finer than that of the lookup table.
         """
+        if use_lookup_table and precision < WBT_TABLE_PRECISION:
+            raise ValueError(
+                f"A precision of at least {WBT_TABLE_PRECISION} K is required "
+                f"to use the lookup table, not {precision} K."
+            )
         self.precision = precision
         self.maximum_iterations = 20
         self.model_id_attr = model_id_attr
+        self.use_lookup_table = use_lookup_table
 
     @staticmethod
     def _slice_inputs(temperature, relative_humidity, pressure):
@@ -177,6 +301,43 @@ class WetBulbTemperature(BasePlugin):
 
     def _calculate_wet_bulb_temperature(
         self, pressure: ndarray, relative_humidity: ndarray, temperature: ndarray
+    ) -> ndarray:
+        """
+        Calculate an array of wet bulb temperatures from inputs in
+        the correct units, interpolating from the lookup table if required.
+        Masked inputs are always passed to the Newton iterator.
+
+        Args:
+            pressure:
+                Array of air Pressure (Pa).
+            relative_humidity:
+                Array of relative humidities (1).
+            temperature:
+                Array of air temperature (K).
+
+        Returns:
+            Array of wet bulb temperature (K).
+        """
+        if not self.use_lookup_table or any(
+            np.ma.isMaskedArray(data)
+            for data in (pressure, relative_humidity, temperature)
+        ):
+            return self._iterate_wet_bulb_temperature(
+                pressure, relative_humidity, temperature
+            )
+        wbt_data, in_table = _wet_bulb_temperature_from_lookup(
+            pressure, relative_humidity, temperature
+        )
+        if not in_table.all():
+            wbt_data[~in_table] = self._iterate_wet_bulb_temperature(
+                pressure[~in_table],
+                relative_humidity[~in_table],
+                temperature[~in_table],
+            )
+        return wbt_data
+
+    def _iterate_wet_bulb_temperature(
+        self, pressure: ndarray, relative_humidity: ndarray, temperature: ndarray
     ) -> ndarray:
         """
         Calculate an array of wet bulb temperatures from inputs in
@@ -184,7 +345,9 @@ class WetBulbTemperature(BasePlugin):
 
         A Newton iterator is used to minimise the gradient of enthalpy
         against temperature. Assumes that the variation of latent heat with
-        temperature can be ignored.
+        temperature can be ignored.  Where numba is available and the inputs
+        are unmasked float32 arrays, the iteration is performed for each point
+        in turn by a compiled solver.
 
         Args:
             pressure:
@@ -198,6 +361,36 @@ class WetBulbTemperature(BasePlugin):
             Array of wet bulb temperature (K).
 
         """
+        if all(
+            isinstance(data, ndarray)
+            and not np.ma.isMaskedArray(data)
+            and data.dtype == np.float32
+            for data in (pressure, relative_humidity, temperature)
+        ):
+            try:
+                import numba  # noqa: F401
+
+                from improver.psychrometric_calculations.numba_utilities import (
+                    fast_wet_bulb_temperature,
+                )
+            except ImportError:
+                warnings.warn(
+                    "Module numba unavailable. WetBulbTemperature will be slower."
+                )
+            else:
+                wbt_data = fast_wet_bulb_temperature(
+                    temperature.ravel(),
+                    relative_humidity.ravel(),
+                    pressure.ravel(),
+                    _svp_table(None),
+                    SVP_T_MIN,
+                    SVP_T_MAX - SVP_T_INCREMENT,
+                    SVP_T_INCREMENT,
+                    self.precision,
+                    self.maximum_iterations,
+                )
+                return wbt_data.reshape(temperature.shape)
+
         # Initialise psychrometric variables
         wbt_data_upd = wbt_data = temperature.flatten()
         pressure = pressure.flatten()
@@ -14,6 +14,7 @@ from typing import Tuple, Union
 import numpy as np
 from numpy import ndarray
 from numpy.ma.core import MaskedArray
+from scipy.sparse import csr_matrix
 
 from improver.regrid.grid import similar_surface_classify
 from improver.regrid.idw import (
@@ -58,6 +59,50 @@ def apply_weights(
     return out_values
 
 
+def apply_sparse_weights(
+    indexes: ndarray, in_values: Union[ndarray, MaskedArray], weights: ndarray
+) -> Union[ndarray, MaskedArray]:
+    """
+    Apply bilinear weight of source points for target value, as a sparse
+    matrix product applied to all the leading dimensions of the input values
+    at once. This gives the same result as apply_weights without creating
+    an array of the values of every source point for each target point.
+
+    Args:
+        indexes:
+            Array of source grid point number for target grid points.
+        in_values:
+            Input values (maybe multidimensional).
+        weights:
+            Array of source grid point weighting for target grid points.
+
+    Returns:
+        Regridded values for target points.
+    """
+    input_array_masked = False
+    if isinstance(in_values, MaskedArray):
+        input_array_masked = True
+        in_values = np.ma.filled(in_values, np.nan)
+
+    # Zero weights are kept so that, as in apply_weights, any NaN source
+    # value results in a NaN target value.
+    num_target_points, num_source_points = indexes.shape
+    weights_matrix = csr_matrix(
+        (
+            np.ravel(weights),
+            np.ravel(indexes),
+            np.arange(0, indexes.size + 1, num_source_points),
+        ),
+        shape=(num_target_points, in_values.shape[0]),
+    )
+    out_values = weights_matrix @ in_values.reshape(in_values.shape[0], -1)
+    out_values = out_values.reshape((num_target_points,) + in_values.shape[1:])
+    if input_array_masked:
+        out_values = np.ma.masked_invalid(out_values)
+
+    return out_values
+
+
 def basic_indexes(
     out_latlons: ndarray,
     in_latlons: ndarray,
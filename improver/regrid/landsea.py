@@ -5,10 +5,11 @@
 """Plugin to regrid with land-sea awareness"""
 
 import functools
+import hashlib
 import warnings
+from collections import OrderedDict
 from typing import Optional, Tuple
 
-import iris
 import numpy as np
 from iris.analysis import Linear, Nearest
 from iris.cube import Cube
@@ -18,11 +19,20 @@ from scipy.spatial import cKDTree
 from improver import PostProcessingPlugin
 from improver.metadata.constants.attributes import MANDATORY_ATTRIBUTE_DEFAULTS
 from improver.metadata.constants.mo_attributes import MOSG_GRID_ATTRIBUTES
+from improver.metadata.utilities import create_coordinate_hash
 from improver.regrid.landsea2 import RegridWithLandSeaMask
 from improver.threshold import Threshold
 from improver.utilities.cube_checker import spatial_coords_match
+from improver.utilities.lookup_tables import load_lookup_table
 from improver.utilities.spatial import OccurrenceWithinVicinity
 
+#: Number of land-sea corrections retained for reuse by AdjustLandSeaPoints
+SOURCE_INDICES_CACHE_SIZE = 4
+
+# Source indices of land-sea corrections, keyed by a hash of the land-sea
+# masks, the extrapolation mode and the vicinity radius
+_SOURCE_INDICES_CACHE: "OrderedDict[str, ndarray]" = OrderedDict()
+
 
 class RegridLandSea(PostProcessingPlugin):
     """Nearest-neighbour and bilinear regridding with or without land-sea mask
@@ -304,6 +314,110 @@ class AdjustLandSeaPoints(PostProcessingPlugin):
         # Replace these points with the filled-domain data
         self.output_cube.data[mismatch_points] = selector_data[mismatch_points]
 
+    def _cache_key(self, input_land: Cube, output_land: Cube) -> str:
+        """
+        Generate a key identifying the land-sea correction for the given
+        land-sea masks.
+
+        Args:
+            input_land:
+                Cube of land_binary_mask data on the source grid.
+            output_land:
+                Cube of land_binary_mask data on the target grid.
+
+        Returns:
+            A hash identifying the land-sea correction.
+        """
+        key = hashlib.sha256(
+            "{}:{}:{}:{}".format(
+                self.regridder.extrapolation_mode,
+                self.vicinity.radii,
+                create_coordinate_hash(input_land),
+                create_coordinate_hash(output_land),
+            ).encode()
+        )
+        for land in (input_land, output_land):
+            data = land.data
+            key.update(f"{data.dtype}:{data.shape}".encode())
+            key.update(np.ma.getdata(data).tobytes())
+            key.update(np.packbits(np.ma.getmaskarray(data)).tobytes())
+        return key.hexdigest()
+
+    def _calculate_source_indices(self, input_land: Cube) -> ndarray:
+        """
+        Calculate the point from which the corrected value at each point on
+        the target grid is taken, replacing points where output_land and
+        input_land do not match with the nearest matching point in the
+        vicinity, as done by correct_where_input_true. Sets self.input_land
+        to input_land regridded to the target grid.
+
+        Args:
+            input_land:
+                Cube of land_binary_mask data on the source grid.
+
+        Returns:
+            Array on the target grid of the indices into the flattened
+            target grid of the points from which the corrected values are
+            taken.
+        """
+        self.input_land = input_land.regrid(self.output_land, self.regridder)
+
+        # Reset cache as input_land and output_land have changed
+        self._get_matches.cache_clear()
+        shape = self.input_land.shape
+        source_indices = np.arange(np.prod(shape)).reshape(shape)
+        # Each correction takes values from the uncorrected data, so the
+        # sources for sea and land points are found independently.
+        for selector_val in (0, 1):
+            try:
+                mismatch_points, indices, use_points, no_use_points = self._get_matches(
+                    selector_val
+                )
+            except self._NoMatchesError:
+                continue
+            selector_indices = np.arange(np.prod(shape)).reshape(shape)
+            selector_indices[no_use_points] = np.ravel_multi_index(use_points, shape)[
+                indices
+            ]
+            source_indices[mismatch_points] = selector_indices[mismatch_points]
+        return source_indices
+
+    def source_indices(self, input_land: Cube, output_land: Cube) -> ndarray:
+        """
+        Return the point from which the corrected value at each point on the
+        target grid is taken. These depend only on the land-sea masks, so
+        the most recently used are retained for reuse by subsequent calls,
+        including calls of other instances of the plugin. They are also
+        cached on disk, to be shared between processes, if a lookup table
+        cache directory is set (see improver.utilities.lookup_tables).
+
+        Args:
+            input_land:
+                Cube of land_binary_mask data on the source grid.
+            output_land:
+                Cube of land_binary_mask data on the target grid.
+
+        Returns:
+            Read-only array on the target grid of the indices into the
+            flattened target grid of the points from which the corrected
+            values are taken.
+        """
+        self.output_land = output_land
+        key = self._cache_key(input_land, output_land)
+        if key in _SOURCE_INDICES_CACHE:
+            _SOURCE_INDICES_CACHE.move_to_end(key)
+            return _SOURCE_INDICES_CACHE[key]
+
+        _SOURCE_INDICES_CACHE[key] = load_lookup_table(
+            "adjust_landsea_points_source_indices",
+            1,
+            lambda key: self._calculate_source_indices(input_land),
+            key,
+        )
+        while len(_SOURCE_INDICES_CACHE) > SOURCE_INDICES_CACHE_SIZE:
+            _SOURCE_INDICES_CACHE.popitem(last=False)
+        return _SOURCE_INDICES_CACHE[key]
+
     def process(self, cube: Cube, input_land: Cube, output_land: Cube) -> Cube:
         """
         Update cube.data so that output_land and sea points match an input_land
@@ -312,6 +426,10 @@ class AdjustLandSeaPoints(PostProcessingPlugin):
         input land mask MUST be checked against the source grid, to ensure
         the grids match.
 
+        The points from which corrected values are taken are reused for the
+        same land-sea masks (see source_indices), and all the x-y slices of
+        the cube are corrected at once.
+
         Args:
             cube:
                 Cube of data to be updated (on same grid as output_land).
@@ -335,31 +453,15 @@ class AdjustLandSeaPoints(PostProcessingPlugin):
                     repr(cube), repr(output_land)
                 )
             )
-        self.output_land = output_land
-
-        # Regrid input_land to output_land grid.
-        self.input_land = input_land.regrid(self.output_land, self.regridder)
+        source_indices = self.source_indices(input_land, output_land)
 
-        # Slice over x-y grids for multi-realization data.
-        result = iris.cube.CubeList()
-
-        # Reset cache as input_land and output_land have changed
-        self._get_matches.cache_clear()
-        for xyslice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            # Store and copy cube ready for the output data
-            self.nearest_cube = xyslice
-            self.output_cube = self.nearest_cube.copy()
-
-            # Update sea points that were incorrectly sourced from land points
-            self.correct_where_input_true(0)
-
-            # Update land points that were incorrectly sourced from sea points
-            self.correct_where_input_true(1)
-
-            result.append(self.output_cube)
-
-        result = result.merge_cube()
-        return result
+        # Take the corrected values for all x-y slices of the cube at once.
+        spatial_dims = [
+            cube.coord_dims(cube.coord(axis=axis))[0] for axis in ("y", "x")
+        ]
+        data = np.moveaxis(cube.data, spatial_dims, [-2, -1])
+        data = data.reshape(data.shape[:-2] + (-1,))[..., source_indices]
+        return cube.copy(data=np.moveaxis(data, [-2, -1], spatial_dims))
 
 
 def grid_contains_cutout(grid: Cube, cutout: Cube) -> bool:
@@ -7,13 +7,18 @@ Plugin to regrid using custom nearest and bilinear methods, both with
 land-sea awareness
 """
 
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 from iris.cube import Cube
+from numpy import ndarray
 
 from improver import PostProcessingPlugin
+from improver.metadata.utilities import create_coordinate_hash
 from improver.regrid.bilinear import (
     adjust_for_surface_mismatch,
-    apply_weights,
+    apply_sparse_weights,
     basic_indexes,
     basic_weights,
 )
@@ -32,7 +37,8 @@ from improver.regrid.grid import (
     slice_mask_cube_by_domain,
     unflatten_spatial_dimensions,
 )
-from improver.regrid.nearest import nearest_regrid, nearest_with_mask_regrid
+from improver.regrid.nearest import nearest_with_mask_regrid
+from improver.utilities.lookup_tables import load_lookup_table
 from improver.utilities.spatial import transform_grid_to_lat_lon
 
 NEAREST = "nearest"
@@ -44,6 +50,12 @@ NEAREST_MASK2 = f"{NEAREST}{WITH_MASK}-2"
 BILINEAR_MASK2 = f"{BILINEAR}{WITH_MASK}-2"
 NUM_NEIGHBOURS = 4
 
+#: Number of sets of regridding weights retained for reuse by RegridWithLandSeaMask
+REGRID_WEIGHTS_CACHE_SIZE = 4
+
+# Regridding weights, keyed by a hash of the grids, land-sea masks and mode
+_REGRID_WEIGHTS_CACHE: "OrderedDict[str, ndarray]" = OrderedDict()
+
 
 class RegridWithLandSeaMask(PostProcessingPlugin):
     """
@@ -72,35 +84,104 @@ class RegridWithLandSeaMask(PostProcessingPlugin):
         self.regrid_mode = regrid_mode
         self.vicinity = vicinity_radius
 
-    def process(self, cube_in: Cube, cube_in_mask: Cube, cube_out_mask: Cube) -> Cube:
+    def _cache_key(self, cube_in: Cube, cube_in_mask: Cube, cube_out_mask: Cube) -> str:
         """
-        Regridding considering land_sea mask. please note cube_in must use
-        lats/lons rectlinear system(GeogCS). cube_in_mask and cube_in could be
-        different  resolution. cube_out could be either in lats/lons rectlinear
-        system or LambertAzimuthalEqualArea system. Grid points in cube_out
-        domain but not in cube_in domain will be masked.
+        Generate a key identifying the regridding weights for the given grids
+        and, if the land-sea masks are considered, the land-sea masks.
 
         Args:
             cube_in:
-                Cube of data to be regridded.
+                Cube of data to be regridded, with ascending coordinates.
             cube_in_mask:
-                Cube of land_binary_mask data ((land:1, sea:0). used to determine
-                where the input model data is representing land and sea points.
+                Cube of land_binary_mask data on the source grid, with
+                ascending coordinates.
             cube_out_mask:
-                Cube of land_binary_mask data on target grid (land:1, sea:0).
+                Cube of land_binary_mask data on the target grid.
 
         Returns:
-            Regridded result cube.
+            A hash identifying the regridding weights.
         """
-        # if cube_in's coordinate descending, make it assending.
-        # if mask considered, reverse mask cube's coordinate if descending
-        cube_in = ensure_ascending_coord(cube_in)
+        key = hashlib.sha256(
+            "{}:{}:{}:{}".format(
+                self.regrid_mode,
+                self.vicinity,
+                create_coordinate_hash(cube_in),
+                create_coordinate_hash(cube_out_mask),
+            ).encode()
+        )
         if WITH_MASK in self.regrid_mode:
-            cube_in_mask = ensure_ascending_coord(cube_in_mask)
+            key.update(create_coordinate_hash(cube_in_mask).encode())
+            for mask in (cube_in_mask, cube_out_mask):
+                key.update(np.packbits(np.ma.getdata(mask.data) != 0).tobytes())
+        return key.hexdigest()
+
+    def regrid_weights(
+        self, cube_in: Cube, cube_in_mask: Cube, cube_out_mask: Cube
+    ) -> ndarray:
+        """
+        Return the source grid point indexes and weights from which each
+        target grid point is calculated. These depend only on the grids, the
+        land-sea masks and the regrid mode, so the most recently used weights
+        are retained for reuse by subsequent calls. The weights are also
+        cached on disk, to be shared between processes, if a lookup table
+        cache directory is set (see improver.utilities.lookup_tables).
 
+        Args:
+            cube_in:
+                Cube of data to be regridded, with ascending coordinates.
+            cube_in_mask:
+                Cube of land_binary_mask data on the source grid, with
+                ascending coordinates.
+            cube_out_mask:
+                Cube of land_binary_mask data on the target grid.
+
+        Returns:
+            Read-only structured array of the flattened target grid points
+            with fields "index" and "weight", giving the indexes in the
+            flattened source grid and the weights of the source points from
+            which each target point is calculated, and "inside", which is
+            False for target points outside the source domain.
+        """
+        key = self._cache_key(cube_in, cube_in_mask, cube_out_mask)
+        if key in _REGRID_WEIGHTS_CACHE:
+            _REGRID_WEIGHTS_CACHE.move_to_end(key)
+            return _REGRID_WEIGHTS_CACHE[key]
+
+        _REGRID_WEIGHTS_CACHE[key] = load_lookup_table(
+            "regrid_with_landsea_mask_weights",
+            1,
+            lambda key: self._calculate_weights(cube_in, cube_in_mask, cube_out_mask),
+            key,
+        )
+        while len(_REGRID_WEIGHTS_CACHE) > REGRID_WEIGHTS_CACHE_SIZE:
+            _REGRID_WEIGHTS_CACHE.popitem(last=False)
+        return _REGRID_WEIGHTS_CACHE[key]
+
+    def _calculate_weights(
+        self, cube_in: Cube, cube_in_mask: Cube, cube_out_mask: Cube
+    ) -> ndarray:
+        """
+        Calculate the source grid point indexes and weights from which each
+        target grid point is calculated (see regrid_weights).
+
+        Args:
+            cube_in:
+                Cube of data to be regridded, with ascending coordinates.
+            cube_in_mask:
+                Cube of land_binary_mask data on the source grid, with
+                ascending coordinates.
+            cube_out_mask:
+                Cube of land_binary_mask data on the target grid.
+
+        Returns:
+            Structured array of the indexes and weights of the source points
+            for each target point.
+        """
         # check if input source grid is on even-spacing, ascending lat/lon system
         # return grid spacing for latitude and logitude
         lat_spacing, lon_spacing = calculate_input_grid_spacing(cube_in)
+        full_lats = cube_in.coord(axis="y").points
+        full_lons = cube_in.coord(axis="x").points
 
         # Gather output latitude/longitudes from output template cube
         if (
@@ -142,9 +223,6 @@ class RegridWithLandSeaMask(PostProcessingPlugin):
         # stripes for finding surrounding points for bilinear interpolation
         in_lons_size = cube_in.coord(axis="x").shape[0]  # longitude
 
-        # Reshape input data so that spatial dimensions can be handled as one
-        in_values, lats_index, lons_index = flatten_spatial_dimensions(cube_in)
-
         # Locate nearby input points for output points
         indexes = basic_indexes(
             out_latlons, in_latlons, in_lons_size, lat_spacing, lon_spacing
@@ -188,8 +266,11 @@ class RegridWithLandSeaMask(PostProcessingPlugin):
                     self.vicinity,
                 )
 
-            # apply nearest distance rule
-            output_flat = nearest_regrid(distances, indexes, in_values)
+            # apply nearest distance rule, taking the whole value of the
+            # nearest source point
+            min_index = np.argmin(distances, axis=1)
+            indexes = indexes[np.arange(min_index.shape[0]), min_index, np.newaxis]
+            weights = np.ones(indexes.shape, dtype=np.float32)
 
         elif BILINEAR in self.regrid_mode:
             # Assume all four nearby points are same surface type and calculate default weights
@@ -216,8 +297,72 @@ class RegridWithLandSeaMask(PostProcessingPlugin):
                     lon_spacing,
                 )
 
+        # Convert the indexes in the flattened subset of the source grid into
+        # indexes in the whole flattened source grid
+        lats_offset = np.searchsorted(full_lats, cube_in.coord(axis="y").points[0])
+        lons_offset = np.searchsorted(full_lons, cube_in.coord(axis="x").points[0])
+        lats_index, lons_index = np.divmod(indexes, in_lons_size)
+        indexes = (lats_index + lats_offset) * len(full_lons) + lons_index + lons_offset
+
+        regrid_weights = np.zeros(
+            total_out_point_num,
+            dtype=[
+                ("index", np.int64, indexes.shape[1:]),
+                ("weight", np.float32, weights.shape[1:]),
+                ("inside", bool),
+            ],
+        )
+        regrid_weights["index"][inside_input_domain_index] = indexes
+        regrid_weights["weight"][inside_input_domain_index] = weights
+        regrid_weights["inside"][inside_input_domain_index] = True
+        return regrid_weights
+
+    def process(self, cube_in: Cube, cube_in_mask: Cube, cube_out_mask: Cube) -> Cube:
+        """
+        Regridding considering land_sea mask. please note cube_in must use
+        lats/lons rectlinear system(GeogCS). cube_in_mask and cube_in could be
+        different  resolution. cube_out could be either in lats/lons rectlinear
+        system or LambertAzimuthalEqualArea system. Grid points in cube_out
+        domain but not in cube_in domain will be masked.
+
+        The regridding weights are reused by subsequent calls with the same
+        grids and land-sea masks (see regrid_weights), and are applied to all
+        the leading dimensions of cube_in at once.
+
+        Args:
+            cube_in:
+                Cube of data to be regridded.
+            cube_in_mask:
+                Cube of land_binary_mask data ((land:1, sea:0). used to determine
+                where the input model data is representing land and sea points.
+            cube_out_mask:
+                Cube of land_binary_mask data on target grid (land:1, sea:0).
+
+        Returns:
+            Regridded result cube.
+        """
+        # if cube_in's coordinate descending, make it assending.
+        # if mask considered, reverse mask cube's coordinate if descending
+        cube_in = ensure_ascending_coord(cube_in)
+        if WITH_MASK in self.regrid_mode:
+            cube_in_mask = ensure_ascending_coord(cube_in_mask)
+
+        regrid_weights = self.regrid_weights(cube_in, cube_in_mask, cube_out_mask)
+        total_out_point_num = regrid_weights.shape[0]
+        inside_input_domain_index = np.flatnonzero(regrid_weights["inside"])
+        outside_input_domain_index = np.flatnonzero(~regrid_weights["inside"])
+        indexes = regrid_weights["index"][inside_input_domain_index]
+        weights = regrid_weights["weight"][inside_input_domain_index]
+
+        # Reshape input data so that spatial dimensions can be handled as one
+        in_values, lats_index, lons_index = flatten_spatial_dimensions(cube_in)
+
+        if NEAREST in self.regrid_mode:
+            # apply nearest distance rule
+            output_flat = in_values[indexes[:, 0]]
+        elif BILINEAR in self.regrid_mode:
             # apply bilinear rule
-            output_flat = apply_weights(indexes, in_values, weights)
+            output_flat = apply_sparse_weights(indexes, in_values, weights)
 
         # check if we need mask cube_out grid points which are out of cube_in range
         if len(outside_input_domain_index) > 0:
@@ -0,0 +1,330 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Module containing a long-lived worker process for running IMPROVER
+commands, and a client to submit commands to it over a Unix domain socket."""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import traceback
+import warnings
+from collections import OrderedDict
+from copy import deepcopy
+from fnmatch import fnmatch
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class InputCache:
+    """Least recently used cache of inputs loaded from file.
+
+    Entries are keyed by the converter used to load the file, the file path,
+    modification time and size, so that a file which is replaced on disk is
+    reloaded. Cubes are realised when cached so that they remain resident
+    between jobs, and a copy is returned on each access so that callers may
+    modify their inputs in place.
+    """
+
+    def __init__(self, max_entries: int = 16, patterns: Sequence[str] = ()):
+        """Initialise the cache.
+
+        Args:
+            max_entries:
+                Maximum number of loaded inputs to retain. When exceeded, the
+                least recently used input is evicted.
+            patterns:
+                Glob patterns of the file paths to be cached, e.g. matching
+                the directory containing ancillary files. Files not matching
+                any pattern are loaded without caching, so by default nothing
+                is cached.
+        """
+        self.max_entries = max_entries
+        self.patterns = patterns
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cacheable(self, path: Any) -> bool:
+        """Check whether the path refers to a file that should be cached.
+        The patterns are matched against the real path of the file, so that
+        relative paths and symbolic links match patterns given as absolute
+        paths."""
+        return (
+            self.max_entries > 0
+            and isinstance(path, str)
+            and os.path.isfile(path)
+            and any(
+                fnmatch(os.path.realpath(path), pattern) for pattern in self.patterns
+            )
+        )
+
+    def load(self, converter: Callable, path: str, **kwargs) -> Any:
+        """Load an input via the cache.
+
+        Args:
+            converter:
+                Function used to load the file, e.g. load_cube.
+            path:
+                Path of the file to be loaded.
+            kwargs:
+                Keyword arguments to pass to the converter.
+
+        Returns:
+            The loaded input.
+        """
+        if not self._cacheable(path):
+            return converter(path, **kwargs)
+
+        file_stat = os.stat(path)
+        key = (
+            converter,
+            os.path.realpath(path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            tuple(sorted(kwargs.items())),
+        )
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            loaded = converter(path, **kwargs)
+            for item in loaded if isinstance(loaded, list) else [loaded]:
+                if getattr(item, "has_lazy_data", lambda: False)():
+                    item.data
+            self._entries[key] = loaded
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return deepcopy(self._entries[key])
+
+
+def preload_processing_modules() -> List[str]:
+    """Import the modules providing the IMPROVER plugins, so that commands
+    run without incurring the cost of these imports. Modules requiring
+    unavailable optional dependencies are skipped.
+
+    Returns:
+        Names of the modules that were imported.
+    """
+    from improver.api import PROCESSING_MODULES
+
+    imported = []
+    for module in sorted(set(PROCESSING_MODULES.values())):
+        try:
+            import_module(module)
+        except ImportError:
+            continue
+        imported.append(module)
+    return imported
+
+
+def _write_warning(message, category, filename, lineno, file=None, line=None):
+    """Write a warning to the current stderr, which is redirected while a
+    job is running."""
+    sys.stderr.write(warnings.formatwarning(message, category, filename, lineno, line))
+
+
+def run_job(argv: Sequence[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Run a single IMPROVER command, capturing its output.
+
+    Args:
+        argv:
+            Command name and arguments, as would be given on the command
+            line after "improver".
+        cwd:
+            Directory in which to run the command, against which relative
+            paths are resolved.
+
+    Returns:
+        Response containing the "returncode", captured "stdout" and "stderr",
+        including any warnings raised by the job, the string representation of any returned
+        "result" and, on failure, the "error" traceback.
+    """
+    from improver.cli import SUBCOMMANDS_DISPATCHER, execute_command, unbracket
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    response = {"returncode": 0, "result": None, "error": None}
+    original_cwd = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+            warnings.catch_warnings(),
+        ):
+            # catching warnings resets the record of those already shown, so
+            # each job reports its own warnings to its captured stderr
+            warnings.showwarning = _write_warning
+            result = execute_command(
+                SUBCOMMANDS_DISPATCHER, "improver", *unbracket(argv)
+            )
+        if result is not None:
+            response["result"] = str(result)
+    except Exception:
+        response.update(returncode=1, error=traceback.format_exc())
+    finally:
+        os.chdir(original_cwd)
+    response["stdout"] = stdout.getvalue()
+    response["stderr"] = stderr.getvalue()
+    return response
+
+
+def _receive(conn: socket.socket) -> Dict:
+    """Read a single newline terminated JSON message from a connection."""
+    with conn.makefile("r", encoding="utf-8") as stream:
+        return json.loads(stream.readline())
+
+
+def _send(conn: socket.socket, message: Dict) -> None:
+    """Write a single newline terminated JSON message to a connection."""
+    conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+
+def _peer_uid(conn: socket.socket) -> Optional[int]:
+    """Return the user ID of the process at the other end of a connection,
+    or None if this is not reported on this platform."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+
+def _handle(conn: socket.socket) -> bool:
+    """Receive a single request from a connection, run it and reply.
+
+    Args:
+        conn:
+            Connection from a client.
+
+    Returns:
+        True if a shutdown was requested.
+
+    Raises:
+        PermissionError: If the client is run by a different user.
+        ValueError: If the request is not a shutdown or a command.
+    """
+    # the request is read before it is refused, so that the client is not
+    # disconnected while sending it
+    request = _receive(conn)
+    uid = _peer_uid(conn)
+    if uid is not None and uid != os.getuid():
+        raise PermissionError(f"Requests from user ID {uid} are not accepted.")
+    if not isinstance(request, dict):
+        raise ValueError(f"Request must be a JSON object, not {request!r}.")
+    if request.get("shutdown"):
+        _send(conn, {"returncode": 0})
+        return True
+    if "argv" not in request:
+        raise ValueError("Request must contain either argv or shutdown.")
+    _send(conn, run_job(request["argv"], request.get("cwd")))
+    return False
+
+
+def serve(
+    socket_path: str,
+    cache_size: int = 16,
+    cache_patterns: Sequence[str] = (),
+) -> None:
+    """Run IMPROVER commands received over a Unix domain socket until a
+    shutdown request is received.
+
+    The plugin modules are imported once on start up, and inputs loaded by
+    the commands from files matching the cache patterns are retained between
+    jobs in a least recently used cache. Jobs are run one at a time, in the
+    order they are received.
+
+    The socket is only accessible to the user running the server, and
+    requests from other users are refused where the platform reports the
+    user of the client. A request that fails, for example because it is
+    malformed or the client disconnects, is answered with an error where
+    possible and does not stop the server.
+
+    Args:
+        socket_path:
+            Path of the Unix domain socket to listen on. A stale socket left
+            at this path by a previous server is replaced.
+        cache_size:
+            Maximum number of loaded inputs to retain between jobs. Zero
+            disables caching.
+        cache_patterns:
+            Glob patterns of the input file paths to retain, e.g. matching
+            the directory containing ancillary files. By default no inputs
+            are retained.
+
+    Raises:
+        FileExistsError: If the socket path exists and is not a socket.
+    """
+    from improver import cli
+
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise FileExistsError(f"{socket_path} exists and is not a socket.")
+        os.remove(socket_path)
+
+    preload_processing_modules()
+    cli.INPUT_CACHE = InputCache(cache_size, cache_patterns)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            # create the socket accessible only to the current user
+            original_umask = os.umask(0o177)
+            try:
+                server.bind(socket_path)
+            finally:
+                os.umask(original_umask)
+            server.listen()
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        if _handle(conn):
+                            break
+                    except Exception:
+                        with contextlib.suppress(OSError):
+                            _send(
+                                conn, {"returncode": 1, "error": traceback.format_exc()}
+                            )
+    finally:
+        cli.INPUT_CACHE = None
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def submit(
+    socket_path: str, argv: Sequence[str] = (), shutdown: bool = False
+) -> Dict[str, Any]:
+    """Submit a command to a running IMPROVER server and wait for it to
+    complete.
+
+    Args:
+        socket_path:
+            Path of the Unix domain socket the server is listening on.
+        argv:
+            Command name and arguments, as would be given on the command
+            line after "improver". Relative paths are resolved against the
+            current working directory.
+        shutdown:
+            If True, request that the server stops instead of running a
+            command.
+
+    Returns:
+        Response from the server, as returned by run_job.
+    """
+    if shutdown:
+        request = {"shutdown": True}
+    else:
+        request = {"argv": [str(arg) for arg in argv], "cwd": os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        _send(conn, request)
+        return _receive(conn)
@@ -5,12 +5,16 @@
 
 """Neighbour finding for the Improver site specific process chain."""
 
+import hashlib
 import warnings
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 import cartopy.crs as ccrs
+import iris
 import numpy as np
 from cartopy.crs import CRS
+from iris.coords import Coord
 from iris.cube import Cube
 from numpy import ndarray
 from scipy.spatial import cKDTree
@@ -22,6 +26,12 @@ from improver.utilities.cube_manipulation import enforce_coordinate_ordering
 
 from .utilities import get_neighbour_finding_method_name
 
+#: Number of KD-trees retained for reuse by NeighbourSelection
+KDTREE_CACHE_SIZE = 4
+
+# KD-trees and their index nodes, keyed by a hash of the grid and nodes
+_KDTREE_CACHE: "OrderedDict[str, Tuple[cKDTree, ndarray]]" = OrderedDict()
+
 
 class NeighbourSelection(BasePlugin):
     """
@@ -53,6 +63,7 @@ class NeighbourSelection(BasePlugin):
         site_y_coordinate: str = "latitude",
         node_limit: int = 36,
         unique_site_id_key: Optional[str] = None,
+        max_workers: int = 1,
     ) -> None:
         """
         Args:
@@ -88,6 +99,10 @@ class NeighbourSelection(BasePlugin):
                 used to name the resulting unique ID coordinate on the constructed
                 cube. Values in this coordinate will be recorded as strings, with
                 all numbers padded to 8-digits, e.g. "00012345".
+            max_workers:
+                Number of threads with which to query the KD-tree for the
+                neighbours of the sites. The default of 1 queries the tree
+                serially. This is worthwhile for large site lists.
         """
         self.minimum_dz = minimum_dz
         self.land_constraint = land_constraint
@@ -98,6 +113,7 @@ class NeighbourSelection(BasePlugin):
         self.site_altitude = "altitude"
         self.node_limit = node_limit
         self.unique_site_id_key = unique_site_id_key
+        self.max_workers = max_workers
         self.global_coordinate_system = False
 
     def __repr__(self) -> str:
@@ -243,6 +259,41 @@ class NeighbourSelection(BasePlugin):
         site_y_coords = site_y_coords[domain_valid]
         return sites, site_coords, site_x_coords, site_y_coords
 
+    @staticmethod
+    def _nearest_neighbour_indices(coord: Coord, points: ndarray) -> ndarray:
+        """
+        Find the index of the cell of a one-dimensional coordinate nearest to
+        each of an array of points. This is equivalent to calling the iris
+        coordinate method nearest_neighbour_index for each point, but for a
+        coordinate with bounds all of the points are located at once.
+
+        Args:
+            coord:
+                One-dimensional coordinate.
+            points:
+                Array of points to locate on the coordinate.
+
+        Returns:
+            Array of the indices of the nearest cells to the points.
+        """
+        if not coord.has_bounds():
+            return np.array(
+                [coord.nearest_neighbour_index(point) for point in points], dtype=int
+            )
+        bounds = coord.bounds
+        if getattr(coord, "circular", False):
+            wrap_origin = np.min(np.hstack((coord.points, bounds.flatten())))
+            points = wrap_origin + (points - wrap_origin) % coord.units.modulus
+        bounds = bounds.astype(np.result_type(bounds, points))
+        # As iris does, order the cells by their centres and move adjacent
+        # bounds to their average, so that the cells are contiguous. A point
+        # on an edge is in the first of the two cells, and points beyond the
+        # ends are in the end cells.
+        sort_inds = np.argsort(np.mean(bounds, axis=1))
+        bounds = bounds[sort_inds]
+        edges = 0.5 * (bounds[:-1].max(axis=1) + bounds[1:].min(axis=1))
+        return sort_inds[np.searchsorted(edges, points, side="left")]
+
     @staticmethod
     def get_nearest_indices(site_coords: ndarray, cube: Cube) -> ndarray:
         """
@@ -261,12 +312,12 @@ class NeighbourSelection(BasePlugin):
             of the nearest grid points to the sites.
         """
         nearest_indices = np.zeros((len(site_coords), 2)).astype(np.int32)
-        for index, (x_point, y_point) in enumerate(site_coords):
-            nearest_indices[index, 0] = cube.coord(axis="x").nearest_neighbour_index(
-                x_point
+        if len(site_coords) > 0:
+            nearest_indices[:, 0] = NeighbourSelection._nearest_neighbour_indices(
+                cube.coord(axis="x"), site_coords[:, 0]
             )
-            nearest_indices[index, 1] = cube.coord(axis="y").nearest_neighbour_index(
-                y_point
+            nearest_indices[:, 1] = NeighbourSelection._nearest_neighbour_indices(
+                cube.coord(axis="y"), site_coords[:, 1]
             )
         return nearest_indices
 
@@ -309,7 +360,10 @@ class NeighbourSelection(BasePlugin):
         """
         Build a KDTree for extracting the nearest point or points to a site.
         The tree can be built with a constrained set of grid points, e.g. only
-        land points, if required.
+        land points, if required. The most recently built trees are retained,
+        keyed by the grid and the grid points included, so that a tree is
+        reused by subsequent neighbour selections with the same grid and
+        constraint rather than being rebuilt.
 
         Args:
             land_mask:
@@ -325,10 +379,24 @@ class NeighbourSelection(BasePlugin):
               index_nodes[100] = [10, 300]
         """
         if self.land_constraint:
-            included_points = np.nonzero(land_mask.data)
+            included = land_mask.data != 0
         else:
-            included_points = np.where(np.isfinite(land_mask.data.data))
-
+            included = np.isfinite(land_mask.data.data)
+        included = np.ma.filled(included, False)
+
+        key = hashlib.sha256(
+            "{}:{}:{}".format(
+                create_coordinate_hash(land_mask),
+                self.global_coordinate_system,
+                included.shape,
+            ).encode()
+            + np.packbits(included).tobytes()
+        ).hexdigest()
+        if key in _KDTREE_CACHE:
+            _KDTREE_CACHE.move_to_end(key)
+            return _KDTREE_CACHE[key]
+
+        included_points = np.nonzero(included)
         x_indices = included_points[0]
         y_indices = included_points[1]
         x_coords = land_mask.coord(axis="x").points[x_indices]
@@ -340,8 +408,13 @@ class NeighbourSelection(BasePlugin):
             nodes = list(zip(x_coords, y_coords))
 
         index_nodes = np.array(list(zip(x_indices, y_indices)))
+        # The nodes are shared between calls, so must not be modified.
+        index_nodes.flags.writeable = False
 
-        return cKDTree(nodes), index_nodes
+        _KDTREE_CACHE[key] = (cKDTree(nodes), index_nodes)
+        while len(_KDTREE_CACHE) > KDTREE_CACHE_SIZE:
+            _KDTREE_CACHE.popitem(last=False)
+        return _KDTREE_CACHE[key]
 
     def select_minimum_dz(
         self,
@@ -419,8 +492,209 @@ class NeighbourSelection(BasePlugin):
 
         return grid_point
 
+    def search_constrained_neighbours(
+        self,
+        land_mask: Cube,
+        orography: Cube,
+        site_coords: ndarray,
+        site_altitudes: ndarray,
+        nearest_indices: ndarray,
+    ) -> ndarray:
+        """
+        Find the grid point neighbours of sites that satisfy the land and
+        minimum vertical displacement constraints, by querying a KD-tree of
+        the grid points.
+
+        Args:
+            land_mask:
+                A land mask cube for the model/grid from which grid point
+                neighbours are being selected.
+            orography:
+                A cube of orography, used to obtain the grid point altitudes.
+            site_coords:
+                An array of shape (n_sites, 2) that contains the x and y
+                coordinates of the sites in the coordinate system of the grid.
+            site_altitudes:
+                The altitudes of the sites.
+            nearest_indices:
+                An array of shape (n_sites, 2) that contains the x and y
+                indices of the nearest grid points to the sites, which are
+                used for sites without a neighbour satisfying the constraints.
+
+        Returns:
+            An array of shape (n_sites, 2) that contains the x and y indices
+            of the selected grid point neighbours.
+        """
+        # Build the KDTree, an internal test for the land_constraint checks
+        # whether to exclude sea points from the tree.
+        tree, index_nodes = self.build_KDTree(land_mask)
+
+        # Site coordinates made cartesian for global coordinate system
+        if self.global_coordinate_system:
+            site_coords = self.geocentric_cartesian(
+                orography, site_coords[:, 0], site_coords[:, 1]
+            )
+
+        if not self.minimum_dz:
+            # Query the tree for the nearest neighbour, in this case a land
+            # neighbour is returned along with the distance to it.
+            distances, node_indices = tree.query(
+                [site_coords], workers=self.max_workers
+            )
+            # Look up the grid coordinates that correspond to the tree node
+            (land_neighbour_indices,) = index_nodes[node_indices]
+            # Use the found land neighbour if it is within the
+            # search_radius, otherwise use the nearest neighbour.
+            distances = np.array([distances[0], distances[0]]).T
+            return np.where(
+                distances < self.search_radius,
+                land_neighbour_indices,
+                nearest_indices,
+            )
+
+        # Query the tree for self.node_limit nearby neighbours.
+        distances, node_indices = tree.query(
+            [site_coords],
+            distance_upper_bound=self.search_radius,
+            k=self.node_limit,
+            workers=self.max_workers,
+        )
+        # Loop over the sites and for each choose the returned
+        # neighbour with the minimum vertical displacement.
+        nearest_indices = nearest_indices.copy()
+        for index, (distance, indices) in enumerate(zip(distances[0], node_indices[0])):
+            grid_point = self.select_minimum_dz(
+                orography, site_altitudes[index], index_nodes, distance, indices
+            )
+            # None is returned if the tree query returned no neighbours
+            # within the search radius.
+            if grid_point is not None:
+                nearest_indices[index] = grid_point
+        return nearest_indices
+
+    def _neighbour_search_hash(self, orography: Cube, land_mask: Cube) -> str:
+        """
+        Generate a hash of the inputs and options that determine the
+        neighbours found by a constrained search, other than the sites and
+        the neighbour finding method. This is recorded on the neighbour cube,
+        so that a previous neighbour cube is only reused for the same inputs
+        and options.
+
+        Args:
+            orography:
+                A cube of orography, with x-y coordinate order.
+            land_mask:
+                A land mask cube, with x-y coordinate order.
+
+        Returns:
+            A hash of the orography and land mask data, the search_radius and
+            the node_limit.
+        """
+        data_hash = hashlib.sha256()
+        for cube in (orography, land_mask):
+            data = np.ascontiguousarray(np.ma.getdata(cube.data))
+            data_hash.update("{}:{}:".format(data.dtype, data.shape).encode())
+            data_hash.update(data.tobytes())
+        return hashlib.sha256(
+            "{}:{}:{}".format(
+                data_hash.hexdigest(), self.search_radius, self.node_limit
+            ).encode()
+        ).hexdigest()
+
+    def previous_neighbour_indices(
+        self,
+        previous_neighbours: Cube,
+        orography: Cube,
+        land_mask: Cube,
+        method_name: str,
+        site_keys: List[Tuple],
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Find the grid point neighbours of sites that are unchanged from a
+        previously generated neighbour cube, so that these need not be found
+        again.
+
+        Args:
+            previous_neighbours:
+                A neighbour cube previously generated by this plugin, with
+                the same options, orography and land mask.
+            orography:
+                A cube of orography, used to check that the previous neighbour
+                cube is for the same grid and orography.
+            land_mask:
+                A land mask cube, used to check that the previous neighbour
+                cube is for the same land mask.
+            method_name:
+                Name of the neighbour finding method.
+            site_keys:
+                For each site, a tuple of its altitude, latitude, longitude,
+                WMO ID and, if in use, unique site ID, as recorded on the
+                neighbour cube.
+
+        Returns:
+            - Boolean array which is True for the sites found on the previous
+              neighbour cube.
+            - Array of shape (n_sites, 2) giving the x and y indices of the
+              neighbours of those sites.
+
+        Raises:
+            ValueError: If the previous neighbour cube is not for the grid of
+                the orography, was not created with the same orography, land
+                mask, search_radius and node_limit, or does not contain the
+                neighbour finding method.
+        """
+        if previous_neighbours.attributes.get(
+            "model_grid_hash"
+        ) != create_coordinate_hash(orography):
+            raise ValueError(
+                "The previous neighbour cube was not created for the grid of "
+                "the orography."
+            )
+        if previous_neighbours.attributes.get(
+            "neighbour_search_hash"
+        ) != self._neighbour_search_hash(orography, land_mask):
+            raise ValueError(
+                "The previous neighbour cube was not created with the same "
+                "orography, land mask, search_radius and node_limit."
+            )
+        previous = previous_neighbours.extract(
+            iris.Constraint(neighbour_selection_method_name=method_name)
+        )
+        if previous is None:
+            raise ValueError(
+                'The previous neighbour cube does not contain the "{}" '
+                "neighbour finding method.".format(method_name)
+            )
+
+        coord_names = ["altitude", "latitude", "longitude", "wmo_id"]
+        if self.unique_site_id_key:
+            coord_names.append(self.unique_site_id_key)
+        previous_keys = zip(
+            *[previous.coord(name).points.tolist() for name in coord_names]
+        )
+        previous_indices = np.rint(
+            [
+                previous.extract(iris.Constraint(grid_attributes_key=key)).data
+                for key in ("x_index", "y_index")
+            ]
+        ).astype(np.int32)
+        lookup = {key: index for index, key in enumerate(previous_keys)}
+
+        reused = np.zeros(len(site_keys), dtype=bool)
+        indices = np.zeros((len(site_keys), 2), dtype=np.int32)
+        for index, key in enumerate(site_keys):
+            previous_index = lookup.get(key)
+            if previous_index is not None:
+                reused[index] = True
+                indices[index] = previous_indices[:, previous_index]
+        return reused, indices
+
     def process(
-        self, sites: List[Dict[str, Any]], orography: Cube, land_mask: Cube
+        self,
+        sites: List[Dict[str, Any]],
+        orography: Cube,
+        land_mask: Cube,
+        previous_neighbours: Optional[Cube] = None,
     ) -> Cube:
         """
         Using the constraints provided, find the nearest grid point neighbours
@@ -429,6 +703,13 @@ class NeighbourSelection(BasePlugin):
         spot sites (e.g. x coordinate, y coordinate, altitude) and the indices
         of the selected grid point neighbour.
 
+        If a previous neighbour cube is provided, the neighbours of sites
+        that are unchanged from that cube are taken from it, and only added
+        or moved sites are searched for. The result is identical to finding
+        the neighbours of every site. An error is raised if the previous
+        neighbour cube was not generated with the same grid, orography, land
+        mask, search_radius and node_limit.
+
         Args:
             sites:
                 A list of dictionaries defining the spot sites for which
@@ -443,6 +724,10 @@ class NeighbourSelection(BasePlugin):
                 A land mask cube for the model/grid from which grid point
                 neighbours are being selected, with land points set to one and
                 sea points set to zero.
+            previous_neighbours:
+                Optional neighbour cube previously generated with the same
+                options, orography and land mask, which may include other
+                neighbour finding methods.
 
         Returns:
             A cube containing both the spot site information and for each
@@ -455,6 +740,8 @@ class NeighbourSelection(BasePlugin):
             ValueError: If a unique_site_id is in use but the unique_site_id is
                         not unique for every site.
             ValueError: If any unique IDs are longer than 8 digits.
+            ValueError: If the previous neighbour cube does not match the
+                        inputs and options.
         """
         # Check if we are dealing with a global grid.
         self.global_coordinate_system = orography.coord(axis="x").circular
@@ -512,59 +799,6 @@ class NeighbourSelection(BasePlugin):
             site_altitudes,
         )
 
-        # If further constraints are being applied, build a KD Tree which
-        # includes points filtered by constraint.
-        if self.land_constraint or self.minimum_dz:
-            # Build the KDTree, an internal test for the land_constraint checks
-            # whether to exclude sea points from the tree.
-            tree, index_nodes = self.build_KDTree(land_mask)
-
-            # Site coordinates made cartesian for global coordinate system
-            if self.global_coordinate_system:
-                site_coords = self.geocentric_cartesian(
-                    orography, site_coords[:, 0], site_coords[:, 1]
-                )
-
-            if not self.minimum_dz:
-                # Query the tree for the nearest neighbour, in this case a land
-                # neighbour is returned along with the distance to it.
-                distances, node_indices = tree.query([site_coords])
-                # Look up the grid coordinates that correspond to the tree node
-                (land_neighbour_indices,) = index_nodes[node_indices]
-                # Use the found land neighbour if it is within the
-                # search_radius, otherwise use the nearest neighbour.
-                distances = np.array([distances[0], distances[0]]).T
-                nearest_indices = np.where(
-                    distances < self.search_radius,
-                    land_neighbour_indices,
-                    nearest_indices,
-                )
-            else:
-                # Query the tree for self.node_limit nearby neighbours.
-                distances, node_indices = tree.query(
-                    [site_coords],
-                    distance_upper_bound=self.search_radius,
-                    k=self.node_limit,
-                )
-                # Loop over the sites and for each choose the returned
-                # neighbour with the minimum vertical displacement.
-                for index, (distance, indices) in enumerate(
-                    zip(distances[0], node_indices[0])
-                ):
-                    grid_point = self.select_minimum_dz(
-                        orography, site_altitudes[index], index_nodes, distance, indices
-                    )
-                    # None is returned if the tree query returned no neighbours
-                    # within the search radius.
-                    if grid_point is not None:
-                        nearest_indices[index] = grid_point
-
-        # Calculate the vertical displacements between the chosen grid point
-        # and the spot site.
-        vertical_displacements = (
-            site_altitudes - orography.data[tuple(nearest_indices.T)]
-        )
-
         # Create a list of WMO IDs if available. These are stored as strings
         # to accommodate the use of 'None' for unset IDs.
         wmo_ids = []
@@ -604,13 +838,6 @@ class NeighbourSelection(BasePlugin):
             self.land_constraint, self.minimum_dz
         )
 
-        # Create an array of indices and displacements to return
-        data = np.stack(
-            (nearest_indices[:, 0], nearest_indices[:, 1], vertical_displacements),
-            axis=0,
-        )
-        data = np.expand_dims(data, 0).astype(np.float32)
-
         # Regardless of input sitelist coordinate system, the site coordinates
         # are stored as latitudes and longitudes in the neighbour cube.
         if self.site_coordinate_system != ccrs.PlateCarree():
@@ -623,6 +850,50 @@ class NeighbourSelection(BasePlugin):
             longitudes = site_x_coords
             latitudes = site_y_coords
 
+        # If further constraints are being applied, build a KD Tree which
+        # includes points filtered by constraint.
+        if self.land_constraint or self.minimum_dz:
+            # Take the neighbours of sites which are unchanged from the
+            # previous neighbour cube, and only search for the others.
+            search = np.ones(len(sites), dtype=bool)
+            if previous_neighbours is not None and len(sites) > 0:
+                site_keys = list(
+                    zip(
+                        site_altitudes.astype(np.float32).tolist(),
+                        latitudes.astype(np.float32).tolist(),
+                        longitudes.astype(np.float32).tolist(),
+                        wmo_ids,
+                        *([unique_site_id] if unique_site_id else []),
+                    )
+                )
+                reused, previous_indices = self.previous_neighbour_indices(
+                    previous_neighbours, orography, land_mask, method_name, site_keys
+                )
+                nearest_indices[reused] = previous_indices[reused]
+                search = ~reused
+
+            if search.any():
+                nearest_indices[search] = self.search_constrained_neighbours(
+                    land_mask,
+                    orography,
+                    site_coords[search],
+                    site_altitudes[search],
+                    nearest_indices[search],
+                )
+
+        # Calculate the vertical displacements between the chosen grid point
+        # and the spot site.
+        vertical_displacements = (
+            site_altitudes - orography.data[tuple(nearest_indices.T)]
+        )
+
+        # Create an array of indices and displacements to return
+        data = np.stack(
+            (nearest_indices[:, 0], nearest_indices[:, 1], vertical_displacements),
+            axis=0,
+        )
+        data = np.expand_dims(data, 0).astype(np.float32)
+
         # Create a cube of neighbours
         neighbour_cube = build_spotdata_cube(
             data,
@@ -642,5 +913,9 @@ class NeighbourSelection(BasePlugin):
         # cube is only used with a compatible grid.
         grid_hash = create_coordinate_hash(orography)
         neighbour_cube.attributes["model_grid_hash"] = grid_hash
+        # Add a hash of the inputs and options that determine the neighbours,
+        # to ensure the neighbour cube is only reused with the same ones.
+        search_hash = self._neighbour_search_hash(orography, land_mask)
+        neighbour_cube.attributes["neighbour_search_hash"] = search_hash
 
         return neighbour_cube
@@ -7,10 +7,12 @@
 
 from typing import List, Optional, Tuple, Union
 
+import dask.array as da
 import iris
 import numpy as np
+from dask.array import Array
 from iris.coords import AuxCoord, DimCoord
-from iris.cube import Cube
+from iris.cube import Cube, CubeList
 from numpy import ndarray
 
 from improver import BasePlugin
@@ -245,26 +247,55 @@ class SpotExtraction(BasePlugin):
         )
         return spot_diagnostic_cube
 
-    def process(
+    @staticmethod
+    def extract_spot_values(
+        data: Union[ndarray, Array], x_indices: ndarray, y_indices: ndarray
+    ) -> Union[ndarray, Array]:
+        """
+        Extract the values at the given grid points from the trailing y and x
+        dimensions of an array of diagnostic data.  Lazy data is left lazy, and
+        indexed such that only the chunks containing the grid points are read
+        when the result is computed.
+
+        Args:
+            data:
+                Array of diagnostic data, with y and x as the trailing
+                dimensions.
+            x_indices, y_indices:
+                The array indices that correspond to sites for which data is
+                to be extracted.
+
+        Returns:
+            Array of the extracted values, with the sites as the trailing
+            dimension.
+        """
+        if isinstance(data, Array):
+            leading_dims = (slice(None),) * (data.ndim - 2)
+            spot_values = data.vindex[leading_dims + (y_indices, x_indices)]
+            # vindex places the sites first, whereas numpy keeps them in place
+            return da.moveaxis(spot_values, 0, -1)
+        return data[..., y_indices, x_indices]
+
+    def extract_cubes(
         self,
         neighbour_cube: Cube,
-        diagnostic_cube: Cube,
+        diagnostic_cubes: Union[List[Cube], CubeList],
         new_title: Optional[str] = None,
-    ) -> Cube:
+    ) -> CubeList:
         """
-        Create a spot data cube containing diagnostic data extracted at the
-        coordinates provided by the neighbour cube.
-
-        .. See the documentation for more details about the inputs and output.
-        .. include:: /extended_documentation/spotdata/spot_extraction/
-           spot_extraction_examples.rst
+        Create spot data cubes containing diagnostic data extracted from each
+        of several diagnostic cubes at the coordinates provided by the
+        neighbour cube.  The grid coordinates are extracted from the neighbour
+        cube once, and the spot values of all the diagnostic cubes are
+        computed together, so that lazy cubes are read concurrently and only
+        the chunks containing neighbour grid points are read.
 
         Args:
             neighbour_cube:
                 A cube containing information about the spot data sites and
                 their grid point neighbours.
-            diagnostic_cube:
-                A cube of diagnostic data from which spot data is being taken.
+            diagnostic_cubes:
+                Cubes of diagnostic data from which spot data is being taken.
             new_title:
                 New title for spot-extracted data.  If None, this attribute is
                 reset to a default value, since it has no prescribed standard
@@ -272,11 +303,12 @@ class SpotExtraction(BasePlugin):
                 correct after spot-extraction.
 
         Returns:
-            A cube containing diagnostic data for each spot site, as well
-            as information about the sites themselves.
+            Cubes containing diagnostic data for each spot site, as well
+            as information about the sites themselves, in the order of the
+            diagnostic cubes.
         """
-        # Check we are using a matched neighbour/diagnostic cube pair
-        check_grid_match([neighbour_cube, diagnostic_cube])
+        # Check we are using matched neighbour/diagnostic cubes
+        check_grid_match([neighbour_cube, *diagnostic_cubes])
 
         # Get the unique_site_id if it is present on the neighbour cbue
         unique_site_id_data = self.check_for_unique_id(neighbour_cube)
@@ -286,58 +318,108 @@ class SpotExtraction(BasePlugin):
         else:
             unique_site_id, unique_site_id_key = None, None
 
-        # Ensure diagnostic cube is y-x order as neighbour cube expects.
-        enforce_coordinate_ordering(
-            diagnostic_cube,
-            [
-                diagnostic_cube.coord(axis="y").name(),
-                diagnostic_cube.coord(axis="x").name(),
-            ],
-            anchor_start=False,
-        )
+        # Ensure diagnostic cubes are y-x order as neighbour cube expects.
+        for diagnostic_cube in diagnostic_cubes:
+            enforce_coordinate_ordering(
+                diagnostic_cube,
+                [
+                    diagnostic_cube.coord(axis="y").name(),
+                    diagnostic_cube.coord(axis="x").name(),
+                ],
+                anchor_start=False,
+            )
 
         coordinate_cube = self.extract_coordinates(neighbour_cube)
         x_indices, y_indices = coordinate_cube.data
-        spot_values = diagnostic_cube.data[..., y_indices, x_indices]
-
-        additional_dims = []
-        if len(spot_values.shape) > 1:
-            additional_dims = diagnostic_cube.dim_coords[:-2]
-        scalar_coords, nonscalar_coords = self.get_aux_coords(
-            diagnostic_cube, x_indices, y_indices
+        all_spot_values = da.compute(
+            *[
+                self.extract_spot_values(
+                    diagnostic_cube.core_data(), x_indices, y_indices
+                )
+                for diagnostic_cube in diagnostic_cubes
+            ]
         )
 
-        spotdata_cube = self.build_diagnostic_cube(
-            neighbour_cube,
-            diagnostic_cube,
-            spot_values,
-            scalar_coords=scalar_coords,
-            auxiliary_coords=nonscalar_coords,
-            additional_dims=additional_dims,
-            unique_site_id=unique_site_id,
-            unique_site_id_key=unique_site_id_key,
-        )
+        spotdata_cubes = CubeList()
+        for diagnostic_cube, spot_values in zip(diagnostic_cubes, all_spot_values):
+            additional_dims = []
+            if len(spot_values.shape) > 1:
+                additional_dims = diagnostic_cube.dim_coords[:-2]
+            scalar_coords, nonscalar_coords = self.get_aux_coords(
+                diagnostic_cube, x_indices, y_indices
+            )
 
-        # Copy attributes from the diagnostic cube that describe the data's
-        # provenance
-        spotdata_cube.attributes = diagnostic_cube.attributes
-        spotdata_cube.attributes["model_grid_hash"] = neighbour_cube.attributes[
-            "model_grid_hash"
-        ]
-
-        # Remove the unique_site_id coordinate attribute as it is internal
-        # metadata only
-        if unique_site_id is not None:
-            spotdata_cube.coord(unique_site_id_key).attributes.pop(UNIQUE_ID_ATTRIBUTE)
-
-        # Remove grid attributes and update title
-        for attr in MOSG_GRID_ATTRIBUTES:
-            spotdata_cube.attributes.pop(attr, None)
-        spotdata_cube.attributes["title"] = (
-            MANDATORY_ATTRIBUTE_DEFAULTS["title"] if new_title is None else new_title
-        )
+            spotdata_cube = self.build_diagnostic_cube(
+                neighbour_cube,
+                diagnostic_cube,
+                spot_values,
+                scalar_coords=scalar_coords,
+                auxiliary_coords=nonscalar_coords,
+                additional_dims=additional_dims,
+                unique_site_id=unique_site_id,
+                unique_site_id_key=unique_site_id_key,
+            )
 
-        # Copy cell methods
-        spotdata_cube.cell_methods = diagnostic_cube.cell_methods
+            # Copy attributes from the diagnostic cube that describe the data's
+            # provenance
+            spotdata_cube.attributes = diagnostic_cube.attributes
+            spotdata_cube.attributes["model_grid_hash"] = neighbour_cube.attributes[
+                "model_grid_hash"
+            ]
 
+            # Remove the unique_site_id coordinate attribute as it is internal
+            # metadata only
+            if unique_site_id is not None:
+                spotdata_cube.coord(unique_site_id_key).attributes.pop(
+                    UNIQUE_ID_ATTRIBUTE
+                )
+
+            # Remove grid attributes and update title
+            for attr in MOSG_GRID_ATTRIBUTES:
+                spotdata_cube.attributes.pop(attr, None)
+            spotdata_cube.attributes["title"] = (
+                MANDATORY_ATTRIBUTE_DEFAULTS["title"]
+                if new_title is None
+                else new_title
+            )
+
+            # Copy cell methods
+            spotdata_cube.cell_methods = diagnostic_cube.cell_methods
+
+            spotdata_cubes.append(spotdata_cube)
+        return spotdata_cubes
+
+    def process(
+        self,
+        neighbour_cube: Cube,
+        diagnostic_cube: Cube,
+        new_title: Optional[str] = None,
+    ) -> Cube:
+        """
+        Create a spot data cube containing diagnostic data extracted at the
+        coordinates provided by the neighbour cube.
+
+        .. See the documentation for more details about the inputs and output.
+        .. include:: /extended_documentation/spotdata/spot_extraction/
+           spot_extraction_examples.rst
+
+        Args:
+            neighbour_cube:
+                A cube containing information about the spot data sites and
+                their grid point neighbours.
+            diagnostic_cube:
+                A cube of diagnostic data from which spot data is being taken.
+            new_title:
+                New title for spot-extracted data.  If None, this attribute is
+                reset to a default value, since it has no prescribed standard
+                and may therefore contain grid information that is no longer
+                correct after spot-extraction.
+
+        Returns:
+            A cube containing diagnostic data for each spot site, as well
+            as information about the sites themselves.
+        """
+        (spotdata_cube,) = self.extract_cubes(
+            neighbour_cube, [diagnostic_cube], new_title=new_title
+        )
         return spotdata_cube
@@ -473,23 +473,30 @@ class Threshold(PostProcessingPlugin):
     def _vicinity_processing(
         self,
         thresholded_cube: Cube,
-        truth_value: np.ndarray,
+        truth_values: np.ndarray,
         unmasked: np.ndarray,
         landmask: np.ndarray,
         grid_point_radii: List[int],
-        index: int,
     ):
         """
         Apply max in vicinity processing to the thresholded values. The
         resulting modified threshold values are changed in place in
         thresholded_cube.
 
+        The maximum is evaluated for all thresholds, and any other leading
+        dimensions, in a single call for each vicinity radius. Where no
+        points are excluded from the vicinity by masking or a landmask, each
+        radius is calculated from the result of the next smaller radius, as
+        the maximum within a square vicinity of radius r1 + r2 is the maximum
+        within radius r2 of the maxima within radius r1.
+
         Args:
             thresholded_cube:
                 The cube into which the resulting values are added.
-            truth_value:
+            truth_values:
                 An array of thresholded values prior to the application of
-                vicinity processing.
+                vicinity processing, with a leading dimension corresponding to
+                the threshold coordinate.
             unmasked:
                 Array identifying unmasked data points that should be updated.
             landmask:
@@ -499,23 +506,20 @@ class Threshold(PostProcessingPlugin):
             grid_point_radii:
                 The vicinity radius to apply expressed as a number of grid
                 cells.
-            index:
-                Index corresponding to the threshold coordinate to identify
-                which array we are summing the contribution into.
         """
-        for ivic, vicinity in enumerate(grid_point_radii):
-            if truth_value.ndim > 2:
-                maxes = np.zeros(truth_value.shape, dtype=FLOAT_DTYPE)
-                for yxindex in np.ndindex(*truth_value.shape[:-2]):
-                    slice_max = maximum_within_vicinity(
-                        truth_value[yxindex + (slice(None), slice(None))],
-                        vicinity,
-                        landmask,
-                    )
-                    maxes[yxindex] = slice_max
+        incremental = landmask is None and not np.ma.is_masked(truth_values)
+        maxes = truth_values
+        previous_radius = 0
+        # The vicinity dimension of the thresholded cube is sorted into
+        # ascending order when it is created, so the radii are processed in
+        # the same order.
+        for ivic, vicinity in enumerate(sorted(grid_point_radii)):
+            if incremental:
+                maxes = maximum_within_vicinity(maxes, vicinity - previous_radius)
+                previous_radius = vicinity
             else:
-                maxes = maximum_within_vicinity(truth_value, vicinity, landmask)
-            thresholded_cube.data[ivic][index][unmasked] += maxes[unmasked]
+                maxes = maximum_within_vicinity(truth_values, vicinity, landmask)
+            thresholded_cube.data[ivic][:, unmasked] += maxes[:, unmasked]
 
     def _create_threshold_cube(self, cube: Cube) -> Cube:
         """
@@ -678,21 +682,26 @@ class Threshold(PostProcessingPlugin):
             # points.
             contribution_total += unmasked
 
+            if self.vicinity is not None:
+                truth_values = [
+                    self._calculate_truth_value(cube, threshold, bounds)
+                    for threshold, bounds in zip(self.thresholds, self.fuzzy_bounds)
+                ]
+                stack = np.ma.stack if np.ma.is_masked(cube.data) else np.stack
+                self._vicinity_processing(
+                    thresholded_cube,
+                    stack(truth_values),
+                    unmasked,
+                    landmask,
+                    grid_point_radii,
+                )
+                continue
+
             for index, (threshold, bounds) in enumerate(
                 zip(self.thresholds, self.fuzzy_bounds)
             ):
                 truth_value = self._calculate_truth_value(cube, threshold, bounds)
-                if self.vicinity is not None:
-                    self._vicinity_processing(
-                        thresholded_cube,
-                        truth_value,
-                        unmasked,
-                        landmask,
-                        grid_point_radii,
-                        index,
-                    )
-                else:
-                    thresholded_cube.data[index][unmasked] += truth_value[unmasked]
+                thresholded_cube.data[index][unmasked] += truth_value[unmasked]
 
         # Any x-y position for which there are no valid contributions must be
         # a masked point in every realization, so we can use this array to
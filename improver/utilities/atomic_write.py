@@ -0,0 +1,57 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Provides a context manager for writing files atomically, so that processes
+reading them never see a partially written file."""
+
+import contextlib
+import os
+import tempfile
+from typing import IO, Iterator
+
+
+def _default_file_mode() -> int:
+    """Return the permissions given to a new file by open, which are read and
+    write for all users restricted by the umask of the process."""
+    # the umask can only be read by setting it
+    umask = os.umask(0o077)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = "w", suffix: str = ".tmp") -> Iterator[IO]:
+    """
+    Open a temporary file for writing, which replaces the file at the given
+    path once it has been written.  The temporary file is created in the same
+    directory as the path, so that it can be renamed over it, and is given
+    the permissions of a file created by open, as temporary files are
+    otherwise only accessible to their owner.  If writing fails, the
+    temporary file is removed and the path is left unchanged.
+
+    Args:
+        path:
+            Path of the file to write.
+        mode:
+            Mode in which to open the file, "w" to write text or "wb" to
+            write bytes.
+        suffix:
+            Suffix of the temporary file name.
+
+    Yields:
+        The temporary file, open for writing.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    temporary_file = tempfile.NamedTemporaryFile(
+        mode, dir=directory, suffix=suffix, delete=False
+    )
+    try:
+        with temporary_file:
+            yield temporary_file
+        os.chmod(temporary_file.name, _default_file_mode())
+        os.replace(temporary_file.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temporary_file.name)
+        raise
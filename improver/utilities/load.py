@@ -4,23 +4,285 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module for loading cubes."""
 
+import contextlib
+import hashlib
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import List, Optional, Union
 
 import iris
+import joblib
+import netCDF4
 from iris import Constraint
 from iris.cube import Cube, CubeList
+from iris.fileformats.netcdf.loader import CHUNK_CONTROL
 
+import improver
 from improver.utilities.cube_manipulation import (
     MergeCubes,
     enforce_coordinate_ordering,
     strip_var_names,
 )
 
+#: Environment variable giving the default maximum number of files to load
+#: concurrently
+LOAD_MAX_WORKERS = "IMPROVER_LOAD_MAX_WORKERS"
+
+#: Environment variable naming the default directory in which to cache the
+#: metadata parsed from loaded files
+LOAD_CACHE_DIR = "IMPROVER_LOAD_CACHE_DIR"
+
+
+def _forkserver_context() -> multiprocessing.context.BaseContext:
+    """Return a multiprocessing context in which worker processes are forked
+    from a server process that has already imported this module. Forking
+    directly from the calling process is unsafe if other threads (e.g. dask
+    workers) hold netCDF or HDF5 library locks."""
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _cache_path(
+    filepath: str, cache_dir: Union[str, Path], file_chunks: bool = False
+) -> Path:
+    """Construct the metadata cache file path for a file, keyed by its real
+    path, modification time and size so that a replaced file is re-parsed,
+    by the chunking of the lazy data, and by the iris and IMPROVER versions
+    so that cubes pickled by other versions are not used.
+
+    Args:
+        filepath:
+            Path of the file to be loaded.
+        cache_dir:
+            Directory containing the metadata cache.
+        file_chunks:
+            Whether the lazy data is chunked along the spatial dimensions as
+            in the file.
+
+    Returns:
+        Path of the cache file.
+    """
+    file_stat = os.stat(filepath)
+    key = f"{os.path.realpath(filepath)}:{file_stat.st_mtime_ns}:{file_stat.st_size}"
+    if file_chunks:
+        key += ":file_chunks"
+    improver_version = getattr(improver, "__version__", "unknown")
+    key += f":iris-{iris.__version__}:improver-{improver_version}"
+    return Path(cache_dir) / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+
+def _is_private(path: Union[str, Path]) -> bool:
+    """Check whether a path is owned by the current user and is not writable
+    by the group or others, such that no other user can have written it.
+
+    Args:
+        path:
+            Path of the file or directory to be checked.
+
+    Returns:
+        True if the path exists, is owned by the current user and is not
+        writable by the group or others.
+    """
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return False
+    return path_stat.st_uid == os.getuid() and not path_stat.st_mode & 0o022
+
+
+def _load_with_file_chunks(
+    filepath: str, constraints: Optional[Constraint] = None
+) -> CubeList:
+    """Load cubes from a filepath with lazy data chunked along the trailing
+    (spatial) dimensions as the variables are chunked in the file, so that
+    computing a subset of the data reads only the file chunks containing it.
+    The chunks along leading dimensions are left to be set as usual, so that
+    each lazy chunk still spans many file chunks and the file is not opened
+    once per file chunk.
+
+    Args:
+        filepath:
+            Filepath that will be loaded.
+        constraints:
+            Constraint to be applied to the loaded cubes.
+
+    Returns:
+        CubeList loaded from the filepath.
+    """
+    dimension_chunks = {}
+    if os.path.isfile(filepath):
+        with netCDF4.Dataset(filepath) as dataset:
+            for variable in dataset.variables.values():
+                chunking = variable.chunking()
+                if variable.ndim >= 2 and chunking not in ("contiguous", None):
+                    dimension_chunks.update(
+                        zip(variable.dimensions[-2:], chunking[-2:])
+                    )
+    with CHUNK_CONTROL.set(**dimension_chunks):
+        return iris.load(filepath, constraints=constraints)
+
+
+def _load_file(
+    filepath: str,
+    constraints: Optional[Constraint],
+    cache_dir: Optional[Union[str, Path]] = None,
+    file_chunks: bool = False,
+) -> CubeList:
+    """Load cubes from a single filepath, using an on-disk metadata cache if
+    requested.
+
+    The cache holds the deferred (lazy) cubes from parsing the whole file, so
+    a cached load skips parsing the file metadata; data are still read from
+    the original file. The constraints are applied after retrieval from the
+    cache. Filepaths that are not a single existing file (e.g. wildcards) are
+    not cached.
+
+    Cache files are unpickled, so could run arbitrary code if written by
+    another user. The cache directory is therefore created readable only by
+    the current user, and is not used if it is owned by another user or is
+    writable by the group or others. Cache files that are owned by another
+    user or writable by others are regenerated.
+
+    Args:
+        filepath:
+            Filepath that will be loaded.
+        constraints:
+            Constraint to be applied to the loaded cubes.
+        cache_dir:
+            Directory in which to cache the loaded metadata.
+        file_chunks:
+            If True, lazy data is chunked along the spatial dimensions as
+            the variables are chunked in the file.
+
+    Returns:
+        CubeList loaded from the filepath.
+    """
+    load = _load_with_file_chunks if file_chunks else iris.load
+    if cache_dir is None or not os.path.isfile(filepath):
+        return load(filepath, constraints=constraints)
+
+    cache_path = _cache_path(filepath, cache_dir, file_chunks)
+    cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _is_private(cache_path.parent):
+        warnings.warn(
+            f"The metadata cache directory {cache_path.parent} is not used, as "
+            "it is owned by another user or is writable by others."
+        )
+        return load(filepath, constraints=constraints)
+
+    cubes = None
+    if _is_private(cache_path):
+        # partially written, corrupt or incompatible cache files are
+        # regenerated
+        with contextlib.suppress(Exception):
+            cubes = joblib.load(cache_path)
+    if cubes is None:
+        cubes = load(filepath)
+        # write atomically so that concurrent loads do not read a partial file
+        with NamedTemporaryFile(dir=cache_path.parent, delete=False) as tmp_file:
+            joblib.dump(cubes, tmp_file)
+        os.replace(tmp_file.name, cache_path)
+    return cubes.extract(constraints)
+
+
+def _load_files(
+    filepaths: List[str],
+    constraints: Optional[Union[Constraint, str]],
+    max_workers: Optional[int],
+    cache_dir: Optional[Union[str, Path]],
+    file_chunks: bool,
+) -> List[CubeList]:
+    """Load cubes from each of a list of filepaths, concurrently if requested.
+    Strips off all var names except for "threshold"-type coordinates, and
+    orders the coordinates of the loaded cubes.
+
+    Args:
+        filepaths:
+            Filepaths that will be loaded.
+        constraints:
+            Constraint to be applied when loading from each filepath.
+        max_workers:
+            Maximum number of files to load concurrently, using a pool of
+            processes. If None, taken from the IMPROVER_LOAD_MAX_WORKERS
+            environment variable, or 1 if this is not set.
+        cache_dir:
+            Directory in which to cache the metadata parsed from each file.
+            If None, taken from the IMPROVER_LOAD_CACHE_DIR environment
+            variable, or not cached if this is not set.
+        file_chunks:
+            If True, lazy data is chunked along the spatial dimensions as
+            the variables are chunked in the file.
+
+    Returns:
+        CubeList loaded from each filepath given the constraints provided.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get(LOAD_MAX_WORKERS) or 1)
+    if cache_dir is None:
+        cache_dir = os.environ.get(LOAD_CACHE_DIR) or None
+
+    # Remove legacy metadata prefix cube if present
+    constraints = (
+        iris.Constraint(cube_func=lambda cube: cube.long_name != "prefixes")
+        & constraints
+    )
+
+    if max_workers > 1 and len(filepaths) > 1:
+        # The netCDF and HDF5 libraries are not thread safe, so files are
+        # parsed in separate processes. Constraints may not be picklable, so
+        # are applied to the (lazy) cubes returned from each process.
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=_forkserver_context()
+        ) as executor:
+            loaded = [
+                cubes.extract(constraints)
+                for cubes in executor.map(
+                    _load_file,
+                    filepaths,
+                    repeat(None),
+                    repeat(cache_dir),
+                    repeat(file_chunks),
+                )
+            ]
+    else:
+        loaded = [
+            _load_file(item, constraints, cache_dir, file_chunks) for item in filepaths
+        ]
+
+    for cubes in loaded:
+        # Remove var_name from cubes and coordinates (except where needed to
+        # describe probabilistic data)
+        strip_var_names(cubes)
+
+        for cube in cubes:
+            # Remove metadata attributes pointing to legacy prefix cube
+            cube.attributes.pop("bald__isPrefixedBy", None)
+
+            # Ensure the probabilistic coordinates are the first coordinates
+            # within a cube and are in the specified order.
+            enforce_coordinate_ordering(
+                cube, ["realization", "percentile", "threshold"]
+            )
+            # Ensure the y and x dimensions are the last within the cube.
+            y_name = cube.coord(axis="y").name()
+            x_name = cube.coord(axis="x").name()
+            enforce_coordinate_ordering(cube, [y_name, x_name], anchor_start=False)
+    return loaded
+
 
 def load_cubelist(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    file_chunks: bool = False,
 ) -> CubeList:
     """Load cubes from filepath(s) into a cubelist. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -38,47 +300,46 @@ def load_cubelist(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        max_workers:
+            Maximum number of files to load concurrently, using a pool of
+            processes. If None, taken from the IMPROVER_LOAD_MAX_WORKERS
+            environment variable, or 1 (loading the files serially) if this
+            is not set.
+        cache_dir:
+            If provided, the metadata parsed from each file is cached in this
+            directory, keyed by file path, modification time and size, so
+            that subsequent loads of the same file skip parsing it. If None,
+            taken from the IMPROVER_LOAD_CACHE_DIR environment variable, or
+            not cached if this is not set. Cache files are unpickled, so the
+            directory must be private to the current user; it is not used if
+            it is owned by another user or is writable by others.
+        file_chunks:
+            If True, lazy data is chunked along the spatial dimensions as
+            the variables are chunked in the file, rather than in larger
+            chunks, so that extracting a small subset of the data (such as
+            spot sites) reads only the file chunks containing it.
 
     Returns:
         CubeList that has been created from the input filepath given the
         constraints provided.
     """
-    # Remove legacy metadata prefix cube if present
-    constraints = (
-        iris.Constraint(cube_func=lambda cube: cube.long_name != "prefixes")
-        & constraints
-    )
-
     # Load each file individually to avoid partial merging (not used
     # iris.load_raw() due to issues with time representation)
     if isinstance(filepath, str):
-        cubes = iris.load(filepath, constraints=constraints)
-    else:
-        cubes = iris.cube.CubeList([])
-        for item in filepath:
-            cubes.extend(iris.load(item, constraints=constraints))
+        filepath = [filepath]
+    cubes = iris.cube.CubeList([])
+    for loaded in _load_files(
+        filepath, constraints, max_workers, cache_dir, file_chunks
+    ):
+        cubes.extend(loaded)
 
     if not cubes:
         message = "No cubes found using constraints {}".format(constraints)
         raise ValueError(message)
 
-    # Remove var_name from cubes and coordinates (except where needed to
-    # describe probabilistic data)
-    cubes = strip_var_names(cubes)
-
-    for cube in cubes:
-        # Remove metadata attributes pointing to legacy prefix cube
-        cube.attributes.pop("bald__isPrefixedBy", None)
-
-        # Ensure the probabilistic coordinates are the first coordinates within
-        # a cube and are in the specified order.
-        enforce_coordinate_ordering(cube, ["realization", "percentile", "threshold"])
-        # Ensure the y and x dimensions are the last within the cube.
-        y_name = cube.coord(axis="y").name()
-        x_name = cube.coord(axis="x").name()
-        enforce_coordinate_ordering(cube, [y_name, x_name], anchor_start=False)
-        if no_lazy_load:
-            # Force cube's data into memory by touching the .data attribute.
+    if no_lazy_load:
+        # Force cube's data into memory by touching the .data attribute.
+        for cube in cubes:
             cube.data
 
     return cubes
@@ -88,6 +349,9 @@ def load_cube(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    file_chunks: bool = False,
 ) -> Cube:
     """Load the filepath provided using Iris into a cube. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -106,15 +370,90 @@ def load_cube(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        max_workers:
+            Maximum number of files to load concurrently, using a pool of
+            processes. If None, taken from the IMPROVER_LOAD_MAX_WORKERS
+            environment variable, or 1 (loading the files serially) if this
+            is not set.
+        cache_dir:
+            If provided, the metadata parsed from each file is cached in this
+            directory, keyed by file path, modification time and size, so
+            that subsequent loads of the same file skip parsing it. If None,
+            taken from the IMPROVER_LOAD_CACHE_DIR environment variable, or
+            not cached if this is not set. Cache files are unpickled, so the
+            directory must be private to the current user; it is not used if
+            it is owned by another user or is writable by others.
+        file_chunks:
+            If True, lazy data is chunked along the spatial dimensions as
+            the variables are chunked in the file, rather than in larger
+            chunks, so that extracting a small subset of the data (such as
+            spot sites) reads only the file chunks containing it.
 
     Returns:
         Cube that has been loaded from the input filepath given the
         constraints provided.
     """
-    cubes = load_cubelist(filepath, constraints, no_lazy_load)
+    cubes = load_cubelist(
+        filepath,
+        constraints,
+        no_lazy_load,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+        file_chunks=file_chunks,
+    )
     # Merge loaded cubes
     if len(cubes) == 1:
         cube = cubes[0]
     else:
         cube = MergeCubes()(cubes)
     return cube
+
+
+def load_cubes(
+    filepaths: List[str],
+    no_lazy_load: bool = False,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> List[Cube]:
+    """Load each of a list of filepaths into a cube, as load_cube does for a
+    single filepath, loading the files concurrently if requested. This is
+    used to load the many inputs of steps such as blending and time-lagging.
+
+    Args:
+        filepaths:
+            Filepaths that will each be loaded into a cube.
+        no_lazy_load:
+            If True, bypass cube deferred (lazy) loading and load the whole
+            cube into memory. This can increase performance at the cost of
+            memory. If False (default) then lazy load.
+        max_workers:
+            Maximum number of files to load concurrently, using a pool of
+            processes. If None, taken from the IMPROVER_LOAD_MAX_WORKERS
+            environment variable, or 1 (loading the files serially) if this
+            is not set.
+        cache_dir:
+            If provided, the metadata parsed from each file is cached in this
+            directory, keyed by file path, modification time and size, so
+            that subsequent loads of the same file skip parsing it. If None,
+            taken from the IMPROVER_LOAD_CACHE_DIR environment variable, or
+            not cached if this is not set. Cache files are unpickled, so the
+            directory must be private to the current user; it is not used if
+            it is owned by another user or is writable by others.
+
+    Returns:
+        Cubes loaded from each filepath, in the same order as the filepaths.
+
+    Raises:
+        ValueError: If no cubes are found in a file.
+    """
+    result = []
+    for filepath, cubes in zip(
+        filepaths, _load_files(filepaths, None, max_workers, cache_dir, False)
+    ):
+        if not cubes:
+            raise ValueError(f"No cubes found in {filepath}")
+        if no_lazy_load:
+            for cube in cubes:
+                cube.data
+        result.append(cubes[0] if len(cubes) == 1 else MergeCubes()(cubes))
+    return result
@@ -0,0 +1,201 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+Provides a registry of generated lookup tables, which are cached within each
+process and optionally on disk, so that they are generated only once and are
+shared between processes.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import warnings
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+import improver
+from improver.utilities.atomic_write import atomic_write
+
+#: Environment variable naming the directory in which to cache lookup tables
+LOOKUP_TABLE_CACHE_DIR = "IMPROVER_LOOKUP_TABLE_CACHE_DIR"
+
+#: Registered lookup table generators, by name
+LOOKUP_TABLES: Dict[str, Callable] = {}
+
+
+def _cache_path(name: str, version: int, arguments: Tuple) -> Optional[str]:
+    """
+    Return the path of the file in which to cache a lookup table, if the
+    cache directory environment variable is set.  The file name includes the
+    table version and IMPROVER version, so that a table is regenerated if the
+    code which generates it may have changed, and a hash of the arguments
+    used to generate it.
+
+    Args:
+        name:
+            Name of the lookup table.
+        version:
+            Version of the lookup table.
+        arguments:
+            Arguments with which the table is generated.
+
+    Returns:
+        Path of the cache file, or None if lookup tables are not to be cached
+        on disk.
+    """
+    cache_dir = os.environ.get(LOOKUP_TABLE_CACHE_DIR)
+    if not cache_dir:
+        return None
+    improver_version = getattr(improver, "__version__", "unknown")
+    key = repr((name, version, improver_version, arguments)).encode()
+    digest = hashlib.sha256(key).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}_v{version}_{digest}.npy")
+
+
+def _save_table(path: str, table: ndarray) -> None:
+    """
+    Save a lookup table to file.  The table is written to a temporary file
+    which is then renamed, so that processes reading the cache never see a
+    partially written table.
+
+    Args:
+        path:
+            Path of the cache file.
+        table:
+            Lookup table to save.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with atomic_write(path, "wb", suffix=".npy.tmp") as output:
+        np.save(output, table)
+
+
+def load_lookup_table(
+    name: str, version: int, generator: Callable, *args, **kwargs
+) -> ndarray:
+    """
+    Load a lookup table from the disk cache, generating and saving it if it
+    is not already cached.  Tables loaded from the cache are memory-mapped,
+    so that the operating system shares a single copy between all processes
+    using the table.  If the cache directory environment variable is not set,
+    or the table cannot be saved, the generated table is returned directly.
+
+    Args:
+        name:
+            Name of the lookup table.
+        version:
+            Version of the lookup table.  This should be incremented when
+            the generator is changed.
+        generator:
+            Function returning the lookup table for the given arguments.
+        args:
+            Positional arguments for the generator.
+        kwargs:
+            Keyword arguments for the generator.
+
+    Returns:
+        Read-only lookup table.
+    """
+    bound = inspect.signature(generator).bind(*args, **kwargs)
+    bound.apply_defaults()
+    path = _cache_path(name, version, tuple(bound.arguments.items()))
+
+    if path is not None and os.path.exists(path):
+        try:
+            return np.asarray(np.load(path, mmap_mode="r"))
+        except (OSError, ValueError):
+            # regenerate a corrupt cache file
+            pass
+
+    table = np.asarray(generator(*args, **kwargs))
+    if path is not None:
+        try:
+            _save_table(path, table)
+            return np.asarray(np.load(path, mmap_mode="r"))
+        except OSError as error:
+            warnings.warn(f"Unable to cache lookup table {name} in {path}: {error}")
+    table.flags.writeable = False
+    return table
+
+
+def lookup_table(name: str, version: int = 1) -> Callable:
+    """
+    Decorator to register a function which generates a lookup table.  The
+    decorated function returns the table for the given arguments from the
+    disk cache if available (see load_lookup_table), and the table is cached
+    within each process so that it is only loaded once.
+
+    Args:
+        name:
+            Unique name of the lookup table.
+        version:
+            Version of the lookup table.  This should be incremented when
+            the generator is changed.
+
+    Returns:
+        Decorator registering the lookup table generator.
+
+    Raises:
+        ValueError: If a different lookup table with the same name is
+            already registered.
+    """
+
+    def decorator(generator: Callable) -> Callable:
+        registered = LOOKUP_TABLES.get(name)
+        if registered is not None and (
+            registered.__module__,
+            registered.__qualname__,
+        ) != (generator.__module__, generator.__qualname__):
+            raise ValueError(f"A lookup table named {name} is already registered.")
+
+        @functools.lru_cache()
+        @functools.wraps(generator)
+        def cached_table(*args, **kwargs):
+            return load_lookup_table(name, version, generator, *args, **kwargs)
+
+        LOOKUP_TABLES[name] = cached_table
+        return cached_table
+
+    return decorator
+
+
+def interpolate_from_table(
+    values: ndarray,
+    table: ndarray,
+    minimum: float,
+    maximum: float,
+    increment: float,
+) -> ndarray:
+    """
+    Interpolate linearly through a lookup table with regularly spaced points.
+    Values outside the range of the table are clipped to within it.
+
+    Args:
+        values:
+            Array of values at which to interpolate.
+        table:
+            1D lookup table, the first point of which is at minimum.
+        minimum:
+            Value at the first point in the table.
+        maximum:
+            Maximum value to interpolate to, which must be at least one
+            increment less than the value at the last point in the table.
+        increment:
+            Spacing of the points in the table.
+
+    Returns:
+        Array of values interpolated from the table.
+    """
+    clipped = np.clip(values, minimum, maximum)
+
+    # interpolate between bracketing values
+    table_position = (clipped - minimum) / increment
+    table_index = table_position.astype(int)
+    interpolation_factor = table_position - table_index
+    return (1.0 - interpolation_factor) * table[
+        table_index
+    ] + interpolation_factor * table[table_index + 1]
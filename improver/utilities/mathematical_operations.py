@@ -6,9 +6,11 @@
 
 from typing import List, Optional, Tuple, Union
 
+import dask.array as da
 import iris
 import numpy as np
 import numpy.ma as ma
+from dask.array import Array
 from iris.coords import CellMethod
 from iris.cube import Cube
 from numpy import ndarray
@@ -200,7 +202,7 @@ class Integration(BasePlugin):
 
         # create new cube from template
         integrated_cube = create_new_diagnostic_cube(
-            name, units, template, attributes, data=np.array(data)
+            name, units, template, attributes, data=np.asarray(data)
         )
 
         integrated_cube.coord(self.coord_name_to_integrate).bounds = np.array(
@@ -224,7 +226,8 @@ class Integration(BasePlugin):
         from the lowermost half of the stride is calculated by multiplying the
         lower bound value by 0.5 * stride. The contribution from the
         uppermost half of the stride and the bottom half of the stride is
-        summed.
+        summed, and the contributions are accumulated over all the levels
+        in a single cumulative sum.
 
         Integration is performed ONLY over positive values.
 
@@ -256,48 +259,23 @@ class Integration(BasePlugin):
                     return True
             return False
 
-        data = []
-        coord_points = []
-        coord_bounds = []
-        integral = 0
-        levels_tuple = zip(
-            upper_bounds_cube.slices_over(self.coord_name_to_integrate),
-            lower_bounds_cube.slices_over(self.coord_name_to_integrate),
-        )
-
-        for upper_bounds_slice, lower_bounds_slice in levels_tuple:
-            (upper_bound,) = upper_bounds_slice.coord(
-                self.coord_name_to_integrate
-            ).points
-            (lower_bound,) = lower_bounds_slice.coord(
-                self.coord_name_to_integrate
-            ).points
-
-            if skip_slice(
+        coord_name = self.coord_name_to_integrate
+        upper_points = upper_bounds_cube.coord(coord_name).points
+        lower_points = lower_bounds_cube.coord(coord_name).points
+        levels = [
+            index
+            for index, (upper_bound, lower_bound) in enumerate(
+                zip(upper_points, lower_points)
+            )
+            if not skip_slice(
                 upper_bound,
                 lower_bound,
                 self.positive_integration,
                 self.start_point,
                 self.end_point,
-            ):
-                continue
-
-            stride = np.abs(upper_bound - lower_bound)
-            upper_half_data = np.where(
-                upper_bounds_slice.data > 0, upper_bounds_slice.data * 0.5 * stride, 0.0
             )
-            lower_half_data = np.where(
-                lower_bounds_slice.data > 0, lower_bounds_slice.data * 0.5 * stride, 0.0
-            )
-            integral += upper_half_data + lower_half_data
-
-            data.append(integral.copy())
-            coord_points.append(
-                upper_bound if self.positive_integration else lower_bound
-            )
-            coord_bounds.append([lower_bound, upper_bound])
-
-        if len(data) == 0:
+        ]
+        if not levels:
             msg = (
                 "No integration could be performed for "
                 "coord_to_integrate: {}, start_point: {}, end_point: {}, "
@@ -311,12 +289,126 @@ class Integration(BasePlugin):
             )
             raise ValueError(msg)
 
+        data = self._cumulative_integral(
+            self._level_data(upper_bounds_cube, levels),
+            self._level_data(lower_bounds_cube, levels),
+            np.abs(upper_points[levels] - lower_points[levels]),
+        )
+        coord_points = list(
+            (upper_points if self.positive_integration else lower_points)[levels]
+        )
+        coord_bounds = np.stack([lower_points[levels], upper_points[levels]], axis=-1)
+
         template = upper_bounds_cube if self.positive_integration else lower_bounds_cube
         integrated_cube = self._create_output_cube(
-            template.copy(), data, coord_points, coord_bounds
+            template.copy(data=template.lazy_data()), data, coord_points, coord_bounds
         )
         return integrated_cube
 
+    def _level_data(self, cube: Cube, levels: List[int]) -> Union[ndarray, Array]:
+        """Return the data for the chosen levels of the cube, with the
+        coordinate being integrated as the leading dimension.  Lazy data is
+        left lazy, and a view of the data is returned where possible.
+
+        Args:
+            cube:
+                Cube containing the coordinate to be integrated.
+            levels:
+                Indices of the levels to return.
+
+        Returns:
+            Data of the cube on the chosen levels.
+        """
+        data = cube.core_data()
+        dims = cube.coord_dims(self.coord_name_to_integrate)
+        if dims:
+            data = np.moveaxis(data, dims[0], 0)
+        else:
+            data = data[np.newaxis]
+        if np.all(np.diff(levels) == 1):
+            return data[levels[0] : levels[-1] + 1]
+        return data[levels]
+
+    @staticmethod
+    def _trapezoid_contributions(
+        upper: ndarray, lower: ndarray, strides: ndarray, out: ndarray
+    ) -> ndarray:
+        """Calculate the contribution of each level to the integral of the
+        positive values, and accumulate these along the leading dimension.
+
+        Args:
+            upper:
+                Values at the upper bound of each level.
+            lower:
+                Values at the lower bound of each level.
+            strides:
+                Difference between the upper and lower bound of each level.
+            out:
+                Array into which the running integral is written.
+
+        Returns:
+            The running integral, which is the array passed as out.
+        """
+        strides = strides.reshape((-1,) + (1,) * (upper.ndim - 1))
+        np.multiply(upper, 0.5, out=out)
+        out *= strides
+        out[~(upper > 0)] = 0.0
+        lower_half = np.multiply(lower, 0.5, out=np.empty_like(out))
+        lower_half *= strides
+        lower_half[~(lower > 0)] = 0.0
+        out += lower_half
+        return np.cumsum(out, axis=0, out=out)
+
+    def _cumulative_integral(
+        self,
+        upper: Union[ndarray, Array],
+        lower: Union[ndarray, Array],
+        strides: ndarray,
+    ) -> ndarray:
+        """Integrate the positive values of the data along the leading
+        dimension in a single pass, writing the running integral over each
+        level into one preallocated array.  Lazy data is realised and
+        integrated one spatial tile at a time, following the chunking of the
+        data, so that the whole of the input is never held in memory at once.
+
+        Args:
+            upper:
+                Values at the upper bound of each level, with the integrated
+                coordinate as the leading dimension.
+            lower:
+                Values at the lower bound of each level, with the integrated
+                coordinate as the leading dimension.
+            strides:
+                Difference between the upper and lower bound of each level.
+
+        Returns:
+            The running integral at each level.
+        """
+        dtype = np.result_type(upper.dtype, lower.dtype, 0.5, strides.dtype)
+        integral = np.empty(upper.shape, dtype=dtype)
+        if not isinstance(upper, Array) and not isinstance(lower, Array):
+            return self._trapezoid_contributions(
+                np.asarray(upper), np.asarray(lower), strides, integral
+            )
+
+        # tiles span all levels, and are aligned with the chunks of the data
+        upper = da.asarray(upper)
+        lower = da.asarray(lower).rechunk(upper.chunks)
+        offsets = [np.cumsum((0,) + chunks) for chunks in upper.chunks[1:]]
+        for block_index in np.ndindex(upper.numblocks[1:]):
+            tile = (slice(None),) + tuple(
+                slice(offset[index], offset[index + 1])
+                for offset, index in zip(offsets, block_index)
+            )
+            upper_tile, lower_tile = da.compute(upper[tile], lower[tile])
+            self._trapezoid_contributions(
+                np.asarray(upper_tile),
+                np.asarray(lower_tile),
+                strides,
+                integral[tile],
+            )
+        return integral
+
     def process(self, cube: Cube) -> Cube:
         """Integrate data along a specified coordinate.  Only positive values
         are integrated; zero and negative values are not included in the sum or
@@ -209,3 +209,45 @@ def boxsum(
         - data[..., i : i + m, :n]
     )
     return result
+
+
+def fft_correlate(data: ndarray, kernel: ndarray) -> ndarray:
+    """Correlate the last two dimensions of an array with a kernel using
+    fast Fourier transforms.
+
+    This is equivalent to `scipy.ndimage.correlate` with mode="nearest" to
+    within floating point precision. The cost grows with the logarithm of the
+    kernel size rather than with the kernel area, so this is faster for large
+    kernels. The transforms are calculated at double precision and results
+    with a magnitude within their rounding error are set to zero, so that the
+    correlation of a region of zeros remains exactly zero.
+
+    Args:
+        data:
+            The input data array.
+        kernel:
+            Two dimensional kernel, with an odd number of points along
+            each dimension.
+
+    Returns:
+        Array of the same shape and type as the input data, containing the
+        correlation of the data with the kernel.
+    """
+    from scipy.signal import fftconvolve
+
+    working_dtype = np.result_type(data.dtype, kernel.dtype, np.float64)
+    half_y, half_x = kernel.shape[0] // 2, kernel.shape[1] // 2
+    padding = [(0, 0)] * (data.ndim - 2) + [(half_y, half_y), (half_x, half_x)]
+    padded = np.pad(data.astype(working_dtype), padding, mode="edge")
+    # Correlation is convolution with a reversed kernel
+    kernel = kernel[::-1, ::-1].reshape((1,) * (data.ndim - 2) + kernel.shape)
+    result = fftconvolve(padded, kernel, mode="valid", axes=(-2, -1))
+    if result.size:
+        tolerance = (
+            np.finfo(working_dtype).eps
+            * kernel.size
+            * np.abs(kernel).sum()
+            * np.abs(padded).max()
+        )
+        result[np.abs(result) <= tolerance] = 0
+    return result.astype(data.dtype)
@@ -0,0 +1,181 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Module for running a pipeline of IMPROVER commands within a single process."""
+
+from collections import Counter
+from copy import deepcopy
+from typing import Any, Dict, List, Optional
+
+REFERENCE_PREFIX = "@"
+
+
+def _reference(arg: Any, steps: Dict[str, Dict]) -> Optional[str]:
+    """Return the name of the step referred to by an argument, if any.
+
+    Args:
+        arg:
+            A single argument from a step definition.
+        steps:
+            All step definitions of the pipeline, keyed by step name.
+
+    Returns:
+        The name of the referenced step, or None if the argument is not a
+        reference.
+
+    Raises:
+        ValueError: If the argument refers to a step that is not defined.
+    """
+    if not isinstance(arg, str) or not arg.startswith(REFERENCE_PREFIX):
+        return None
+    name = arg[len(REFERENCE_PREFIX) :]
+    if name not in steps:
+        raise ValueError(f"Reference {arg} does not match any step in the pipeline.")
+    return name
+
+
+def _dependencies(steps: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Find the steps that each step takes as input.
+
+    Args:
+        steps:
+            All step definitions of the pipeline, keyed by step name.
+
+    Returns:
+        Names of the referenced steps (one entry per reference) keyed by
+        the name of the step that refers to them.
+
+    Raises:
+        ValueError: If a step does not define a command.
+    """
+    dependencies = {}
+    for name, step in steps.items():
+        if "command" not in step:
+            raise ValueError(f"Step {name} does not define a command.")
+        refs = [_reference(arg, steps) for arg in step.get("args", [])]
+        dependencies[name] = [ref for ref in refs if ref is not None]
+    return dependencies
+
+
+def pipeline_order(steps: Dict[str, Dict]) -> List[str]:
+    """Sort the pipeline steps so that every step follows the steps it
+    depends on. Independent steps retain the order in which they are defined.
+
+    Args:
+        steps:
+            All step definitions of the pipeline, keyed by step name.
+
+    Returns:
+        Step names in execution order.
+
+    Raises:
+        ValueError: If the steps contain a circular dependency.
+    """
+    dependencies = _dependencies(steps)
+    order = []
+    remaining = list(steps)
+    while remaining:
+        ready = [
+            name
+            for name in remaining
+            if all(dep in order for dep in dependencies[name])
+        ]
+        if not ready:
+            raise ValueError(
+                "Pipeline contains a circular dependency between steps: "
+                f"{', '.join(remaining)}"
+            )
+        order.extend(ready)
+        remaining = [name for name in remaining if name not in ready]
+    return order
+
+
+def run_pipeline(
+    config: Dict, verbose: bool = False, dry_run: bool = False
+) -> Dict[str, Any]:
+    """Run a directed acyclic graph of IMPROVER commands in a single process.
+
+    The configuration contains a "steps" dictionary keyed by step name. Each
+    step defines the "command" to run, a list of command line "args" and
+    optionally an "output" file name, e.g.::
+
+        {
+            "steps": {
+                "probabilities": {
+                    "command": "threshold",
+                    "args": ["temperature.nc", "--threshold-values", "280"],
+                },
+                "neighbourhood": {
+                    "command": "nbhood",
+                    "args": [
+                        "@probabilities",
+                        "--neighbourhood-output",
+                        "probabilities",
+                        "--radii",
+                        "20000",
+                    ],
+                    "output": "output.nc",
+                },
+            }
+        }
+
+    An argument of the form "@<step name>" is replaced with the in-memory
+    result of that step, so intermediate results are only written to disk
+    where an output is declared. Results are released as soon as their last
+    consumer has run. Consumers other than the last are given a copy of the
+    result, so that a command modifying its input in place does not affect
+    the other consumers.
+
+    Args:
+        config:
+            Pipeline description as detailed above.
+        verbose:
+            Print executed commands.
+        dry_run:
+            Print commands to be executed, without running them.
+
+    Returns:
+        Results of the steps that have neither an output file nor a
+        consumer within the pipeline, keyed by step name.
+    """
+    from improver.cli import SUBCOMMANDS_DISPATCHER, ObjectAsStr, execute_command
+
+    steps = config["steps"]
+    order = pipeline_order(steps)
+    consumers = Counter(ref for refs in _dependencies(steps).values() for ref in refs)
+
+    results = {}
+    final_results = {}
+    for name in order:
+        step = steps[name]
+        argv = [step["command"]]
+        for arg in step.get("args", []):
+            ref = _reference(arg, steps)
+            if ref is None:
+                argv.append(str(arg))
+                continue
+            consumers[ref] -= 1
+            value = deepcopy(results[ref]) if consumers[ref] else results.pop(ref)
+            # wrap to prevent lists (e.g. CubeList) being run as nested commands
+            argv.append(ObjectAsStr(value))
+
+        output = step.get("output")
+        if output:
+            argv.extend(["--output", output])
+            if consumers[name]:
+                argv.append("--pass-through-output")
+
+        result = execute_command(
+            SUBCOMMANDS_DISPATCHER,
+            "improver",
+            *argv,
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+        if consumers[name]:
+            # unwrap results passed through after saving to file
+            results[name] = getattr(result, "original_object", result)
+        elif not output:
+            final_results[name] = result
+    return final_results
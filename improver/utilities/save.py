@@ -6,7 +6,7 @@
 
 import os
 import warnings
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 import cf_units
 import iris
@@ -59,6 +59,7 @@ def save_netcdf(
     compression_level: int = 1,
     least_significant_digit: Optional[int] = None,
     fill_value: Optional[float] = None,
+    chunksizes: Optional[Sequence[int]] = None,
 ) -> None:
     """Save the input Cube or CubeList as a NetCDF file and check metadata
     where required for integrity.
@@ -87,8 +88,19 @@ def save_netcdf(
             the default fill value for the data type will be used. If the data is not masked then
             the numpy array's fill value will retain the default value while the _FillValue attribute
             in the NetCDF file will be updated.
+        chunksizes:
+            If specified, the chunk lengths of the trailing dimensions of the
+            data, e.g. (256, 256) to write spatial tiles that can be read
+            efficiently for sub-areas. Leading dimensions have a chunk length
+            of 1 and chunk lengths are limited to the length of the dimension.
+            If not specified, each x-y slice is written as a single chunk.
+            Smaller chunks are compressed independently, at the cost of some
+            compression ratio.
     Raises:
         warning if cubelist contains cubes of varying dimensions.
+        ValueError: if more chunk lengths are specified than the cube has
+            dimensions, or chunk lengths are specified for cubes of varying
+            shapes.
     """
     if isinstance(cubelist, iris.cube.Cube):
         cubelist = iris.cube.CubeList([cubelist])
@@ -104,10 +116,32 @@ def save_netcdf(
         # attribute if present.
         cube.attributes.pop("least_significant_digit", None)
 
-    # If all xy slices are the same shape, use this to determine
-    # the chunksize for the netCDF (eg. 1, 1, 970, 1042)
+    # Apply the requested trailing chunk lengths (eg. 1, 1, 256, 256), or
+    # if all xy slices are the same shape, use this to determine the
+    # chunksize for the netCDF (eg. 1, 1, 970, 1042)
+    trailing_chunksizes = chunksizes
     chunksizes = None
-    if len({cube.shape[:2] for cube in cubelist}) == 1:
+    if trailing_chunksizes is not None:
+        if len({cube.shape for cube in cubelist}) > 1:
+            raise ValueError(
+                "Chunk lengths cannot be specified for a cubelist containing "
+                "cubes of varying shapes"
+            )
+        cube = cubelist[0]
+        if len(trailing_chunksizes) > cube.ndim:
+            raise ValueError(
+                f"{len(trailing_chunksizes)} chunk lengths specified for "
+                f"a cube with {cube.ndim} dimensions"
+            )
+        trailing_shape = cube.shape[cube.ndim - len(trailing_chunksizes) :]
+        chunksizes = tuple(
+            [1] * (cube.ndim - len(trailing_chunksizes))
+            + [
+                min(size, length)
+                for size, length in zip(trailing_chunksizes, trailing_shape)
+            ]
+        )
+    elif len({cube.shape[:2] for cube in cubelist}) == 1:
         cube = cubelist[0]
         if cube.ndim >= 2:
             xy_chunksizes = [cube.shape[-2], cube.shape[-1]]
@@ -722,6 +722,51 @@ class GradientBetweenAdjacentGridSquares(PostProcessingPlugin):
         return gradients
 
 
+def _vicinity_filter_size(ndim: int, width: int) -> Tuple[int, ...]:
+    """Return the filter size to apply a square vicinity of the given width
+    over the last two (spatial) dimensions of an array, independently for
+    each slice over any leading dimensions."""
+    return (1,) * (ndim - 2) + (width, width)
+
+
+def _nan_extreme_filter(
+    extreme_filter: callable, data: ndarray, width: int, nan_fill: float
+) -> ndarray:
+    """
+    Apply a maximum or minimum filter over the vicinity of each point,
+    ignoring NaN values. NaNs are replaced with a value that cannot be
+    selected by the filter, and points with no valid values within their
+    vicinity are returned as NaN, matching the behaviour of np.nanmax and
+    np.nanmin. This retains the speed of the separable scipy filters.
+
+    Args:
+        extreme_filter:
+            The scipy maximum_filter or minimum_filter function.
+        data:
+            An array of values to which the filter is applied, with the
+            spatial dimensions last.
+        width:
+            The number of points along an edge of the square vicinity.
+        nan_fill:
+            The value used in place of NaNs, -inf for a maximum filter and
+            inf for a minimum filter.
+
+    Returns:
+        Array of the maximum or minimum value within the vicinity of each
+        point.
+    """
+    size = _vicinity_filter_size(data.ndim, width)
+    nan_points = np.isnan(data)
+    if not nan_points.any():
+        return extreme_filter(data, size=size, mode="nearest")
+    result = extreme_filter(
+        np.where(nan_points, nan_fill, data), size=size, mode="nearest"
+    )
+    no_valid_points = ~maximum_filter(~nan_points, size=size, mode="nearest")
+    result[no_valid_points] = np.nan
+    return result
+
+
 def operator_within_vicinity(
     apply_filter: callable,
     fill_value: Union[float, int],
@@ -742,7 +787,9 @@ def operator_within_vicinity(
         fill_value:
             The fill-value to use when masking out points within the grid.
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied. The last two
+            dimensions must be the spatial dimensions; each slice over any
+            leading dimensions is processed independently.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the maximum value.
@@ -772,7 +819,7 @@ def operator_within_vicinity(
         patch_data = np.empty_like(grid)
         for match in (True, False):
             matched_data = unmasked_grid.copy()
-            matched_data[landmask != match] = fill_value
+            matched_data[..., landmask != match] = fill_value
             matched_patch_data = apply_filter(matched_data, grid_points)
             patch_data = np.where(landmask == match, matched_patch_data, patch_data)
     else:
@@ -803,7 +850,8 @@ def maximum_within_vicinity(
 
     Args:
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied, with the
+            spatial dimensions last.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the maximum value.
@@ -819,17 +867,7 @@ def maximum_within_vicinity(
     """
 
     def _apply_max_filter(data, width):
-        if np.any(np.isnan(data)):
-            # Fix-me: from scipy version 1.6.0, vectorized_filter method exists
-            # which can significantly speed up generic_filter methods.
-            msg = (
-                "This method utilises the scipy generic_filter which is inefficient"
-                "for large grids."
-            )
-            warnings.warn(msg)
-            return generic_filter(data, np.nanmax, size=width, mode="nearest")
-        else:
-            return maximum_filter(data, size=width, mode="nearest")
+        return _nan_extreme_filter(maximum_filter, data, width, -np.inf)
 
     # Value, the negative of which is used to fill masked points, ensuring
     # that when we take a maximum the masked points do not contribute.
@@ -856,7 +894,8 @@ def minimum_within_vicinity(
 
     Args:
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied, with the
+            spatial dimensions last.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the minimum value.
@@ -872,17 +911,7 @@ def minimum_within_vicinity(
     """
 
     def _apply_min_filter(data, width):
-        if np.any(np.isnan(data)):
-            # Fix-me: from scipy version 1.6.0, vectorized_filter method exists
-            # which can significantly speed up generic_filter methods.
-            msg = (
-                "This method utilises the scipy generic_filter which is inefficient"
-                "for large grids."
-            )
-            warnings.warn(msg)
-            return generic_filter(data, np.nanmin, size=width, mode="nearest")
-        else:
-            return minimum_filter(data, size=width, mode="nearest")
+        return _nan_extreme_filter(minimum_filter, data, width, np.inf)
 
     # Value, which is used to fill masked points, ensuring that when we
     # take a minimum the masked points do not contribute.
@@ -906,7 +935,8 @@ def mean_within_vicinity(
 
     Args:
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied, with the
+            spatial dimensions last.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the mean value.
@@ -930,9 +960,16 @@ def mean_within_vicinity(
                 "for large grids."
             )
             warnings.warn(msg)
-            return generic_filter(data, np.nanmean, size=width, mode="nearest")
+            return generic_filter(
+                data,
+                np.nanmean,
+                size=_vicinity_filter_size(data.ndim, width),
+                mode="nearest",
+            )
         else:
-            return uniform_filter(data, size=width, mode="nearest")
+            return uniform_filter(
+                data, size=_vicinity_filter_size(data.ndim, width), mode="nearest"
+            )
 
     fill_value = np.nan
     processed_grid = operator_within_vicinity(
@@ -954,7 +991,8 @@ def std_within_vicinity(
 
     Args:
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied, with the
+            spatial dimensions last.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the standard deviation.
@@ -978,11 +1016,21 @@ def std_within_vicinity(
                 "for large grids."
             )
             warnings.warn(msg)
-            return generic_filter(data, np.nanstd, size=width, mode="nearest")
+            return generic_filter(
+                data,
+                np.nanstd,
+                size=_vicinity_filter_size(data.ndim, width),
+                mode="nearest",
+            )
         else:
             # Fix-me: from scipy version 1.6.0, vectorized_filter method exists
             # which can significantly speed up generic_filter methods.
-            return generic_filter(data, np.std, size=width, mode="nearest")
+            return generic_filter(
+                data,
+                np.std,
+                size=_vicinity_filter_size(data.ndim, width),
+                mode="nearest",
+            )
 
     fill_value = np.nan
     processed_grid = operator_within_vicinity(
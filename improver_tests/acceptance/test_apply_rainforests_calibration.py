@@ -118,6 +118,30 @@ class TestApplyRainforestsCalibration:
         run_cli(args)
         acc.compare(output_path, kgo_path)
 
+    def test_max_workers(
+        self, tmp_path, model_key, create_model_config, test_data_paths
+    ):
+        """Test that evaluating the threshold models concurrently does not affect
+        the output."""
+        _, kgo_path, forecast_path, feature_paths = test_data_paths
+        model_config = create_model_config
+        output_path = tmp_path / "output.nc"
+        args = [
+            forecast_path,
+            *feature_paths,
+            "--model-config",
+            model_config,
+            "--output-thresholds",
+            "0.0,0.0005,0.001",
+            "--bin-data",
+            "--max-workers",
+            "2",
+            "--output",
+            output_path,
+        ]
+        run_cli(args)
+        acc.compare(output_path, kgo_path)
+
     def test_json_threshold_config(
         self, tmp_path, model_key, create_model_config, test_data_paths
     ):
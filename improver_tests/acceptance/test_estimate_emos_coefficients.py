@@ -237,7 +237,11 @@ def test_normal_point_by_point_sites(tmp_path):
     ]
     run_cli(args)
     acc.compare(
-        output_path, kgo_path, atol=compare_emos_tolerance, rtol=compare_emos_tolerance
+        output_path,
+        kgo_path,
+        atol=compare_emos_tolerance,
+        rtol=compare_emos_tolerance,
+        exclude_attributes="emos_convergence_statistics",
     )
 
 
@@ -272,7 +276,11 @@ def test_normal_realizations_point_by_point_sites(tmp_path):
     ]
     run_cli(args)
     acc.compare(
-        output_path, kgo_path, atol=compare_emos_tolerance, rtol=compare_emos_tolerance
+        output_path,
+        kgo_path,
+        atol=compare_emos_tolerance,
+        rtol=compare_emos_tolerance,
+        exclude_attributes="emos_convergence_statistics",
     )
 
 
@@ -306,5 +314,9 @@ def test_normal_point_by_point_default_initial_guess_sites(tmp_path):
     ]
     run_cli(args)
     acc.compare(
-        output_path, kgo_path, atol=compare_emos_tolerance, rtol=compare_emos_tolerance
+        output_path,
+        kgo_path,
+        atol=compare_emos_tolerance,
+        rtol=compare_emos_tolerance,
+        exclude_attributes="emos_convergence_statistics",
     )
@@ -58,6 +58,34 @@ def test_percentiles_reordering(tmp_path, tie_break, kgo):
     acc.compare(output_path, kgo_path)
 
 
+def test_percentiles_reordering_tiles_max_workers(tmp_path):
+    """Test that reordering tiles concurrently gives the same result as
+    reordering them serially"""
+    kgo_dir = acc.kgo_root() / "generate-realizations/percentiles_reordering"
+    forecast_path = kgo_dir / "raw_precip_forecast.nc"
+    percentiles_path = kgo_dir / "multiple_percentiles_precip_cube.nc"
+    output_paths = []
+    for max_workers in ("1", "2"):
+        output_path = tmp_path / f"output_{max_workers}.nc"
+        args = [
+            "--realizations-count",
+            "12",
+            "--random-seed",
+            "0",
+            "--tile-size",
+            "100",
+            "--max-workers",
+            max_workers,
+            percentiles_path,
+            forecast_path,
+            "--output",
+            output_path,
+        ]
+        run_cli(args)
+        output_paths.append(output_path)
+    acc.compare(*output_paths, recreate=False)
+
+
 @pytest.mark.parametrize(
     "bounds_option, kgo",
     (
@@ -37,6 +37,33 @@ def test_basic_circular(tmp_path):
     acc.compare(output_path, kgo_path)
 
 
+def test_circular_max_workers_fft(tmp_path):
+    """Test that processing slices concurrently and summing with fast Fourier
+    transforms does not affect circular neighbourhooding"""
+    kgo_dir = acc.kgo_root() / "nbhood/basic"
+    kgo_path = kgo_dir / "kgo_circular.nc"
+    input_path = kgo_dir / "input.nc"
+    output_path = tmp_path / "output.nc"
+    args = [
+        input_path,
+        "--neighbourhood-output",
+        "probabilities",
+        "--neighbourhood-shape",
+        "circular",
+        "--radii",
+        "20000",
+        "--weighted-mode",
+        "--max-workers",
+        "2",
+        "--correlation-method",
+        "fft",
+        "--output",
+        output_path,
+    ]
+    run_cli(args)
+    acc.compare(output_path, kgo_path)
+
+
 def test_basic_square(tmp_path):
     """Test basic square neighbourhooding"""
     kgo_dir = acc.kgo_root() / "nbhood/basic"
@@ -7,6 +7,7 @@ Tests for the neighbour-finding CLI
 """
 
 import json
+from functools import partial
 
 import pytest
 
@@ -15,6 +16,9 @@ from . import acceptance as acc
 pytestmark = [pytest.mark.acc, acc.skip_if_kgo_missing]
 CLI = acc.cli_name_with_dashes(__file__)
 run_cli = acc.run_cli(CLI)
+# The known good outputs predate the neighbour_search_hash attribute, so it
+# is not compared.
+compare = partial(acc.compare, exclude_attributes="neighbour_search_hash")
 
 UK_GLOBAL = [("uk", "ukvx"), ("global", "global")]
 
@@ -30,7 +34,7 @@ def test_nearest(tmp_path, domain, model):
     output_path = tmp_path / "output.nc"
     args = [orography_path, landmask_path, sites_path, "--output", output_path]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 @pytest.mark.parametrize("domain,model", UK_GLOBAL)
@@ -54,7 +58,7 @@ def test_nearest_land(tmp_path, domain, model):
         output_path,
     ]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 @pytest.mark.slow
@@ -79,7 +83,7 @@ def test_nearest_minimum_dz(tmp_path, domain, model):
         output_path,
     ]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 @pytest.mark.slow
@@ -107,7 +111,7 @@ def test_nearest_land_minimum_dz(tmp_path, domain, model):
     if domain == "uk":
         args += ["--node-limit", "100"]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 @pytest.mark.slow
@@ -132,7 +136,7 @@ def test_all_methods(tmp_path, domain, model):
         output_path,
     ]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 def test_alternative_coordinate_system(tmp_path):
@@ -170,7 +174,7 @@ def test_alternative_coordinate_system(tmp_path):
         output_path,
     ]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 def test_incompatible_constraints(tmp_path):
@@ -204,7 +208,7 @@ def test_invalid_site(tmp_path):
     args = [orography_path, landmask_path, sites_path, "--output", output_path]
     with pytest.warns(UserWarning, match=".*outside the grid.*"):
         run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
 
 
 def test_coord_beyond_bounds(tmp_path):
@@ -217,7 +221,7 @@ def test_coord_beyond_bounds(tmp_path):
     output_path = tmp_path / "output.nc"
     args = [orography_path, landmask_path, sites_path, "--output", output_path]
     run_cli(args)
-    acc.compare(output_path, kgo_path, exclude_vars=["longitude"])
+    compare(output_path, kgo_path, exclude_vars=["longitude"])
 
 
 def test_unset_wmo_ids_with_unique_ids(tmp_path):
@@ -239,4 +243,4 @@ def test_unset_wmo_ids_with_unique_ids(tmp_path):
         output_path,
     ]
     run_cli(args)
-    acc.compare(output_path, kgo_path)
+    compare(output_path, kgo_path)
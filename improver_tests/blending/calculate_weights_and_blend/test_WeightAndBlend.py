@@ -6,6 +6,7 @@
 
 import unittest
 from datetime import datetime as dt
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -13,9 +14,14 @@ import pytest
 from iris.tests import IrisTest
 
 from improver.blending.calculate_weights_and_blend import WeightAndBlend
-from improver.blending.weighted_blend import MergeCubesForWeightedBlending
+from improver.blending.weighted_blend import (
+    MergeCubesForWeightedBlending,
+    PercentileBlendingAggregator,
+    WeightedBlendAcrossWholeDimension,
+)
 from improver.metadata.constants.attributes import MANDATORY_ATTRIBUTE_DEFAULTS
 from improver.synthetic_data.set_up_test_cubes import (
+    set_up_percentile_cube,
     set_up_probability_cube,
     set_up_variable_cube,
 )
@@ -624,6 +630,39 @@ class Test_process(IrisTest):
         with self.assertRaisesRegex(ValueError, msg):
             plugin.process([self.ukv_cube, self.ukv_cube_latest])
 
+    def test_percentile_blend_max_workers(self):
+        """Test that max_workers is passed on to the blending plugin, and
+        that blending chunks of percentiles concurrently gives the same
+        output as blending them serially."""
+        percentiles = np.array([25, 50, 75], dtype=np.float32)
+        data = np.arange(3 * 4 * 4, dtype=np.float32).reshape(3, 4, 4)
+        cubes = [
+            set_up_percentile_cube(
+                data + offset,
+                percentiles,
+                time=dt(2018, 9, 10, 7),
+                frt=dt(2018, 9, 10, hour),
+            )
+            for offset, hour in ((0, 3), (2, 4))
+        ]
+        expected = WeightAndBlend(
+            "forecast_reference_time", "linear", y0val=1, ynval=1
+        ).process([cube.copy() for cube in cubes], cycletime=self.cycletime)
+        plugin = WeightAndBlend(
+            "forecast_reference_time", "linear", y0val=1, ynval=1, max_workers=2
+        )
+        with (
+            patch.object(PercentileBlendingAggregator, "POINTS_PER_CHUNK", 4),
+            patch(
+                "improver.blending.calculate_weights_and_blend."
+                "WeightedBlendAcrossWholeDimension",
+                wraps=WeightedBlendAcrossWholeDimension,
+            ) as blend_plugin,
+        ):
+            result = plugin.process(cubes, cycletime=self.cycletime)
+        blend_plugin.assert_called_once_with("forecast_reference_time", max_workers=2)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
     def test_error_record_run_without_model_id(self):
         """Test error is raised if record_run_attr is set for use without
         also providing the model_id_attr. The latter may be used without the
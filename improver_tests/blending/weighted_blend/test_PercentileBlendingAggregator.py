@@ -5,6 +5,7 @@
 """Unit tests for the weighted_blend.PercentileBlendingAggregator class."""
 
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from iris.tests import IrisTest
@@ -219,6 +220,37 @@ class Test_aggregate(IrisTest):
         with self.assertRaisesRegex(ValueError, "Weights shape does not match data"):
             PercentileBlendingAggregator.aggregate(perc_data, 1, percentiles, weights)
 
+    def test_chunks_match_blend_percentiles(self):
+        """Test that blending chunks of points, serially and concurrently,
+        gives exactly the same result as blending each point individually,
+        including points with masked, non-finite and unsorted values which
+        are blended individually."""
+        rng = np.random.default_rng(0)
+        percentiles = np.array([0, 10, 25, 50, 75, 90, 100], dtype=np.float32)
+        perc_data = np.sort(rng.normal(size=(7, 3, 10)), axis=0).astype(np.float32)
+        perc_data[:, :, 2] = np.round(perc_data[:, :, 2])
+        perc_data[3, 1, 4] = np.nan
+        perc_data[:, 0, 5] = perc_data[::-1, 0, 5]
+        perc_data = np.ma.masked_array(perc_data)
+        perc_data[2, 2, 6] = np.ma.masked
+        weights = rng.uniform(size=(3, 10)).astype(np.float32)
+        weights /= weights.sum(axis=0)
+        expected = np.stack(
+            [
+                PercentileBlendingAggregator.blend_percentiles(
+                    perc_data[:, :, i].T, percentiles, weights[:, i]
+                )
+                for i in range(10)
+            ],
+            axis=-1,
+        )
+        for max_workers in (1, 2):
+            with patch.object(PercentileBlendingAggregator, "POINTS_PER_CHUNK", 3):
+                result = PercentileBlendingAggregator.aggregate(
+                    perc_data, 1, percentiles, weights, max_workers=max_workers
+                )
+            np.testing.assert_array_equal(result, expected)
+
 
 class Test_blend_percentiles(IrisTest):
     """Test the blend_percentiles method"""
@@ -573,6 +573,64 @@ class Test_process_normal_distribution(
             result, self.expected_point_by_point_sites_additional_predictor
         )
 
+    def test_point_by_point_max_workers(self):
+        """
+        Test that minimising the points within a pool of processes gives the
+        same coefficients as minimising the points serially, and that the
+        convergence statistics are recorded.
+        """
+        predictor = "mean"
+        distribution = "norm"
+
+        self.truth.data[:, 0, 0] = np.nan
+        results = []
+        for max_workers in [1, 2]:
+            plugin = Plugin(
+                predictor,
+                tolerance=self.tolerance,
+                point_by_point=True,
+                max_workers=max_workers,
+            )
+            results.append(
+                plugin.process(
+                    self.initial_guess_spot_mean,
+                    self.forecast_predictor_mean.copy(),
+                    self.truth.copy(),
+                    self.forecast_variance.copy(),
+                    distribution,
+                )
+            )
+            statistics = plugin.convergence_statistics
+            self.assertEqual(statistics["points"], 9)
+            self.assertEqual(statistics["minimised_points"], 8)
+            self.assertEqual(statistics["converged_points"], 8)
+            self.assertGreater(statistics["mean_iterations"], 0)
+        self.assertArrayEqual(results[0], results[1])
+
+    def test_point_by_point_unmatched_coordinates(self):
+        """
+        Test that the expected coefficients are generated point by point when
+        the spatial dimensions of the forecast predictor are ordered
+        differently to the truth, such that the data for each point is
+        extracted by coordinate value.
+        """
+        predictor = "mean"
+        distribution = "norm"
+
+        forecast_predictor = self.forecast_predictor_mean.copy()
+        forecast_predictor[0].transpose([0, 2, 1])
+        plugin = Plugin(predictor, tolerance=self.tolerance, point_by_point=True)
+        result = plugin.process(
+            self.initial_guess_spot_mean,
+            forecast_predictor,
+            self.truth,
+            self.forecast_variance,
+            distribution,
+        )
+        self.assertEMOSCoefficientsAlmostEqual(
+            result, self.expected_mean_coefficients_point_by_point
+        )
+
 
 class SetupTruncatedNormalInputs(SetupInputs, SetupCubes):
     """Create a class for setting up cubes for testing."""
@@ -1343,6 +1343,123 @@ class Test_process(
             beta_cube.coord("predictor_name").points, ["air_temperature", "altitude"]
         )
 
+    def test_point_by_point_convergence_statistics(self):
+        """Test that a summary of the convergence of the point by point
+        minimisation is recorded on each coefficient cube, and that no summary
+        is recorded when all points are minimised together."""
+        n_points = self.temperature_truth_cube.shape[-2:]
+        n_points = n_points[0] * n_points[1]
+        result = self.plugin(self.distribution, point_by_point=True).process(
+            self.historic_temperature_forecast_cube.copy(),
+            self.temperature_truth_cube.copy(),
+        )
+        summaries = {cube.attributes["emos_convergence_statistics"] for cube in result}
+        self.assertEqual(len(summaries), 1)
+        statistics = dict(item.split(": ") for item in summaries.pop().split(", "))
+        self.assertEqual(
+            list(statistics),
+            [
+                "points",
+                "minimised_points",
+                "converged_points",
+                "mean_iterations",
+                "max_iterations",
+            ],
+        )
+        self.assertEqual(int(statistics["points"]), n_points)
+        self.assertEqual(int(statistics["minimised_points"]), n_points)
+        self.assertGreater(float(statistics["mean_iterations"]), 0)
+
+        result = self.plugin(self.distribution).process(
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+        )
+        for cube in result:
+            self.assertNotIn("emos_convergence_statistics", cube.attributes)
+
+    def test_point_by_point_previous_coefficients(self):
+        """Test that coefficients estimated previously can be used as the
+        initial guess, such that the minimisation requires fewer iterations
+        and returns similar coefficients."""
+        plugin = self.plugin(self.distribution, point_by_point=True)
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube.copy(),
+            self.temperature_truth_cube.copy(),
+        )
+        cold_start_iterations = plugin.minimiser.convergence_statistics[
+            "mean_iterations"
+        ]
+        result = plugin.process(
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+            previous_coefficients=previous,
+        )
+        self.assertLess(
+            plugin.minimiser.convergence_statistics["mean_iterations"],
+            cold_start_iterations,
+        )
+        self.assertEqual(
+            [cube.name() for cube in result], [cube.name() for cube in previous]
+        )
+        self.assertArrayAlmostEqual(
+            result.extract_cube("emos_coefficient_beta").data,
+            previous.extract_cube("emos_coefficient_beta").data,
+            decimal=2,
+        )
+
+    def _assert_previous_coefficients_not_used(self, plugin, forecast, truth, previous):
+        """Assert that a warning is raised and the previous coefficients are
+        not used as the initial guess."""
+        expected = plugin.process(forecast.copy(), truth.copy())
+        msg = "The previous coefficients do not match"
+        with self.assertWarnsRegex(UserWarning, msg):
+            result = plugin.process(forecast, truth, previous_coefficients=previous)
+        self.assertEqual(result, expected)
+
+    def test_previous_coefficients_mismatch(self):
+        """Test that the previous coefficients are not used if they do not
+        provide coefficients for each point."""
+        previous = self.plugin(self.distribution).process(
+            self.historic_forecast_spot_cube.copy(), self.truth_spot_cube.copy()
+        )
+        self._assert_previous_coefficients_not_used(
+            self.plugin(self.distribution, point_by_point=True),
+            self.historic_forecast_spot_cube,
+            self.truth_spot_cube,
+            previous,
+        )
+
+    def test_previous_coefficients_different_sites(self):
+        """Test that the previous coefficients are not used if they are for
+        different sites, even if the number of sites matches."""
+        plugin = self.plugin(self.distribution, point_by_point=True)
+        previous = plugin.process(
+            self.historic_forecast_spot_cube.copy(), self.truth_spot_cube.copy()
+        )
+        for cube in previous:
+            cube.coord("wmo_id").points = ["03005", "03006", "03007", "03008"]
+        self._assert_previous_coefficients_not_used(
+            plugin, self.historic_forecast_spot_cube, self.truth_spot_cube, previous
+        )
+
+    def test_previous_coefficients_different_grid(self):
+        """Test that the previous coefficients are not used if they are for
+        different grid points, even if the number of points matches."""
+        plugin = self.plugin(self.distribution, point_by_point=True)
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube.copy(),
+            self.temperature_truth_cube.copy(),
+        )
+        for cube in previous:
+            x_coord = cube.coord(axis="x")
+            x_coord.points = x_coord.points + 10
+        self._assert_previous_coefficients_not_used(
+            plugin,
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+            previous,
+        )
+
     def test_additional_dynamic_predictor(self):
         """Raise an error if the additional predictor provided is not static."""
         plugin = self.plugin(self.distribution)
@@ -447,6 +447,36 @@ def test_process_with_bin_data(
     np.testing.assert_equal(result.data, result_bin.data)
 
 
+@pytest.mark.parametrize("bin_data", (False, True))
+def test_process_with_max_workers(
+    ensemble_forecast,
+    ensemble_features,
+    plugin_and_dummy_models,
+    model_config,
+    lightgbm_model_files,
+    bin_data,
+):
+    """Test that evaluating the threshold models concurrently does not affect
+    the results.
+
+    Note: The lightgbm_model_files parameter is not used explicitly, but it is
+    required in order to make the files available.
+    """
+    plugin_cls, dummy_models = plugin_and_dummy_models
+    output_thresholds = [0.0, 0.0005, 0.001]
+    results = []
+    for max_workers in (1, 3):
+        plugin = plugin_cls(
+            model_config_dict={}, bin_data=bin_data, max_workers=max_workers
+        )
+        plugin.tree_models, plugin.lead_times, plugin.model_thresholds = dummy_models
+        plugin.combined_feature_splits = plugin._get_feature_splits(model_config)
+        results.append(
+            plugin.process(ensemble_forecast, ensemble_features, output_thresholds)
+        )
+    np.testing.assert_equal(results[0].data, results[1].data)
+
+
 def test_process_deterministic(
     deterministic_forecast,
     deterministic_features,
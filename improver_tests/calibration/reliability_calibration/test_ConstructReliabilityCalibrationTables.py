@@ -389,6 +389,24 @@ def test_table_values_masked_truth(
     assert_array_equal(result[0].data.mask, result[1].data.mask)
 
 
+def test_table_values_masked_forecast(
+    forecast_grid, truth_grid, expected_table_shape_grid
+):
+    """Test that a point at which the forecast is masked at only one of the
+    timesteps is masked within the resulting reliability table, when the
+    truths are unmasked."""
+    forecast_grid.data = np.ma.masked_array(forecast_grid.data)
+    forecast_grid.data[0, :, 0, 0] = np.ma.masked
+    expected_mask = np.zeros(expected_table_shape_grid, dtype=bool)
+    expected_mask[:, :, 0, 0] = True
+    result = Plugin(
+        single_value_lower_limit=True, single_value_upper_limit=True
+    ).process(forecast_grid, truth_grid)
+    assert isinstance(result.data, np.ma.MaskedArray)
+    assert_array_equal(result[0].data.mask, expected_mask)
+    assert_array_equal(result[0].data.mask, result[1].data.mask)
+
+
 def test_process_mismatching_threshold_coordinates(truth_grid, forecast_grid):
     """Test that an exception is raised if the forecast and truth cubes
     have differing threshold coordinates."""
@@ -424,3 +442,32 @@ def test_process_and_aggregate(create_rel_table_inputs):
 
     # check that the two cubes are identical
     assert constructed_with_agg == aggregated
+
+
+@pytest.mark.parametrize("aggregate", (False, True))
+def test_process_update_existing_table(create_rel_table_inputs, aggregate):
+    """Test that updating a table constructed from the first forecast and
+    truth with the second gives the same table as constructing it from
+    both."""
+    forecast, truth = create_rel_table_inputs.forecast, create_rel_table_inputs.truth
+    agg_coords = None
+    if aggregate:
+        agg_coords = [forecast.coord(axis="x").name(), forecast.coord(axis="y").name()]
+        if forecast.coords("spot_index"):
+            agg_coords = ["spot_index"]
+    plugin = Plugin(single_value_lower_limit=True, single_value_upper_limit=True)
+    expected = plugin.process(forecast, truth, agg_coords)
+    existing = plugin.process(forecast[0], truth[0], agg_coords)
+    result = plugin.process(forecast[1], truth[1], agg_coords, existing)
+    assert result == expected
+
+
+def test_process_update_overlapping_table(create_rel_table_inputs):
+    """Test that an exception is raised if the existing table was
+    constructed from any of the same forecasts."""
+    forecast, truth = create_rel_table_inputs.forecast, create_rel_table_inputs.truth
+    plugin = Plugin()
+    existing = plugin.process(forecast, truth)
+    msg = "Reliability calibration tables have overlapping"
+    with pytest.raises(ValueError, match=msg):
+        plugin.process(forecast[1], truth[1], reliability_table=existing)
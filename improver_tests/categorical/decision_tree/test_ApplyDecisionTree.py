@@ -908,6 +908,22 @@ class Test_construct_extract_constraint(Test_WXCode):
             self.cubes.extract(result)[0].data, self.cubes.extract(expected)[0].data
         )
 
+    def test_repeated_constraint(self):
+        """Test the same constraint is returned for a repeated diagnostic
+        threshold, and a different constraint for a different threshold."""
+        diagnostic = "probability_of_rainfall_rate_above_threshold"
+        result = self.plugin.construct_extract_constraint(
+            diagnostic, AuxCoord(0.03, units="mm hr-1"), False
+        )
+        repeated = self.plugin.construct_extract_constraint(
+            diagnostic, AuxCoord(0.03, units="mm hr-1"), False
+        )
+        different = self.plugin.construct_extract_constraint(
+            diagnostic, AuxCoord(0.1, units="mm hr-1"), False
+        )
+        self.assertIs(result, repeated)
+        self.assertIsNot(result, different)
+
 
 class Test_evaluate_extract_expression(Test_WXCode):
     """Test the evaluate_extract_expression method ."""
@@ -984,6 +1000,33 @@ class Test_evaluate_extract_expression(Test_WXCode):
         result = self.plugin.evaluate_extract_expression(self.cubes, expression)
         self.assertArrayEqual(result, expected)
 
+    def test_cache(self):
+        """Test that constraints and sub-expressions shared between
+        expressions are only evaluated once when a cache is provided."""
+        t = AuxCoord(0.1, units="mm hr-1")
+        t.convert_units("m s-1")
+        sleet, rain = [
+            self.plugin.construct_extract_constraint(
+                f"probability_of_{name}_above_threshold", t, False
+            )
+            for name in ["lwe_sleetfall_rate", "rainfall_rate"]
+        ]
+        sub_expression = [sleet, "+", rain]
+        cache = {}
+        with patch.object(
+            self.cubes, "extract", wraps=self.cubes.extract
+        ) as mock_extract:
+            first = self.plugin.evaluate_extract_expression(
+                self.cubes, [0.5, "*", list(sub_expression)], cache
+            )
+            second = self.plugin.evaluate_extract_expression(
+                self.cubes, [list(sub_expression), "-", rain], cache
+            )
+        self.assertEqual(mock_extract.call_count, 2)
+        expected = self.cubes.extract(sleet)[0].data + self.cubes.extract(rain)[0].data
+        self.assertArrayEqual(first, 0.5 * expected)
+        self.assertArrayEqual(second, expected - self.cubes.extract(rain)[0].data)
+
 
 class Test_evaluate_condition_chain(Test_WXCode):
     """Test the evaluate_condition_chain method ."""
@@ -1671,6 +1714,35 @@ class Test_compare_to_threshold(IrisTest):
             plugin.compare_array_to_threshold(arr, "!=", 1)
 
 
+class Test_compile_evaluation_plan(IrisTest):
+    """Test the compile_evaluation_plan method."""
+
+    def test_basic(self):
+        """Test that the plan contains routes for each category in the order
+        in which they are defined, with each branch condition constructed
+        once and shared between the routes that use it."""
+        plugin = ApplyDecisionTree(decision_tree=wxcode_decision_tree())
+        with patch.object(
+            plugin, "create_condition_chain", wraps=plugin.create_condition_chain
+        ) as mock_create:
+            plan, branch_chains = plugin.compile_evaluation_plan()
+        branches = [
+            branch for _, routes in plan for route in routes for branch in route
+        ]
+        self.assertEqual(set(branches), set(branch_chains))
+        self.assertEqual(mock_create.call_count, len(branch_chains))
+        self.assertLess(len(branch_chains), len(branches))
+        self.assertEqual(plan[0][0], 0)
+        lightning_routes = dict(plan)[29]
+        self.assertIn(
+            [
+                ("lightning", "lightning_shower"),
+                ("lightning_shower", "Thunder_Shower_Day"),
+            ],
+            lightning_routes,
+        )
+
+
 class Test_process(Test_WXCode):
     """Test the find_all_routes method ."""
 
@@ -594,3 +594,42 @@ def test_unmatching_bounds_exception(wxcode_series):
             WET_CATEGORIES,
             intensity_categories=INTENSITY_CATEGORIES,
         )(wxcode_cubes)
+
+
+@pytest.mark.parametrize("record_run_attr", [False])
+@pytest.mark.parametrize("model_id_attr", [False])
+@pytest.mark.parametrize("interval", [3])
+@pytest.mark.parametrize("offset_reference_times", [False])
+@pytest.mark.parametrize("cube_type", ["gridded", "spot"])
+@pytest.mark.parametrize(
+    "data",
+    [
+        [
+            [0, 0, 1, 3, 3, 10, 12, 12],
+            [1, 1, 1, 8, 12, 12, 10, 14],
+            [29, 29, 26, 26, 10, 10, 1, 1],
+            [17, 17, 23, 23, 24, 1, 3, 5],
+        ]
+    ],
+)
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_chunks(wxcode_series, monkeypatch, max_workers):
+    """Test that the modal codes are unchanged when the points are processed
+    in chunks, serially or concurrently, with day weighting and intensity
+    categories."""
+    _, _, _, _, wxcode_cubes = wxcode_series
+    monkeypatch.setattr(ModalFromGroupings, "DAY_LENGTH", 24)
+    kwargs = {"intensity_categories": INTENSITY_CATEGORIES, "day_weighting": 2}
+    expected = ModalFromGroupings(
+        wxcode_decision_tree(), BROAD_CATEGORIES, WET_CATEGORIES, **kwargs
+    )(wxcode_cubes.copy())
+    monkeypatch.setattr(ModalFromGroupings, "POINTS_PER_CHUNK", 3)
+    result = ModalFromGroupings(
+        wxcode_decision_tree(),
+        BROAD_CATEGORIES,
+        WET_CATEGORIES,
+        max_workers=max_workers,
+        **kwargs,
+    )(wxcode_cubes)
+    np.testing.assert_array_equal(result.data, expected.data)
+    np.testing.assert_array_equal(expected.data.flatten(), [3, 12, 26, 23])
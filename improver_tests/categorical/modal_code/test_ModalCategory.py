@@ -279,3 +279,43 @@ def test_unmatching_bounds_exception(wxcode_series):
         ValueError, match="Input diagnostics do not have consistent periods."
     ):
         ModalCategory(wxcode_decision_tree())(wxcode_cubes)
+
+
+def test_counts_per_category():
+    """Test that the weighted occurrences of each category are counted at
+    each point, ignoring masked values."""
+    data = np.ma.masked_array(
+        [[0, 2, 2, 1], [3, 3, 0, 3]], mask=[[0, 0, 0, 1], [0] * 4]
+    )
+    weights = np.array([1, 2, 1, 1])
+    result = ModalCategory.counts_per_category(data, bin_max=3, weights=weights)
+    np.testing.assert_array_equal(result, [[1, 0, 3, 0], [1, 0, 0, 4]])
+
+
+def test_counts_per_category_exception():
+    """Test that an exception is raised if the data contains values outside
+    the range of the categories."""
+    with pytest.raises(ValueError, match="Categories must be integers between 0 and 3"):
+        ModalCategory.counts_per_category(np.array([[0, 4]]), bin_max=3)
+
+
+@pytest.mark.parametrize("record_run_attr", [False])
+@pytest.mark.parametrize("model_id_attr", [False])
+@pytest.mark.parametrize("interval", [1])
+@pytest.mark.parametrize("offset_reference_times", [False])
+@pytest.mark.parametrize("cube_type", ["gridded", "spot"])
+@pytest.mark.parametrize(
+    "data", [[[1, 1, 3, 15], [3, 4, 5, 7], [10, 12, 14, 15], [23, 23, 1, 0]]]
+)
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_chunks(wxcode_series, monkeypatch, max_workers):
+    """Test that the modal codes are unchanged when the points are processed
+    in chunks, serially or concurrently."""
+    _, _, _, _, wxcode_cubes = wxcode_series
+    expected = ModalCategory(wxcode_decision_tree())(wxcode_cubes.copy())
+    monkeypatch.setattr(ModalCategory, "POINTS_PER_CHUNK", 3)
+    result = ModalCategory(wxcode_decision_tree(), max_workers=max_workers)(
+        wxcode_cubes
+    )
+    np.testing.assert_array_equal(result.data, expected.data)
+    np.testing.assert_array_equal(expected.data.flatten(), [1, 7, 10, 23])
@@ -9,19 +9,24 @@ from unittest.mock import patch
 
 import dask.array as da
 import numpy as np
+from clize.errors import BadArgumentFormat
 from iris.cube import Cube, CubeList
 from iris.exceptions import ConstraintMismatchError
 
 import improver
 from improver.cli import (
+    ObjectAsStr,
     clizefy,
     create_constrained_inputcubelist_converter,
     docutilize,
     inputcube,
+    inputcube_deferred,
+    inputcube_filechunks,
     inputcube_nolazy,
     inputcubelist,
     inputdatetime,
     inputjson,
+    load_inputcubes,
     maybe_coerce_with,
     run_main,
     unbracket,
@@ -145,6 +150,49 @@ class Test_inputcube_nolazy(unittest.TestCase):
         self.assertEqual(result, "return")
 
 
+class Test_inputcube_filechunks(unittest.TestCase):
+    """Tests the input cube file chunks function"""
+
+    @patch("improver.cli.maybe_coerce_with", return_value="return")
+    def test_basic(self, m):
+        """Tests that input cube calls load_cube with the string, requesting
+        the file chunking"""
+        result = inputcube_filechunks("foo")
+        m.assert_called_with(improver.utilities.load.load_cube, "foo", file_chunks=True)
+        self.assertEqual(result, "return")
+
+
+class Test_inputcube_deferred(unittest.TestCase):
+    """Tests the input cube deferred function"""
+
+    def test_basic(self):
+        """Tests that file names are returned without loading, and wrapped
+        objects are unwrapped"""
+        cube = Cube(np.zeros(1), long_name="dummy")
+        self.assertEqual(inputcube_deferred("foo"), "foo")
+        self.assertIs(inputcube_deferred(ObjectAsStr(cube, "foo")), cube)
+
+
+class Test_load_inputcubes(unittest.TestCase):
+    """Tests the load input cubes function"""
+
+    @patch("improver.utilities.load.load_cubes", return_value=["cube1", "cube2"])
+    def test_basic(self, m):
+        """Tests that file names are loaded together, and other objects
+        passed through in order"""
+        cube = Cube(np.zeros(1), long_name="dummy")
+        result = load_inputcubes(["foo", cube, "bar"])
+        m.assert_called_once_with(["foo", "bar"])
+        self.assertEqual(result, ["cube1", cube, "cube2"])
+
+    @patch("improver.cli.maybe_coerce_with", return_value="return")
+    def test_single_file(self, m):
+        """Tests that a single file name is loaded with load_cube"""
+        result = load_inputcubes(["foo"])
+        m.assert_called_with(improver.utilities.load.load_cube, "foo")
+        self.assertEqual(result, ["return"])
+
+
 class Test_inputcubelist(unittest.TestCase):
     """Tests the input cubelist function"""
 
@@ -194,7 +242,7 @@ class Test_with_output(unittest.TestCase):
         compression_level=1 and default least_significant_digit=None"""
         save_object = Cube([0])
         result = wrapped_with_output.cli("argv[0]", [save_object], "--output=foo")
-        m.assert_called_with(save_object, "foo", 1, None)
+        m.assert_called_with(save_object, "foo", 1, None, chunksizes=None)
         self.assertEqual(result, None)
 
     @patch("joblib.dump")
@@ -213,7 +261,7 @@ class Test_with_output(unittest.TestCase):
         result = wrapped_with_output.cli(
             "argv[0]", [save_object], "--output=foo", "--compression-level=9"
         )
-        m.assert_called_with(save_object, "foo", 9, None)
+        m.assert_called_with(save_object, "foo", 9, None, chunksizes=None)
         self.assertEqual(result, None)
 
     @patch("improver.utilities.save.save_netcdf")
@@ -223,7 +271,7 @@ class Test_with_output(unittest.TestCase):
         result = wrapped_with_output.cli(
             "argv[0]", [save_object], "--output=foo", "--compression-level=0"
         )
-        m.assert_called_with(save_object, "foo", 0, None)
+        m.assert_called_with(save_object, "foo", 0, None, chunksizes=None)
         self.assertEqual(result, None)
 
     @patch("improver.utilities.save.save_netcdf")
@@ -237,9 +285,29 @@ class Test_with_output(unittest.TestCase):
             "--compression-level=0",
             "--least-significant-digit=2",
         )
-        m.assert_called_with(save_object, "foo", 0, 2)
+        m.assert_called_with(save_object, "foo", 0, 2, chunksizes=None)
+        self.assertEqual(result, None)
+
+    @patch("improver.utilities.save.save_netcdf")
+    def test_with_output_with_chunk_sizes(self, m):
+        """Tests save_netcdf, default compression-level=1 and chunk-sizes=256,256"""
+        save_object = Cube([0])
+        result = wrapped_with_output.cli(
+            "argv[0]", [save_object], "--output=foo", "--chunk-sizes=256,256"
+        )
+        m.assert_called_with(save_object, "foo", 1, None, chunksizes=[256, 256])
         self.assertEqual(result, None)
 
+    @patch("improver.utilities.save.save_netcdf")
+    def test_with_output_with_invalid_chunk_sizes(self, m):
+        """Tests chunk-sizes which are not integers are rejected when the
+        arguments are parsed"""
+        with self.assertRaisesRegex(BadArgumentFormat, "--chunk-sizes"):
+            wrapped_with_output.cli(
+                "argv[0]", [Cube([0])], "--output=foo", "--chunk-sizes=256,a"
+            )
+        m.assert_not_called()
+
 
 def setup_for_mock():
     """Function that returns a CubeList of wind_speed and wind_from_direction
@@ -407,6 +475,48 @@ def test_import_cli():
     subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
 
 
+def test_load_inputcubes_from_environment(tmp_path, monkeypatch):
+    """Test that the inputs of a command are loaded concurrently and their
+    metadata cached, as set by environment variables."""
+    from datetime import datetime
+
+    from improver.cli import SUBCOMMANDS_DISPATCHER, execute_command
+    from improver.utilities.load import LOAD_CACHE_DIR, LOAD_MAX_WORKERS, load_cube
+    from improver.utilities.save import save_netcdf
+
+    paths = []
+    for hour, realizations in ((0, [0, 1]), (1, [2, 3])):
+        cube = set_up_variable_cube(
+            np.full((2, 3, 3), 280, dtype=np.float32),
+            realizations=realizations,
+            time=datetime(2017, 11, 10, 4, 0),
+            frt=datetime(2017, 11, 10, hour, 0),
+        )
+        paths.append(str(tmp_path / f"input{hour}.nc"))
+        save_netcdf(cube, paths[-1])
+    output = str(tmp_path / "output.nc")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(LOAD_MAX_WORKERS, "2")
+    monkeypatch.setenv(LOAD_CACHE_DIR, str(cache_dir))
+    with patch(
+        "improver.utilities.load.ProcessPoolExecutor",
+        wraps=improver.utilities.load.ProcessPoolExecutor,
+    ) as executor:
+        execute_command(
+            SUBCOMMANDS_DISPATCHER,
+            "improver",
+            "time-lagged-ensembles",
+            *paths,
+            "--output",
+            output,
+        )
+    executor.assert_called_once()
+    assert len(list(cache_dir.iterdir())) == 2
+    monkeypatch.delenv(LOAD_CACHE_DIR)
+    result = load_cube(output)
+    assert list(result.coord("realization").points) == [0, 1, 2, 3]
+
+
 def test_help_no_stderr():
     """Test if help writes to sys.stderr."""
     import contextlib
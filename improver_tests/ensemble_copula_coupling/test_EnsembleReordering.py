@@ -10,6 +10,7 @@ Unit tests for the
 
 import itertools
 import unittest
+from datetime import datetime
 
 import numpy as np
 from iris.cube import Cube
@@ -19,6 +20,7 @@ from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
     EnsembleReordering as Plugin,
 )
 from improver.synthetic_data.set_up_test_cubes import (
+    add_coordinate,
     set_up_percentile_cube,
     set_up_variable_cube,
 )
@@ -369,6 +371,72 @@ class Test_rank_ecc(IrisTest):
         matches = [np.array_equal(aresult, result.data) for aresult in permutations]
         self.assertIn(True, matches)
 
+    def test_tiled_independent_of_tiling(self):
+        """Test that, with a random seed, tiled reordering gives identical
+        results for any tile size and number of workers, for random tie
+        breaking and random ordering, and that ties are broken differently at
+        different times."""
+        raw_data = np.zeros((3, 2, 5, 6), dtype=np.float32)
+        raw_data[1] = 1
+        raw_cube = add_coordinate(
+            set_up_variable_cube(raw_data[:, 0]),
+            [datetime(2017, 11, 10, 4, 0), datetime(2017, 11, 10, 5, 0)],
+            "time",
+            is_datetime=True,
+            order=[1, 0, 2, 3],
+        )
+        calibrated_cube = raw_cube.copy(
+            data=np.broadcast_to(
+                np.array([1, 2, 3], dtype=np.float32)[:, None, None, None],
+                raw_cube.shape,
+            ).copy()
+        )
+        for random_ordering in [False, True]:
+            expected = Plugin().rank_ecc(
+                calibrated_cube.copy(),
+                raw_cube,
+                random_ordering=random_ordering,
+                random_seed=0,
+                tile_size=30,
+            )
+            for tile_size, max_workers in [(1, 1), (7, 1), (7, 3), (100, 2)]:
+                result = Plugin().rank_ecc(
+                    calibrated_cube.copy(),
+                    raw_cube,
+                    random_ordering=random_ordering,
+                    random_seed=0,
+                    tile_size=tile_size,
+                    max_workers=max_workers,
+                )
+                self.assertArrayEqual(result.data, expected.data)
+            self.assertFalse(np.array_equal(expected.data[:, 0], expected.data[:, 1]))
+            if not random_ordering:
+                # the raw ordering is respected, with ties broken randomly
+                self.assertArrayEqual(expected.data[1], 3)
+                self.assertArrayEqual(np.sort(expected.data[::2], axis=0)[0], 1)
+
+    def test_tiled_matches_untiled(self):
+        """Test that tiled reordering of masked data with ties broken by
+        realization matches the result without tiling."""
+        raw_data = np.array([[1, 9, 4], [3, 5, 4], [2, 7, 4]])
+        mask = np.array([[True, False, False]] * 3)
+        calibrated_data = np.ma.MaskedArray(
+            [[1, 6, 1], [2, 8, 2], [3, 10, 3]], mask=mask, dtype=np.float32
+        )
+        cube = self.cube[:, :3, 0].copy()
+        raw_cube = cube.copy(data=raw_data)
+        calibrated_cube = cube.copy(data=calibrated_data)
+
+        expected = Plugin().rank_ecc(
+            calibrated_cube.copy(), raw_cube, tie_break="realization"
+        )
+        result = Plugin().rank_ecc(
+            calibrated_cube, raw_cube, tie_break="realization", tile_size=2
+        )
+        self.assertArrayEqual(result.data, expected.data)
+        self.assertArrayEqual(result.data.mask, mask)
+        self.assertEqual(result.data.dtype, np.float32)
+
     def test_bad_tie_break_exception(self):
         """
         Test that the correct exception is raised when an unknown method is input for
@@ -71,3 +71,22 @@ def test___init___exceptions(
     kwargs.update(dict(lead_times=[1, 2, 3], radii=[1, 2, 3]))
     with pytest.raises(RuntimeError, match=exception_msg):
         MetaNeighbourhood(*args, **kwargs)
+
+
+@patch("improver.nbhood.nbhood.as_cube", side_effect=lambda cube: cube)
+@patch("improver.nbhood.nbhood.NeighbourhoodProcessing")
+def test_max_workers_and_correlation_method(mock_nbhood, _):
+    """Test that max_workers and correlation_method are passed on to
+    NeighbourhoodProcessing."""
+    mock_nbhood.return_value.return_value = sentinel.result
+    result = MetaNeighbourhood(
+        "probabilities",
+        neighbourhood_shape="circular",
+        radii=[10000.0],
+        max_workers=2,
+        correlation_method="fft",
+    )(sentinel.cube)
+    assert result is sentinel.result
+    _, kwargs = mock_nbhood.call_args
+    assert kwargs["max_workers"] == 2
+    assert kwargs["correlation_method"] == "fft"
@@ -35,6 +35,13 @@ class Test__init__(IrisTest):
         with self.assertRaisesRegex(ValueError, msg):
             NeighbourhoodProcessing("square", radii, weighted_mode=True)
 
+    def test_correlation_method_does_not_exist(self):
+        """Test that desired error message is raised, if the correlation
+        method does not exist."""
+        msg = "nonsense is not a valid correlation_method"
+        with self.assertRaisesRegex(ValueError, msg):
+            NeighbourhoodProcessing("circular", 10000, correlation_method="nonsense")
+
 
 class Test__calculate_neighbourhood(IrisTest):
     """Test the _calculate_neighbourhood method."""
@@ -415,6 +422,80 @@ class Test_process(IrisTest):
         self.assertTupleEqual(result.cell_methods, self.cube.cell_methods)
         self.assertDictEqual(result.attributes, self.cube.attributes)
 
+    def test_matches_slice_by_slice(self):
+        """Test the result matches processing each x-y slice separately,
+        with a mask cube, masked input data and concurrent processing."""
+        self.cube.data[1, 0, :] = 0
+        mask_cube = self.cube[0].copy(data=np.ones((5, 5), dtype=np.float32))
+        mask_cube.data[:, 4] = 0
+        for data in (
+            self.cube.data,
+            np.ma.masked_array(self.cube.data, self.cube.data * 0),
+            np.ma.masked_less(self.cube.data, 0.5),
+        ):
+            cube = self.cube.copy(data=data)
+            for max_workers in (1, 2):
+                plugin = NeighbourhoodProcessing(
+                    "circular", 4000, weighted_mode=True, max_workers=max_workers
+                )
+                result = plugin(cube.copy(), mask_cube=mask_cube)
+                for index, cube_slice in enumerate(cube.slices_over("air_temperature")):
+                    expected = plugin(cube_slice, mask_cube=mask_cube)
+                    self.assertArrayEqual(result[index].data, expected.data)
+                    self.assertArrayEqual(
+                        np.ma.getmaskarray(result[index].data),
+                        np.ma.getmaskarray(expected.data),
+                    )
+
+    def test_fft_matches_direct(self):
+        """Test that circular neighbourhoods calculated using FFTs match
+        direct correlation, including where regions of the data are trimmed
+        as all zeros or all ones."""
+        data = np.zeros((3, 40, 40), dtype=np.float32)
+        data[0, 15:25, 10:20] = 1
+        data[1] = 1
+        data[1, 30:, 30:] = 0.5
+        data[2, :, :20] = np.random.default_rng(0).random((40, 20))
+        cube = set_up_probability_cube(
+            data,
+            thresholds=np.array([278, 281, 284], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        mask_cube = cube[0].copy(data=np.ones((40, 40), dtype=np.float32))
+        mask_cube.data[:5] = 0
+        for weighted_mode in (True, False):
+            for method in ("auto", "fft"):
+                result = NeighbourhoodProcessing(
+                    "circular",
+                    12000,
+                    weighted_mode=weighted_mode,
+                    correlation_method=method,
+                )(cube.copy(), mask_cube=mask_cube)
+                expected = NeighbourhoodProcessing(
+                    "circular",
+                    12000,
+                    weighted_mode=weighted_mode,
+                    correlation_method="direct",
+                )(cube.copy(), mask_cube=mask_cube)
+                np.testing.assert_allclose(result.data, expected.data, atol=1e-6)
+                self.assertArrayEqual(result.data.mask, expected.data.mask)
+                self.assertArrayEqual(result.data[0, 32:], 0)
+
+    def test_dimension_order(self):
+        """Test the x-y dimensions are last in the result, and leading
+        dimensions of length 1 are demoted to scalar coordinates."""
+        cube = self.cube[:1].copy()
+        cube.transpose([1, 0, 2])
+        result = NeighbourhoodProcessing("square", 2000)(cube)
+        self.assertEqual(
+            [coord.name() for coord in result.coords(dim_coords=True)],
+            ["projection_y_coordinate", "projection_x_coordinate"],
+        )
+        self.assertEqual(result.coord_dims("air_temperature"), ())
+        self.assertArrayAlmostEqual(
+            result.data, NeighbourhoodProcessing("square", 2000)(self.cube)[0].data
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,11 +4,14 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.RecursiveFilter plugin."""
 
+import sys
 import unittest
 from datetime import timedelta
+from unittest.mock import patch
 
 import iris
 import numpy as np
+import pytest
 from iris.cube import Cube
 from iris.tests import IrisTest
 
@@ -445,6 +448,66 @@ class Test__run_recursion(Test_RecursiveFilter):
         self.assertArrayAlmostEqual(unpadded_result, expected_result)
 
 
+class Test__run_recursion_on_stack(Test_RecursiveFilter):
+    """Test the _run_recursion_on_stack method"""
+
+    def setUp(self):
+        """Set up a stack of padded slices and smoothing coefficients, and the
+        result of filtering each slice in turn."""
+        super().setUp()
+        edge_width = 1
+        rng = np.random.default_rng(0)
+        cube = iris.util.squeeze(self.cube)
+        self.coeffs_x, self.coeffs_y = RecursiveFilter(
+            edge_width=edge_width
+        )._pad_coefficients(*self.smoothing_coefficients_alternative)
+        padded_cubes = []
+        for _ in range(3):
+            padded_cube = pad_cube_with_halo(
+                cube.copy(data=rng.random(cube.shape, dtype=np.float32)),
+                2 * edge_width,
+                2 * edge_width,
+            )
+            padded_cubes.append(padded_cube)
+        self.stack = np.stack([padded_cube.data for padded_cube in padded_cubes])
+        self.expected = np.stack(
+            [
+                RecursiveFilter._run_recursion(
+                    padded_cube, self.coeffs_x, self.coeffs_y, 2
+                ).data
+                for padded_cube in padded_cubes
+            ]
+        )
+
+    def test_matches_slices(self):
+        """Test that filtering the stack gives results identical to filtering
+        each slice in turn."""
+        result = RecursiveFilter._run_recursion_on_stack(
+            self.stack, self.coeffs_x.data[None], self.coeffs_y.data[None], 2
+        )
+        self.assertArrayEqual(result, self.expected)
+
+    def test_without_numba(self):
+        """Test that the numpy implementation, used when numba is unavailable,
+        gives results identical to filtering each slice in turn."""
+        with patch.dict(sys.modules, {"numba": None}):
+            with pytest.warns(UserWarning, match="Module numba unavailable"):
+                result = RecursiveFilter._run_recursion_on_stack(
+                    self.stack, self.coeffs_x.data[None], self.coeffs_y.data[None], 2
+                )
+        self.assertArrayEqual(result, self.expected)
+
+    def test_coefficients_per_slice(self):
+        """Test that separate smoothing coefficients can be provided for each
+        slice."""
+        coeffs_x = np.stack([self.coeffs_x.data, np.zeros_like(self.coeffs_x.data)])
+        coeffs_y = np.stack([self.coeffs_y.data, np.zeros_like(self.coeffs_y.data)])
+        stack = self.stack[:2].copy()
+        result = RecursiveFilter._run_recursion_on_stack(stack, coeffs_x, coeffs_y, 2)
+        self.assertArrayEqual(result[0], self.expected[0])
+        self.assertArrayEqual(result[1], self.stack[1])
+
+
 class Test_process(Test_RecursiveFilter):
     """Test the process method."""
 
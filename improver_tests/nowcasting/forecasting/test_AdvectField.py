@@ -82,52 +82,86 @@ class Test__repr__(IrisTest):
         self.assertEqual(result, expected_result)
 
 
-class Test__increment_output_array(IrisTest):
-    """Tests for the _increment_output_array method"""
-
-    def setUp(self):
-        """Create input arrays"""
-        vel_x = set_up_xy_velocity_cube("advection_velocity_x")
-        vel_y = vel_x.copy(data=2.0 * np.ones(shape=(4, 3)))
-        self.dummy_plugin = AdvectField(vel_x, vel_y)
-
-        self.data = np.array(
-            [[2.0, 3.0, 4.0], [1.0, 2.0, 3.0], [0.0, 1.0, 2.0], [0.0, 0.0, 1.0]]
-        )
-        (self.xgrid, self.ygrid) = np.meshgrid(np.arange(3), np.arange(4))
+class Test__advection_stencil(IrisTest):
+    """Tests for the _advection_stencil method"""
 
     def test_basic(self):
-        """Test one increment from the points negative x-wards and positive
-        y-wards on the source grid, with different directional weightings"""
-        xsrc = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
-        ysrc = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3], [4, 4, 4]])
-        cond = np.array(
+        """Test the source points and weights for advection by half a grid
+        point negative x-wards and one grid point positive y-wards"""
+        grid_vel_x = np.full((4, 3), -0.5, dtype=np.float32)
+        grid_vel_y = np.full((4, 3), 1.0, dtype=np.float32)
+        cond_pt, indices, x_weights, y_weights = AdvectField._advection_stencil(
+            grid_vel_x, grid_vel_y, 1
+        )
+        expected_cond = np.array(
             [
-                [False, True, True],
-                [False, True, True],
-                [False, True, True],
                 [False, False, False],
+                [True, True, True],
+                [True, True, True],
+                [True, True, True],
             ]
         )
-        xfrac = np.full((4, 3), 0.5)
-        yfrac = np.full((4, 3), 0.75)
-        outdata = np.zeros(shape=(4, 3))
+        self.assertArrayEqual(cond_pt, expected_cond)
+        self.assertSequenceEqual(indices.shape, (4, 4, 3))
+        # source points from the lower x and y points, with an index of 12
+        # (beyond the flattened field) where there is no valid source
+        self.assertArrayEqual(
+            indices[0], [[12, 12, 12], [0, 1, 2], [3, 4, 5], [6, 7, 8]]
+        )
+        # source points from the upper x and lower y points
+        self.assertArrayEqual(
+            indices[2], [[12, 12, 12], [1, 2, 12], [4, 5, 12], [7, 8, 12]]
+        )
+        self.assertArrayAlmostEqual(x_weights, np.full((4, 4, 3), 0.5))
+        self.assertArrayAlmostEqual(y_weights[::2], np.ones((2, 4, 3)))
+        self.assertArrayAlmostEqual(y_weights[1::2], np.zeros((2, 4, 3)))
 
-        expected_output = np.array(
+
+class Test__apply_stencil(IrisTest):
+    """Tests for the _apply_stencil method"""
+
+    def setUp(self):
+        """Set up a stencil and gridded data"""
+        grid_vel_x = np.full((4, 3), 0.5, dtype=np.float32)
+        grid_vel_y = np.full((4, 3), 1.0, dtype=np.float32)
+        self.stencil = AdvectField._advection_stencil(grid_vel_x, grid_vel_y, 2)
+        self.data = np.array(
+            [[2.0, 3.0, 4.0], [1.0, 2.0, 3.0], [0.0, 1.0, 2.0], [0.0, 0.0, 1.0]],
+            dtype=np.float32,
+        )
+        self.expected_data = np.array(
             [
-                [0.0, 0.375, 0.750],
-                [0.0, 0.000, 0.375],
-                [0.0, 0.000, 0.000],
-                [0.0, 0.000, 0.000],
-            ]
+                [np.nan, np.nan, np.nan],
+                [np.nan, np.nan, np.nan],
+                [np.nan, 2.0, 3.0],
+                [np.nan, 1.0, 2.0],
+            ],
+            dtype=np.float32,
         )
 
-        self.dummy_plugin._increment_output_array(
-            self.data, outdata, cond, self.xgrid, self.ygrid, xsrc, ysrc, xfrac, yfrac
+    def test_basic(self):
+        """Test a single field is advected"""
+        result = AdvectField._apply_stencil(self.data, self.stencil)
+        self.assertIsInstance(result, np.ma.MaskedArray)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertArrayEqual(result.mask, np.isnan(self.expected_data))
+        self.assertArrayAlmostEqual(
+            result.filled(np.nan), self.expected_data, decimal=6
         )
 
-        self.assertIsInstance(outdata, np.ndarray)
-        self.assertArrayAlmostEqual(outdata, expected_output)
+    def test_multiple_fields(self):
+        """Test a stack of fields is advected, with each matching the result
+        for that field alone"""
+        stack = np.ma.stack(
+            [self.data, np.ma.masked_equal(10 * self.data, 20), 2 * self.data]
+        )
+        result = AdvectField._apply_stencil(stack, self.stencil)
+        self.assertSequenceEqual(result.shape, (3, 4, 3))
+        for field, field_result in zip(stack, result):
+            expected = AdvectField._apply_stencil(field, self.stencil)
+            self.assertArrayEqual(field_result.mask, expected.mask)
+            self.assertArrayEqual(field_result.filled(0), expected.filled(0))
+        self.assertTrue(result.mask[1, 2, 1])
 
 
 class Test__advect_field(IrisTest):
@@ -383,6 +417,23 @@ class Test_process(IrisTest):
             result.data[~result.data.mask], expected_data[~result.data.mask]
         )
 
+    def test_advect_cubes(self):
+        """Test several cubes are advected together, matching the results of
+        processing each cube alone"""
+        masked_cube = self.cube.copy(
+            np.ma.masked_array(self.cube.data, mask=self.cube.data > 3)
+        )
+        cubes = [self.cube, masked_cube, self.cube.copy(2 * self.cube.data)]
+        result = self.plugin.advect_cubes(cubes, self.timestep)
+        self.assertIsInstance(result, iris.cube.CubeList)
+        self.assertEqual(len(result), 3)
+        for cube, result_cube in zip(cubes, result):
+            expected = self.plugin.process(cube, self.timestep)
+            # history attributes record the time of processing
+            for output in (expected, result_cube):
+                output.attributes.pop("history")
+            self.assertEqual(result_cube, expected)
+
     def test_raises_grid_mismatch_error(self):
         """Test error is raised if cube grid does not match velocity grids"""
         x_coord = DimCoord(np.arange(5), "projection_x_coordinate", units="km")
@@ -240,5 +240,41 @@ class Test_extrapolate(SetUpCubes):
         )
 
 
+class Test_process(SetUpCubes):
+    """Test the process method."""
+
+    def setUp(self):
+        """Set up an input cube which does not need orographic enhancement"""
+        super().setUp()
+        self.input_cube = self.precip_cube.copy()
+        self.input_cube.rename("air_temperature")
+        self.input_cube.units = "K"
+
+    def test_basic(self):
+        """Test a forecast is returned for each lead time, in order"""
+        plugin = CreateExtrapolationForecast(self.input_cube, self.vel_x, self.vel_y)
+        result = plugin.process(5, 15)
+        self.assertEqual(len(result), 4)
+        self.assertArrayEqual(
+            [cube.coord("forecast_period").points[0] for cube in result],
+            [0, 300, 600, 900],
+        )
+        self.assertArrayEqual(result[2].data, plugin.extrapolate(10).data)
+
+    def test_max_workers(self):
+        """Test forecasts extrapolated concurrently match those extrapolated
+        serially"""
+        expected = CreateExtrapolationForecast(
+            self.input_cube, self.vel_x, self.vel_y
+        ).process(5, 15)
+        result = CreateExtrapolationForecast(
+            self.input_cube, self.vel_x, self.vel_y, max_workers=3
+        ).process(5, 15)
+        # history attributes record the time of processing
+        for cube in result + expected:
+            cube.attributes.pop("history")
+        self.assertEqual(result, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
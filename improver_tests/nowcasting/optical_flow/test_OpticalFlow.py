@@ -199,39 +199,44 @@ class Test__partial_derivative_temporal(OpticalFlowUtilityTest):
         self.assertArrayAlmostEqual(result, expected_output)
 
 
-class Test__make_subboxes(OpticalFlowUtilityTest):
-    """Test _make_subboxes function"""
+class Test__box_sum(OpticalFlowUtilityTest):
+    """Test _box_sum function"""
 
     def test_basic(self):
-        """Test for correct output types"""
+        """Test for correct output type and shape"""
         self.plugin.boxsize = 2
-        boxes, weights = self.plugin._make_subboxes(self.plugin.data1)
-        self.assertIsInstance(boxes, list)
-        self.assertIsInstance(boxes[0], np.ndarray)
-        self.assertIsInstance(weights, np.ndarray)
-
-    def test_box_list(self):
-        """Test function carves up array as expected"""
-        expected_boxes = [
-            np.array([[1.0, 2.0], [0.0, 1.0]]),
-            np.array([[3.0, 4.0], [2.0, 3.0]]),
-            np.array([[5.0], [4.0]]),
-            np.array([[0.0, 0.0]]),
-            np.array([[1.0, 2.0]]),
-            np.array([[3.0]]),
-        ]
+        result = self.plugin._box_sum(self.plugin.data1)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertSequenceEqual(result.shape, (2, 3))
+
+    def test_values(self):
+        """Test function sums over boxes as expected, including the smaller
+        boxes at the end of each axis"""
+        expected_sums = np.array([[4.0, 12.0, 9.0], [0.0, 3.0, 3.0]])
         self.plugin.boxsize = 2
-        boxes, _ = self.plugin._make_subboxes(self.plugin.data1)
-        for box, ebox in zip(boxes, expected_boxes):
-            self.assertArrayAlmostEqual(box, ebox)
+        result = self.plugin._box_sum(self.plugin.data1)
+        self.assertArrayAlmostEqual(result, expected_sums)
+
+    def test_exact_multiple(self):
+        """Test a field which is an exact multiple of the box size"""
+        self.plugin.boxsize = 3
+        field = np.arange(36, dtype=np.float32).reshape((6, 6))
+        expected_sums = np.array([[63.0, 90.0], [225.0, 252.0]])
+        result = self.plugin._box_sum(field)
+        self.assertArrayAlmostEqual(result, expected_sums)
+
+
+class Test__box_weights(OpticalFlowUtilityTest):
+    """Test _box_weights function"""
 
-    def test_weights_values(self):
+    def test_values(self):
         """Test output weights values"""
         expected_weights = np.array(
-            [0.54216664, 0.95606307, 0.917915, 0.0, 0.46473857, 0.54216664]
+            [[0.54216664, 0.95606307, 0.917915], [0.0, 0.46473857, 0.54216664]]
         )
         self.plugin.boxsize = 2
-        _, weights = self.plugin._make_subboxes(self.plugin.data1)
+        weights = self.plugin._box_weights()
+        self.assertEqual(weights.dtype, np.float32)
         self.assertArrayAlmostEqual(weights, expected_weights)
 
 
@@ -418,6 +423,45 @@ class Test_solve_for_uv(IrisTest):
         self.assertAlmostEqual(v, 2.0)
 
 
+class Test_solve_for_uv_boxes(IrisTest):
+    """Test solve_for_uv_boxes function"""
+
+    def setUp(self):
+        """Define box sums of derivative products for three boxes: the first
+        as in Test_solve_for_uv, the second with all-zero derivatives and the
+        third with a single point and so a singular matrix"""
+        deriv_xy = np.array([[2.0, 3.0], [1.0, -2.0]])
+        deriv_t = np.array([-8.0, 3.0])
+        self.box_sums = [
+            np.array([5.0, 0.0, 0.04]),
+            np.array([4.0, 0.0, 0.06]),
+            np.array([13.0, 0.0, 0.09]),
+            np.array([deriv_xy[:, 0].dot(deriv_t), 0.0, 0.2 * 0.1]),
+            np.array([deriv_xy[:, 1].dot(deriv_t), 0.0, 0.3 * 0.1]),
+        ]
+
+    def test_values(self):
+        """Test output values, with zero displacement for singular boxes"""
+        u, v = OpticalFlow().solve_for_uv_boxes(*self.box_sums)
+        self.assertArrayAlmostEqual(u, [1.0, 0.0, 0.0])
+        self.assertArrayAlmostEqual(v, [2.0, 0.0, 0.0])
+
+    def test_matches_least_squares(self):
+        """Test the displacements match least squares solutions found box by
+        box"""
+        rng = np.random.default_rng(0)
+        boxes = [rng.normal(size=(9, 3)) for _ in range(5)]
+        box_sums = [
+            np.array([box[:, i].dot(box[:, j]) for box in boxes])
+            for i, j in [(0, 0), (0, 1), (1, 1), (0, 2), (1, 2)]
+        ]
+        u, v = OpticalFlow().solve_for_uv_boxes(*box_sums)
+        for box, box_u, box_v in zip(boxes, u, v):
+            expected_u, expected_v = np.linalg.lstsq(box[:, :2], -box[:, 2])[0]
+            self.assertAlmostEqual(box_u, expected_u)
+            self.assertAlmostEqual(box_v, expected_v)
+
+
 class Test_extreme_value_check(IrisTest):
     """Test extreme_value_check function"""
 
@@ -4,16 +4,21 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for psychrometric_calculations WetBulbTemperature"""
 
+import sys
 import unittest
 from unittest.mock import patch, sentinel
 
 import iris
 import numpy as np
+import pytest
 from cf_units import Unit
 from iris.cube import Cube, CubeList
 from iris.tests import IrisTest
 
-from improver.psychrometric_calculations.wet_bulb_temperature import WetBulbTemperature
+from improver.psychrometric_calculations.wet_bulb_temperature import (
+    WBT_TABLE_PRECISION,
+    WetBulbTemperature,
+)
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 
 
@@ -122,6 +127,68 @@ class Test_create_wet_bulb_temperature_cube(Test_WetBulbTemperature):
         self.assertEqual(result.units, Unit("K"))
 
 
+class Test__calculate_wet_bulb_temperature(IrisTest):
+    """Test the alternative methods of calculating wet bulb temperatures
+    give consistent results."""
+
+    def setUp(self):
+        """Set up input arrays spanning a range of conditions, including
+        points outside the range of the lookup table."""
+        rng = np.random.default_rng(0)
+        shape = (3, 20, 20)
+        self.temperature = rng.uniform(190, 330, shape).astype(np.float32)
+        self.relative_humidity = rng.uniform(0, 1.05, shape).astype(np.float32)
+        self.pressure = rng.uniform(5.0e4, 1.05e5, shape).astype(np.float32)
+        self.temperature[0, 0, :2] = [180.0, 340.0]
+        self.relative_humidity[0, 1, 0] = 1.2
+        self.pressure[0, 1, 1] = 5000.0
+
+    def test_without_numba(self):
+        """Test the result without numba is identical to that from the
+        compiled solver."""
+        plugin = WetBulbTemperature()
+        expected = plugin._calculate_wet_bulb_temperature(
+            self.pressure, self.relative_humidity, self.temperature
+        )
+        with patch.dict(sys.modules, {"numba": None}):
+            with pytest.warns(UserWarning, match="Module numba unavailable"):
+                result = plugin._calculate_wet_bulb_temperature(
+                    self.pressure, self.relative_humidity, self.temperature
+                )
+        self.assertEqual(result.dtype, np.float32)
+        self.assertArrayEqual(result, expected)
+
+    def test_lookup_table(self):
+        """Test values interpolated from the lookup table are within its
+        precision of those from the Newton iterator, and that points outside
+        the range of the table are calculated by the Newton iterator."""
+        expected = WetBulbTemperature(precision=1.0e-4)._calculate_wet_bulb_temperature(
+            self.pressure, self.relative_humidity, self.temperature
+        )
+        plugin = WetBulbTemperature(
+            precision=WBT_TABLE_PRECISION, use_lookup_table=True
+        )
+        result = plugin._calculate_wet_bulb_temperature(
+            self.pressure, self.relative_humidity, self.temperature
+        )
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.all(np.abs(result - expected) < WBT_TABLE_PRECISION))
+        iterated = WetBulbTemperature(
+            precision=WBT_TABLE_PRECISION
+        )._calculate_wet_bulb_temperature(
+            self.pressure, self.relative_humidity, self.temperature
+        )
+        outside_table = (0, [0, 0, 1, 1], [0, 1, 0, 1])
+        self.assertArrayEqual(result[outside_table], iterated[outside_table])
+
+    def test_lookup_table_precision_error(self):
+        """Test an error is raised if the lookup table is requested with a
+        finer precision than it provides."""
+        msg = "A precision of at least 0.01 K is required"
+        with self.assertRaisesRegex(ValueError, msg):
+            WetBulbTemperature(precision=0.005, use_lookup_table=True)
+
+
 class Test_process(Test_WetBulbTemperature):
     """Test the calculation of wet bulb temperatures from temperature,
     pressure, and relative humidity information using the process function."""
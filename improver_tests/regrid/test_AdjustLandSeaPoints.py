@@ -4,7 +4,11 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the AdjustLandSeaPoints class"""
 
+import os
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -13,11 +17,13 @@ from iris.cube import Cube
 from iris.tests import IrisTest
 
 from improver.grids import ELLIPSOID
+from improver.regrid import landsea
 from improver.regrid.landsea import AdjustLandSeaPoints
 from improver.synthetic_data.set_up_test_cubes import (
     add_coordinate,
     set_up_variable_cube,
 )
+from improver.utilities.lookup_tables import LOOKUP_TABLE_CACHE_DIR
 from improver.utilities.spatial import OccurrenceWithinVicinity
 
 
@@ -223,6 +229,7 @@ class Test_process(IrisTest):
         data_cube[4, 4] = 0.1
 
         self.plugin = AdjustLandSeaPoints(vicinity_radius=2200.0)
+        landsea._SOURCE_INDICES_CACHE.clear()
 
         self.cube = set_up_variable_cube(
             data_cube,
@@ -316,6 +323,52 @@ class Test_process(IrisTest):
         self.assertDictEqual(result.attributes, self.cube.attributes)
         self.assertEqual(result.name(), self.cube.name())
 
+    def patch_calculation(self):
+        """Patch the calculation of the land-sea correction for the duration
+        of the test, returning a mock recording the calls."""
+        patcher = patch.object(
+            AdjustLandSeaPoints,
+            "_calculate_source_indices",
+            autospec=True,
+            side_effect=AdjustLandSeaPoints._calculate_source_indices,
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_source_indices_reused(self):
+        """Test that the land-sea correction is calculated once for the same
+        land-sea masks, extrapolation mode and vicinity radius, including by
+        other instances of the plugin, and recalculated if these change."""
+        cube = add_coordinate(self.cube, [0, 1], "realization", coord_units=1)
+        calculate_source_indices = self.patch_calculation()
+        with patch.dict(os.environ):
+            os.environ.pop(LOOKUP_TABLE_CACHE_DIR, None)
+            expected = self.plugin.process(self.cube, self.input_land, self.output_land)
+            plugin = AdjustLandSeaPoints(vicinity_radius=2200.0)
+            result = plugin.process(cube, self.input_land, self.output_land)
+            self.assertEqual(calculate_source_indices.call_count, 1)
+            AdjustLandSeaPoints(vicinity_radius=4400.0).process(
+                self.cube, self.input_land, self.output_land
+            )
+            self.output_land.data[2, 2] = 0.0
+            plugin.process(self.cube, self.input_land, self.output_land)
+            self.assertEqual(calculate_source_indices.call_count, 3)
+        self.assertArrayEqual(result.data, [expected.data, expected.data])
+
+    def test_source_indices_disk_cache(self):
+        """Test that the land-sea correction is saved to and reused from the
+        lookup table cache directory if it is set."""
+        calculate_source_indices = self.patch_calculation()
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with patch.dict(os.environ, {LOOKUP_TABLE_CACHE_DIR: cache_dir}):
+            expected = self.plugin.process(self.cube, self.input_land, self.output_land)
+            landsea._SOURCE_INDICES_CACHE.clear()
+            result = self.plugin.process(self.cube, self.input_land, self.output_land)
+            self.assertEqual(calculate_source_indices.call_count, 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+        self.assertArrayEqual(result.data, expected.data)
+
     def test_raises_gridding_error(self):
         """Test error raised when cube and output grids don't match."""
         self.cube = self.input_land_ll
@@ -9,13 +9,18 @@
 # the regridding reference results are manually checked for different methods
 # not using "set_up_variable_cube" because of different spacing at lat/lon
 
+from collections import OrderedDict
+
 import numpy as np
 import pytest
 
-from improver.regrid.bilinear import basic_indexes
+from improver.regrid import landsea2
+from improver.regrid.bilinear import apply_sparse_weights, apply_weights, basic_indexes
 from improver.regrid.grid import calculate_input_grid_spacing, latlon_from_cube
 from improver.regrid.landsea import RegridLandSea
+from improver.regrid.landsea2 import RegridWithLandSeaMask
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.lookup_tables import LOOKUP_TABLE_CACHE_DIR
 from improver.utilities.pad_spatial import pad_cube_with_halo
 
 
@@ -331,3 +336,78 @@ def test_target_domain_bigger_than_source_domain(regridder, landmask, maskedinpu
         np.testing.assert_array_equal(
             regrid_out_pad.data, np.full_like(regrid_out_pad.data, np.nan)
         )
+
+
+@pytest.fixture(name="calculations")
+def calculations_fixture(monkeypatch):
+    """Empty the cache of regridding weights, and return a list to which
+    each calculation of regridding weights is appended."""
+    monkeypatch.setattr(landsea2, "_REGRID_WEIGHTS_CACHE", OrderedDict())
+    calculations = []
+    calculate_weights = RegridWithLandSeaMask._calculate_weights
+
+    def _calculate_weights(self, *args):
+        calculations.append(self.regrid_mode)
+        return calculate_weights(self, *args)
+
+    monkeypatch.setattr(RegridWithLandSeaMask, "_calculate_weights", _calculate_weights)
+    return calculations
+
+
+@pytest.mark.parametrize(
+    "regrid_mode",
+    ("nearest-2", "bilinear-2", "nearest-with-mask-2", "bilinear-with-mask-2"),
+)
+def test_weights_reused(monkeypatch, calculations, regrid_mode):
+    """Test that regridding weights are calculated once for the same grids,
+    land-sea masks and mode, and give the same result when reused for
+    different data."""
+    monkeypatch.delenv(LOOKUP_TABLE_CACHE_DIR, raising=False)
+    cube_in, cube_out_mask, cube_in_mask = define_source_target_grid_data()
+    plugin = RegridWithLandSeaMask(regrid_mode=regrid_mode)
+    plugin(cube_in, cube_in_mask, cube_out_mask)
+    cube_in.data = cube_in.data[::-1].copy()
+    result = plugin(cube_in, cube_in_mask, cube_out_mask)
+    assert calculations == [regrid_mode]
+
+    # a land-sea mask change only affects the weights for masked regridding
+    cube_out_mask.data[0, 0] = 1 - cube_out_mask.data[0, 0]
+    plugin(cube_in, cube_in_mask, cube_out_mask)
+    assert len(calculations) == (2 if "with-mask" in regrid_mode else 1)
+
+    landsea2._REGRID_WEIGHTS_CACHE.clear()
+    cube_out_mask.data[0, 0] = 1 - cube_out_mask.data[0, 0]
+    expected = plugin(cube_in, cube_in_mask, cube_out_mask)
+    np.testing.assert_array_equal(result.data, expected.data)
+
+
+def test_weights_disk_cache(monkeypatch, tmp_path, calculations):
+    """Test that regridding weights are saved to and reused from the lookup
+    table cache directory if it is set."""
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(tmp_path))
+    cube_in, cube_out_mask, cube_in_mask = define_source_target_grid_data()
+    plugin = RegridWithLandSeaMask(regrid_mode="bilinear-with-mask-2")
+    expected = plugin(cube_in, cube_in_mask, cube_out_mask)
+    landsea2._REGRID_WEIGHTS_CACHE.clear()
+    result = plugin(cube_in, cube_in_mask, cube_out_mask)
+    assert calculations == ["bilinear-with-mask-2"]
+    assert len(list(tmp_path.iterdir())) == 1
+    np.testing.assert_array_equal(result.data, expected.data)
+
+
+def test_apply_sparse_weights():
+    """Test that applying weights as a sparse matrix product matches
+    apply_weights for multidimensional masked input."""
+    rng = np.random.default_rng(0)
+    in_values = np.ma.masked_array(
+        rng.normal(size=(20, 3, 2)).astype(np.float32), mask=False
+    )
+    in_values[5, 1, 0] = np.ma.masked
+    indexes = rng.integers(20, size=(10, 4))
+    weights = rng.uniform(size=(10, 4)).astype(np.float32)
+    weights[0, 0] = 0.0
+    result = apply_sparse_weights(indexes, in_values, weights)
+    expected = apply_weights(indexes, in_values, weights)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result.mask, expected.mask)
+    np.testing.assert_array_equal(result, expected)
@@ -347,6 +347,38 @@ class Test_check_sites_are_within_domain(Test_NeighbourSelection):
         self.assertArrayEqual(out_y, y_points)
 
 
+class Test__nearest_neighbour_indices(Test_NeighbourSelection):
+    """Test the vectorised location of points on a coordinate."""
+
+    def test_matches_iris(self):
+        """Test the indices match those found by iris for points within,
+        beyond and on the edges of the cells of ascending, descending and
+        circular coordinates."""
+        ascending = self.region_orography.coord(axis="x")
+        descending = ascending[::-1]
+        circular = self.global_orography.coord(axis="x")
+        for coord in (ascending, descending, circular):
+            points = np.concatenate(
+                [
+                    coord.points,
+                    coord.bounds.flatten(),
+                    coord.points + 0.3 * np.diff(coord.bounds, axis=1)[:, 0],
+                    [coord.points.min() - 1e6, coord.points.max() + 1e6],
+                ]
+            )
+            expected = [coord.nearest_neighbour_index(point) for point in points]
+            result = NeighbourSelection._nearest_neighbour_indices(coord, points)
+            self.assertArrayEqual(result, expected)
+
+    def test_no_bounds(self):
+        """Test the indices are found for a coordinate without bounds."""
+        coord = self.region_orography.coord(axis="x").copy()
+        coord.bounds = None
+        points = np.array([-1.1e5, -4.0e4, 0.0, 3.0e4])
+        result = NeighbourSelection._nearest_neighbour_indices(coord, points)
+        self.assertArrayEqual(result, [0, 2, 4, 5])
+
+
 class Test_get_nearest_indices(Test_NeighbourSelection):
     """Test function wrapping iris functionality to get nearest grid point
     indices to arbitrary coordinates."""
@@ -497,6 +529,23 @@ class Test_build_KDTree(Test_NeighbourSelection):
         self.assertEqual(result_nodes.shape[0], expected_length)
         self.assertIsInstance(result, scipy.spatial.ckdtree.cKDTree)
 
+    def test_cached(self):
+        """Test that the tree is reused for a land mask with the same grid
+        and included points, and not for a different land mask."""
+
+        plugin = NeighbourSelection(land_constraint=True)
+        tree, nodes = plugin.build_KDTree(self.region_land_mask)
+        same_tree, same_nodes = plugin.build_KDTree(self.region_land_mask.copy())
+        self.assertIs(same_tree, tree)
+        self.assertIs(same_nodes, nodes)
+        self.assertFalse(nodes.flags.writeable)
+
+        land_mask = self.region_land_mask.copy()
+        land_mask.data[0, 0] = 1
+        other_tree, other_nodes = plugin.build_KDTree(land_mask)
+        self.assertIsNot(other_tree, tree)
+        self.assertEqual(other_nodes.shape[0], nodes.shape[0] + 1)
+
 
 class Test_select_minimum_dz(Test_NeighbourSelection):
     """Test extraction of the minimum height difference points from a provided
@@ -923,6 +972,133 @@ class Test_process(Test_NeighbourSelection):
 
         self.assertArrayEqual(result.data, expected)
 
+    def test_max_workers(self):
+        """Test that the neighbours are unchanged when the tree is searched
+        with several workers."""
+
+        plugin = NeighbourSelection(
+            land_constraint=True, minimum_dz=True, search_radius=1e8, max_workers=2
+        )
+        result = plugin.process(
+            self.global_sites, self.global_orography, self.global_land_mask
+        )
+        expected = [[[0], [4], [1]]]
+
+        self.assertArrayEqual(result.data, expected)
+
+    def test_previous_neighbours(self):
+        """Test that the neighbours of sites which are unchanged are taken
+        from a previous neighbour cube, and those of moved sites are found
+        again. The x index of the first site is altered on the previous cube
+        to demonstrate that it is reused."""
+
+        plugin = NeighbourSelection(
+            land_constraint=True, minimum_dz=True, search_radius=1e8
+        )
+        sites = self.global_sites + [
+            {"altitude": 2.0, "latitude": 0.0, "longitude": 64.0, "wmo_id": 2}
+        ]
+        expected = plugin.process(sites, self.global_orography, self.global_land_mask)
+        previous = expected.copy()
+        previous.data[0, 0, 0] = 3
+        moved_sites = [sites[0], dict(sites[1], latitude=20.0)]
+        previous.data[0, :, 1] = -1
+
+        result = plugin.process(
+            moved_sites,
+            self.global_orography,
+            self.global_land_mask,
+            previous_neighbours=previous,
+        )
+        full_result = plugin.process(
+            moved_sites, self.global_orography, self.global_land_mask
+        )
+
+        self.assertEqual(result.data[0, 0, 0], 3)
+        self.assertArrayEqual(result.data[..., 1], full_result.data[..., 1])
+        self.assertEqual(result.coords(), full_result.coords())
+
+    def test_previous_neighbours_grid_mismatch(self):
+        """Test an error is raised if the previous neighbour cube is for a
+        different grid."""
+
+        plugin = NeighbourSelection(land_constraint=True, search_radius=1e7)
+        previous = plugin.process(
+            self.global_sites, self.global_orography, self.global_land_mask
+        )
+        previous.attributes["model_grid_hash"] = "different"
+        msg = "The previous neighbour cube was not created for the grid"
+        with pytest.raises(ValueError, match=msg):
+            plugin.process(
+                self.global_sites,
+                self.global_orography,
+                self.global_land_mask,
+                previous_neighbours=previous,
+            )
+
+    def test_previous_neighbours_orography_mismatch(self):
+        """Test an error is raised if the previous neighbour cube was created
+        with a different orography on the same grid."""
+
+        plugin = NeighbourSelection(minimum_dz=True, search_radius=1e8)
+        previous = plugin.process(
+            self.global_sites, self.global_orography, self.global_land_mask
+        )
+        orography = self.global_orography.copy()
+        orography.data[0, 0] += 100
+        msg = "The previous neighbour cube was not created with the same orography"
+        with pytest.raises(ValueError, match=msg):
+            plugin.process(
+                self.global_sites,
+                orography,
+                self.global_land_mask,
+                previous_neighbours=previous,
+            )
+
+    def test_previous_neighbours_search_options_mismatch(self):
+        """Test an error is raised if the previous neighbour cube was created
+        with a different land mask or search radius."""
+
+        plugin = NeighbourSelection(land_constraint=True, search_radius=1e7)
+        previous = plugin.process(
+            self.global_sites, self.global_orography, self.global_land_mask
+        )
+        land_mask = self.global_land_mask.copy()
+        land_mask.data[0, 0] = 1 - land_mask.data[0, 0]
+        msg = "The previous neighbour cube was not created with the same"
+        with pytest.raises(ValueError, match=msg):
+            plugin.process(
+                self.global_sites,
+                self.global_orography,
+                land_mask,
+                previous_neighbours=previous,
+            )
+        plugin = NeighbourSelection(land_constraint=True, search_radius=1e8)
+        with pytest.raises(ValueError, match=msg):
+            plugin.process(
+                self.global_sites,
+                self.global_orography,
+                self.global_land_mask,
+                previous_neighbours=previous,
+            )
+
+    def test_previous_neighbours_missing_method(self):
+        """Test an error is raised if the previous neighbour cube does not
+        contain the neighbour finding method."""
+
+        previous = NeighbourSelection(search_radius=1e7).process(
+            self.global_sites, self.global_orography, self.global_land_mask
+        )
+        plugin = NeighbourSelection(land_constraint=True, search_radius=1e7)
+        msg = 'does not contain the "nearest_land" neighbour finding method'
+        with pytest.raises(ValueError, match=msg):
+            plugin.process(
+                self.global_sites,
+                self.global_orography,
+                self.global_land_mask,
+                previous_neighbours=previous,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
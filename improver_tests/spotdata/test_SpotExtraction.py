@@ -8,6 +8,7 @@ import unittest
 from datetime import datetime as dt
 from datetime import timedelta
 
+import dask.array as da
 import iris
 import numpy as np
 from iris.tests import IrisTest
@@ -345,6 +346,56 @@ class Test_build_diagnostic_cube(Test_SpotExtraction):
         self.assertArrayEqual(result.data, spot_values)
 
 
+class Test_extract_spot_values(Test_SpotExtraction):
+    """Test the extraction of values at grid points from real and lazy
+    data."""
+
+    def setUp(self):
+        """Set up data with a leading dimension, and grid point indices."""
+        super().setUp()
+        self.data = np.arange(50, dtype=np.float32).reshape(2, 5, 5)
+        self.x_indices = np.array([0, 4, 2, 2])
+        self.y_indices = np.array([0, 1, 4, 4])
+        self.expected = np.array([[0, 9, 22, 22], [25, 34, 47, 47]])
+
+    def test_real_data(self):
+        """Test values are extracted from real data."""
+        result = SpotExtraction.extract_spot_values(
+            self.data, self.x_indices, self.y_indices
+        )
+        self.assertArrayEqual(result, self.expected)
+
+    def test_lazy_data(self):
+        """Test values are extracted lazily from lazy data, with the sites
+        as the trailing dimension."""
+        data = da.from_array(self.data, chunks=(1, 2, 2))
+        result = SpotExtraction.extract_spot_values(
+            data, self.x_indices, self.y_indices
+        )
+        self.assertIsInstance(result, da.Array)
+        self.assertArrayEqual(result.compute(), self.expected)
+
+
+class Test_extract_cubes(Test_SpotExtraction):
+    """Test the extraction of spot data from several diagnostic cubes."""
+
+    def test_multiple_cubes(self):
+        """Test that a spot data cube is returned for each of a lazy and a
+        real diagnostic cube, without realising the lazy cube."""
+        lazy_cube = self.diagnostic_cube_xy.copy(
+            data=self.diagnostic_cube_xy.lazy_data().rechunk((2, 2))
+        )
+        real_cube = self.diagnostic_cube_yx.copy()
+        plugin = SpotExtraction()
+        result = plugin.extract_cubes(self.neighbour_cube, [lazy_cube, real_cube])
+        self.assertIsInstance(result, iris.cube.CubeList)
+        self.assertEqual(len(result), 2)
+        for spot_cube in result:
+            self.assertArrayEqual(spot_cube.data, [0, 0, 12, 12])
+            self.assertDictEqual(spot_cube.attributes, self.expected_attributes)
+        self.assertTrue(lazy_cube.has_lazy_data())
+
+
 class Test_process(Test_SpotExtraction):
     """Test the process method which extracts data and builds cubes with
     metadata added."""
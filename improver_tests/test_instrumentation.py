@@ -0,0 +1,136 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the instrumentation of plugin calls."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from improver import BasePlugin, instrumentation
+
+PLUGIN_NAME = f"{__name__}.ReadFile"
+
+
+class ReadFile(BasePlugin):
+    """Plugin reading a file."""
+
+    def process(self, path):
+        """Return the contents of the file at path."""
+        with open(path, "rb") as file:
+            return file.read()
+
+
+@pytest.fixture(name="enabled")
+def enabled_fixture(monkeypatch):
+    """Enable instrumentation with no existing records, restoring the
+    existing records afterwards."""
+    monkeypatch.setattr(instrumentation, "_RECORDS", {})
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+    instrumentation.instrumentation_enable()
+
+
+@pytest.fixture(name="data_file")
+def data_file_fixture(tmp_path):
+    """Return the path of a file of 10000 bytes."""
+    path = tmp_path / "data"
+    path.write_bytes(b"0" * 10000)
+    return path
+
+
+def test_disabled(monkeypatch, data_file):
+    """Test that calls are not recorded if instrumentation is disabled."""
+    monkeypatch.setattr(instrumentation, "_RECORDS", {})
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+    assert ReadFile()(data_file) == b"0" * 10000
+    assert instrumentation.instrumentation_records() == {}
+
+
+def test_record_calls(enabled, data_file):
+    """Test that the resources used by each call are accumulated."""
+    plugin = ReadFile()
+    assert plugin(data_file) == b"0" * 10000
+    plugin(data_file)
+    records = instrumentation.instrumentation_records()
+    assert list(records) == [PLUGIN_NAME]
+    record = records[PLUGIN_NAME]
+    assert list(record) == list(instrumentation.METRICS)
+    assert record["calls"] == 2
+    assert record["wall_seconds"] > 0
+    assert record["cpu_seconds"] >= 0
+    assert record["peak_rss_increase_bytes"] >= 0
+    if instrumentation._io_bytes() != (0, 0):
+        assert record["read_bytes"] == 20000
+
+
+def test_record_exception(enabled, tmp_path):
+    """Test that a call raising an exception is recorded."""
+    with pytest.raises(FileNotFoundError):
+        ReadFile()(tmp_path / "missing")
+    assert instrumentation.instrumentation_records()[PLUGIN_NAME]["calls"] == 1
+
+
+def test_reset(enabled, data_file):
+    """Test that records are discarded on reset, and calls are not recorded
+    once instrumentation is disabled."""
+    ReadFile()(data_file)
+    instrumentation.instrumentation_reset()
+    instrumentation.instrumentation_disable()
+    ReadFile()(data_file)
+    assert instrumentation.instrumentation_records() == {}
+
+
+def test_format_prometheus():
+    """Test the records are formatted as Prometheus metrics."""
+    record = dict.fromkeys(instrumentation.METRICS, 0)
+    record.update(calls=2, wall_seconds=1.5)
+    result = instrumentation.format_prometheus({"a.Plugin": record}).splitlines()
+    assert result[:5] == [
+        "# HELP improver_plugin_calls_total Number of calls of the plugin.",
+        "# TYPE improver_plugin_calls_total counter",
+        'improver_plugin_calls_total{plugin="a.Plugin"} 2',
+        "# HELP improver_plugin_wall_seconds_total Wall time spent in the plugin.",
+        "# TYPE improver_plugin_wall_seconds_total counter",
+    ]
+    assert 'improver_plugin_wall_seconds_total{plugin="a.Plugin"} 1.5' in result
+    assert "# TYPE improver_plugin_peak_rss_increase_bytes gauge" in result
+    assert len(result) == 3 * len(instrumentation.METRICS)
+
+
+@pytest.mark.parametrize("filename", ["metrics.json", "metrics.prom"])
+def test_dump(enabled, data_file, tmp_path, filename):
+    """Test the records are written to file in the format given by the file
+    name."""
+    ReadFile()(data_file)
+    path = tmp_path / filename
+    instrumentation.instrumentation_dump(str(path))
+    records = instrumentation.instrumentation_records()
+    if filename.endswith(".prom"):
+        assert path.read_text() == instrumentation.format_prometheus(records)
+    else:
+        assert json.loads(path.read_text()) == {"plugins": records}
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["data", filename])
+
+
+def test_dump_permissions(enabled, data_file, tmp_path):
+    """Test the records file is given the permissions derived from the
+    umask."""
+    ReadFile()(data_file)
+    path = tmp_path / "metrics.json"
+    original_umask = os.umask(0o077)
+    try:
+        instrumentation.instrumentation_dump(str(path))
+    finally:
+        os.umask(original_umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_dump_stderr(enabled, data_file, capsys):
+    """Test the records are written to stderr as JSON."""
+    ReadFile()(data_file)
+    instrumentation.instrumentation_dump("-")
+    result = json.loads(capsys.readouterr().err)
+    assert list(result["plugins"]) == [PLUGIN_NAME]
@@ -0,0 +1,269 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the server module."""
+
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+import warnings
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from improver import cli
+from improver.server import InputCache, _receive, _send, run_job, serve, submit
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.cli_utilities import load_json_or_none
+from improver.utilities.load import load_cube
+from improver.utilities.save import save_netcdf
+
+
+@pytest.fixture(name="socket_path")
+def socket_path_fixture(tmp_path):
+    """Run a server caching all inputs in a thread, yielding the path of its
+    socket, and shut it down afterwards."""
+    path = str(tmp_path / "improver.sock")
+    with patch("improver.server.preload_processing_modules"):
+        server = threading.Thread(
+            target=serve, args=(path,), kwargs={"cache_patterns": ["*"]}
+        )
+        server.start()
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.1)
+        yield path
+        if server.is_alive():
+            submit(path, shutdown=True)
+        server.join(timeout=10)
+    assert not server.is_alive()
+
+
+@pytest.fixture(name="input_path")
+def input_path_fixture(tmp_path):
+    """Save a temperature cube to file and return the path."""
+    data = np.linspace(270, 290, 25, dtype=np.float32).reshape((5, 5))
+    path = tmp_path / "temperature.nc"
+    save_netcdf(set_up_variable_cube(data), str(path))
+    return str(path)
+
+
+def test_cache_reuses_loaded_input(input_path):
+    """Test a file is loaded once, realised, and a copy returned on each
+    access."""
+    cache = InputCache(patterns=["*"])
+    loader = Mock(wraps=load_cube)
+    first = cache.load(loader, input_path)
+    second = cache.load(loader, input_path)
+    assert loader.call_count == 1
+    assert not first.has_lazy_data()
+    assert first == second
+    assert first is not second
+
+
+def test_cache_eviction(tmp_path):
+    """Test the least recently used input is evicted."""
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.json"
+        path.write_text("{}")
+        paths.append(str(path))
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return {}
+
+    cache = InputCache(max_entries=2, patterns=["*"])
+    for path in (paths[0], paths[1], paths[0], paths[2], paths[0], paths[1]):
+        cache.load(loader, path)
+    assert len(cache) == 2
+    assert calls == [paths[0], paths[1], paths[2], paths[1]]
+
+
+def test_cache_reloads_modified_file(tmp_path):
+    """Test a file is reloaded when it is replaced."""
+    path = tmp_path / "config.json"
+    path.write_text('{"a": 1}')
+    cache = InputCache(patterns=["*"])
+    assert cache.load(load_json_or_none, str(path)) == {"a": 1}
+    path.write_text('{"a": 22}')
+    assert cache.load(load_json_or_none, str(path)) == {"a": 22}
+
+
+def test_cache_patterns(tmp_path):
+    """Test only files matching the patterns, and not other strings, are
+    cached."""
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    cache = InputCache(patterns=["*/ancillaries/*"])
+    cache.load(load_json_or_none, str(path))
+    cache.load(lambda s: s.split(","), "1,2")
+    assert len(cache) == 0
+
+
+def test_cache_patterns_match_real_path(tmp_path, monkeypatch):
+    """Test a relative path is cached if its real path matches an absolute
+    pattern."""
+    (tmp_path / "ancillaries").mkdir()
+    path = tmp_path / "ancillaries" / "config.json"
+    path.write_text("{}")
+    monkeypatch.chdir(tmp_path)
+    cache = InputCache(patterns=[f"{os.path.realpath(tmp_path)}/ancillaries/*"])
+    cache.load(load_json_or_none, os.path.join("ancillaries", "config.json"))
+    assert len(cache) == 1
+
+
+def test_cache_nothing_by_default(tmp_path):
+    """Test no files are cached unless patterns are given."""
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    cache = InputCache()
+    cache.load(load_json_or_none, str(path))
+    assert len(cache) == 0
+
+
+def test_run_job(input_path, tmp_path):
+    """Test a command is run relative to the requested directory."""
+    output = tmp_path / "output.nc"
+    response = run_job(
+        ["threshold", os.path.basename(input_path), "--threshold-values", "280"]
+        + ["--output", output.name],
+        cwd=str(tmp_path),
+    )
+    assert response["returncode"] == 0
+    assert response["error"] is None
+    expected = (load_cube(input_path).data > 280).astype(np.float32)
+    np.testing.assert_array_equal(load_cube(str(output)).data, expected)
+
+
+def test_run_job_failure(tmp_path):
+    """Test a failing command returns the error."""
+    response = run_job(["threshold", "missing.nc", "--threshold-values", "280"])
+    assert response["returncode"] == 1
+    assert "missing.nc" in response["error"]
+
+
+def test_run_job_stderr():
+    """Test warnings and anything written to stderr by a command are
+    returned."""
+
+    def command(*args):
+        print("to stdout")
+        print("to stderr", file=sys.stderr)
+        warnings.warn("job warning")
+
+    with patch("improver.cli.execute_command", side_effect=command):
+        response = run_job(["threshold"])
+    assert response["returncode"] == 0
+    assert response["stdout"] == "to stdout\n"
+    assert "to stderr" in response["stderr"]
+    assert "job warning" in response["stderr"]
+
+
+def test_submit_cli_prints_stderr(capsys):
+    """Test the submit command prints the output of the command run by the
+    server to the corresponding streams."""
+    from improver.cli import submit as submit_cli
+
+    response = {
+        "returncode": 0,
+        "result": None,
+        "error": None,
+        "stdout": "to stdout\n",
+        "stderr": "to stderr\n",
+    }
+    with patch("improver.server.submit", return_value=response):
+        submit_cli.process("improver.sock", "threshold")
+    captured = capsys.readouterr()
+    assert captured.out == "to stdout\n"
+    assert captured.err == "to stderr\n"
+
+
+def test_serve_and_submit(input_path, tmp_path):
+    """Test commands are run by the server, the socket is only accessible
+    to the current user, and the cache is only enabled while serving."""
+    socket_path = str(tmp_path / "improver.sock")
+    with patch("improver.server.preload_processing_modules"):
+        server = threading.Thread(
+            target=serve, args=(socket_path,), kwargs={"cache_patterns": ["*"]}
+        )
+        server.start()
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.1)
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        response = submit(
+            socket_path, ["threshold", input_path, "--threshold-values", "280"]
+        )
+        assert response["returncode"] == 0
+        assert "probability_of_air_temperature_above_threshold" in response["result"]
+        assert len(cli.INPUT_CACHE) == 1
+        assert submit(socket_path, shutdown=True) == {"returncode": 0}
+        server.join(timeout=10)
+    assert not server.is_alive()
+    assert not os.path.exists(socket_path)
+    assert cli.INPUT_CACHE is None
+
+
+@pytest.mark.parametrize(
+    "message, error",
+    (
+        (b"not json\n", "JSONDecodeError"),
+        (b'{"cwd": "/"}\n', "must contain either argv or shutdown"),
+        (b"[1, 2]\n", "must be a JSON object"),
+    ),
+)
+def test_serve_bad_request(input_path, socket_path, message, error):
+    """Test a malformed request is answered with an error and later
+    requests are still served."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        conn.sendall(message)
+        response = _receive(conn)
+    assert response["returncode"] == 1
+    assert error in response["error"]
+    response = submit(
+        socket_path, ["threshold", input_path, "--threshold-values", "280"]
+    )
+    assert response["returncode"] == 0
+
+
+def test_serve_client_disconnects(input_path, socket_path):
+    """Test the server keeps running if a client disconnects before its
+    reply is sent."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        _send(conn, {"argv": ["threshold", input_path, "--threshold-values", "280"]})
+    response = submit(
+        socket_path, ["threshold", input_path, "--threshold-values", "280"]
+    )
+    assert response["returncode"] == 0
+
+
+def test_serve_refuses_other_users(input_path, socket_path):
+    """Test requests from clients run by other users are refused."""
+    with patch("improver.server._peer_uid", return_value=os.getuid() + 1):
+        response = submit(
+            socket_path, ["threshold", input_path, "--threshold-values", "280"]
+        )
+    assert response["returncode"] == 1
+    assert "are not accepted" in response["error"]
+    assert response.get("stdout") is None
+
+
+def test_serve_refuses_to_replace_file(tmp_path):
+    """Test an error is raised if the socket path is an existing file."""
+    path = tmp_path / "improver.sock"
+    path.write_text("")
+    with pytest.raises(FileExistsError, match="exists and is not a socket"):
+        serve(str(path))
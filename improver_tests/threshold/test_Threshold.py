@@ -759,6 +759,33 @@ def test_vicinity_with_landmask(custom_cube, landmask, kwargs, expected_result):
     assert result.data.dtype == expected_result.dtype
 
 
+@pytest.mark.parametrize(
+    "n_realizations,n_times,data",
+    [(3, 1, np.r_[[0] * 40, [1], [0] * 170, [2] * 32].reshape((3, 9, 9)))],
+)
+@pytest.mark.parametrize("mask", [np.r_[[1] * 4, [0] * 5] * np.ones((9, 1))])
+@pytest.mark.parametrize("with_landmask", [False, True])
+def test_multiple_vicinities_unordered(custom_cube, landmask, with_landmask):
+    """Test that vicinity processing of an ensemble with unordered radii,
+    where larger radii may be calculated from the results of smaller radii,
+    matches processing each radius separately. Tested with and without a
+    landmask."""
+    landmask = landmask if with_landmask else None
+    vicinities = [6000, 2000, 4000]
+
+    result = Threshold(threshold_values=[0.5, 1.5], vicinity=vicinities)(
+        custom_cube, landmask
+    )
+
+    for result_slice in result.slices_over("radius_of_vicinity"):
+        vicinity = result_slice.coord("radius_of_vicinity").points[0]
+        expected = Threshold(threshold_values=[0.5, 1.5], vicinity=vicinity)(
+            custom_cube, landmask
+        )
+        np.testing.assert_array_equal(result_slice.data, expected.data)
+        assert result_slice.data.any()
+
+
 @pytest.mark.parametrize(
     "n_realizations,n_times,data", [(1, 1, np.array([[0, np.nan], [1, 1]]))]
 )
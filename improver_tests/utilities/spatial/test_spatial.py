@@ -5,6 +5,7 @@
 """Unit tests for the distance_to_number_of_grid_cells function from
 spatial.py."""
 
+import warnings
 from copy import copy
 from datetime import datetime as dt
 
@@ -815,6 +816,42 @@ def test_maximum_within_vicinity(grid, radius, landmask, expected_result):
         assert_array_equal(reference.mask, result.mask)
 
 
+@pytest.mark.parametrize("with_landmask", [False, True])
+@pytest.mark.parametrize("function", [maximum_within_vicinity, minimum_within_vicinity])
+def test_extreme_within_vicinity_leading_dimensions(function, with_landmask):
+    """Test that the maximum and minimum within vicinity functions process
+    each slice over leading dimensions independently, matching the result
+    of processing each 2D slice in turn."""
+    rng = np.random.default_rng(0)
+    grid = rng.random((2, 3, 7, 8))
+    grid[0, 1, 2:4, 3:5] = np.nan
+    landmask = rng.random((7, 8)) > 0.5 if with_landmask else None
+    expected = np.array(
+        [[function(grid[i, j], 2, landmask) for j in range(3)] for i in range(2)]
+    )
+
+    result = function(grid, 2, landmask)
+
+    assert_array_equal(result, expected)
+
+
+def test_maximum_within_vicinity_nan_region():
+    """Test that points with only NaN values within their vicinity return NaN,
+    and that the NaN aware maximum does not warn of a slow filter."""
+    grid = np.zeros((5, 5))
+    grid[:2, :2] = np.nan
+    grid[4, 4] = 1
+    expected = np.zeros((5, 5))
+    expected[0, 0] = np.nan
+    expected[3:, 3:] = 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = maximum_within_vicinity(grid, 1)
+
+    assert_array_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "grid,radius,landmask,expected_result",
     [
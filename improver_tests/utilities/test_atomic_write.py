@@ -0,0 +1,66 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for atomic file writing."""
+
+import os
+import stat
+
+import pytest
+
+from improver.utilities.atomic_write import atomic_write
+
+
+@pytest.fixture(name="umask")
+def umask_fixture(request):
+    """Set the umask of the process for a test, restoring it afterwards."""
+    original = os.umask(request.param)
+    yield request.param
+    os.umask(original)
+
+
+def test_write_text(tmp_path):
+    """Test a file is written and replaces any existing file, leaving no
+    temporary file."""
+    path = tmp_path / "output.txt"
+    path.write_text("old")
+    with atomic_write(str(path)) as output:
+        output.write("new")
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["output.txt"]
+
+
+def test_write_bytes(tmp_path):
+    """Test a file is written in binary mode."""
+    path = tmp_path / "output.bin"
+    with atomic_write(str(path), "wb") as output:
+        output.write(b"\x00\x01")
+    assert path.read_bytes() == b"\x00\x01"
+
+
+@pytest.mark.parametrize(
+    "umask, expected",
+    ((0o022, 0o644), (0o077, 0o600), (0o002, 0o664)),
+    indirect=["umask"],
+)
+def test_permissions_follow_umask(tmp_path, umask, expected):
+    """Test the file is given the permissions derived from the umask."""
+    path = tmp_path / "output.txt"
+    with atomic_write(str(path)) as output:
+        output.write("new")
+    assert stat.S_IMODE(os.stat(path).st_mode) == expected
+    assert os.umask(umask) == umask
+
+
+def test_failed_write(tmp_path):
+    """Test a failed write leaves the existing file unchanged and removes the
+    temporary file."""
+    path = tmp_path / "output.txt"
+    path.write_text("old")
+    with pytest.raises(RuntimeError, match="failed"):
+        with atomic_write(str(path)) as output:
+            output.write("new")
+            raise RuntimeError("failed")
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["output.txt"]
@@ -5,9 +5,11 @@
 """Unit tests for loading functionality."""
 
 import os
+import shutil
 import unittest
 from datetime import datetime
 from tempfile import mkdtemp
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -216,6 +218,19 @@ class Test_load_cube(IrisTest):
         result = load_cube(self.filepath)
         self.assertTrue(result.has_lazy_data())
 
+    def test_file_chunks(self):
+        """Test that lazy data is chunked spatially as in the file, and along
+        leading dimensions as usual, if file chunks are requested."""
+        from iris.fileformats.netcdf import loader
+
+        save_netcdf(self.cube, self.filepath, chunksizes=(2, 2))
+        with patch.object(loader, "_LAZYVAR_MIN_BYTES", 0):
+            default = load_cube(self.filepath)
+            result = load_cube(self.filepath, file_chunks=True)
+        self.assertEqual(default.lazy_data().chunks, ((3,), (3,), (3,)))
+        self.assertEqual(result.lazy_data().chunks, ((3,), (2, 1), (2, 1)))
+        self.assertArrayEqual(result.data, self.cube.data)
+
     def test_var_names_removed(self):
         """Test a cube with an unnecessary coordinate var name does not have
         this on load"""
@@ -417,6 +432,101 @@ class Test_load_cubelist(IrisTest):
         result = load_cubelist([self.filepath, self.filepath])
         self.assertArrayEqual([True, True], [_.has_lazy_data() for _ in result])
 
+    def test_parallel_load(self):
+        """Test that loading files with a pool of processes gives the same
+        cubes, in the same order, as loading them serially."""
+        low_cloud_cube = self.cube.copy()
+        low_cloud_cube.rename("low_type_cloud_area_fraction")
+        low_cloud_cube.units = 1
+        save_netcdf(low_cloud_cube, self.low_cloud_filepath)
+        filepaths = [self.low_cloud_filepath, self.filepath] * 3
+        expected = load_cubelist(filepaths)
+        result = load_cubelist(filepaths, max_workers=4)
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [cube.name() for cube in result],
+            ["low_type_cloud_area_fraction", "air_temperature"] * 3,
+        )
+
+    def test_metadata_cache(self):
+        """Test that a second load with a metadata cache does not parse the
+        file, and that constraints are applied to the cached cubes."""
+        cache_dir = os.path.join(self.directory, "cache")
+        expected = load_cubelist(self.filepath)
+        load_cubelist(self.filepath, cache_dir=cache_dir)
+        with patch("improver.utilities.load.iris.load") as mock_load:
+            result = load_cubelist(self.filepath, cache_dir=cache_dir)
+            constrained = load_cubelist(
+                self.filepath, constraints="air_temperature", cache_dir=cache_dir
+            )
+        mock_load.assert_not_called()
+        self.assertEqual(result, expected)
+        self.assertEqual(constrained, expected)
+        with self.assertRaisesRegex(ValueError, "No cubes found"):
+            load_cubelist(self.filepath, constraints="kittens", cache_dir=cache_dir)
+        shutil.rmtree(cache_dir)
+
+    def test_metadata_cache_replaced_file(self):
+        """Test that a file replaced on disk is parsed again rather than
+        retrieved from the metadata cache."""
+        cache_dir = os.path.join(self.directory, "cache")
+        load_cubelist(self.filepath, cache_dir=cache_dir)
+        cube = self.cube.copy(data=np.zeros((3, 3, 3), dtype=np.float32))
+        cube.rename("kittens")
+        save_netcdf(cube, self.filepath)
+        result = load_cubelist(self.filepath, cache_dir=cache_dir)
+        self.assertEqual(result[0].name(), "kittens")
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        shutil.rmtree(cache_dir)
+
+    def test_metadata_cache_corrupt_file(self):
+        """Test that a corrupt cache file is replaced by parsing the file
+        again."""
+        cache_dir = os.path.join(self.directory, "cache")
+        expected = load_cubelist(self.filepath, cache_dir=cache_dir)
+        (cache_file,) = os.listdir(cache_dir)
+        with open(os.path.join(cache_dir, cache_file), "wb") as corrupt_file:
+            corrupt_file.write(b"\x80\x04corrupt")
+        result = load_cubelist(self.filepath, cache_dir=cache_dir)
+        self.assertEqual(result, expected)
+        with patch("improver.utilities.load.iris.load") as mock_load:
+            load_cubelist(self.filepath, cache_dir=cache_dir)
+        mock_load.assert_not_called()
+        shutil.rmtree(cache_dir)
+
+    def test_metadata_cache_directory_private(self):
+        """Test that the cache directory is created readable only by the
+        current user, and that a directory writable by the group is not
+        used."""
+        cache_dir = os.path.join(self.directory, "cache")
+        expected = load_cubelist(self.filepath, cache_dir=cache_dir)
+        self.assertEqual(os.stat(cache_dir).st_mode & 0o777, 0o700)
+        os.chmod(cache_dir, 0o720)
+        msg = "is owned by another user or is writable by others"
+        with (
+            self.assertWarnsRegex(UserWarning, msg),
+            patch("improver.utilities.load.joblib.load") as mock_load,
+        ):
+            result = load_cubelist(self.filepath, cache_dir=cache_dir)
+        mock_load.assert_not_called()
+        self.assertEqual(result, expected)
+        shutil.rmtree(cache_dir)
+
+    def test_metadata_cache_file_writable_by_others(self):
+        """Test that a cache file writable by the group is not unpickled, but
+        is replaced by parsing the file again."""
+        cache_dir = os.path.join(self.directory, "cache")
+        expected = load_cubelist(self.filepath, cache_dir=cache_dir)
+        (cache_file,) = os.listdir(cache_dir)
+        cache_file = os.path.join(cache_dir, cache_file)
+        os.chmod(cache_file, 0o620)
+        with patch("improver.utilities.load.joblib.load") as mock_load:
+            result = load_cubelist(self.filepath, cache_dir=cache_dir)
+        mock_load.assert_not_called()
+        self.assertEqual(result, expected)
+        self.assertEqual(os.stat(cache_file).st_mode & 0o022, 0)
+        shutil.rmtree(cache_dir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the lookup table registry."""
+
+import os
+import stat
+
+import numpy as np
+import pytest
+
+from improver.utilities import lookup_tables
+from improver.utilities.lookup_tables import (
+    LOOKUP_TABLE_CACHE_DIR,
+    interpolate_from_table,
+    load_lookup_table,
+    lookup_table,
+)
+
+
+@pytest.fixture(name="generator")
+def generator_fixture():
+    """Return a lookup table generator which records its calls."""
+
+    def generator(size, scale=1.0):
+        """Generate a simple lookup table."""
+        generator.call_count += 1
+        return scale * np.arange(size, dtype=np.float32)
+
+    generator.call_count = 0
+    return generator
+
+
+def test_no_disk_cache(monkeypatch, generator):
+    """Test a read-only table is generated each time if no cache directory is
+    set."""
+    monkeypatch.delenv(LOOKUP_TABLE_CACHE_DIR, raising=False)
+    result = load_lookup_table("table", 1, generator, 5)
+    np.testing.assert_array_equal(result, np.arange(5))
+    assert not result.flags.writeable
+    load_lookup_table("table", 1, generator, 5)
+    assert generator.call_count == 2
+
+
+def test_disk_cache(monkeypatch, tmp_path, generator):
+    """Test a table is generated once, saved to the cache directory, and
+    memory-mapped from the cache, with default arguments treated as given."""
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(tmp_path / "cache"))
+    first = load_lookup_table("table", 1, generator, 5)
+    second = load_lookup_table("table", 1, generator, 5, scale=1.0)
+    assert generator.call_count == 1
+    assert len(os.listdir(tmp_path / "cache")) == 1
+    for result in (first, second):
+        np.testing.assert_array_equal(result, np.arange(5))
+        assert isinstance(result.base, np.memmap)
+        assert not result.flags.writeable
+
+
+def test_disk_cache_permissions(monkeypatch, tmp_path, generator):
+    """Test a cached table is given the permissions derived from the umask."""
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(tmp_path))
+    original_umask = os.umask(0o077)
+    try:
+        load_lookup_table("table", 1, generator, 5)
+    finally:
+        os.umask(original_umask)
+    (path,) = tmp_path.iterdir()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_disk_cache_keys(monkeypatch, tmp_path, generator):
+    """Test tables with different versions or arguments are cached
+    separately."""
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(tmp_path))
+    load_lookup_table("table", 1, generator, 5)
+    load_lookup_table("table", 2, generator, 5)
+    result = load_lookup_table("table", 1, generator, 5, scale=2.0)
+    assert generator.call_count == 3
+    assert len(os.listdir(tmp_path)) == 3
+    np.testing.assert_array_equal(result, 2 * np.arange(5))
+
+
+def test_corrupt_cache_file(monkeypatch, tmp_path, generator):
+    """Test a corrupt cache file is replaced."""
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(tmp_path))
+    load_lookup_table("table", 1, generator, 5)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"corrupt")
+    result = load_lookup_table("table", 1, generator, 5)
+    np.testing.assert_array_equal(result, np.arange(5))
+    assert generator.call_count == 2
+
+
+def test_unwritable_cache(monkeypatch, tmp_path, generator):
+    """Test a warning is raised and the generated table returned if the
+    table cannot be cached."""
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    monkeypatch.setenv(LOOKUP_TABLE_CACHE_DIR, str(not_a_directory))
+    with pytest.warns(UserWarning, match="Unable to cache lookup table table"):
+        result = load_lookup_table("table", 1, generator, 5)
+    np.testing.assert_array_equal(result, np.arange(5))
+
+
+def test_lookup_table_decorator(monkeypatch, generator):
+    """Test the decorator registers the table and caches it in memory."""
+    monkeypatch.delenv(LOOKUP_TABLE_CACHE_DIR, raising=False)
+    monkeypatch.setattr(lookup_tables, "LOOKUP_TABLES", {})
+    table = lookup_table("test_table")(generator)
+    assert lookup_tables.LOOKUP_TABLES == {"test_table": table}
+    assert table(5) is table(5)
+    assert generator.call_count == 1
+    with pytest.raises(ValueError, match="named test_table is already registered"):
+        lookup_table("test_table")(interpolate_from_table)
+
+
+def test_interpolate_from_table():
+    """Test linear interpolation through a table, with clipping to the range
+    of the table."""
+    table = np.array([0.0, 10.0, 30.0, 60.0])
+    values = np.array([-1.0, 0.5, 1.25, 2.0, 2.5, 3.0, 10.0])
+    result = interpolate_from_table(values, table, 0.0, 2.5, 1.0)
+    np.testing.assert_allclose(result, [0.0, 5.0, 15.0, 30.0, 45.0, 45.0, 45.0])
@@ -471,6 +471,15 @@ class Test_process(IrisTest):
         result_coord_order = [coord.name() for coord in result.coords(dim_coords=True)]
         self.assertListEqual(result_coord_order, expected_coord_order)
 
+    def test_lazy_data(self):
+        """Test that lazy data, which is integrated one tile at a time,
+        gives the same result as real data."""
+        cube = self.cube.copy(data=self.cube.lazy_data().rechunk((3, 2, 1)))
+        expected = self.plugin.process(self.cube.copy())
+        result = self.plugin.process(cube)
+        self.assertFalse(result.has_lazy_data())
+        self.assertArrayEqual(result.data, expected.data)
+
 
 class Test_fast_linear_fit(IrisTest):
     """Test the fast_linear_fit method"""
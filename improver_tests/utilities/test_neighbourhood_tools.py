@@ -6,9 +6,12 @@
 
 import numpy as np
 import pytest
+from scipy.ndimage import correlate
 
+from improver.nbhood.nbhood import circular_kernel
 from improver.utilities.neighbourhood_tools import (
     boxsum,
+    fft_correlate,
     pad_and_roll,
     pad_boxsum,
     rolling_window,
@@ -185,3 +188,31 @@ def test_boxsum_exception_not_odd(array_size_5):
     with pytest.raises(ValueError) as exc_info:
         boxsum(array_size_5, (1, 2))
     assert msg in str(exc_info.value)
+
+
+@pytest.mark.parametrize("dtype", (np.float32, np.float64))
+@pytest.mark.parametrize("weighted_mode", (True, False))
+def test_fft_correlate(dtype, weighted_mode):
+    """Test that correlation using FFTs matches direct correlation with
+    nearest edge handling, and that regions of zeros remain exactly zero."""
+    data = np.random.default_rng(0).random((3, 30, 40)).astype(dtype)
+    data[:, :12] = 0
+    kernel = circular_kernel(5, weighted_mode)
+    expected = np.array(
+        [correlate(data_slice, kernel, mode="nearest") for data_slice in data]
+    )
+    result = fft_correlate(data, kernel)
+    assert result.dtype == dtype
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+    assert np.all(result[:, :7] == 0)
+
+
+def test_fft_correlate_complex():
+    """Test that correlation using FFTs supports complex data."""
+    rng = np.random.default_rng(0)
+    data = rng.random((20, 20)) + 1j * rng.random((20, 20))
+    kernel = circular_kernel(3, False)
+    expected = correlate(data.real, kernel, mode="nearest") + 1j * correlate(
+        data.imag, kernel, mode="nearest"
+    )
+    np.testing.assert_allclose(fft_correlate(data, kernel), expected)
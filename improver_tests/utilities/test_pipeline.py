@@ -0,0 +1,134 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the pipeline utilities."""
+
+import numpy as np
+import pytest
+
+from improver.cli import main
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.load import load_cube
+from improver.utilities.pipeline import pipeline_order, run_pipeline
+from improver.utilities.save import save_netcdf
+
+
+@pytest.fixture(name="input_path")
+def input_path_fixture(tmp_path):
+    """Save a temperature cube to file and return the path."""
+    data = np.linspace(270, 290, 25, dtype=np.float32).reshape((5, 5))
+    cube = set_up_variable_cube(data, spatial_grid="equalarea")
+    path = tmp_path / "temperature.nc"
+    save_netcdf(cube, str(path))
+    return path
+
+
+def threshold_step(input_arg, output=None):
+    """Construct a threshold step definition."""
+    step = {"command": "threshold", "args": [input_arg, "--threshold-values", "280"]}
+    if output:
+        step["output"] = str(output)
+    return step
+
+
+def nbhood_step(input_arg, output=None):
+    """Construct a neighbourhood processing step definition."""
+    step = {
+        "command": "nbhood",
+        "args": [
+            input_arg,
+            "--neighbourhood-output",
+            "probabilities",
+            "--radii",
+            "2000",
+        ],
+    }
+    if output:
+        step["output"] = str(output)
+    return step
+
+
+def test_order_follows_dependencies():
+    """Test steps are ordered after the steps they reference, with
+    independent steps retaining their definition order."""
+    steps = {
+        "c": {"command": "cmd", "args": ["@b", "@a"]},
+        "b": {"command": "cmd", "args": ["@a"]},
+        "a": {"command": "cmd", "args": ["input.nc"]},
+        "d": {"command": "cmd", "args": ["input.nc"]},
+    }
+    assert pipeline_order(steps) == ["a", "d", "b", "c"]
+
+
+def test_order_cycle_error():
+    """Test an error is raised for circular dependencies."""
+    steps = {
+        "a": {"command": "cmd", "args": ["@b"]},
+        "b": {"command": "cmd", "args": ["@a"]},
+    }
+    with pytest.raises(ValueError, match="circular dependency between steps: a, b"):
+        pipeline_order(steps)
+
+
+def test_unknown_reference_error():
+    """Test an error is raised for a reference to an undefined step."""
+    steps = {"a": {"command": "cmd", "args": ["@b"]}}
+    with pytest.raises(ValueError, match="Reference @b does not match any step"):
+        pipeline_order(steps)
+
+
+def test_missing_command_error():
+    """Test an error is raised for a step without a command."""
+    steps = {"a": {"args": ["input.nc"]}}
+    with pytest.raises(ValueError, match="Step a does not define a command"):
+        pipeline_order(steps)
+
+
+def test_in_memory_chain(input_path, tmp_path):
+    """Test results are passed between steps in memory, with only the
+    declared output written to file."""
+    output = tmp_path / "output.nc"
+    config = {
+        "steps": {
+            "stage_one": threshold_step(str(input_path)),
+            "stage_two": nbhood_step("@stage_one", output=output),
+        }
+    }
+    result = run_pipeline(config)
+    assert result == {}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "output.nc",
+        "temperature.nc",
+    ]
+
+    # compare with running the commands separately through files
+    separate_path = tmp_path / "separate"
+    separate_path.mkdir()
+    intermediate = separate_path / "intermediate.nc"
+    expected = separate_path / "expected.nc"
+    for step in (
+        threshold_step(str(input_path), output=intermediate),
+        nbhood_step(str(intermediate), output=expected),
+    ):
+        main("improver", step["command"], *step["args"], "--output", step["output"])
+    assert load_cube(str(output)) == load_cube(str(expected))
+
+
+def test_shared_and_final_results(input_path, tmp_path):
+    """Test a step consumed by several steps and saved to file, and that
+    unsaved results of final steps are returned."""
+    output = tmp_path / "probabilities.nc"
+    config = {
+        "steps": {
+            "probabilities": threshold_step(str(input_path), output=output),
+            "first": nbhood_step("@probabilities"),
+            "second": nbhood_step("@probabilities"),
+        }
+    }
+    result = run_pipeline(config)
+    assert list(result) == ["first", "second"]
+    assert result["first"] is not result["second"]
+    assert result["first"] == result["second"]
+    expected = load_cube(str(output)).data
+    assert not np.array_equal(result["first"].data, expected)
@@ -121,6 +121,41 @@ class Test_save_netcdf(IrisTest):
         with self.assertRaises(ValueError):
             save_netcdf(self.cube, self.filepath, compression_level=10)
 
+    def test_default_chunking(self):
+        """Test data are written with one chunk per x-y slice by default"""
+        save_netcdf(self.cube, self.filepath)
+
+        data = Dataset(self.filepath, mode="r")
+        self.assertEqual(data.variables["air_temperature"].chunking(), [1, 3, 3])
+
+    def test_chunksizes(self):
+        """Test data are written in chunks of the requested trailing lengths,
+        limited to the length of each dimension"""
+        save_netcdf(self.cube, self.filepath, chunksizes=(5, 2))
+
+        data = Dataset(self.filepath, mode="r")
+        self.assertEqual(data.variables["air_temperature"].chunking(), [1, 3, 2])
+        np.testing.assert_array_equal(
+            data.variables["air_temperature"][:], self.cube.data
+        )
+
+    def test_chunksizes_too_many(self):
+        """Test ValueError raised when more chunk lengths than dimensions"""
+        with self.assertRaisesRegex(ValueError, "4 chunk lengths specified"):
+            save_netcdf(self.cube, self.filepath, chunksizes=(1, 1, 2, 2))
+
+    def test_chunksizes_varying_shapes(self):
+        """Test ValueError raised when chunk lengths are specified for cubes
+        of varying shapes, rather than the chunk lengths being ignored"""
+        other_cube = self.cube[:, :2]
+        other_cube.rename("other")
+        with self.assertRaisesRegex(ValueError, "cubes of varying shapes"):
+            save_netcdf(
+                iris.cube.CubeList([self.cube, other_cube]),
+                self.filepath,
+                chunksizes=(2, 2),
+            )
+
     def test_basic_cube_list(self):
         """
         Test functionality for saving iris.cube.CubeList